@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from hypomnema.base.errors import (
   XmlSerializationError,
   XmlDeserializationError,
@@ -26,27 +28,50 @@ from hypomnema.base.types import (
   Pos,
   Segtype,
 )
-from hypomnema.xml import XmlBackend, LxmlBackend, StandardBackend, Deserializer, Serializer
-
-
-from hypomnema.xml.policy import PolicyValue, DeserializationPolicy, SerializationPolicy
+from hypomnema._lazy import lazy_attributes
 
-from hypomnema.api import (
-  load,
-  save,
-  create_tmx,
-  create_header,
-  create_tu,
-  create_tuv,
-  create_note,
-  create_prop,
-  create_bpt,
-  create_ept,
-  create_it,
-  create_ph,
-  create_hi,
-  create_sub,
-)
+if TYPE_CHECKING:
+  from hypomnema.base.hashing import DATE_FIELDS, digest, DigestCache
+  from hypomnema.base.languages import normalize_language_tag, language_matches
+  from hypomnema.base.compact import CompactTuStore
+  from hypomnema.xml.backends import XmlBackend, LxmlBackend, StandardBackend
+  from hypomnema.xml.deserialization.deserializer import Deserializer
+  from hypomnema.xml.deserialization.expat import ExpatDeserializer
+  from hypomnema.xml.serialization.serializer import Serializer
+  from hypomnema.xml.deserialization.interning import AttributeInterner
+  from hypomnema.xml.deserialization.projection import Projection
+  from hypomnema.xml.policy import PolicyValue, DeserializationPolicy, SerializationPolicy
+  from hypomnema.xml.validation import TmxValidator, Violation, validate
+  from hypomnema.xml.diagnostics import Diagnostic, Diagnostics
+  from hypomnema.xml.output import AtomicWriter
+  from hypomnema.xml.progress import MetricsSink, Progress, ProgressReporter
+  from hypomnema.api.core import load, save, save_stream
+  from hypomnema.api.incremental import append, update, recover
+  from hypomnema.api.extract import iter_bilingual, extract_bilingual
+  from hypomnema.api.pipeline import Pipeline, StageStats
+  from hypomnema.api.analysis import LanguageStats, TmxStats, stats
+  from hypomnema.api.dedup import (
+    DuplicateCluster,
+    DuplicateFinder,
+    default_normalizer,
+    find_duplicates,
+    remove_duplicates,
+  )
+  from hypomnema.api.text import TextMode, TextProjector, default_placeholder, to_text
+  from hypomnema.api.helpers import (
+    create_tmx,
+    create_header,
+    create_tu,
+    create_tuv,
+    create_note,
+    create_prop,
+    create_bpt,
+    create_ept,
+    create_it,
+    create_ph,
+    create_hi,
+    create_sub,
+  )
 
 __all__ = [
   # Type aliases
@@ -78,20 +103,62 @@ __all__ = [
   "InvalidTagError",
   "InvalidContentError",
   "MissingHandlerError",
+  # Hashing
+  "DATE_FIELDS",
+  "digest",
+  "DigestCache",
+  # Languages
+  "normalize_language_tag",
+  "language_matches",
+  # Storage
+  "CompactTuStore",
   # Backends
   "XmlBackend",
   "LxmlBackend",
   "StandardBackend",
   # I/O
   "Deserializer",
+  "ExpatDeserializer",
   "Serializer",
+  "AttributeInterner",
+  "Projection",
   # Policies
   "PolicyValue",
   "DeserializationPolicy",
   "SerializationPolicy",
+  # Validation
+  "TmxValidator",
+  "Violation",
+  "validate",
+  "Diagnostic",
+  "Diagnostics",
+  "AtomicWriter",
+  "MetricsSink",
+  "Progress",
+  "ProgressReporter",
   # Public API
   "load",
   "save",
+  "save_stream",
+  "append",
+  "update",
+  "recover",
+  "iter_bilingual",
+  "extract_bilingual",
+  "Pipeline",
+  "StageStats",
+  "LanguageStats",
+  "TmxStats",
+  "stats",
+  "DuplicateCluster",
+  "DuplicateFinder",
+  "default_normalizer",
+  "find_duplicates",
+  "remove_duplicates",
+  "TextMode",
+  "TextProjector",
+  "default_placeholder",
+  "to_text",
   "create_tmx",
   "create_header",
   "create_tu",
@@ -105,3 +172,69 @@ __all__ = [
   "create_hi",
   "create_sub",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+  __name__,
+  {
+    "DATE_FIELDS": ".base.hashing",
+    "digest": ".base.hashing",
+    "DigestCache": ".base.hashing",
+    "normalize_language_tag": ".base.languages",
+    "language_matches": ".base.languages",
+    "CompactTuStore": ".base.compact",
+    "XmlBackend": ".xml.backends",
+    "LxmlBackend": ".xml.backends",
+    "StandardBackend": ".xml.backends",
+    "Deserializer": ".xml.deserialization.deserializer",
+    "ExpatDeserializer": ".xml.deserialization.expat",
+    "Serializer": ".xml.serialization.serializer",
+    "AttributeInterner": ".xml.deserialization.interning",
+    "Projection": ".xml.deserialization.projection",
+    "PolicyValue": ".xml.policy",
+    "DeserializationPolicy": ".xml.policy",
+    "SerializationPolicy": ".xml.policy",
+    "TmxValidator": ".xml.validation",
+    "Violation": ".xml.validation",
+    "validate": ".xml.validation",
+    "Diagnostic": ".xml.diagnostics",
+    "Diagnostics": ".xml.diagnostics",
+    "AtomicWriter": ".xml.output",
+    "MetricsSink": ".xml.progress",
+    "Progress": ".xml.progress",
+    "ProgressReporter": ".xml.progress",
+    "load": ".api.core",
+    "save": ".api.core",
+    "save_stream": ".api.core",
+    "append": ".api.incremental",
+    "update": ".api.incremental",
+    "recover": ".api.incremental",
+    "iter_bilingual": ".api.extract",
+    "extract_bilingual": ".api.extract",
+    "Pipeline": ".api.pipeline",
+    "StageStats": ".api.pipeline",
+    "LanguageStats": ".api.analysis",
+    "TmxStats": ".api.analysis",
+    "stats": ".api.analysis",
+    "DuplicateCluster": ".api.dedup",
+    "DuplicateFinder": ".api.dedup",
+    "default_normalizer": ".api.dedup",
+    "find_duplicates": ".api.dedup",
+    "remove_duplicates": ".api.dedup",
+    "TextMode": ".api.text",
+    "TextProjector": ".api.text",
+    "default_placeholder": ".api.text",
+    "to_text": ".api.text",
+    "create_tmx": ".api.helpers",
+    "create_header": ".api.helpers",
+    "create_tu": ".api.helpers",
+    "create_tuv": ".api.helpers",
+    "create_note": ".api.helpers",
+    "create_prop": ".api.helpers",
+    "create_bpt": ".api.helpers",
+    "create_ept": ".api.helpers",
+    "create_it": ".api.helpers",
+    "create_ph": ".api.helpers",
+    "create_hi": ".api.helpers",
+    "create_sub": ".api.helpers",
+  },
+)
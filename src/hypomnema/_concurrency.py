@@ -0,0 +1,81 @@
+"""
+Ordered parallel map over a stream, on a pool of threads.
+
+Threads avoid the pickling cost of a process pool: the items and results
+are shared as-is between the producer and the workers. On free-threaded
+builds of Python the workers run truly in parallel; with the GIL they only
+overlap with the code that produces the items.
+"""
+
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+__all__ = ["ordered_map"]
+
+
+def ordered_map[T, R](
+  func: Callable[[T], R], items: Iterable[T], *, workers: int, max_pending: int | None = None
+) -> Generator[R]:
+  """
+  Apply ``func`` to every item on a pool of threads, yielding results in order.
+
+  Items are pulled from ``items`` in the calling thread and submitted to the
+  pool. At most ``max_pending`` items are submitted and not yet yielded at
+  any time, so memory stays bounded however long the stream is: an item is
+  only pulled once the item ``max_pending`` positions before it has been
+  yielded.
+
+  Parameters
+  ----------
+  func : Callable[[T], R]
+      The function to apply. It is called concurrently from several threads
+      and must be thread-safe.
+  items : Iterable[T]
+      The items to process, consumed lazily.
+  workers : int
+      The number of worker threads.
+  max_pending : int | None, optional
+      The maximum number of items in flight. Defaults to twice ``workers``.
+
+  Yields
+  ------
+  R
+      ``func(item)`` for every item, in the order of ``items``.
+
+  Raises
+  ------
+  ValueError
+      If ``workers`` or ``max_pending`` is lower than 1.
+  Exception
+      Any exception raised by ``func`` is re-raised when its result is due.
+      Items submitted after it are cancelled or discarded.
+
+  Examples
+  --------
+  >>> for chunk in ordered_map(deserializer.deserialize_many, batched(elements, 256), workers=4):
+  >>>     ...
+  """
+  if workers < 1:
+    raise ValueError(f"workers must be at least 1, got {workers}")
+  if max_pending is None:
+    max_pending = 2 * workers
+  elif max_pending < 1:
+    raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+  return _ordered_map(func, items, workers, max_pending)
+
+
+def _ordered_map[T, R](
+  func: Callable[[T], R], items: Iterable[T], workers: int, max_pending: int
+) -> Generator[R]:
+  pending: deque[Future[R]] = deque()
+  executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hypomnema")
+  try:
+    for item in items:
+      pending.append(executor.submit(func, item))
+      if len(pending) >= max_pending:
+        yield pending.popleft().result()
+    while pending:
+      yield pending.popleft().result()
+  finally:
+    executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,56 @@
+"""
+Lazy attribute loading for package ``__init__`` modules.
+
+Packages re-export many names from their submodules. Importing all of them
+eagerly means that ``import hypomnema`` pulls in both XML backends (and
+``lxml``), every handler and the whole public API, even when a short-lived
+program only needs one of them. Packages instead declare which submodule
+provides each name, and the submodule is only imported the first time one
+of its names is accessed (see PEP 562).
+"""
+
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from typing import Any
+
+__all__ = ["lazy_attributes"]
+
+
+def lazy_attributes(
+  package: str, attributes: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+  """
+  Build the module-level ``__getattr__`` and ``__dir__`` of a package.
+
+  Parameters
+  ----------
+  package : str
+      The ``__name__`` of the package.
+  attributes : Mapping[str, str]
+      Maps each lazily loaded name to the module that defines it, relative to
+      ``package`` (e.g. ``".backends.lxml"``).
+
+  Returns
+  -------
+  tuple[Callable[[str], Any], Callable[[], list[str]]]
+      The ``__getattr__`` and ``__dir__`` functions to assign in the package.
+      Once loaded, a name is stored in the package's namespace, so
+      ``__getattr__`` is only called on first access.
+
+  Examples
+  --------
+  >>> __getattr__, __dir__ = lazy_attributes(__name__, {"Serializer": ".serialization"})
+  """
+  namespace = import_module(package).__dict__
+
+  def __getattr__(name: str) -> Any:
+    if (module := attributes.get(name)) is None:
+      raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    value = getattr(import_module(module, package), name)
+    namespace[name] = value
+    return value
+
+  def __dir__() -> list[str]:
+    return sorted(namespace.keys() | attributes.keys())
+
+  return __getattr__, __dir__
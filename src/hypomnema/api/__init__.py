@@ -1,23 +1,65 @@
-from hypomnema.api.core import load, save
-from hypomnema.api.helpers import (
-  create_tmx,
-  create_header,
-  create_tu,
-  create_tuv,
-  create_note,
-  create_prop,
-  create_bpt,
-  create_ept,
-  create_it,
-  create_ph,
-  create_hi,
-  create_sub,
-)
+from typing import TYPE_CHECKING
+
+from hypomnema._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+  from hypomnema.api.core import load, save, save_stream
+  from hypomnema.api.incremental import append, update, recover
+  from hypomnema.api.extract import iter_bilingual, extract_bilingual
+  from hypomnema.api.pipeline import Pipeline, StageStats
+  from hypomnema.api.analysis import LanguageStats, TmxStats, stats
+  from hypomnema.api.dedup import (
+    DuplicateCluster,
+    DuplicateFinder,
+    default_normalizer,
+    find_duplicates,
+    remove_duplicates,
+  )
+  from hypomnema.api.text import TextMode, TextProjector, default_placeholder, to_text
+  from hypomnema.api.helpers import (
+    create_tmx,
+    create_header,
+    create_tu,
+    create_tuv,
+    create_note,
+    create_prop,
+    create_bpt,
+    create_ept,
+    create_it,
+    create_ph,
+    create_hi,
+    create_sub,
+  )
 
 __all__ = [
   # Core I/O
   "load",
   "save",
+  "save_stream",
+  "append",
+  "update",
+  "recover",
+  # Extraction
+  "iter_bilingual",
+  "extract_bilingual",
+  # Pipelines
+  "Pipeline",
+  "StageStats",
+  # Statistics
+  "LanguageStats",
+  "TmxStats",
+  "stats",
+  # Deduplication
+  "DuplicateCluster",
+  "DuplicateFinder",
+  "default_normalizer",
+  "find_duplicates",
+  "remove_duplicates",
+  # Text projection
+  "TextMode",
+  "TextProjector",
+  "default_placeholder",
+  "to_text",
   # Element helpers
   "create_tmx",
   "create_header",
@@ -32,3 +74,43 @@ __all__ = [
   "create_hi",
   "create_sub",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+  __name__,
+  {
+    "load": ".core",
+    "save": ".core",
+    "save_stream": ".core",
+    "append": ".incremental",
+    "update": ".incremental",
+    "recover": ".incremental",
+    "iter_bilingual": ".extract",
+    "extract_bilingual": ".extract",
+    "Pipeline": ".pipeline",
+    "StageStats": ".pipeline",
+    "LanguageStats": ".analysis",
+    "TmxStats": ".analysis",
+    "stats": ".analysis",
+    "DuplicateCluster": ".dedup",
+    "DuplicateFinder": ".dedup",
+    "default_normalizer": ".dedup",
+    "find_duplicates": ".dedup",
+    "remove_duplicates": ".dedup",
+    "TextMode": ".text",
+    "TextProjector": ".text",
+    "default_placeholder": ".text",
+    "to_text": ".text",
+    "create_tmx": ".helpers",
+    "create_header": ".helpers",
+    "create_tu": ".helpers",
+    "create_tuv": ".helpers",
+    "create_note": ".helpers",
+    "create_prop": ".helpers",
+    "create_bpt": ".helpers",
+    "create_ept": ".helpers",
+    "create_it": ".helpers",
+    "create_ph": ".helpers",
+    "create_hi": ".helpers",
+    "create_sub": ".helpers",
+  },
+)
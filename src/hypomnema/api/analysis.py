@@ -0,0 +1,350 @@
+"""
+File statistics computed in a single streaming pass.
+
+The file is fed to ``xml.parsers.expat`` and the counters are updated from
+the parser's events: no element tree and no TMX object is ever built, so
+the cost is close to the raw parse speed and memory does not depend on the
+size of the file. Several files can be processed in parallel, each in its
+own process, and their statistics merged.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import repeat
+from os import PathLike
+from pathlib import Path
+from typing import Any
+from xml.parsers import expat
+
+from hypomnema.base.errors import XmlDeserializationError
+from hypomnema.base.languages import normalize_language_tag
+from hypomnema.xml.utils import make_usable_path, parse_datetime
+
+__all__ = ["LanguageStats", "TmxStats", "stats"]
+
+# Inline codes, whose content is native code rather than text
+_CODES = frozenset({"bpt", "ept", "it", "ph", "ut"})
+
+
+@dataclass(slots=True)
+class LanguageStats:
+  """
+  Statistics of the variants in one language.
+
+  Attributes
+  ----------
+  tuvs : int
+      Number of `<tuv>` elements.
+  words : int
+      Number of whitespace-separated words in the text of their segments.
+  characters : int
+      Number of characters in the text of their segments, spaces included.
+  inline_tags : int
+      Number of inline elements (`<bpt>`, `<ept>`, `<it>`, `<ph>`, `<hi>`,
+      `<sub>` and `<ut>`) in their segments.
+
+  Notes
+  -----
+  The text of a segment excludes the native code of `<bpt>`, `<ept>`,
+  `<it>`, `<ph>` and `<ut>` elements, as ``to_text`` does in "strip" mode.
+  """
+
+  tuvs: int = 0
+  words: int = 0
+  characters: int = 0
+  inline_tags: int = 0
+
+  @property
+  def inline_density(self) -> float:
+    """Average number of inline elements per `<tuv>`."""
+    return self.inline_tags / self.tuvs if self.tuvs else 0.0
+
+  def merge(self, other: LanguageStats) -> None:
+    """Add the counts of ``other`` to this one."""
+    self.tuvs += other.tuvs
+    self.words += other.words
+    self.characters += other.characters
+    self.inline_tags += other.inline_tags
+
+
+def _earliest(a: datetime | None, b: datetime | None) -> datetime | None:
+  return b if a is None else a if b is None else min(a, b)
+
+
+def _latest(a: datetime | None, b: datetime | None) -> datetime | None:
+  return b if a is None else a if b is None else max(a, b)
+
+
+@dataclass(slots=True)
+class TmxStats:
+  """
+  Statistics of one or more TMX files.
+
+  Attributes
+  ----------
+  files : int
+      Number of files the statistics cover.
+  tus : int
+      Number of `<tu>` elements.
+  tuvs : int
+      Number of `<tuv>` elements.
+  languages : dict[str, LanguageStats]
+      Statistics per language, keyed by normalized language tag (see
+      ``normalize_language_tag``). Variants without ``xml:lang`` are counted
+      under ``""``.
+  props : Counter[str]
+      Number of `<prop>` elements per ``type``, wherever they appear.
+  first_created, last_created : datetime | None
+      Range of the ``creationdate`` of `<tu>` and `<tuv>` elements.
+  first_changed, last_changed : datetime | None
+      Range of the ``changedate`` of `<tu>` and `<tuv>` elements.
+
+  Notes
+  -----
+  Dates that are not valid ISO 8601 are ignored, and dates without a time
+  zone are taken to be UTC, like the ``Z`` suffix TMX prescribes.
+  """
+
+  files: int = 0
+  tus: int = 0
+  tuvs: int = 0
+  languages: dict[str, LanguageStats] = field(default_factory=dict)
+  props: Counter[str] = field(default_factory=Counter)
+  first_created: datetime | None = None
+  last_created: datetime | None = None
+  first_changed: datetime | None = None
+  last_changed: datetime | None = None
+
+  def merge(self, other: TmxStats) -> None:
+    """Add the statistics of ``other`` to this one."""
+    self.files += other.files
+    self.tus += other.tus
+    self.tuvs += other.tuvs
+    for lang, language in other.languages.items():
+      self.languages.setdefault(lang, LanguageStats()).merge(language)
+    self.props.update(other.props)
+    self.first_created = _earliest(self.first_created, other.first_created)
+    self.last_created = _latest(self.last_created, other.last_created)
+    self.first_changed = _earliest(self.first_changed, other.first_changed)
+    self.last_changed = _latest(self.last_changed, other.last_changed)
+
+  def as_dict(self) -> dict[str, Any]:
+    """
+    Convert the statistics to JSON-compatible types.
+
+    Returns
+    -------
+    dict[str, Any]
+        The attributes, with dates as ISO 8601 strings and the inline
+        density of every language.
+    """
+    return {
+      "files": self.files,
+      "tus": self.tus,
+      "tuvs": self.tuvs,
+      "languages": {
+        lang: {
+          "tuvs": language.tuvs,
+          "words": language.words,
+          "characters": language.characters,
+          "inline_tags": language.inline_tags,
+          "inline_density": language.inline_density,
+        }
+        for lang, language in sorted(self.languages.items())
+      },
+      "props": dict(self.props.most_common()),
+      **{
+        name: value.isoformat() if value is not None else None
+        for name, value in (
+          ("first_created", self.first_created),
+          ("last_created", self.last_created),
+          ("first_changed", self.first_changed),
+          ("last_changed", self.last_changed),
+        )
+      },
+    }
+
+
+class _Collector:
+  """Expat event handlers updating a ``TmxStats``."""
+
+  __slots__ = ("result", "languages", "language", "in_seg", "skip_depth", "parts", "tags")
+
+  def __init__(self) -> None:
+    self.result = TmxStats(files=1)
+    # Keyed by raw xml:lang, normalized once at the end
+    self.languages: dict[str, LanguageStats] = {}
+    self.language: LanguageStats | None = None
+    self.in_seg = False
+    self.skip_depth = 0
+    self.parts: list[str] = []
+    self.tags = 0
+
+  def dates(self, attributes: dict[str, str]) -> None:
+    result = self.result
+    if (value := attributes.get("creationdate")) is not None and (date := _date(value)):
+      result.first_created = _earliest(result.first_created, date)
+      result.last_created = _latest(result.last_created, date)
+    if (value := attributes.get("changedate")) is not None and (date := _date(value)):
+      result.first_changed = _earliest(result.first_changed, date)
+      result.last_changed = _latest(result.last_changed, date)
+
+  def start(self, tag: str, attributes: dict[str, str]) -> None:
+    if self.in_seg:
+      self.tags += 1
+      if tag in _CODES or self.skip_depth:
+        self.skip_depth += 1
+      return
+    match tag:
+      case "tu":
+        self.result.tus += 1
+        self.dates(attributes)
+      case "tuv":
+        self.result.tuvs += 1
+        lang = attributes.get("xml:lang", attributes.get("lang", ""))
+        if (language := self.languages.get(lang)) is None:
+          language = self.languages[lang] = LanguageStats()
+        language.tuvs += 1
+        self.language = language
+        self.dates(attributes)
+      case "seg":
+        self.in_seg = True
+        self.tags = 0
+      case "prop":
+        self.result.props[attributes.get("type", "")] += 1
+
+  def end(self, tag: str) -> None:
+    if not self.in_seg:
+      if tag == "tuv":
+        self.language = None
+      return
+    if self.skip_depth:
+      self.skip_depth -= 1
+      return
+    if tag != "seg":
+      return
+    self.in_seg = False
+    if (language := self.language) is not None:
+      text = "".join(self.parts)
+      language.words += len(text.split())
+      language.characters += len(text)
+      language.inline_tags += self.tags
+    self.parts.clear()
+
+  def characters(self, data: str) -> None:
+    if self.in_seg and not self.skip_depth:
+      self.parts.append(data)
+
+  def finish(self) -> TmxStats:
+    result = self.result
+    for lang, language in self.languages.items():
+      key = normalize_language_tag(lang) if lang else ""
+      result.languages.setdefault(key, LanguageStats()).merge(language)
+    return result
+
+
+def _date(value: str) -> datetime | None:
+  try:
+    date = parse_datetime(value)
+  except ValueError:
+    return None
+  return date if date.tzinfo is not None else date.replace(tzinfo=UTC)
+
+
+def _file_stats(path: Path, encoding: str | None, buffer_size: int) -> TmxStats:
+  parser = expat.ParserCreate(encoding)
+  collector = _Collector()
+  parser.buffer_text = True
+  parser.StartElementHandler = collector.start
+  parser.EndElementHandler = collector.end
+  parser.CharacterDataHandler = collector.characters
+  with open(path, "rb") as file:
+    try:
+      while data := file.read(buffer_size):
+        parser.Parse(data, False)
+      parser.Parse(b"", True)
+    except expat.ExpatError as e:
+      raise XmlDeserializationError(
+        f"Cannot parse {path}: {expat.ErrorString(e.code)} at line {e.lineno}, column {e.offset}"
+      ) from e
+  return collector.finish()
+
+
+def stats(
+  paths: PathLike | str | Iterable[PathLike | str],
+  *,
+  encoding: str | None = None,
+  jobs: int | None = None,
+  buffer_size: int = 65536,
+) -> TmxStats:
+  """
+  Compute the statistics of one or more TMX files.
+
+  Each file is streamed once through ``xml.parsers.expat``: translation
+  units, variants, words, characters, inline elements, props and date
+  ranges are all counted in the same pass, without building any object.
+
+  Parameters
+  ----------
+  paths : PathLike | str | Iterable[PathLike | str]
+      Path of a TMX file, or paths of several files whose statistics are
+      merged.
+  encoding : str | None, optional
+      Overrides the encoding declared in the files. Defaults to None (the
+      declared encoding, or UTF-8, is used).
+  jobs : int | None, optional
+      Number of worker processes. If greater than 1, the files are processed
+      in parallel, one per process, and the partial statistics merged. A
+      single file is always processed in the calling process. Defaults to
+      None (sequential).
+  buffer_size : int, optional
+      Number of bytes read from a file and fed to expat at a time. Defaults
+      to 65536.
+
+  Returns
+  -------
+  TmxStats
+      The statistics of all the files together.
+
+  Raises
+  ------
+  FileNotFoundError
+      If a file does not exist.
+  IsADirectoryError
+      If a path is a directory.
+  XmlDeserializationError
+      If a file is not well-formed XML.
+  ValueError
+      If ``jobs`` or ``buffer_size`` is lower than 1.
+
+  Examples
+  --------
+  >>> report = stats("vendor.tmx")
+  >>> report.tus, report.languages["fr-FR"].words
+  >>> total = stats(Path("deliveries").glob("*.tmx"), jobs=4)
+  """
+  if jobs is not None and jobs < 1:
+    raise ValueError(f"jobs must be at least 1, got {jobs}")
+  if buffer_size < 1:
+    raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+  if isinstance(paths, (str, PathLike)):
+    paths = [paths]
+  _paths = [make_usable_path(path, mkdir=False) for path in paths]
+  for path in _paths:
+    if not path.exists():
+      raise FileNotFoundError(f"File {path} does not exist")
+    if not path.is_file():
+      raise IsADirectoryError(f"Path {path} is a directory")
+
+  result = TmxStats()
+  if jobs is None or jobs == 1 or len(_paths) < 2:
+    for path in _paths:
+      result.merge(_file_stats(path, encoding, buffer_size))
+    return result
+  with ProcessPoolExecutor(max_workers=min(jobs, len(_paths))) as executor:
+    for partial in executor.map(_file_stats, _paths, repeat(encoding), repeat(buffer_size)):
+      result.merge(partial)
+  return result
@@ -1,23 +1,33 @@
 from pathlib import Path
-from hypomnema.xml.utils import make_usable_path
+from hypomnema.xml.utils import make_usable_path, normalize_encoding
+from hypomnema._concurrency import ordered_map
 from logging import Logger, getLogger
-from hypomnema import (
-  Tmx,
-  BaseElement,
-  DeserializationPolicy,
-  XmlBackend,
-  StandardBackend,
-  Deserializer,
-  SerializationPolicy,
-  Serializer,
-  XmlSerializationError,
-  XmlDeserializationError,
-)
-from collections.abc import Collection, Generator
-from typing import overload
+from hypomnema.base.errors import XmlDeserializationError, XmlSerializationError
+from hypomnema.api.helpers import create_header
+from hypomnema.base.types import BaseElement, Header, Tmx, Tu
+from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.deserialization.deserializer import Deserializer
+from hypomnema.xml.deserialization.interning import AttributeInterner
+from hypomnema.xml.deserialization.projection import Projection
+from hypomnema.xml.diagnostics import Diagnostics
+from hypomnema.xml.output import DEFAULT_BUFFER_SIZE, FsyncPolicy
+from hypomnema.xml.policy import DeserializationPolicy, SerializationPolicy
+from hypomnema.xml.progress import ProgressReporter
+from hypomnema.xml.serialization.serializer import Serializer
+from contextlib import nullcontext
+from collections.abc import Collection, Generator, Iterable
+from itertools import batched
+from typing import Any, overload
 from os import PathLike
 
-__all__ = ["load", "save"]
+__all__ = ["load", "save", "save_stream"]
+
+# Number of elements handed to a worker at a time when ``workers`` is set
+_WORKER_CHUNK_SIZE = 256
+
+# Number of serialized TUs ``save_stream`` encodes and writes at a time
+_WRITE_CHUNK_SIZE = 1000
 
 
 @overload
@@ -29,6 +39,13 @@ def load(
   policy: DeserializationPolicy | None = None,
   backend: XmlBackend | None = None,
   logger: Logger | None = None,
+  interner: AttributeInterner | None = None,
+  lazy_content: bool = False,
+  projection: Projection | None = None,
+  chunk_size: int | None = None,
+  diagnostics: Diagnostics | None = None,
+  workers: int | None = None,
+  progress: ProgressReporter | None = None,
 ) -> Tmx: ...
 @overload
 def load(
@@ -39,6 +56,13 @@ def load(
   policy: DeserializationPolicy | None = None,
   backend: XmlBackend | None = None,
   logger: Logger | None = None,
+  interner: AttributeInterner | None = None,
+  lazy_content: bool = False,
+  projection: Projection | None = None,
+  chunk_size: int | None = None,
+  diagnostics: Diagnostics | None = None,
+  workers: int | None = None,
+  progress: ProgressReporter | None = None,
 ) -> Generator[BaseElement]: ...
 def load(
   path: PathLike | str,
@@ -48,6 +72,13 @@ def load(
   policy: DeserializationPolicy | None = None,
   backend: XmlBackend | None = None,
   logger: Logger | None = None,
+  interner: AttributeInterner | None = None,
+  lazy_content: bool = False,
+  projection: Projection | None = None,
+  chunk_size: int | None = None,
+  diagnostics: Diagnostics | None = None,
+  workers: int | None = None,
+  progress: ProgressReporter | None = None,
 ) -> Tmx | Generator[BaseElement]:
   """
   Load a TMX file from disk.
@@ -70,6 +101,47 @@ def load(
       XML backend to use. Defaults to StandardBackend (stdlib).
   logger : Logger | None
       Logger instance. Defaults to module logger.
+  interner : AttributeInterner | None
+      Pools used to share repeated attribute values (languages, tool names,
+      dates...) between the loaded objects to reduce memory usage.
+      Defaults to None (no interning).
+  lazy_content : bool
+      If True, the content of each `<seg>` is only deserialized the first time
+      ``Tuv.content`` is accessed, which makes metadata-only scans much faster.
+      Defaults to False.
+  projection : Projection | None
+      The parts of `<tu>` and `<tuv>` elements to deserialize (fields,
+      languages, props, notes, inline markup). Everything left out is skipped
+      while parsing. Defaults to None (everything is deserialized).
+  chunk_size : int | None
+      Only used when ``filter`` is provided. If set, elements are read from
+      ``iterparse`` in chunks of ``chunk_size`` and each chunk is deserialized
+      with a single ``Deserializer.deserialize_many`` call, which amortizes
+      the per-element dispatch overhead. Up to ``chunk_size`` parsed elements
+      are kept in memory at once. Defaults to None (elements are deserialized
+      one at a time).
+  diagnostics : Diagnostics | None
+      Sink every policy violation is reported to, with the tag, attribute,
+      ``tuid`` and (with the ``LxmlBackend``) line of the offending element.
+      Use it with a policy set to "collect" (see
+      ``DeserializationPolicy.collecting``) to get every problem of a file
+      in a single pass. Defaults to None (violations are only logged).
+  workers : int | None
+      Only used when ``filter`` is provided. If set, the file is parsed in
+      the calling thread and each element is detached from the tree (see
+      ``XmlBackend.detach``) as soon as it is parsed. Chunks of
+      ``chunk_size`` elements (256 if None) are then deserialized by a pool
+      of ``workers`` threads, and the results are yielded in document order.
+      At most ``2 * workers`` chunks are in flight at once. This scales with
+      the number of cores on free-threaded builds of Python; with the GIL,
+      it only overlaps parsing with deserialization. Custom handlers must be
+      thread-safe. Defaults to None (everything runs in the calling thread).
+  progress : ProgressReporter | None
+      Reporter the bytes read (the position in the file) and the loaded
+      elements are counted to, as the ``"load"`` operation, see
+      ``ProgressReporter``. With a ``filter``, elements are counted as they
+      are parsed; otherwise the file is parsed as a whole and the TUs are
+      counted once deserialized. Defaults to None.
 
   Returns
   -------
@@ -87,6 +159,8 @@ def load(
       If the file does not exist.
   IsADirectoryError
       If the path is a directory.
+  ValueError
+      If ``chunk_size`` or ``workers`` is lower than 1.
 
   Examples
   --------
@@ -100,20 +174,59 @@ def load(
   >>>         print(element.srclang)
   >>>     elif isinstance(element, Header):
   >>>         print(element.creationtool)
+  >>> projection = Projection(languages=["en", "fr"], inline_markup=False)
+  >>> for tu in load("large.tmx", filter="tu", projection=projection):
+  >>>     print([tuv.content for tuv in tu.variants])
+  >>> for tu in load("large.tmx", filter="tu", chunk_size=1000):
+  >>>     print(tu.tuid)
+  >>> for tu in load("large.tmx", filter="tu", workers=8):
+  >>>     print(tu.tuid)
+  >>> diagnostics = Diagnostics()
+  >>> tmx = load("vendor.tmx", policy=DeserializationPolicy.collecting(), diagnostics=diagnostics)
+  >>> print(diagnostics.counts())
+  >>> reporter = ProgressReporter(lambda p: print(f"{p.fraction:.0%}"), interval=10)
+  >>> tmx = load("huge.tmx", progress=reporter)
   """
+  # progress is only passed when set, so that backends implementing the
+  # former parse and iterparse signatures keep working without it
+  options: dict[str, Any] = {"progress": progress} if progress is not None else {}
 
   def _load_filtered(
     _backend: XmlBackend, _path: Path, _filter: str | Collection[str], _deserializer: Deserializer
   ) -> Generator[BaseElement]:
     """Internal generator for filtered loading."""
-    for element in _backend.iterparse(_path, tag_filter=_filter):
-      yield _deserializer.deserialize(element)
+    with progress.track("load") if progress is not None else nullcontext():
+      if workers is not None:
+        elements = map(_backend.detach, _backend.iterparse(_path, tag_filter=_filter, **options))
+        chunks = batched(elements, chunk_size if chunk_size is not None else _WORKER_CHUNK_SIZE)
+        for results in ordered_map(_deserializer.deserialize_many, chunks, workers=workers):
+          yield from results
+        return
+      if chunk_size is None:
+        for element in _backend.iterparse(_path, tag_filter=_filter, **options):
+          yield _deserializer.deserialize(element)
+        return
+      elements = _backend.iterparse(_path, tag_filter=_filter, keep_yielded=chunk_size, **options)
+      for chunk in batched(elements, chunk_size):
+        yield from _deserializer.deserialize_many(chunk)
 
+  if chunk_size is not None and chunk_size < 1:
+    raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+  if workers is not None and workers < 1:
+    raise ValueError(f"workers must be at least 1, got {workers}")
   _backend = backend if backend is not None else StandardBackend(logger=logger)
   _logger = logger if logger is not None else getLogger("hypomnema.api.load")
   _policy = policy if policy is not None else DeserializationPolicy()
 
-  _deserializer = Deserializer(_backend, policy=_policy, logger=_logger)
+  _deserializer = Deserializer(
+    _backend,
+    policy=_policy,
+    logger=_logger,
+    interner=interner,
+    lazy_content=lazy_content,
+    projection=projection,
+    diagnostics=diagnostics,
+  )
 
   _path = make_usable_path(path, mkdir=False)
   if not _path.exists():
@@ -123,12 +236,15 @@ def load(
 
   if filter is not None:
     return _load_filtered(_backend, _path, filter, _deserializer)
-  root = _backend.parse(_path, encoding=encoding)
-  if _backend.get_tag(root, as_qname=True).local_name != "tmx":
-    raise XmlDeserializationError("Root element is not a tmx")
-  tmx = _deserializer.deserialize(root)
-  if not isinstance(tmx, Tmx):
-    raise XmlDeserializationError(f"root element did not deserialize to a Tmx: {type(tmx)}")
+  with progress.track("load") if progress is not None else nullcontext():
+    root = _backend.parse(_path, encoding=encoding, **options)
+    if _backend.get_tag(root, as_qname=True).local_name != "tmx":
+      raise XmlDeserializationError("Root element is not a tmx")
+    tmx = _deserializer.deserialize(root)
+    if not isinstance(tmx, Tmx):
+      raise XmlDeserializationError(f"root element did not deserialize to a Tmx: {type(tmx)}")
+    if progress is not None:
+      progress.add_elements(len(tmx.body))
   return tmx
 
 
@@ -140,10 +256,15 @@ def save(
   policy: SerializationPolicy | None = None,
   backend: XmlBackend | None = None,
   logger: Logger | None = None,
+  fsync: FsyncPolicy = "none",
+  progress: ProgressReporter | None = None,
 ) -> None:
   """
   Save a TMX object to disk.
 
+  The file is replaced atomically: it is written to a temporary file first,
+  so an interrupted save leaves the previous file intact.
+
   Parameters
   ----------
   tmx : Tmx
@@ -158,6 +279,14 @@ def save(
       XML backend to use. Defaults to StandardBackend (stdlib).
   logger : Logger | None
       Logger instance. Defaults to module logger.
+  fsync : {"none", "file", "full"}
+      Durability policy, see ``AtomicWriter``. ``"file"`` syncs the data
+      before the file is replaced, ``"full"`` also syncs its directory.
+      Defaults to "none".
+  progress : ProgressReporter | None
+      Reporter the bytes written and the saved TUs are counted to, as the
+      ``"save"`` operation, see ``ProgressReporter``. The TUs are counted
+      once the file is written. Defaults to None.
 
   Raises
   ------
@@ -170,6 +299,7 @@ def save(
   --------
   >>> save(tmx, "output.tmx")
   >>> save(tmx, "output.tmx", encoding="utf-16")
+  >>> save(tmx, "output.tmx", fsync="full")
   >>> from hypomnema import LxmlBackend
   >>> save(tmx, "output.tmx", backend=LxmlBackend())
   """
@@ -183,7 +313,111 @@ def save(
 
   if not isinstance(tmx, Tmx):
     raise TypeError(f"Root element is not a Tmx: {type(tmx)}")
-  xml_element = _serializer.serialize(tmx)
-  if xml_element is None:
-    raise XmlSerializationError("serializer returned None")
-  _backend.write(xml_element, _path, encoding=encoding)
+  with progress.track("save") if progress is not None else nullcontext():
+    xml_element = _serializer.serialize(tmx)
+    if xml_element is None:
+      raise XmlSerializationError("serializer returned None")
+    # fsync and progress are only passed when set, so that backends
+    # implementing the former write(element, path, encoding) keep working
+    options: dict[str, Any] = {"progress": progress} if progress is not None else {}
+    if fsync != "none":
+      options["fsync"] = fsync
+    _backend.write(xml_element, _path, encoding=encoding, **options)
+    if progress is not None:
+      progress.add_elements(len(tmx.body))
+
+
+def save_stream(
+  tus: Iterable[Tu],
+  path: PathLike | str,
+  *,
+  header: Header | None = None,
+  encoding: str = "utf-8",
+  policy: SerializationPolicy | None = None,
+  backend: XmlBackend | None = None,
+  logger: Logger | None = None,
+  fsync: FsyncPolicy = "none",
+  buffer_size: int = DEFAULT_BUFFER_SIZE,
+  progress: ProgressReporter | None = None,
+) -> int:
+  """
+  Stream translation units to a TMX file.
+
+  The streaming counterpart of ``save``: TUs are serialized and written one
+  at a time as they are pulled from ``tus``, so memory does not depend on
+  their number. Like ``save``, the file is replaced atomically once every
+  TU has been written.
+
+  Parameters
+  ----------
+  tus : Iterable[Tu]
+      The TUs to write, e.g. the output of ``load(path, filter="tu")``.
+  path : PathLike | str
+      Destination path for the TMX file.
+  header : Header | None
+      The `<header>` to write. Defaults to an empty header (see
+      ``create_header``).
+  encoding : str
+      File encoding. Characters it cannot represent are written as
+      character references. Defaults to "utf-8".
+  policy : SerializationPolicy | None
+      Serialization policy. Defaults to standard policy.
+  backend : XmlBackend | None
+      XML backend to use. Defaults to StandardBackend (stdlib).
+  logger : Logger | None
+      Logger instance. Defaults to module logger.
+  fsync : {"none", "file", "full"}
+      Durability policy, see ``AtomicWriter``. Defaults to "none".
+  buffer_size : int
+      Size in bytes of the writes made to disk. Defaults to
+      ``DEFAULT_BUFFER_SIZE`` (1 MiB).
+  progress : ProgressReporter | None
+      Reporter the bytes and TUs written are counted to, as the
+      ``"save_stream"`` operation, see ``ProgressReporter``. Defaults to
+      None.
+
+  Returns
+  -------
+  int
+      The number of written TUs.
+
+  Raises
+  ------
+  XmlSerializationError
+      If the serialization of the header or of a TU returns None.
+  ValueError
+      If ``encoding`` is unknown or ``buffer_size`` is lower than 1.
+
+  Examples
+  --------
+  >>> tus = load("large.tmx", filter="tu")
+  >>> save_stream((tu for tu in tus if len(tu.variants) > 1), "multilingual.tmx")
+  >>> save_stream(tus, "output.tmx", header=header, encoding="utf-16")
+  """
+  _backend = backend if backend is not None else StandardBackend(logger=logger)
+  _logger = logger if logger is not None else getLogger("hypomnema.api.save_stream")
+  _policy = policy if policy is not None else SerializationPolicy()
+  _serializer = Serializer(_backend, policy=_policy, logger=_logger)
+  _encoding = normalize_encoding(encoding)
+  _path = make_usable_path(path, mkdir=True)
+
+  def _serialize(obj: Header | Tu) -> str:
+    element = _serializer.serialize(obj)
+    if element is None:
+      raise XmlSerializationError(f"serializer returned None for {type(obj).__name__}")
+    return _backend.to_string(element)
+
+  prefix = _serialize(header if header is not None else create_header()) + "<body>"
+  tracking = progress.track("save_stream") if progress is not None else nullcontext()
+  with tracking:
+    return _backend.write_strings(
+      _path,
+      map(_serialize, tus),
+      _encoding,
+      prefix=prefix,
+      suffix="</body>",
+      max_number_of_strings_in_buffer=_WRITE_CHUNK_SIZE,
+      buffer_size=buffer_size,
+      fsync=fsync,
+      progress=progress,
+    )
@@ -0,0 +1,517 @@
+"""
+Detection of duplicate and near-duplicate translation units.
+
+Segments are compared on the plain text of one language, after a
+normalization that ignores punctuation and whitespace. Exact duplicates of
+the normalized text are grouped directly. The remaining segments are
+compared with MinHash signatures bucketed by locality-sensitive hashing
+(LSH), so that each segment is only compared with a handful of candidates
+and a whole file is processed in roughly linear time.
+"""
+
+import re
+from array import array
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from hashlib import blake2b
+from itertools import count, repeat
+from logging import Logger
+from operator import eq
+from random import Random
+from os import PathLike
+from zlib import crc32
+
+from hypomnema.api.core import load
+from hypomnema.api.pipeline import Pipeline
+from hypomnema.api.text import to_text
+from hypomnema.base.languages import language_matches
+from hypomnema.base.types import Tu
+from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.deserialization.projection import Projection
+from hypomnema.xml.policy import DeserializationPolicy, SerializationPolicy
+
+__all__ = [
+  "default_normalizer",
+  "DuplicateCluster",
+  "DuplicateFinder",
+  "find_duplicates",
+  "remove_duplicates",
+]
+
+_NOT_WORDS = re.compile(r"[\W_]+")
+_MASK = (1 << 64) - 1
+# Odd 64-bit constant used to spread the 32-bit shingle hashes
+_MIX = 0x9E3779B97F4A7C15
+_EMPTY = _MASK
+
+
+def default_normalizer(text: str) -> str:
+  """
+  Default normalization of segment text before comparison.
+
+  Punctuation, symbols and runs of whitespace are replaced by single spaces,
+  so that ``"Click  here!"`` and ``"Click here."`` compare equal. Case and
+  digits are kept.
+
+  Parameters
+  ----------
+  text : str
+      The plain text of a segment.
+
+  Returns
+  -------
+  str
+      The words of ``text`` separated by single spaces.
+  """
+  return _NOT_WORDS.sub(" ", text).strip()
+
+
+def _lsh_shape(threshold: float, num_perm: int) -> tuple[int, int]:
+  """
+  Split ``num_perm`` signature values into ``bands`` of ``rows`` values.
+
+  Two segments become candidates when all the rows of one band are equal,
+  which happens with a probability that rises steeply around
+  ``(1 / bands) ** (1 / rows)``. The shape whose rise is closest below
+  ``threshold`` is picked, favoring recall: false candidates are discarded
+  when their signatures are compared.
+  """
+  best = (num_perm, 1)
+  best_distance = float("inf")
+  for rows in range(1, num_perm + 1):
+    bands = num_perm // rows
+    rise = (1 / bands) ** (1 / rows)
+    if rise <= threshold and threshold - rise < best_distance:
+      best, best_distance = (bands, rows), threshold - rise
+  return best
+
+
+@dataclass(slots=True, frozen=True)
+class DuplicateCluster:
+  """
+  A group of translation units with the same or near-identical text.
+
+  Attributes
+  ----------
+  positions : list[int]
+      0-based positions of the units among the `<tu>` elements of the file,
+      in document order.
+  tuids : list[str | None]
+      The ``tuid`` of each unit, in the same order as ``positions``.
+  """
+
+  positions: list[int]
+  tuids: list[str | None]
+
+
+class DuplicateFinder:
+  """
+  Streaming index of translation units that finds near-duplicate clusters.
+
+  Units are added one by one with ``add``. Each is reduced to the normalized
+  plain text of its first variant in ``lang``, then:
+
+  - Units whose normalized text was already seen join the cluster of the
+    first unit with that text.
+  - Otherwise a MinHash signature of the character shingles of the text is
+    computed and split into LSH bands. The unit is compared with the first
+    unit seen in each of its bands, and joins its cluster if their estimated
+    Jaccard similarity reaches ``threshold``.
+
+  Signatures use one-permutation hashing: every shingle is hashed once and
+  lands in one of ``num_perm`` bins, keeping the minimum of each bin, and
+  empty bins copy another bin chosen by a fixed pseudo-random sequence.
+  The cost per unit is one pass over its text, whatever ``num_perm`` is.
+  Memory grows by about ``8 * num_perm`` bytes per distinct text.
+
+  Parameters
+  ----------
+  lang : str
+      Language of the variants to compare.
+  threshold : float, optional
+      Minimum estimated Jaccard similarity between the shingle sets of two
+      texts for them to be near-duplicates, in ``(0, 1]``. With 1, only
+      identical normalized texts are grouped. Defaults to 0.8.
+  exact : bool, optional
+      If True, ``xml:lang`` must be equal to ``lang``. If False (default),
+      ``lang`` is a BCP-47 language range (``"en"`` matches ``"en-US"``).
+  num_perm : int, optional
+      Number of values in each signature. More values give more accurate
+      similarity estimates. Defaults to 64.
+  shingle_size : int, optional
+      Number of characters in each shingle. Defaults to 4.
+  normalize : Callable[[str], str] | None, optional
+      Normalization applied to the text before comparison. Defaults to
+      ``default_normalizer``.
+
+  Raises
+  ------
+  ValueError
+      If ``threshold`` is not in ``(0, 1]``, or ``num_perm`` or
+      ``shingle_size`` is lower than 1.
+
+  Examples
+  --------
+  >>> finder = DuplicateFinder("en", threshold=0.9)
+  >>> for tu in load("memory.tmx", filter="tu"):
+  >>>     finder.add(tu)
+  >>> for cluster in finder.clusters():
+  >>>     print(cluster.tuids)
+
+  Notes
+  -----
+  Units without a variant in ``lang``, or whose normalized text is empty,
+  are counted (they keep their position) but never part of a cluster.
+  """
+
+  __slots__ = (
+    "lang",
+    "threshold",
+    "exact",
+    "num_perm",
+    "shingle_size",
+    "normalize",
+    "bands",
+    "rows",
+    "_tuids",
+    "_parents",
+    "_texts",
+    "_buckets",
+    "_signatures",
+    "_probes",
+  )
+  lang: str
+  threshold: float
+  exact: bool
+  num_perm: int
+  shingle_size: int
+  normalize: Callable[[str], str]
+  bands: int
+  rows: int
+  _tuids: list[str | None]
+  _parents: dict[int, int]
+  _texts: dict[bytes, int]
+  _buckets: list[dict[bytes, int]]
+  _signatures: dict[int, array]
+  _probes: tuple[tuple[int, ...], ...]
+
+  def __init__(
+    self,
+    lang: str,
+    *,
+    threshold: float = 0.8,
+    exact: bool = False,
+    num_perm: int = 64,
+    shingle_size: int = 4,
+    normalize: Callable[[str], str] | None = None,
+  ) -> None:
+    if not 0 < threshold <= 1:
+      raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+    if num_perm < 1:
+      raise ValueError(f"num_perm must be at least 1, got {num_perm}")
+    if shingle_size < 1:
+      raise ValueError(f"shingle_size must be at least 1, got {shingle_size}")
+    self.lang = lang
+    self.threshold = threshold
+    self.exact = exact
+    self.num_perm = num_perm
+    self.shingle_size = shingle_size
+    self.normalize = normalize if normalize is not None else default_normalizer
+    self.bands, self.rows = _lsh_shape(threshold, num_perm)
+    self._tuids = []
+    self._parents = {}
+    self._texts = {}
+    self._buckets = [{} for _ in range(self.bands)]
+    self._signatures = {}
+    # Seeded, so that signatures are reproducible from one run to the next
+    self._probes = tuple(
+      tuple(Random(i).sample(range(num_perm), num_perm)) for i in range(num_perm)
+    )
+
+  def __len__(self) -> int:
+    return len(self._tuids)
+
+  def _text(self, tu: Tu) -> str | None:
+    for tuv in tu.variants:
+      if tuv.lang == self.lang if self.exact else language_matches(tuv.lang, self.lang):
+        return self.normalize(to_text(tuv))
+    return None
+
+  def signature(self, text: str) -> array:
+    """
+    Compute the MinHash signature of a text.
+
+    Parameters
+    ----------
+    text : str
+        The text, already normalized.
+
+    Returns
+    -------
+    array
+        ``num_perm`` unsigned 64-bit values. The fraction of equal values in
+        the signatures of two texts estimates the Jaccard similarity of their
+        shingle sets.
+    """
+    k, size = self.num_perm, self.shingle_size
+    starts = range(max(len(text) - size + 1, 1))
+    if text.isascii():
+      data = text.encode("ascii")
+      hashes = map(crc32, {data[i : i + size] for i in starts})
+    else:
+      hashes = map(crc32, map(str.encode, {text[i : i + size] for i in starts}))
+    # Rather than comparing each hash with the minimum of its bin, hashes are
+    # mixed to 64 bits and sorted in decreasing order: the dict built from the
+    # (bin, hash) pairs then keeps the smallest hash of each bin
+    mixed = [(value * _MIX) & _MASK for value in hashes]
+    mixed.sort(reverse=True)
+    minima = dict(zip([(value >> 32) % k for value in mixed], mixed))
+    bins = list(map(minima.get, range(k), repeat(_EMPTY)))
+    if len(minima) < k:
+      # Optimal densification: an empty bin copies the first non-empty bin in
+      # its own probe order, which is the same for every text
+      for i, probes in enumerate(self._probes):
+        if bins[i] == _EMPTY:
+          bins[i] = next(minima[j] for j in probes if j in minima)
+    return array("Q", bins)
+
+  def _find(self, position: int) -> int:
+    parents = self._parents
+    while (parent := parents[position]) != position:
+      parents[position] = parent = parents[parent]
+      position = parent
+    return position
+
+  def _union(self, a: int, b: int) -> None:
+    root_a, root_b = self._find(a), self._find(b)
+    if root_a != root_b:
+      # The earliest unit is the root, so clusters are keyed by their first unit
+      self._parents[max(root_a, root_b)] = min(root_a, root_b)
+
+  def add(self, tu: Tu) -> int:
+    """
+    Add a translation unit to the index.
+
+    Parameters
+    ----------
+    tu : Tu
+        The unit. Only its ``tuid`` and variants in ``lang`` are used.
+
+    Returns
+    -------
+    int
+        The position of the unit, i.e. the number of units added before it.
+    """
+    position = len(self._tuids)
+    self._tuids.append(tu.tuid)
+    text = self._text(tu)
+    if not text:
+      return position
+    self._parents[position] = position
+    key = blake2b(text.encode("utf-8"), digest_size=16).digest()
+    if (first := self._texts.get(key)) is not None:
+      self._union(position, first)
+      return position
+    self._texts[key] = position
+    if self.threshold == 1:
+      return position
+
+    signature = self.signature(text)
+    needed = self.threshold * self.num_perm
+    anchor = False
+    for band, bucket in enumerate(self._buckets):
+      band_key = signature[band * self.rows : (band + 1) * self.rows].tobytes()
+      other = bucket.get(band_key)
+      if other is None:
+        bucket[band_key] = position
+        anchor = True
+      elif sum(map(eq, signature, self._signatures[other])) >= needed:
+        self._union(position, other)
+    if anchor:
+      # Only units first in a bucket are ever compared with later units
+      self._signatures[position] = signature
+    return position
+
+  def add_many(self, tus: Iterable[Tu]) -> None:
+    """Add every unit of ``tus``, in order."""
+    for tu in tus:
+      self.add(tu)
+
+  def clusters(self) -> list[DuplicateCluster]:
+    """
+    Return the clusters of duplicates found so far.
+
+    Returns
+    -------
+    list[DuplicateCluster]
+        Every group of two or more units, ordered by the position of their
+        first unit.
+    """
+    groups: dict[int, list[int]] = {}
+    for position in self._parents:
+      groups.setdefault(self._find(position), []).append(position)
+    return [
+      DuplicateCluster(positions, [self._tuids[position] for position in positions])
+      for _, positions in sorted(groups.items())
+      if len(positions) > 1
+    ]
+
+
+def find_duplicates(
+  path: PathLike | str,
+  lang: str,
+  *,
+  threshold: float = 0.8,
+  exact: bool = False,
+  num_perm: int = 64,
+  shingle_size: int = 4,
+  normalize: Callable[[str], str] | None = None,
+  encoding: str = "utf-8",
+  policy: DeserializationPolicy | None = None,
+  backend: XmlBackend | None = None,
+  logger: Logger | None = None,
+) -> list[DuplicateCluster]:
+  """
+  Find the clusters of duplicate and near-duplicate units of a TMX file.
+
+  The file is streamed, and only the ``tuid`` and the plain text of the
+  variants in ``lang`` are deserialized. See ``DuplicateFinder`` for the
+  comparison itself.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path to the TMX file.
+  lang : str
+      Language of the variants to compare.
+  threshold, exact, num_perm, shingle_size, normalize
+      See ``DuplicateFinder``.
+  encoding : str, optional
+      File encoding. Defaults to "utf-8".
+  policy : DeserializationPolicy | None, optional
+      Deserialization policy. Defaults to standard policy.
+  backend : XmlBackend | None, optional
+      XML backend to use. Defaults to StandardBackend (stdlib).
+  logger : Logger | None, optional
+      Logger instance. Defaults to module logger.
+
+  Returns
+  -------
+  list[DuplicateCluster]
+      Every group of two or more units, ordered by the position of their
+      first unit.
+
+  Examples
+  --------
+  >>> for cluster in find_duplicates("vendor.tmx", "en", threshold=0.9):
+  >>>     print(cluster.tuids)
+  """
+  finder = DuplicateFinder(
+    lang,
+    threshold=threshold,
+    exact=exact,
+    num_perm=num_perm,
+    shingle_size=shingle_size,
+    normalize=normalize,
+  )
+  projection = Projection(
+    tu_fields=["tuid"],
+    tuv_fields=["content"],
+    languages=[lang],
+    language_matching="exact" if exact else "basic",
+    props=False,
+    notes=False,
+    inline_markup=False,
+  )
+  finder.add_many(
+    load(
+      path,
+      encoding=encoding,
+      policy=policy,
+      backend=backend,
+      logger=logger,
+      filter="tu",
+      projection=projection,
+    )
+  )
+  return finder.clusters()
+
+
+def remove_duplicates(
+  path: PathLike | str,
+  output: PathLike | str,
+  lang: str,
+  *,
+  threshold: float = 0.8,
+  exact: bool = False,
+  num_perm: int = 64,
+  shingle_size: int = 4,
+  normalize: Callable[[str], str] | None = None,
+  encoding: str = "utf-8",
+  policy: DeserializationPolicy | None = None,
+  serialization_policy: SerializationPolicy | None = None,
+  backend: XmlBackend | None = None,
+  logger: Logger | None = None,
+) -> list[DuplicateCluster]:
+  """
+  Copy a TMX file, keeping only the first unit of each duplicate cluster.
+
+  The file is streamed twice: once to find the clusters with
+  ``find_duplicates``, once to write every unit that is not a later member
+  of a cluster, through a ``Pipeline``.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path to the TMX file.
+  output : PathLike | str
+      Path of the deduplicated file. It must differ from ``path``.
+  lang : str
+      Language of the variants to compare.
+  threshold, exact, num_perm, shingle_size, normalize
+      See ``DuplicateFinder``.
+  encoding : str, optional
+      Encoding of both files. Defaults to "utf-8".
+  policy : DeserializationPolicy | None, optional
+      Deserialization policy. Defaults to standard policy.
+  serialization_policy : SerializationPolicy | None, optional
+      Serialization policy of the output. Defaults to standard policy.
+  backend : XmlBackend | None, optional
+      XML backend to use. Defaults to StandardBackend (stdlib).
+  logger : Logger | None, optional
+      Logger instance. Defaults to module logger.
+
+  Returns
+  -------
+  list[DuplicateCluster]
+      The clusters found. All units but the first of each were dropped.
+
+  Raises
+  ------
+  ValueError
+      If ``output`` is the same file as ``path``.
+
+  Examples
+  --------
+  >>> clusters = remove_duplicates("vendor.tmx", "clean.tmx", "en")
+  >>> print(sum(len(cluster.positions) - 1 for cluster in clusters), "units removed")
+  """
+  clusters = find_duplicates(
+    path,
+    lang,
+    threshold=threshold,
+    exact=exact,
+    num_perm=num_perm,
+    shingle_size=shingle_size,
+    normalize=normalize,
+    encoding=encoding,
+    policy=policy,
+    backend=backend,
+    logger=logger,
+  )
+  dropped = {position for cluster in clusters for position in cluster.positions[1:]}
+  positions = count()
+  Pipeline(path, encoding=encoding, policy=policy, backend=backend, logger=logger).filter(
+    lambda _: next(positions) not in dropped, name="remove-duplicates"
+  ).write(output, encoding=encoding, policy=serialization_policy)
+  return clusters
@@ -0,0 +1,289 @@
+from codecs import getincrementalencoder
+from collections.abc import Generator
+from logging import Logger, getLogger
+from os import PathLike
+from pathlib import Path
+
+from hypomnema.api.core import save_stream
+from hypomnema.api.helpers import create_header
+from hypomnema.base.languages import language_matches
+from hypomnema.base.types import Header, Tu, Tuv
+from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.deserialization.deserializer import Deserializer
+from hypomnema.xml.deserialization.projection import Projection
+from hypomnema.xml.output import AtomicWriter
+from hypomnema.xml.policy import DeserializationPolicy, SerializationPolicy
+from hypomnema.xml.utils import make_usable_path
+
+__all__ = ["iter_bilingual", "extract_bilingual"]
+
+
+def _matches(lang: str | None, language: str, exact: bool) -> bool:
+  return lang == language if exact else language_matches(lang, language)
+
+
+def _input_path(path: PathLike | str) -> Path:
+  _path = make_usable_path(path, mkdir=False)
+  if not _path.exists():
+    raise FileNotFoundError(f"File {_path} does not exist")
+  if not _path.is_file():
+    raise IsADirectoryError(f"Path {_path} is a directory")
+  return _path
+
+
+def _iter_pairs(
+  _path: Path,
+  source_lang: str,
+  target_lang: str,
+  deserializer: Deserializer,
+  exact: bool,
+  with_header: bool,
+) -> Generator[Header | Tu]:
+  """Yield the header (if requested) and the bilingual version of every `<tu>`."""
+  backend = deserializer.backend
+  for element in backend.iterparse(_path, tag_filter=("header", "tu") if with_header else "tu"):
+    obj = deserializer.deserialize(element)
+    if isinstance(obj, Header):
+      yield obj
+      continue
+    if not isinstance(obj, Tu):
+      continue
+    source: Tuv | None = None
+    target: Tuv | None = None
+    for tuv in obj.variants:
+      if source is None and _matches(tuv.lang, source_lang, exact):
+        source = tuv
+      elif target is None and _matches(tuv.lang, target_lang, exact):
+        target = tuv
+    if source is None or target is None:
+      continue
+    obj.variants = [source, target]
+    if obj.srclang is not None:
+      obj.srclang = source.lang
+    yield obj
+
+
+def _make_deserializer(
+  source_lang: str,
+  target_lang: str,
+  exact: bool,
+  inline_markup: bool,
+  backend: XmlBackend | None,
+  policy: DeserializationPolicy | None,
+  logger: Logger | None,
+) -> Deserializer:
+  _backend = backend if backend is not None else StandardBackend(logger=logger)
+  _logger = logger if logger is not None else getLogger("hypomnema.api.extract")
+  projection = Projection(
+    languages=(source_lang, target_lang),
+    language_matching="exact" if exact else "basic",
+    inline_markup=inline_markup,
+  )
+  return Deserializer(
+    _backend, policy=policy or DeserializationPolicy(), logger=_logger, projection=projection
+  )
+
+
+def iter_bilingual(
+  path: PathLike | str,
+  source_lang: str,
+  target_lang: str,
+  *,
+  exact: bool = False,
+  inline_markup: bool = True,
+  policy: DeserializationPolicy | None = None,
+  backend: XmlBackend | None = None,
+  logger: Logger | None = None,
+) -> Generator[Tu]:
+  """
+  Stream the translation units of a TMX file as source/target pairs.
+
+  The file is parsed with ``iterparse``. `<tuv>` elements in languages other
+  than ``source_lang`` and ``target_lang`` are skipped without being
+  deserialized, which makes this much faster than loading a multilingual
+  file and filtering it afterwards.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path to the TMX file.
+  source_lang : str
+      Language of the source variant.
+  target_lang : str
+      Language of the target variant.
+  exact : bool, optional
+      If True, ``xml:lang`` values must be equal to the requested languages.
+      If False (default), the requested languages are BCP-47 language ranges
+      (``"en"`` matches ``"en-US"``, case is ignored).
+  inline_markup : bool, optional
+      If False, the content of each variant is reduced to its plain text.
+      Defaults to True.
+  policy : DeserializationPolicy | None, optional
+      Deserialization policy. Defaults to standard policy.
+  backend : XmlBackend | None, optional
+      XML backend to use. Defaults to StandardBackend (stdlib).
+  logger : Logger | None, optional
+      Logger instance. Defaults to module logger.
+
+  Yields
+  ------
+  Tu
+      Translation units whose ``variants`` are exactly the first source
+      variant followed by the first target variant. If the unit has a
+      ``srclang``, it is set to the language of the source variant. Units
+      lacking either language are skipped.
+
+  Raises
+  ------
+  FileNotFoundError
+      If the file does not exist.
+  IsADirectoryError
+      If the path is a directory.
+
+  Examples
+  --------
+  >>> for tu in iter_bilingual("multilingual.tmx", "en", "fr"):
+  >>>     source, target = tu.variants
+  """
+  deserializer = _make_deserializer(
+    source_lang, target_lang, exact, inline_markup, backend, policy, logger
+  )
+  pairs = _iter_pairs(_input_path(path), source_lang, target_lang, deserializer, exact, False)
+  for obj in pairs:
+    if isinstance(obj, Tu):
+      yield obj
+
+
+def _line(tuv: Tuv) -> str:
+  text = tuv.content[0] if tuv.content else ""
+  if not isinstance(text, str):
+    raise TypeError(f"Expected text content, got {type(text).__name__}")
+  return " ".join(text.splitlines())
+
+
+def extract_bilingual(
+  path: PathLike | str,
+  source_lang: str,
+  target_lang: str,
+  output: PathLike | str,
+  *,
+  target_output: PathLike | str | None = None,
+  exact: bool = False,
+  encoding: str = "utf-8",
+  deserialization_policy: DeserializationPolicy | None = None,
+  serialization_policy: SerializationPolicy | None = None,
+  backend: XmlBackend | None = None,
+  logger: Logger | None = None,
+) -> int:
+  """
+  Extract a bilingual corpus from a (multilingual) TMX file in one pass.
+
+  Translation units are streamed with ``iter_bilingual`` and written as they
+  are read, so memory usage does not depend on the size of the file.
+
+  Two output formats are supported:
+
+  - If ``target_output`` is None, ``output`` is a bilingual TMX file. The
+    header of the input file is kept, with its ``srclang`` set to
+    ``source_lang``, and inline markup is preserved.
+  - Otherwise, ``output`` and ``target_output`` are plain-text parallel
+    files: line *n* of each file holds the text (without inline markup) of
+    the source and target variants of the *n*-th extracted unit. Line
+    breaks inside segments are replaced by spaces.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path to the TMX file to read.
+  source_lang : str
+      Language of the source variant.
+  target_lang : str
+      Language of the target variant.
+  output : PathLike | str
+      Path of the TMX file, or of the source text file, to write.
+  target_output : PathLike | str | None, optional
+      Path of the target text file. If None (default), a TMX file is written.
+      Both text files are written atomically: if the extraction fails, the
+      existing files are left untouched.
+  exact : bool, optional
+      If True, ``xml:lang`` values must be equal to the requested languages.
+      If False (default), they are matched as BCP-47 language ranges.
+  encoding : str, optional
+      Encoding of the output file(s). Defaults to "utf-8".
+  deserialization_policy : DeserializationPolicy | None, optional
+      Policy used to read the input. Defaults to standard policy.
+  serialization_policy : SerializationPolicy | None, optional
+      Policy used to write TMX output. Defaults to standard policy.
+  backend : XmlBackend | None, optional
+      XML backend to use. Defaults to StandardBackend (stdlib).
+  logger : Logger | None, optional
+      Logger instance. Defaults to module logger.
+
+  Returns
+  -------
+  int
+      The number of extracted translation units.
+
+  Raises
+  ------
+  FileNotFoundError
+      If the input file does not exist.
+  IsADirectoryError
+      If the input path is a directory.
+  XmlSerializationError
+      If an element cannot be serialized.
+
+  Examples
+  --------
+  >>> extract_bilingual("multilingual.tmx", "en", "de", "en-de.tmx")
+  >>> extract_bilingual("multilingual.tmx", "en", "de", "train.en", target_output="train.de")
+  """
+  as_text = target_output is not None
+  deserializer = _make_deserializer(
+    source_lang, target_lang, exact, not as_text, backend, deserialization_policy, logger
+  )
+  _path = _input_path(path)
+  pairs = _iter_pairs(_path, source_lang, target_lang, deserializer, exact, not as_text)
+  count = 0
+
+  if target_output is not None:
+    # One encoder per file, so a BOM is only written once at its start.
+    encode_source = getincrementalencoder(encoding)().encode
+    encode_target = getincrementalencoder(encoding)().encode
+    with AtomicWriter(output) as source_file, AtomicWriter(target_output) as target_file:
+      for tu in pairs:
+        if not isinstance(tu, Tu):
+          raise TypeError(f"Expected a Tu, got {type(tu).__name__}")
+        source, target = tu.variants
+        source_file.write(encode_source(_line(source) + "\n"))
+        target_file.write(encode_target(_line(target) + "\n"))
+        count += 1
+      source_file.write(encode_source("", final=True))
+      target_file.write(encode_target("", final=True))
+    return count
+
+  def _tus(first: Tu | None) -> Generator[Tu]:
+    if first is not None:
+      yield first
+    for tu in pairs:
+      if not isinstance(tu, Tu):
+        raise TypeError(f"Expected a Tu, got {type(tu).__name__}")
+      yield tu
+
+  first = next(pairs, None)
+  if isinstance(first, Header):
+    header, first_tu = first, None
+  else:
+    header, first_tu = create_header(), first
+  header.srclang = source_lang
+
+  return save_stream(
+    _tus(first_tu),
+    output,
+    header=header,
+    encoding=encoding,
+    policy=serialization_policy,
+    backend=deserializer.backend,
+    logger=deserializer.logger,
+  )
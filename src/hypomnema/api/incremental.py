@@ -0,0 +1,441 @@
+import os
+import re
+from collections.abc import Callable, Generator, Iterable
+from logging import Logger, getLogger
+from os import PathLike
+from pathlib import Path
+from shutil import copyfileobj
+from typing import BinaryIO
+from xml.parsers import expat
+
+from hypomnema.base.errors import XmlDeserializationError, XmlSerializationError
+from hypomnema.base.types import Tu
+from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.output import fsync_directory
+from hypomnema.xml.policy import SerializationPolicy
+from hypomnema.xml.serialization.serializer import Serializer
+from hypomnema.xml.utils import make_usable_path, normalize_encoding
+
+__all__ = ["append", "update", "recover"]
+
+# Bytes read at the start of a file to find its encoding, and at its end to
+# find the closing tags
+_HEAD_SIZE = 1024
+_TAIL_SIZE = 65536
+# Size of the reads and writes when copying the end of a file
+_COPY_SIZE = 1 << 20
+
+_DECLARED_ENCODING = re.compile(r"""<\?xml[^>]*?encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+_CLOSING_TMX = re.compile(r"\s*</tmx>\s*")
+
+
+def _journal_path(path: Path) -> Path:
+  return path.with_name(path.name + ".journal")
+
+
+def _check_file(path: PathLike | str) -> Path:
+  _path = make_usable_path(path, mkdir=False)
+  if not _path.exists():
+    raise FileNotFoundError(f"File {_path} does not exist")
+  if not _path.is_file():
+    raise IsADirectoryError(f"Path {_path} is a directory")
+  return _path
+
+
+def _detect_codec(path: Path) -> str:
+  """Find the codec of a file from its first bytes, byte order excluded."""
+  with open(path, "rb") as file:
+    head = file.read(_HEAD_SIZE)
+  if head.startswith(b"\xff\xfe") or head.startswith(b"<\x00"):
+    return "utf-16-le"
+  if head.startswith(b"\xfe\xff") or head.startswith(b"\x00<"):
+    return "utf-16-be"
+  match = _DECLARED_ENCODING.search(head.decode("ascii", errors="replace"))
+  if match is None:
+    return "utf-8"
+  codec = normalize_encoding(match.group(1))
+  # The byte order mark is only at the start of the file
+  return "utf-8" if codec == "utf-8-sig" else codec
+
+
+def _make_encoder(
+  backend: XmlBackend, policy: SerializationPolicy | None, logger: Logger, codec: str
+) -> Callable[[Tu], bytes]:
+  """Build the function serializing a `<tu>` to bytes in the file's codec."""
+  serializer = Serializer(backend, policy=policy or SerializationPolicy(), logger=logger)
+
+  def encode(tu: Tu) -> bytes:
+    if not isinstance(tu, Tu):
+      raise TypeError(f"Expected a Tu, got a {type(tu).__name__}")
+    element = serializer.serialize(tu)
+    if element is None:
+      raise XmlSerializationError("serializer returned None")
+    return backend.to_string(element).encode(codec, "xmlcharrefreplace")
+
+  return encode
+
+
+def _restore(path: Path, journal: BinaryIO) -> None:
+  """Write back the end of a file saved in a journal opened for reading."""
+  offset = int(journal.readline())
+  with open(path, "r+b") as file:
+    file.seek(offset)
+    file.truncate()
+    copyfileobj(journal, file, _COPY_SIZE)
+    file.flush()
+    os.fsync(file.fileno())
+
+
+def _rewrite_tail(path: Path, offset: int, build: Callable[[BinaryIO], Iterable[bytes]]) -> None:
+  """
+  Replace everything from ``offset`` to the end of a file, crash-safely.
+
+  The original end of the file is first saved to the journal and synced.
+  ``build`` receives the journal, positioned at ``offset``'s byte, and
+  returns the new end of the file. The journal is removed once the new end
+  is synced, and used to restore the file if anything fails before.
+  """
+  journal_path = _journal_path(path)
+  temporary = journal_path.with_name(journal_path.name + ".tmp")
+  with open(temporary, "wb") as journal, open(path, "rb") as file:
+    journal.write(b"%d\n" % offset)
+    file.seek(offset)
+    copyfileobj(file, journal, _COPY_SIZE)
+    journal.flush()
+    os.fsync(journal.fileno())
+  os.replace(temporary, journal_path)
+  fsync_directory(path)
+
+  try:
+    with open(journal_path, "rb") as journal, open(path, "r+b", buffering=_COPY_SIZE) as file:
+      journal.readline()
+      file.seek(offset)
+      file.truncate()
+      for chunk in build(journal):
+        file.write(chunk)
+      file.flush()
+      os.fsync(file.fileno())
+  except BaseException:
+    _rollback(path)
+    raise
+  journal_path.unlink()
+  fsync_directory(path)
+
+
+def _rollback(path: Path) -> bool:
+  """Restore a file from its journal, if any, and remove the journal."""
+  journal_path = _journal_path(path)
+  # A leftover temporary journal means the file itself was never modified
+  journal_path.with_name(journal_path.name + ".tmp").unlink(missing_ok=True)
+  if not journal_path.exists():
+    return False
+  with open(journal_path, "rb") as journal:
+    _restore(path, journal)
+  journal_path.unlink()
+  fsync_directory(path)
+  return True
+
+
+def recover(path: PathLike | str, *, logger: Logger | None = None) -> bool:
+  """
+  Roll back an ``append`` or ``update`` that was interrupted by a crash.
+
+  Both save the end of the file they modify to a journal
+  (``<path>.journal``), and remove the journal once the file is durably
+  written. If the journal is still there, the file may hold a partial
+  write: it is restored to its state before the interrupted operation.
+  ``append`` and ``update`` call this automatically, call it before reading
+  a file that may have been left behind by a crash.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path of the TMX file.
+  logger : Logger | None, optional
+      Logger instance. Defaults to module logger.
+
+  Returns
+  -------
+  bool
+      True if an interrupted operation was rolled back, False if there was
+      nothing to recover.
+
+  Examples
+  --------
+  >>> if recover("memory.tmx"):
+  >>>     print("The last append was lost")
+  """
+  _path = make_usable_path(path, mkdir=False)
+  if not _rollback(_path):
+    return False
+  _logger = logger if logger is not None else getLogger("hypomnema.api.incremental")
+  _logger.warning("Rolled back an interrupted write to %s", _path)
+  return True
+
+
+def _split_tail(path: Path, codec: str) -> tuple[int, bytes, bytes]:
+  """
+  Find where new `<tu>` elements go in a file.
+
+  Returns the offset of the closing ``</body>`` tag (or of a self-closing
+  ``<body/>``), the bytes to write before the new elements and the bytes to
+  write after them.
+  """
+  start = max(0, path.stat().st_size - _TAIL_SIZE)
+  with open(path, "rb") as file:
+    file.seek(start)
+    tail = file.read()
+  body_end = "</body>".encode(codec)
+  candidates = [(tail.rfind(body_end), body_end, b"")]
+  for empty_body in ("<body/>", "<body />"):
+    encoded = empty_body.encode(codec)
+    candidates.append((tail.rfind(encoded), encoded, "<body>".encode(codec)))
+  position, tag, opening = max(candidates, key=lambda candidate: candidate[0])
+  if position != -1:
+    rest = tail[position + len(tag) :]
+    if _CLOSING_TMX.fullmatch(rest.decode(codec, errors="replace")):
+      return start + position, opening, body_end + rest
+  raise XmlDeserializationError(f"{path} does not end with closing </body> and </tmx> tags")
+
+
+def append(
+  path: PathLike | str,
+  tus: Iterable[Tu],
+  *,
+  policy: SerializationPolicy | None = None,
+  backend: XmlBackend | None = None,
+  logger: Logger | None = None,
+) -> int:
+  """
+  Append `<tu>` elements to the end of an existing TMX file.
+
+  The file is not parsed nor rewritten: its closing ``</body></tmx>`` tags
+  are found at the end of the file, the new elements are written in their
+  place in the file's encoding, and the closing tags are written back after
+  them. Appending costs O(new data) whatever the size of the file.
+
+  The operation is crash-safe. The end of the file is first saved to a
+  journal (``<path>.journal``), which is removed once the file is synced to
+  disk. If the process dies in between, the next ``append`` (or an explicit
+  ``recover``) restores the file to its previous state, and if serializing
+  or writing fails, the file is restored right away. Appends to the same
+  file must not run concurrently.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path of the TMX file to append to.
+  tus : Iterable[Tu]
+      The translation units to append, consumed lazily.
+  policy : SerializationPolicy | None, optional
+      Serialization policy. Defaults to standard policy.
+  backend : XmlBackend | None, optional
+      XML backend used to serialize. Defaults to StandardBackend (stdlib).
+  logger : Logger | None, optional
+      Logger instance. Defaults to module logger.
+
+  Returns
+  -------
+  int
+      The number of appended translation units.
+
+  Raises
+  ------
+  FileNotFoundError
+      If the file does not exist.
+  IsADirectoryError
+      If the path is a directory.
+  XmlDeserializationError
+      If the file does not end with closing ``</body>`` and ``</tmx>`` tags.
+  XmlSerializationError
+      If a translation unit cannot be serialized. The file is left unchanged.
+  TypeError
+      If an element of ``tus`` is not a Tu. The file is left unchanged.
+
+  Examples
+  --------
+  >>> append("memory.tmx", [create_tu(tuid="42", variants=[...])])
+  """
+  _path = _check_file(path)
+  _backend = backend if backend is not None else StandardBackend(logger=logger)
+  _logger = logger if logger is not None else getLogger("hypomnema.api.incremental")
+  recover(_path, logger=_logger)
+  codec = _detect_codec(_path)
+  encode = _make_encoder(_backend, policy, _logger, codec)
+  offset, opening, closing = _split_tail(_path, codec)
+  count = 0
+
+  def build(_: BinaryIO) -> Generator[bytes]:
+    nonlocal count
+    yield opening
+    for tu in tus:
+      yield encode(tu)
+      count += 1
+    yield closing
+
+  _rewrite_tail(_path, offset, build)
+  _logger.debug("Appended %d translation units to %s", count, _path)
+  return count
+
+
+class _Found(Exception):
+  """Stops scanning a file once every wanted `<tu>` has been located."""
+
+
+def _locate_tus(path: Path, tuids: set[str]) -> dict[str, tuple[int, int]]:
+  """
+  Find the byte range of the first `<tu>` with each of ``tuids``.
+
+  The file is scanned with expat, which reports the byte offset of each
+  event, and scanning stops as soon as every `<tu>` is found. The end of a
+  `<tu>` is the offset of the event that follows it, which also covers
+  self-closing `<tu/>` elements.
+  """
+  parser = expat.ParserCreate()
+  remaining = set(tuids)
+  found: dict[str, tuple[int, int]] = {}
+  current: tuple[str, int] | None = None
+  closed: tuple[str, int] | None = None
+
+  def resolve(*_: object) -> None:
+    nonlocal closed
+    if closed is not None:
+      found[closed[0]] = (closed[1], parser.CurrentByteIndex)
+      closed = None
+      parser.CharacterDataHandler = parser.CommentHandler = None
+      parser.ProcessingInstructionHandler = None
+      if not remaining:
+        raise _Found
+
+  def start(tag: str, attributes: dict[str, str]) -> None:
+    nonlocal current
+    resolve()
+    if tag == "tu" and (tuid := attributes.get("tuid")) in remaining:
+      remaining.discard(tuid)
+      current = (tuid, parser.CurrentByteIndex)
+
+  def end(tag: str) -> None:
+    nonlocal current, closed
+    resolve()
+    if tag == "tu" and current is not None:
+      closed, current = current, None
+      parser.CharacterDataHandler = parser.CommentHandler = resolve
+      parser.ProcessingInstructionHandler = resolve
+
+  parser.StartElementHandler = start
+  parser.EndElementHandler = end
+  try:
+    with open(path, "rb") as file:
+      parser.ParseFile(file)
+  except _Found:
+    pass
+  except expat.ExpatError as e:
+    raise XmlDeserializationError(f"Cannot parse {path}: {e}") from e
+  return found
+
+
+def update(
+  path: PathLike | str,
+  tus: Iterable[Tu],
+  *,
+  policy: SerializationPolicy | None = None,
+  backend: XmlBackend | None = None,
+  logger: Logger | None = None,
+) -> int:
+  """
+  Replace `<tu>` elements of an existing TMX file, matched by ``tuid``.
+
+  The file is scanned (not deserialized) until every `<tu>` to replace is
+  found, then only the end of the file, from the first replaced `<tu>`
+  onwards, is rewritten: the replacements are spliced in and the bytes in
+  between are copied as-is. A batch of updates is applied in a single pass,
+  so a handful of edits costs far less than ``load`` followed by ``save``,
+  especially near the end of the file.
+
+  The operation is crash-safe in the same way as ``append``: the end of the
+  file is saved to a journal before it is rewritten, and restored by
+  ``recover`` (or the next ``append`` or ``update``) after a crash.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path of the TMX file to update.
+  tus : Iterable[Tu]
+      The replacement translation units. Each one replaces the first `<tu>`
+      of the file with the same ``tuid``. If several have the same ``tuid``,
+      the last one wins.
+  policy : SerializationPolicy | None, optional
+      Serialization policy. Defaults to standard policy.
+  backend : XmlBackend | None, optional
+      XML backend used to serialize. Defaults to StandardBackend (stdlib).
+  logger : Logger | None, optional
+      Logger instance. Defaults to module logger.
+
+  Returns
+  -------
+  int
+      The number of replaced translation units.
+
+  Raises
+  ------
+  FileNotFoundError
+      If the file does not exist.
+  IsADirectoryError
+      If the path is a directory.
+  ValueError
+      If a translation unit has no ``tuid``.
+  KeyError
+      If no `<tu>` of the file has the ``tuid`` of a translation unit. The
+      file is left unchanged.
+  XmlDeserializationError
+      If the file is not well-formed up to the last replaced `<tu>`.
+  XmlSerializationError
+      If a translation unit cannot be serialized. The file is left unchanged.
+  TypeError
+      If an element of ``tus`` is not a Tu. The file is left unchanged.
+
+  Examples
+  --------
+  >>> tu = next(tu for tu in load("memory.tmx", filter="tu") if tu.tuid == "42")
+  >>> tu.usagecount = (tu.usagecount or 0) + 1
+  >>> update("memory.tmx", [tu])
+  """
+  _path = _check_file(path)
+  _backend = backend if backend is not None else StandardBackend(logger=logger)
+  _logger = logger if logger is not None else getLogger("hypomnema.api.incremental")
+  recover(_path, logger=_logger)
+  codec = _detect_codec(_path)
+  encode = _make_encoder(_backend, policy, _logger, codec)
+
+  replacements: dict[str, bytes] = {}
+  for tu in tus:
+    data = encode(tu)
+    if tu.tuid is None:
+      raise ValueError("Cannot update a translation unit without a tuid")
+    replacements[tu.tuid] = data
+  if not replacements:
+    return 0
+  ranges = _locate_tus(_path, set(replacements))
+  if missing := replacements.keys() - ranges.keys():
+    raise KeyError(f"No <tu> with tuid {', '.join(sorted(missing))} in {_path}")
+  splices = sorted((start, end, replacements[tuid]) for tuid, (start, end) in ranges.items())
+  offset = splices[0][0]
+
+  def build(original: BinaryIO) -> Generator[bytes]:
+    position = offset
+    for start, end, data in splices:
+      remaining = start - position
+      while remaining > 0:
+        chunk = original.read(min(remaining, _COPY_SIZE))
+        remaining -= len(chunk)
+        yield chunk
+      yield data
+      original.seek(end - start, os.SEEK_CUR)
+      position = end
+    while chunk := original.read(_COPY_SIZE):
+      yield chunk
+
+  _rewrite_tail(_path, offset, build)
+  _logger.debug("Replaced %d translation units in %s", len(splices), _path)
+  return len(splices)
@@ -0,0 +1,473 @@
+from collections.abc import Callable, Generator, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import batched, chain
+from logging import Logger, getLogger
+from os import PathLike
+from time import perf_counter
+from typing import Any
+
+from hypomnema._concurrency import ordered_map
+from hypomnema.api.core import load, save_stream
+from hypomnema.base.types import Header, Tu
+from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.deserialization.interning import AttributeInterner
+from hypomnema.xml.deserialization.projection import Projection
+from hypomnema.xml.policy import DeserializationPolicy, SerializationPolicy
+from hypomnema.xml.utils import make_usable_path
+
+__all__ = ["Pipeline", "StageStats"]
+
+# Number of TUs handed to a worker at a time by parallel map stages
+_MAP_CHUNK_SIZE = 64
+
+
+@dataclass(slots=True)
+class StageStats:
+  """
+  Counters of one pipeline stage, updated while the pipeline runs.
+
+  Attributes
+  ----------
+  name : str
+      The name of the stage.
+  items_in : int
+      Number of TUs the stage received.
+  items_out : int
+      Number of TUs the stage passed on.
+  seconds : float
+      Time spent in the stage itself, excluding the stages before it. For
+      parallel map stages, this is the time summed over all workers.
+  """
+
+  name: str
+  items_in: int = 0
+  items_out: int = 0
+  seconds: float = 0.0
+
+  @property
+  def throughput(self) -> float:
+    """Number of TUs processed per second, 0.0 if the stage did not run."""
+    return self.items_in / self.seconds if self.seconds else 0.0
+
+
+class _Stage:
+  """A step of a pipeline, turning a stream of TUs into another one."""
+
+  __slots__ = ("kind", "func", "size", "workers", "stats")
+
+  def __init__(
+    self, kind: str, func: Callable[..., Any], name: str | None, size: int, workers: int | None
+  ) -> None:
+    self.kind = kind
+    self.func = func
+    self.size = size
+    self.workers = workers
+    self.stats = StageStats(name or f"{kind}:{getattr(func, '__name__', type(func).__name__)}")
+
+  def apply(self, tus: Iterable[Tu]) -> Generator[Tu]:
+    func, stats = self.func, self.stats
+    if self.workers is not None:
+      yield from self._apply_parallel(tus)
+      return
+    if self.kind == "batch":
+      for chunk in batched(tus, self.size):
+        stats.items_in += len(chunk)
+        start = perf_counter()
+        results = list(func(list(chunk)))
+        stats.seconds += perf_counter() - start
+        stats.items_out += len(results)
+        yield from results
+      return
+    for tu in tus:
+      stats.items_in += 1
+      start = perf_counter()
+      match self.kind:
+        case "map":
+          results: Iterable[Tu] = (func(tu),)
+        case "filter":
+          results = (tu,) if func(tu) else ()
+        case "flat_map":
+          results = list(func(tu))
+        case _:
+          func(tu)
+          results = (tu,)
+      stats.seconds += perf_counter() - start
+      for result in results:
+        stats.items_out += 1
+        yield result
+
+  def _apply_parallel(self, tus: Iterable[Tu]) -> Generator[Tu]:
+    func, stats = self.func, self.stats
+
+    def run(chunk: tuple[Tu, ...]) -> tuple[list[Tu], float]:
+      start = perf_counter()
+      results = [func(tu) for tu in chunk]
+      return results, perf_counter() - start
+
+    assert self.workers is not None
+    for results, seconds in ordered_map(run, batched(tus, self.size), workers=self.workers):
+      stats.items_in += len(results)
+      stats.items_out += len(results)
+      stats.seconds += seconds
+      yield from results
+
+
+class Pipeline:
+  """
+  Streaming transformation of the `<tu>` elements of a TMX file.
+
+  A pipeline reads the `<tu>` elements of a file one at a time, runs them
+  through a chain of stages (``map``, ``filter``, ``flat_map``, ``batch``
+  and ``tee``) and writes the result to a new file with ``write``, or
+  yields it when iterated. Every stage is a generator, so at most a few
+  TUs per stage (``size`` for ``batch`` stages, a bounded window for
+  parallel ``map`` stages) are in memory at once, whatever the size of the
+  file. The `<header>` of the source is kept in ``header`` and written
+  as-is unless another one is given.
+
+  Stage methods return the pipeline itself, so calls can be chained. Each
+  stage's counters and timing are available in ``stats`` during and after
+  a run, and are reset at the start of each run.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path of the TMX file to read.
+  encoding : str, optional
+      Encoding of the input file. Defaults to "utf-8".
+  policy : DeserializationPolicy | None, optional
+      Policy used to read the input. Defaults to standard policy.
+  backend : XmlBackend | None, optional
+      XML backend used to read and write. Defaults to StandardBackend.
+  logger : Logger | None, optional
+      Logger instance. Defaults to module logger.
+  interner : AttributeInterner | None, optional
+      Forwarded to ``load``.
+  projection : Projection | None, optional
+      Forwarded to ``load``.
+  workers : int | None, optional
+      Number of threads deserializing the input, forwarded to ``load``.
+      Defaults to None (the input is read in the calling thread).
+
+  Attributes
+  ----------
+  path : PathLike | str
+      Path of the TMX file to read.
+  header : Header | None
+      The `<header>` of the source, once the pipeline has started reading.
+  logger : Logger
+      Logger the stats of each run are logged to, at debug level.
+  reader : StageStats
+      Counters of the reading stage.
+  writer : StageStats
+      Counters of the writing stage, if the pipeline was written.
+
+  Examples
+  --------
+  >>> count = (
+  >>>     Pipeline("in.tmx")
+  >>>     .filter(lambda tu: len(tu.variants) >= 2)
+  >>>     .map(strip_whitespace, workers=4)
+  >>>     .tee(print_progress)
+  >>>     .write("out.tmx")
+  >>> )
+  >>> for stats in pipeline.stats:
+  >>>     print(f"{stats.name}: {stats.throughput:.0f} TU/s")
+  """
+
+  __slots__ = (
+    "path",
+    "header",
+    "logger",
+    "reader",
+    "writer",
+    "_load_options",
+    "_backend",
+    "_stages",
+  )
+
+  def __init__(
+    self,
+    path: PathLike | str,
+    *,
+    encoding: str = "utf-8",
+    policy: DeserializationPolicy | None = None,
+    backend: XmlBackend | None = None,
+    logger: Logger | None = None,
+    interner: AttributeInterner | None = None,
+    projection: Projection | None = None,
+    workers: int | None = None,
+  ) -> None:
+    self.path: PathLike | str = path
+    self.header: Header | None = None
+    self.logger: Logger = logger if logger is not None else getLogger("hypomnema.api.pipeline")
+    self.reader: StageStats = StageStats("read")
+    self.writer: StageStats = StageStats("write")
+    self._backend: XmlBackend = backend if backend is not None else StandardBackend(logger=logger)
+    self._load_options: dict[str, Any] = {
+      "encoding": encoding,
+      "policy": policy,
+      "backend": self._backend,
+      "logger": logger,
+      "interner": interner,
+      "projection": projection,
+      "workers": workers,
+    }
+    self._stages: list[_Stage] = []
+
+  @property
+  def stats(self) -> list[StageStats]:
+    """The counters of every stage, reading and writing included, in order."""
+    return [self.reader, *(stage.stats for stage in self._stages), self.writer]
+
+  def _add(
+    self,
+    kind: str,
+    func: Callable[..., Any],
+    name: str | None,
+    size: int = _MAP_CHUNK_SIZE,
+    workers: int | None = None,
+  ) -> Pipeline:
+    self._stages.append(_Stage(kind, func, name, size, workers))
+    return self
+
+  def map(
+    self, func: Callable[[Tu], Tu], *, workers: int | None = None, name: str | None = None
+  ) -> Pipeline:
+    """
+    Replace every TU with ``func(tu)``.
+
+    Parameters
+    ----------
+    func : Callable[[Tu], Tu]
+        The transformation. It can modify and return its argument.
+    workers : int | None, optional
+        If set, ``func`` is run on a pool of ``workers`` threads, on chunks
+        of TUs, and results keep their order. ``func`` must then be
+        thread-safe. Defaults to None (``func`` runs in the calling thread).
+    name : str | None, optional
+        The name of the stage in ``stats``. Defaults to "map:<func name>".
+
+    Returns
+    -------
+    Pipeline
+        The pipeline itself.
+
+    Raises
+    ------
+    ValueError
+        If ``workers`` is lower than 1.
+    """
+    if workers is not None and workers < 1:
+      raise ValueError(f"workers must be at least 1, got {workers}")
+    return self._add("map", func, name, workers=workers)
+
+  def filter(self, predicate: Callable[[Tu], bool], *, name: str | None = None) -> Pipeline:
+    """
+    Only keep the TUs for which ``predicate`` is true.
+
+    Parameters
+    ----------
+    predicate : Callable[[Tu], bool]
+        The condition to keep a TU.
+    name : str | None, optional
+        The name of the stage in ``stats``. Defaults to "filter:<func name>".
+
+    Returns
+    -------
+    Pipeline
+        The pipeline itself.
+    """
+    return self._add("filter", predicate, name)
+
+  def flat_map(self, func: Callable[[Tu], Iterable[Tu]], *, name: str | None = None) -> Pipeline:
+    """
+    Replace every TU with all the TUs of ``func(tu)``, possibly none.
+
+    Parameters
+    ----------
+    func : Callable[[Tu], Iterable[Tu]]
+        The transformation, e.g. splitting a multilingual TU in bilingual ones.
+    name : str | None, optional
+        The name of the stage in ``stats``. Defaults to "flat_map:<func name>".
+
+    Returns
+    -------
+    Pipeline
+        The pipeline itself.
+    """
+    return self._add("flat_map", func, name)
+
+  def batch(
+    self, func: Callable[[list[Tu]], Iterable[Tu]], size: int, *, name: str | None = None
+  ) -> Pipeline:
+    """
+    Run ``func`` on lists of ``size`` TUs and pass on the TUs it returns.
+
+    Meant for operations that are cheaper in bulk, such as database lookups
+    or calls to a remote service. The last list may be shorter.
+
+    Parameters
+    ----------
+    func : Callable[[list[Tu]], Iterable[Tu]]
+        The transformation of a batch.
+    size : int
+        The number of TUs in each batch.
+    name : str | None, optional
+        The name of the stage in ``stats``. Defaults to "batch:<func name>".
+
+    Returns
+    -------
+    Pipeline
+        The pipeline itself.
+
+    Raises
+    ------
+    ValueError
+        If ``size`` is lower than 1.
+    """
+    if size < 1:
+      raise ValueError(f"size must be at least 1, got {size}")
+    return self._add("batch", func, name, size=size)
+
+  def tee(self, func: Callable[[Tu], Any], *, name: str | None = None) -> Pipeline:
+    """
+    Call ``func`` on every TU and pass the TU on unchanged.
+
+    Parameters
+    ----------
+    func : Callable[[Tu], Any]
+        The side effect, e.g. counting, logging or writing to a second sink.
+        Its return value is ignored.
+    name : str | None, optional
+        The name of the stage in ``stats``. Defaults to "tee:<func name>".
+
+    Returns
+    -------
+    Pipeline
+        The pipeline itself.
+    """
+    return self._add("tee", func, name)
+
+  def _read(self) -> Generator[Tu]:
+    stats = self.reader
+    elements = load(self.path, filter=("header", "tu"), **self._load_options)
+    while True:
+      start = perf_counter()
+      element = next(elements, None)
+      stats.seconds += perf_counter() - start
+      if element is None:
+        return
+      if isinstance(element, Header):
+        self.header = element
+        continue
+      assert isinstance(element, Tu)
+      stats.items_in += 1
+      stats.items_out += 1
+      yield element
+
+  def __iter__(self) -> Iterator[Tu]:
+    """
+    Run the pipeline and yield the resulting TUs.
+
+    Yields
+    ------
+    Tu
+        The TUs coming out of the last stage, in order.
+    """
+    self.header = None
+    for stats in self.stats:
+      stats.items_in = stats.items_out = 0
+      stats.seconds = 0.0
+    tus: Iterable[Tu] = self._read()
+    for stage in self._stages:
+      tus = stage.apply(tus)
+    yield from tus
+    for stats in self.stats[:-1]:
+      self.logger.debug(
+        "%s: %d in, %d out, %.0f TU/s",
+        stats.name,
+        stats.items_in,
+        stats.items_out,
+        stats.throughput,
+      )
+
+  def run(self) -> int:
+    """
+    Run the pipeline without writing its output.
+
+    Useful when the stages themselves have the side effects of interest.
+
+    Returns
+    -------
+    int
+        The number of TUs coming out of the last stage.
+    """
+    return sum(1 for _ in self)
+
+  def write(
+    self,
+    path: PathLike | str,
+    *,
+    encoding: str = "utf-8",
+    policy: SerializationPolicy | None = None,
+    header: Header | None = None,
+  ) -> int:
+    """
+    Run the pipeline and stream the resulting TUs to a TMX file.
+
+    Parameters
+    ----------
+    path : PathLike | str
+        Path of the TMX file to write. It may not be the input file.
+    encoding : str, optional
+        Encoding of the output file. Defaults to "utf-8".
+    policy : SerializationPolicy | None, optional
+        Policy used to write the output. Defaults to standard policy.
+    header : Header | None, optional
+        The `<header>` to write. Defaults to the header of the source, or an
+        empty header if the source has none.
+
+    Returns
+    -------
+    int
+        The number of written TUs.
+
+    Raises
+    ------
+    ValueError
+        If ``path`` is the input file.
+    XmlSerializationError
+        If an element cannot be serialized.
+    """
+    _path = make_usable_path(path)
+    if _path.resolve() == make_usable_path(self.path, mkdir=False).resolve():
+      raise ValueError(f"Cannot write a pipeline to its input file {_path}")
+    stats = self.writer
+    started = perf_counter()
+
+    def _counted(tus: Iterable[Tu]) -> Generator[Tu]:
+      for tu in tus:
+        stats.items_in += 1
+        stats.items_out += 1
+        yield tu
+
+    tus = iter(self)
+    # Reading the first TU reads the source header
+    first = next(tus, None)
+    if header is None:
+      header = self.header
+    save_stream(
+      _counted(tus if first is None else chain((first,), tus)),
+      _path,
+      header=header,
+      encoding=encoding,
+      policy=policy,
+      backend=self._backend,
+      logger=self.logger,
+    )
+    upstream = sum(stage.seconds for stage in self.stats[:-1])
+    stats.seconds = perf_counter() - started - upstream
+    self.logger.debug("%s: %d TUs, %.0f TU/s", stats.name, stats.items_out, stats.throughput)
+    return stats.items_out
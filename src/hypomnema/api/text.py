@@ -0,0 +1,257 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Literal
+
+from hypomnema.base.types import Bpt, Ept, Hi, InlineElement, It, Ph, Sub, Tuv
+from hypomnema.xml.backends.base import XmlBackend
+
+__all__ = ["TextMode", "default_placeholder", "TextProjector", "to_text"]
+
+
+type TextMode = Literal["strip", "placeholder", "native"]
+"""How inline codes are rendered when projecting content to text."""
+
+
+def default_placeholder(tag: str, ident: str | None) -> str:
+  """
+  Default placeholder token for an inline code.
+
+  Parameters
+  ----------
+  tag : str
+      The tag of the code: ``"bpt"``, ``"ept"``, ``"it"`` or ``"ph"``.
+  ident : str | None
+      Its ``i`` attribute for `<bpt>`/`<ept>`, its ``x`` attribute otherwise.
+
+  Returns
+  -------
+  str
+      ``"{bpt1}"``, ``"{ept1}"``, ``"{ph}"``, ``"{it2}"``...
+  """
+  return "{" + tag + ident + "}" if ident is not None else "{" + tag + "}"
+
+
+_CODES = (Bpt, Ept, It, Ph)
+_CODE_TAGS = frozenset({"bpt", "ept", "it", "ph"})
+
+
+class TextProjector:
+  """
+  Converts segment content into a flat string.
+
+  `<hi>` elements are always transparent: their text is part of the
+  segment's text. Codes (`<bpt>`, `<ept>`, `<it>` and `<ph>`) are rendered
+  according to ``mode``:
+
+  - ``"strip"``: codes are dropped.
+  - ``"placeholder"``: each code is replaced by a token built by
+    ``placeholder``.
+  - ``"native"``: codes are replaced by their native code, including the
+    text of their `<sub>` elements, which gives back the original markup.
+
+  Content is walked iteratively, so arbitrarily deep nesting is supported.
+  The same projector can be used on deserialized content (``project``) and
+  directly on backend `<seg>` elements (``project_element``), which avoids
+  building any dataclass at all.
+
+  Parameters
+  ----------
+  mode : TextMode, optional
+      How codes are rendered. Defaults to "strip".
+  placeholder : Callable[[str, str | None], str], optional
+      Builds the token of a code from its tag and identifier, see
+      ``default_placeholder``. Only used in "placeholder" mode.
+
+  Attributes
+  ----------
+  mode : TextMode
+      How codes are rendered.
+  placeholder : Callable[[str, str | None], str]
+      The placeholder token factory.
+
+  Raises
+  ------
+  ValueError
+      If ``mode`` is unknown.
+
+  Examples
+  --------
+  >>> projector = TextProjector("placeholder")
+  >>> projector.project(["Click ", Bpt(i=1, content=["<b>"]), "here", Ept(i=1, content=["</b>"])])
+  'Click {bpt1}here{ept1}'
+  """
+
+  __slots__ = ("mode", "placeholder")
+
+  def __init__(
+    self,
+    mode: TextMode = "strip",
+    *,
+    placeholder: Callable[[str, str | None], str] = default_placeholder,
+  ) -> None:
+    if mode not in ("strip", "placeholder", "native"):
+      raise ValueError(f"Unknown text mode {mode!r}")
+    self.mode: TextMode = mode
+    self.placeholder: Callable[[str, str | None], str] = placeholder
+
+  def project(self, content: Tuv | Iterable[InlineElement | str]) -> str:
+    """
+    Convert deserialized content into a string.
+
+    Parameters
+    ----------
+    content : Tuv | Iterable[InlineElement | str]
+        A Tuv, or the content of a Tuv or of an inline element.
+
+    Returns
+    -------
+    str
+        The projected text.
+    """
+    if isinstance(content, Tuv):
+      content = content.content
+    mode = self.mode
+    parts: list[str] = []
+    stack: list[Iterator[Any]] = [iter(content)]
+    while stack:
+      item = next(stack[-1], None)
+      if item is None:
+        stack.pop()
+      elif isinstance(item, str):
+        parts.append(item)
+      elif isinstance(item, Hi):
+        stack.append(iter(item.content))
+      elif isinstance(item, _CODES):
+        if mode == "native":
+          stack.append(iter(item.content))
+        elif mode == "placeholder":
+          if isinstance(item, (Bpt, Ept)):
+            ident = str(item.i)
+          else:
+            ident = None if item.x is None else str(item.x)
+          parts.append(self.placeholder(type(item).__name__.lower(), ident))
+      elif isinstance(item, Sub):
+        if mode == "native":
+          stack.append(iter(item.content))
+      else:
+        raise TypeError(f"Unexpected item in content: {type(item).__name__}")
+    return "".join(parts)
+
+  def project_many(self, contents: Iterable[Tuv | Iterable[InlineElement | str]]) -> list[str]:
+    """
+    Convert several Tuvs (or contents) into strings.
+
+    Parameters
+    ----------
+    contents : Iterable[Tuv | Iterable[InlineElement | str]]
+        The Tuvs or contents to convert.
+
+    Returns
+    -------
+    list[str]
+        The projected texts, in the same order.
+    """
+    project = self.project
+    return [project(content) for content in contents]
+
+  def project_element[TypeOfElement](
+    self, backend: XmlBackend[TypeOfElement], element: TypeOfElement
+  ) -> str:
+    """
+    Convert a backend element with mixed content (usually a `<seg>`) into a string.
+
+    The element is read as-is: it is neither deserialized nor validated, and
+    unknown child elements are treated like `<hi>`.
+
+    Parameters
+    ----------
+    backend : XmlBackend[TypeOfElement]
+        The backend the element belongs to.
+    element : TypeOfElement
+        The element to convert, e.g. a `<seg>` yielded by ``iterparse``.
+
+    Returns
+    -------
+    str
+        The projected text.
+    """
+    mode = self.mode
+    parts: list[str] = []
+    if (text := backend.get_text(element)) is not None:
+      parts.append(text)
+    stack: list[tuple[Iterator[TypeOfElement], TypeOfElement | None]] = [
+      (iter(backend.iter_children(element)), None)
+    ]
+    while stack:
+      children, parent = stack[-1]
+      child = next(children, None)
+      if child is None:
+        stack.pop()
+        if parent is not None and (tail := backend.get_tail(parent)) is not None:
+          parts.append(tail)
+        continue
+      tag = backend.get_tag(child)
+      if tag in _CODE_TAGS or tag == "sub":
+        if mode == "native":
+          if (text := backend.get_text(child)) is not None:
+            parts.append(text)
+          stack.append((iter(backend.iter_children(child)), child))
+          continue
+        if mode == "placeholder" and tag != "sub":
+          ident = backend.get_attribute(child, "i" if tag in ("bpt", "ept") else "x")
+          parts.append(self.placeholder(tag, ident))
+        if (tail := backend.get_tail(child)) is not None:
+          parts.append(tail)
+      else:
+        if (text := backend.get_text(child)) is not None:
+          parts.append(text)
+        stack.append((iter(backend.iter_children(child)), child))
+    return "".join(parts)
+
+  def project_elements[TypeOfElement](
+    self, backend: XmlBackend[TypeOfElement], elements: Iterable[TypeOfElement]
+  ) -> list[str]:
+    """
+    Convert several backend elements into strings.
+
+    Parameters
+    ----------
+    backend : XmlBackend[TypeOfElement]
+        The backend the elements belong to.
+    elements : Iterable[TypeOfElement]
+        The elements to convert.
+
+    Returns
+    -------
+    list[str]
+        The projected texts, in the same order.
+    """
+    project_element = self.project_element
+    return [project_element(backend, element) for element in elements]
+
+
+def to_text(content: Tuv | Iterable[InlineElement | str], mode: TextMode = "strip") -> str:
+  """
+  Convert a Tuv, or some mixed content, into a string.
+
+  Shortcut for ``TextProjector(mode).project(content)``.
+
+  Parameters
+  ----------
+  content : Tuv | Iterable[InlineElement | str]
+      A Tuv, or the content of a Tuv or of an inline element.
+  mode : TextMode, optional
+      How codes are rendered, see ``TextProjector``. Defaults to "strip".
+
+  Returns
+  -------
+  str
+      The projected text.
+
+  Examples
+  --------
+  >>> to_text(tuv)
+  'Click here'
+  >>> to_text(tuv, "native")
+  'Click <b>here</b>'
+  """
+  return TextProjector(mode).project(content)
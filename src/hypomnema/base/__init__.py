@@ -30,6 +30,14 @@ from .types import (
   Sub,
   Hi,
 )
+from typing import TYPE_CHECKING
+
+from hypomnema._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+  from .hashing import DATE_FIELDS, digest, DigestCache
+  from .languages import normalize_language_tag, language_matches
+  from .compact import CompactTuStore
 
 
 __all__ = [
@@ -62,4 +70,25 @@ __all__ = [
   "InvalidTagError",
   "InvalidContentError",
   "MissingHandlerError",
+  # Hashing
+  "DATE_FIELDS",
+  "digest",
+  "DigestCache",
+  # Languages
+  "normalize_language_tag",
+  "language_matches",
+  # Storage
+  "CompactTuStore",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+  __name__,
+  {
+    "DATE_FIELDS": ".hashing",
+    "digest": ".hashing",
+    "DigestCache": ".hashing",
+    "normalize_language_tag": ".languages",
+    "language_matches": ".languages",
+    "CompactTuStore": ".compact",
+  },
+)
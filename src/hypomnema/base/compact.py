@@ -0,0 +1,439 @@
+"""
+Column-oriented, memory-compact storage for translation units.
+
+A deserialized ``Tu`` is a graph of slotted dataclasses, lists, strings and
+datetimes that typically costs a few kilobytes. ``CompactTuStore`` keeps the
+same information in a handful of flat ``array`` columns and a table of
+unique values, and only builds ``Tu`` objects when they are accessed.
+"""
+
+from array import array
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from dataclasses import fields
+from datetime import UTC, datetime, timedelta, timezone
+from sys import getsizeof
+from typing import Any, overload
+
+from hypomnema.base.hashing import DATE_FIELDS
+from hypomnema.base.types import Bpt, Ept, Hi, It, Note, Ph, Prop, Sub, Tu, Tuv
+
+__all__ = ["CompactTuStore"]
+
+
+_NONE = -1
+_END = -2
+_CONTENT = -3
+_FIRST_KIND = -4
+
+_KINDS: tuple[type, ...] = (Prop, Note, Bpt, Ept, It, Ph, Hi, Sub)
+_KIND_CODES: dict[type, int] = {kind: _FIRST_KIND - index for index, kind in enumerate(_KINDS)}
+_KIND_FIELDS: tuple[tuple[str, ...], ...] = tuple(
+  tuple(f.name for f in fields(kind) if f.name != "content") for kind in _KINDS
+)
+_KIND_HAS_CONTENT: tuple[bool, ...] = tuple(
+  any(f.name == "content" for f in fields(kind)) for kind in _KINDS
+)
+_CODE_KINDS = (Bpt, Ept, It, Ph)
+_FIRST_VALUE = _FIRST_KIND - len(_KINDS)
+
+_TU_FIELDS = tuple(f.name for f in fields(Tu) if f.name not in ("props", "notes", "variants"))
+_TUV_FIELDS = tuple(f.name for f in fields(Tuv) if f.name not in ("props", "notes", "content"))
+
+_TEXT_FIELDS = frozenset({"tuid"})
+
+_MISSING_INT = -(2**63)
+_NAIVE = -(2**31)
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_DONE = object()
+
+
+class _Columns:
+  """
+  Typed array columns for the scalar fields of one dataclass.
+
+  A column is only created the first time its field has a value: fields
+  that are None in every row (most of them, in practice) cost nothing.
+  """
+
+  __slots__ = ("kinds", "columns", "offsets", "length", "defaults")
+
+  def __init__(self, names: tuple[str, ...]) -> None:
+    self.kinds: dict[str, str] = {}
+    for name in names:
+      if name in DATE_FIELDS:
+        self.kinds[name] = "date"
+      elif name == "usagecount":
+        self.kinds[name] = "int"
+      elif name in _TEXT_FIELDS:
+        self.kinds[name] = "text"
+      else:
+        self.kinds[name] = "value"
+    self.columns: dict[str, array] = {}
+    self.offsets: dict[str, array] = {}
+    self.length = 0
+    self.defaults: dict[str, None] = dict.fromkeys(names)
+
+  def create(self, name: str) -> array:
+    kind = self.kinds[name]
+    if kind in ("date", "int"):
+      column = self.columns[name] = array("q", [_MISSING_INT]) * self.length
+    else:
+      column = self.columns[name] = array("i", [_NONE]) * self.length
+    if kind == "date":
+      self.offsets[name] = array("i", [0]) * self.length
+    return column
+
+  def truncate(self, length: int) -> None:
+    for column in self.all():
+      del column[length:]
+    self.length = length
+
+  def all(self) -> Iterator[array]:
+    yield from self.columns.values()
+    yield from self.offsets.values()
+
+  def nbytes(self) -> int:
+    return sum(column.itemsize * len(column) for column in self.all())
+
+
+class CompactTuStore(Sequence[Tu]):
+  """
+  Read-mostly sequence of translation units with a small memory footprint.
+
+  Units are stored column-wise instead of as objects:
+
+  - attribute values, which repeat a lot (languages, tool names, user
+    ids, enum members...), are stored once in a value table and referenced
+    by index,
+  - segment text and ``tuid``, which are mostly unique, are stored as UTF-8
+    in a single string table and referenced by index into an offset array,
+    while native code, which repeats a lot, goes to the value table,
+  - the scalar fields of ``Tu`` and ``Tuv`` are arrays of such indices,
+    ``usagecount`` is an array of integers and dates are arrays of epoch
+    microseconds with their UTC offsets. Fields that were always None so
+    far have no array at all,
+  - props, notes and segment content are encoded as a flat stream of
+    integers, with offset arrays pointing to the slice of each unit.
+
+  Indexing or iterating builds brand new ``Tu`` objects, equal to the ones
+  that were added. Modifying them does not change the store. The store can
+  be used anywhere a ``Sequence[Tu]`` is expected, e.g. as ``Tmx.body``.
+
+  Parameters
+  ----------
+  tus : Iterable[Tu], optional
+      Translation units to add, e.g. the result of ``load(path, "tu")``.
+
+  Raises
+  ------
+  TypeError
+      If a unit contains an object that is not a TMX element.
+
+  Notes
+  -----
+  Time zones of aware datetimes are stored as fixed UTC offsets, e.g. a
+  ``ZoneInfo`` is materialized back as the equivalent ``timezone``. The
+  instants are unchanged.
+
+  Examples
+  --------
+  >>> store = CompactTuStore(load("large.tmx", "tu"))
+  >>> tmx = Tmx(header=header, body=store)
+  >>> store[42].variants[0].content
+  ['Hello world']
+  """
+
+  __slots__ = (
+    "_values",
+    "_value_ids",
+    "_text",
+    "_text_ends",
+    "_tu_columns",
+    "_tuv_columns",
+    "_variant_starts",
+    "_tu_streams",
+    "_tu_stream_starts",
+    "_tuv_streams",
+    "_tuv_stream_starts",
+    "_timezones",
+  )
+
+  def __init__(self, tus: Iterable[Tu] = ()) -> None:
+    self._values: list[Any] = []
+    self._value_ids: dict[Hashable, int] = {}
+    self._text = bytearray()
+    self._text_ends = array("q")
+    self._tu_columns = _Columns(_TU_FIELDS)
+    self._tuv_columns = _Columns(_TUV_FIELDS)
+    self._variant_starts = array("q", [0])
+    self._tu_streams = array("i")
+    self._tu_stream_starts = array("q", [0])
+    self._tuv_streams = array("i")
+    self._tuv_stream_starts = array("q", [0])
+    self._timezones: dict[int, timezone] = {0: UTC}
+    self.extend(tus)
+
+  def _arrays(self) -> list[array]:
+    return [
+      self._text_ends,
+      self._variant_starts,
+      self._tu_streams,
+      self._tu_stream_starts,
+      self._tuv_streams,
+      self._tuv_stream_starts,
+    ]
+
+  def _value_id(self, value: Any) -> int:
+    key = value if type(value) is str else (type(value), value)
+    value_id = self._value_ids.get(key)
+    if value_id is None:
+      value_id = self._value_ids[key] = len(self._values)
+      self._values.append(value)
+    return value_id
+
+  def _text_id(self, value: str) -> int:
+    self._text += value.encode("utf-8", "surrogatepass")
+    self._text_ends.append(len(self._text))
+    return len(self._text_ends) - 1
+
+  def _get_text(self, text_id: int) -> str:
+    ends = self._text_ends
+    start = ends[text_id - 1] if text_id else 0
+    return self._text[start : ends[text_id]].decode("utf-8", "surrogatepass")
+
+  def _store_fields(self, columns: _Columns, obj: Tu | Tuv) -> None:
+    for name, kind in columns.kinds.items():
+      value = getattr(obj, name)
+      column = columns.columns.get(name)
+      if value is None:
+        if column is not None:
+          column.append(_NONE if kind in ("value", "text") else _MISSING_INT)
+          if kind == "date":
+            columns.offsets[name].append(0)
+        continue
+      if column is None:
+        column = columns.create(name)
+      if kind == "value":
+        column.append(self._value_id(value))
+      elif kind == "text":
+        column.append(self._text_id(value))
+      elif kind == "int":
+        column.append(value)
+      elif (offset := value.utcoffset()) is None:
+        column.append((value - _NAIVE_EPOCH) // _MICROSECOND)
+        columns.offsets[name].append(_NAIVE)
+      else:
+        column.append((value - _EPOCH) // _MICROSECOND)
+        columns.offsets[name].append(int(offset.total_seconds()))
+    columns.length += 1
+
+  def _load_fields(self, columns: _Columns, index: int) -> dict[str, Any]:
+    values = self._values
+    kwargs: dict[str, Any] = columns.defaults.copy()
+    for name, column in columns.columns.items():
+      code = column[index]
+      kind = columns.kinds[name]
+      if kind == "value":
+        if code != _NONE:
+          kwargs[name] = values[code]
+      elif kind == "text":
+        if code != _NONE:
+          kwargs[name] = self._get_text(code)
+      elif code == _MISSING_INT:
+        continue
+      elif kind == "int":
+        kwargs[name] = code
+      elif (offset := columns.offsets[name][index]) == _NAIVE:
+        kwargs[name] = _NAIVE_EPOCH + code * _MICROSECOND
+      else:
+        tz = self._timezones.get(offset)
+        if tz is None:
+          tz = self._timezones[offset] = timezone(timedelta(seconds=offset))
+        value = _EPOCH + code * _MICROSECOND
+        kwargs[name] = value if tz is UTC else value.astimezone(tz)
+    return kwargs
+
+  def _encode(self, items: Iterable[Any], out: array) -> None:
+    """Append the encoding of props, notes or mixed content to ``out``."""
+    # Native code repeats a lot, so strings directly inside codes go to the
+    # value table rather than to the string table.
+    stack: list[tuple[Iterator[Any], bool]] = [(iter(items), False)]
+    while stack:
+      children, in_code = stack[-1]
+      item = next(children, _DONE)
+      if item is _DONE:
+        stack.pop()
+        if stack:
+          out.append(_END)
+        continue
+      if isinstance(item, str):
+        if in_code:
+          out.append(_FIRST_VALUE - self._value_id(item))
+        else:
+          out.append(self._text_id(item))
+        continue
+      code = _KIND_CODES.get(type(item))
+      if code is None:
+        raise TypeError(f"Cannot store {type(item).__name__} in a CompactTuStore")
+      out.append(code)
+      kind = _FIRST_KIND - code
+      for name in _KIND_FIELDS[kind]:
+        value = getattr(item, name)
+        out.append(_NONE if value is None else self._value_id(value))
+      if _KIND_HAS_CONTENT[kind]:
+        stack.append((iter(item.content), isinstance(item, _CODE_KINDS)))
+
+  def _decode(self, stream: array, start: int, end: int) -> tuple[list[Any], list[Any]]:
+    """Decode a slice of ``stream`` into (props and notes, content)."""
+    values = self._values
+    head: list[Any] = []
+    content: list[Any] = []
+    current = head
+    parents: list[list[Any]] = []
+    index = start
+    while index < end:
+      code = stream[index]
+      index += 1
+      if code >= 0:
+        current.append(self._get_text(code))
+      elif code <= _FIRST_VALUE:
+        current.append(values[_FIRST_VALUE - code])
+      elif code == _END:
+        current = parents.pop()
+      elif code == _CONTENT:
+        current = content
+      else:
+        kind = _FIRST_KIND - code
+        kwargs: dict[str, Any] = {}
+        for name in _KIND_FIELDS[kind]:
+          value_id = stream[index]
+          index += 1
+          kwargs[name] = None if value_id == _NONE else values[value_id]
+        if _KIND_HAS_CONTENT[kind]:
+          children: list[Any] = []
+          current.append(_KINDS[kind](content=children, **kwargs))
+          parents.append(current)
+          current = children
+        else:
+          current.append(_KINDS[kind](**kwargs))
+    return head, content
+
+  def append(self, tu: Tu) -> None:
+    """
+    Add a translation unit at the end of the store.
+
+    Parameters
+    ----------
+    tu : Tu
+        The unit to add. It is copied, so it can be discarded afterwards.
+
+    Raises
+    ------
+    TypeError
+        If ``tu`` is not a Tu or contains an object that is not a TMX element.
+        The store is left unchanged.
+    """
+    if not isinstance(tu, Tu):
+      raise TypeError(f"Expected a Tu, got {type(tu).__name__}")
+    arrays = self._arrays()
+    lengths = [len(a) for a in arrays]
+    text_length = len(self._text)
+    tu_length = self._tu_columns.length
+    tuv_length = self._tuv_columns.length
+    try:
+      self._store_fields(self._tu_columns, tu)
+      self._encode(tu.props, self._tu_streams)
+      self._encode(tu.notes, self._tu_streams)
+      self._tu_stream_starts.append(len(self._tu_streams))
+      count = 0
+      for tuv in tu.variants:
+        self._store_fields(self._tuv_columns, tuv)
+        streams = self._tuv_streams
+        self._encode(tuv.props, streams)
+        self._encode(tuv.notes, streams)
+        streams.append(_CONTENT)
+        self._encode(tuv.content, streams)
+        self._tuv_stream_starts.append(len(streams))
+        count += 1
+      self._variant_starts.append(self._variant_starts[-1] + count)
+    except BaseException:
+      for a, length in zip(arrays, lengths):
+        del a[length:]
+      del self._text[text_length:]
+      self._tu_columns.truncate(tu_length)
+      self._tuv_columns.truncate(tuv_length)
+      raise
+
+  def extend(self, tus: Iterable[Tu]) -> None:
+    """
+    Add several translation units at the end of the store.
+
+    Parameters
+    ----------
+    tus : Iterable[Tu]
+        The units to add. Consumed lazily, so a streaming generator can be
+        passed without holding every unit in memory.
+    """
+    for tu in tus:
+      self.append(tu)
+
+  def _materialize_tuv(self, index: int) -> Tuv:
+    kwargs = self._load_fields(self._tuv_columns, index)
+    head, content = self._decode(
+      self._tuv_streams, self._tuv_stream_starts[index], self._tuv_stream_starts[index + 1]
+    )
+    kwargs["props"] = [item for item in head if isinstance(item, Prop)]
+    kwargs["notes"] = [item for item in head if isinstance(item, Note)]
+    kwargs["content"] = content
+    return Tuv(**kwargs)
+
+  def _materialize(self, index: int) -> Tu:
+    kwargs = self._load_fields(self._tu_columns, index)
+    head, _ = self._decode(
+      self._tu_streams, self._tu_stream_starts[index], self._tu_stream_starts[index + 1]
+    )
+    kwargs["props"] = [item for item in head if isinstance(item, Prop)]
+    kwargs["notes"] = [item for item in head if isinstance(item, Note)]
+    kwargs["variants"] = [
+      self._materialize_tuv(tuv_index)
+      for tuv_index in range(self._variant_starts[index], self._variant_starts[index + 1])
+    ]
+    return Tu(**kwargs)
+
+  def __len__(self) -> int:
+    return len(self._variant_starts) - 1
+
+  @overload
+  def __getitem__(self, index: int) -> Tu: ...
+  @overload
+  def __getitem__(self, index: slice) -> list[Tu]: ...
+  def __getitem__(self, index: int | slice) -> Tu | list[Tu]:
+    if isinstance(index, slice):
+      return [self._materialize(i) for i in range(*index.indices(len(self)))]
+    length = len(self)
+    if index < 0:
+      index += length
+    if not 0 <= index < length:
+      raise IndexError("CompactTuStore index out of range")
+    return self._materialize(index)
+
+  def __iter__(self) -> Iterator[Tu]:
+    for index in range(len(self)):
+      yield self._materialize(index)
+
+  def __repr__(self) -> str:
+    return f"{self.__class__.__name__}(<{len(self)} units>)"
+
+  @property
+  def nbytes(self) -> int:
+    """
+    Approximate memory used by the store, in bytes.
+
+    Counts the array buffers, the string table and the unique values (as
+    reported by ``sys.getsizeof``), not the fixed overhead of the containers.
+    """
+    size = sum(a.itemsize * len(a) for a in self._arrays()) + len(self._text)
+    size += self._tu_columns.nbytes() + self._tuv_columns.nbytes()
+    return size + sum(getsizeof(value) for value in self._values)
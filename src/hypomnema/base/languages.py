@@ -0,0 +1,83 @@
+from functools import lru_cache
+
+__all__ = ["normalize_language_tag", "language_matches"]
+
+
+@lru_cache(maxsize=4096)
+def normalize_language_tag(tag: str) -> str:
+  """
+  Normalize a BCP-47 language tag to its conventional form.
+
+  Underscores are replaced by hyphens and subtags get their conventional
+  case: lowercase language, titlecase script (``Hant``), uppercase region
+  (``US``, ``419``). Subtags following a singleton (extensions and private
+  use, e.g. ``x-foo``) are lowercased. The tag is not validated against the
+  IANA registry.
+
+  Parameters
+  ----------
+  tag : str
+      The language tag, e.g. ``"en_us"`` or ``"ZH-hant-tw"``.
+
+  Returns
+  -------
+  str
+      The normalized tag, e.g. ``"en-US"`` or ``"zh-Hant-TW"``.
+
+  Examples
+  --------
+  >>> normalize_language_tag("sr_latn_rs")
+  'sr-Latn-RS'
+  """
+  subtags = tag.strip().replace("_", "-").lower().split("-")
+  in_extension = False
+  for index in range(1, len(subtags)):
+    subtag = subtags[index]
+    if len(subtag) == 1:
+      in_extension = True
+    elif in_extension:
+      continue
+    elif len(subtag) == 4 and subtag.isalpha():
+      subtags[index] = subtag.title()
+    elif (len(subtag) == 2 and subtag.isalpha()) or (len(subtag) == 3 and subtag.isdigit()):
+      subtags[index] = subtag.upper()
+  return "-".join(subtags)
+
+
+def language_matches(tag: str | None, language_range: str) -> bool:
+  """
+  Check whether a language tag matches a language range.
+
+  Implements the "basic filtering" scheme of RFC 4647: the comparison is
+  case-insensitive (underscores count as hyphens) and a range matches a tag
+  if it is equal to it or to one of its prefixes ending on a subtag boundary.
+  The range ``"*"`` matches every tag.
+
+  Parameters
+  ----------
+  tag : str | None
+      The language tag to test, e.g. an ``xml:lang`` value. None never matches.
+  language_range : str
+      The language range, e.g. ``"en"`` or ``"zh-Hant"``.
+
+  Returns
+  -------
+  bool
+      Whether the tag falls within the range.
+
+  Examples
+  --------
+  >>> language_matches("en-US", "en")
+  True
+  >>> language_matches("en", "en-US")
+  False
+  >>> language_matches("eng", "en")
+  False
+  """
+  if tag is None:
+    return False
+  if language_range == "*":
+    return True
+  tag = normalize_language_tag(tag)
+  language_range = normalize_language_tag(language_range)
+  return tag == language_range or tag.startswith(language_range + "-")
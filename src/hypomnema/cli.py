@@ -0,0 +1,548 @@
+"""
+Command-line interface.
+
+Installed as the ``hypomnema`` command, also available as ``python -m
+hypomnema``; ``hypomnema --help`` lists the commands. Every command streams
+its input, so memory does not depend on the size of the files.
+
+Commands that process several files independently (``validate``,
+``stats``, ``convert``, ``filter`` and ``reencode``) run them on ``--jobs``
+processes. ``--progress`` reports the number of TUs (or files) processed
+and the rate on stderr.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain, islice, repeat
+from pathlib import Path
+from time import monotonic
+from typing import Any, TextIO
+
+from hypomnema.api.analysis import TmxStats, stats
+from hypomnema.api.core import load, save_stream
+from hypomnema.api.pipeline import Pipeline
+from hypomnema.api.text import TextMode, to_text
+from hypomnema.base.errors import XmlDeserializationError, XmlSerializationError
+from hypomnema.base.languages import language_matches
+from hypomnema.base.types import Header, Tu, Tuv
+from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.utils import normalize_encoding
+from hypomnema.xml.validation import validate
+
+__all__ = ["main"]
+
+
+class _Progress:
+  """Count of processed items and rate, rewritten in place on stderr."""
+
+  __slots__ = ("unit", "interval", "stream", "count", "started", "printed")
+
+  def __init__(self, unit: str, interval: float = 0.5, stream: TextIO | None = None) -> None:
+    self.unit = unit
+    self.interval = interval
+    self.stream = stream if stream is not None else sys.stderr
+    self.count = 0
+    self.started = self.printed = monotonic()
+
+  def update(self, count: int = 1) -> None:
+    self.count += count
+    if (now := monotonic()) - self.printed >= self.interval:
+      self.printed = now
+      self._print("\r")
+
+  def close(self) -> None:
+    self._print("\n")
+
+  def _print(self, end: str) -> None:
+    elapsed = monotonic() - self.started
+    rate = self.count / elapsed if elapsed else 0.0
+    print(
+      f"{self.count:,} {self.unit} in {elapsed:.1f}s ({rate:,.0f} {self.unit}/s)",
+      end=end,
+      file=self.stream,
+      flush=True,
+    )
+
+
+def _make_backend(name: str) -> XmlBackend:
+  if name == "lxml":
+    try:
+      from hypomnema.xml.backends.lxml import LxmlBackend
+    except ImportError as e:
+      raise ValueError("the lxml backend requires lxml: pip install 'hypomnema[lxml]'") from e
+    return LxmlBackend()
+  return StandardBackend()
+
+
+def _counted[T](items: Iterable[T], meter: _Progress | None) -> Generator[T]:
+  for item in items:
+    if meter is not None:
+      meter.update()
+    yield item
+
+
+def _map_files[R](
+  func: Callable[..., R],
+  tasks: Sequence[tuple[Any, ...]],
+  jobs: int | None,
+  progress: bool,
+  unit: str = "TUs",
+) -> Generator[R]:
+  """
+  Call ``func(*task, meter)`` for every task, in order.
+
+  Tasks run in this process, sharing a meter that counts ``unit``, unless
+  there are several of them and ``jobs`` is greater than 1: they then run
+  on a pool of processes, without a meter, and finished tasks are counted.
+  """
+  if jobs is not None and jobs < 1:
+    raise ValueError(f"jobs must be at least 1, got {jobs}")
+  if jobs is None or jobs == 1 or len(tasks) < 2:
+    meter = _Progress(unit) if progress else None
+    try:
+      for task in tasks:
+        yield func(*task, meter)
+    finally:
+      if meter is not None:
+        meter.close()
+    return
+  meter = _Progress("files") if progress else None
+  try:
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+      for result in executor.map(func, *zip(*tasks), repeat(None)):
+        if meter is not None:
+          meter.update()
+        yield result
+  finally:
+    if meter is not None:
+      meter.close()
+
+
+def _outputs(files: Sequence[str], output: str, suffix: str | None = None) -> list[Path]:
+  """The output path of every input: ``output`` itself, or a file in that directory."""
+  target = Path(output)
+  if len(files) == 1 and not target.is_dir():
+    return [target]
+  if target.exists() and not target.is_dir():
+    raise NotADirectoryError(f"{target} must be a directory when several files are given")
+  target.mkdir(parents=True, exist_ok=True)
+  names = [Path(file).name for file in files]
+  if len(set(names)) < len(names):
+    raise ValueError(f"Several input files have the same name, cannot write them all to {target}")
+  return [target / (Path(name).with_suffix(suffix) if suffix else Path(name)) for name in names]
+
+
+def _read(path: str | Path, backend: XmlBackend) -> tuple[Header | None, Iterator[Tu]]:
+  """The header of a file and a stream of its TUs."""
+  elements = load(path, filter=("header", "tu"), backend=backend)
+  first = next(elements, None)
+  header = first if isinstance(first, Header) else None
+  if header is None and first is not None:
+    elements = chain((first,), elements)
+  return header, (tu for tu in elements if isinstance(tu, Tu))
+
+
+def _matching(tu: Tu, languages: Sequence[str]) -> list[Tuv] | None:
+  """The variants of ``tu`` in ``languages``, None if one of them is missing."""
+  variants = [
+    tuv for tuv in tu.variants if any(language_matches(tuv.lang, lang) for lang in languages)
+  ]
+  for lang in languages:
+    if not any(language_matches(tuv.lang, lang) for tuv in variants):
+      return None
+  return variants
+
+
+def _parse_props(values: Sequence[str]) -> list[tuple[str, str | None]]:
+  props = []
+  for value in values:
+    prop_type, sep, text = value.partition("=")
+    if not prop_type:
+      raise ValueError(f"Invalid --prop {value!r}, expected TYPE or TYPE=VALUE")
+    props.append((prop_type, text if sep else None))
+  return props
+
+
+# Workers, called in child processes when --jobs is set: they take the
+# command options as plain values and return plain values.
+
+
+def _validate_file(path: str, meter: _Progress | None, *, check_pairing: bool) -> list[str]:
+  violations = validate(path, check_pairing=check_pairing)
+  if meter is not None:
+    meter.update()
+  return [f"{path}:{v.line}:{v.column}: {v.check}: {v.message}" for v in violations]
+
+
+def _stats_file(path: str, meter: _Progress | None, *, encoding: str | None) -> TmxStats:
+  report = stats(path, encoding=encoding)
+  if meter is not None:
+    meter.update()
+  return report
+
+
+def _convert_file(
+  path: str,
+  output: Path,
+  meter: _Progress | None,
+  *,
+  backend: str,
+  fmt: str,
+  languages: Sequence[str],
+  codes: TextMode,
+) -> int:
+  _, tus = _read(path, _make_backend(backend))
+  count = 0
+  with open(output, "w", encoding="utf-8", newline="\n") as file:
+    if fmt == "tsv":
+      file.write("\t".join(languages) + "\n")
+    for tu in _counted(tus, meter):
+      variants = _matching(tu, languages) if languages else tu.variants
+      if variants is None:
+        continue
+      if fmt == "tsv":
+        texts = [
+          next(to_text(tuv, codes) for tuv in variants if language_matches(tuv.lang, lang))
+          for lang in languages
+        ]
+        file.write("\t".join(" ".join(text.split()) for text in texts) + "\n")
+      else:
+        row: dict[str, str | None] = {"tuid": tu.tuid}
+        for tuv in variants:
+          key = next((lang for lang in languages if language_matches(tuv.lang, lang)), tuv.lang)
+          row.setdefault(key, to_text(tuv, codes))
+        file.write(json.dumps(row, ensure_ascii=False) + "\n")
+      count += 1
+  return count
+
+
+def _filter_file(
+  path: str,
+  output: Path,
+  meter: _Progress | None,
+  *,
+  backend: str,
+  languages: Sequence[str],
+  props: Sequence[tuple[str, str | None]],
+) -> int:
+  pipeline = Pipeline(path, backend=_make_backend(backend))
+  if meter is not None:
+    pipeline.tee(lambda _: meter.update(), name="progress")
+  if props:
+    pipeline.filter(
+      lambda tu: all(
+        any(prop.type == kind and (text is None or prop.text == text) for prop in tu.props)
+        for kind, text in props
+      ),
+      name="props",
+    )
+  if languages:
+
+    def select(tu: Tu) -> tuple[Tu, ...]:
+      if (variants := _matching(tu, languages)) is None:
+        return ()
+      tu.variants = variants
+      return (tu,)
+
+    pipeline.flat_map(select, name="languages")
+  return pipeline.write(output)
+
+
+def _reencode_file(
+  path: str, output: Path, meter: _Progress | None, *, backend: str, encoding: str
+) -> int:
+  pipeline = Pipeline(path, backend=_make_backend(backend))
+  if meter is not None:
+    pipeline.tee(lambda _: meter.update(), name="progress")
+  return pipeline.write(output, encoding=encoding)
+
+
+# Commands
+
+
+def _run_validate(args: Namespace) -> int:
+  worker = partial(_validate_file, check_pairing=not args.no_pairing)
+  problems = 0
+  for lines in _map_files(
+    worker, [(file,) for file in args.files], args.jobs, args.progress, "files"
+  ):
+    for line in lines:
+      print(line)
+    problems += len(lines)
+  if problems:
+    print(f"{problems:,} problems found", file=sys.stderr)
+  return 1 if problems else 0
+
+
+def _format_stats(report: TmxStats) -> str:
+  lines = [
+    f"Files       {report.files:>12,}",
+    f"TUs         {report.tus:>12,}",
+    f"TUVs        {report.tuvs:>12,}",
+  ]
+  for label, first, last in (
+    ("Created", report.first_created, report.last_created),
+    ("Changed", report.first_changed, report.last_changed),
+  ):
+    if first is not None and last is not None:
+      lines.append(f"{label:<12}{first.isoformat()} to {last.isoformat()}")
+  if report.languages:
+    lines.append("")
+    lines.append(f"{'Language':<12}{'TUVs':>12}{'Words':>14}{'Characters':>14}{'Tags/TUV':>10}")
+    for lang, language in sorted(report.languages.items()):
+      lines.append(
+        f"{lang or '(none)':<12}{language.tuvs:>12,}{language.words:>14,}"
+        f"{language.characters:>14,}{language.inline_density:>10.2f}"
+      )
+  if report.props:
+    lines.append("")
+    lines.append(f"{'Prop type':<24}{'Count':>12}")
+    for prop_type, count in report.props.most_common():
+      lines.append(f"{prop_type or '(none)':<24}{count:>12,}")
+  return "\n".join(lines)
+
+
+def _run_stats(args: Namespace) -> int:
+  worker = partial(_stats_file, encoding=args.encoding)
+  report = TmxStats()
+  for partial_report in _map_files(
+    worker, [(file,) for file in args.files], args.jobs, args.progress, "files"
+  ):
+    report.merge(partial_report)
+  print(json.dumps(report.as_dict(), indent=2) if args.json else _format_stats(report))
+  return 0
+
+
+def _run_split(args: Namespace) -> int:
+  if args.size < 1:
+    raise ValueError(f"--size must be at least 1, got {args.size}")
+  source = Path(args.file)
+  directory = Path(args.output) if args.output is not None else source.parent
+  backend = _make_backend(args.backend)
+  header, tus = _read(source, backend)
+  meter = _Progress("TUs") if args.progress else None
+  tus = _counted(tus, meter)
+  part = 0
+  try:
+    while (first := next(tus, None)) is not None:
+      part += 1
+      output = directory / f"{source.stem}-{part:04d}{source.suffix}"
+      # Each part is streamed: only the TU being written is in memory
+      chunk = chain((first,), islice(tus, args.size - 1))
+      count = save_stream(chunk, output, header=header, backend=backend)
+      print(f"{output}: {count:,} TUs")
+  finally:
+    if meter is not None:
+      meter.close()
+  return 0
+
+
+def _run_merge(args: Namespace) -> int:
+  backend = _make_backend(args.backend)
+  header, tus = _read(args.files[0], backend)
+  rest = (load(file, filter="tu", backend=backend) for file in args.files[1:])
+  meter = _Progress("TUs") if args.progress else None
+  try:
+    count = save_stream(
+      _counted(chain(tus, *rest), meter), args.output, header=header, backend=backend
+    )
+  finally:
+    if meter is not None:
+      meter.close()
+  print(f"{args.output}: {count:,} TUs")
+  return 0
+
+
+def _run_per_file(args: Namespace, worker: Callable[..., int], suffix: str | None = None) -> int:
+  outputs = _outputs(args.files, args.output, suffix)
+  tasks = list(zip(args.files, outputs))
+  for output, count in zip(outputs, _map_files(worker, tasks, args.jobs, args.progress)):
+    print(f"{output}: {count:,} TUs")
+  return 0
+
+
+def _run_convert(args: Namespace) -> int:
+  languages = args.lang or []
+  if args.format == "tsv" and not languages:
+    raise ValueError("--lang is required with --format tsv")
+  worker = partial(
+    _convert_file, backend=args.backend, fmt=args.format, languages=languages, codes=args.codes
+  )
+  return _run_per_file(args, worker, f".{args.format}")
+
+
+def _run_filter(args: Namespace) -> int:
+  if not args.lang and not args.prop:
+    raise ValueError("at least one --lang or --prop is required")
+  worker = partial(
+    _filter_file,
+    backend=args.backend,
+    languages=args.lang or [],
+    props=_parse_props(args.prop or []),
+  )
+  return _run_per_file(args, worker)
+
+
+def _run_reencode(args: Namespace) -> int:
+  worker = partial(_reencode_file, backend=args.backend, encoding=normalize_encoding(args.to))
+  return _run_per_file(args, worker)
+
+
+def _parser() -> ArgumentParser:
+  parser = ArgumentParser(prog="hypomnema", description="Work with TMX files.")
+  commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+  backend = ArgumentParser(add_help=False)
+  backend.add_argument(
+    "--backend",
+    choices=("standard", "lxml"),
+    default="standard",
+    help="XML backend used to read and write TMX (default: standard)",
+  )
+  jobs = ArgumentParser(add_help=False)
+  jobs.add_argument(
+    "-j", "--jobs", type=int, help="number of files processed in parallel processes"
+  )
+  progress = ArgumentParser(add_help=False)
+  progress.add_argument(
+    "--progress", action="store_true", help="report progress and throughput on stderr"
+  )
+  per_file = ArgumentParser(add_help=False, parents=[backend, jobs, progress])
+  per_file.add_argument("files", nargs="+", help="TMX files to read")
+  per_file.add_argument(
+    "-o", "--output", required=True, help="output file, or directory when several files are given"
+  )
+
+  command = commands.add_parser(
+    "validate",
+    parents=[jobs, progress],
+    help="check TMX files without loading them",
+    description="Check TMX files in a single streaming pass and print every problem found. "
+    "Exits with status 1 if there is any.",
+  )
+  command.add_argument("files", nargs="+", help="TMX files to check")
+  command.add_argument(
+    "--no-pairing", action="store_true", help="do not check that <bpt> and <ept> are paired"
+  )
+  command.set_defaults(func=_run_validate)
+
+  command = commands.add_parser(
+    "stats",
+    parents=[jobs, progress],
+    help="count units, languages, words, tags, props and dates",
+    description="Compute the statistics of TMX files in a single streaming pass.",
+  )
+  command.add_argument("files", nargs="+", help="TMX files; their statistics are merged")
+  command.add_argument("--encoding", help="override the encoding declared in the files")
+  command.add_argument("--json", action="store_true", help="print the statistics as JSON")
+  command.set_defaults(func=_run_stats)
+
+  command = commands.add_parser(
+    "split",
+    parents=[backend, progress],
+    help="split a TMX file into files of at most N TUs",
+    description="Split a TMX file into NAME-0001.tmx, NAME-0002.tmx... of at most --size TUs "
+    "each, all with the header of the source.",
+  )
+  command.add_argument("file", help="TMX file to split")
+  command.add_argument("-n", "--size", type=int, required=True, help="number of TUs per file")
+  command.add_argument(
+    "-o", "--output", help="directory of the parts (default: that of the source)"
+  )
+  command.set_defaults(func=_run_split)
+
+  command = commands.add_parser(
+    "merge",
+    parents=[backend, progress],
+    help="concatenate the TUs of several TMX files",
+    description="Write the TUs of all the files, in order, to a single TMX file with the "
+    "header of the first one.",
+  )
+  command.add_argument("files", nargs="+", help="TMX files to merge")
+  command.add_argument("-o", "--output", required=True, help="TMX file to write")
+  command.set_defaults(func=_run_merge)
+
+  command = commands.add_parser(
+    "convert",
+    parents=[per_file],
+    help="export the text of TMX files as TSV or JSON Lines",
+    description="Write one line per TU with the text of its variants, as TSV (one column per "
+    "--lang, with a header row) or JSON Lines (an object per TU, keyed by language).",
+  )
+  command.add_argument("-f", "--format", choices=("tsv", "jsonl"), default="tsv")
+  command.add_argument(
+    "-l",
+    "--lang",
+    action="append",
+    help="language to export, matched as a language range; TUs without a variant in every "
+    "given language are skipped (repeatable, required for tsv)",
+  )
+  command.add_argument(
+    "--codes",
+    choices=("strip", "placeholder", "native"),
+    default="strip",
+    help="how inline codes are rendered (default: strip)",
+  )
+  command.set_defaults(func=_run_convert)
+
+  command = commands.add_parser(
+    "filter",
+    parents=[per_file],
+    help="keep the TUs in some languages or with some props",
+    description="Write the TUs matching every condition to a new TMX file.",
+  )
+  command.add_argument(
+    "-l",
+    "--lang",
+    action="append",
+    help="keep only the variants in this language range, and only the TUs that have one "
+    "(repeatable)",
+  )
+  command.add_argument(
+    "-p",
+    "--prop",
+    action="append",
+    metavar="TYPE[=VALUE]",
+    help="keep only the TUs with a <prop> of this type, and value if given (repeatable)",
+  )
+  command.set_defaults(func=_run_filter)
+
+  command = commands.add_parser(
+    "reencode",
+    parents=[per_file],
+    help="rewrite TMX files in another encoding",
+    description="Rewrite TMX files in another encoding. Characters it cannot represent are "
+    "written as character references.",
+  )
+  command.add_argument("--to", required=True, help="encoding of the output, e.g. utf-16")
+  command.set_defaults(func=_run_reencode)
+  return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+  """
+  Run the command line interface.
+
+  Parameters
+  ----------
+  argv : Sequence[str] | None, optional
+      The arguments, without the program name. Defaults to ``sys.argv[1:]``.
+
+  Returns
+  -------
+  int
+      The exit status: 0 on success, 1 if the command failed (or, for
+      ``validate``, found problems) and 2 for invalid arguments.
+  """
+  parser = _parser()
+  args = parser.parse_args(argv)
+  try:
+    return args.func(args)
+  except (OSError, ValueError, XmlDeserializationError, XmlSerializationError) as e:
+    print(f"{parser.prog}: error: {e}", file=sys.stderr)
+    return 1
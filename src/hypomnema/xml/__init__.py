@@ -1,5 +1,49 @@
-from .backends import StandardBackend, LxmlBackend, XmlBackend  # type: ignore
-from .deserialization import Deserializer
-from .serialization import Serializer
+from typing import TYPE_CHECKING
 
-__all__ = ["StandardBackend", "LxmlBackend", "Deserializer", "Serializer", "XmlBackend"]
+from hypomnema._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+  from .backends import StandardBackend, LxmlBackend, XmlBackend
+  from .deserialization import Deserializer
+  from .diagnostics import Diagnostic, Diagnostics
+  from .output import AtomicWriter
+  from .progress import MetricsSink, Progress, ProgressReporter
+  from .serialization import Serializer
+  from .validation import TmxValidator, Violation, validate
+
+__all__ = [
+  "StandardBackend",
+  "LxmlBackend",
+  "Deserializer",
+  "Diagnostic",
+  "Diagnostics",
+  "AtomicWriter",
+  "MetricsSink",
+  "Progress",
+  "ProgressReporter",
+  "Serializer",
+  "XmlBackend",
+  "TmxValidator",
+  "Violation",
+  "validate",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+  __name__,
+  {
+    "StandardBackend": ".backends",
+    "LxmlBackend": ".backends",
+    "XmlBackend": ".backends",
+    "Deserializer": ".deserialization",
+    "Diagnostic": ".diagnostics",
+    "Diagnostics": ".diagnostics",
+    "AtomicWriter": ".output",
+    "MetricsSink": ".progress",
+    "Progress": ".progress",
+    "ProgressReporter": ".progress",
+    "Serializer": ".serialization",
+    "TmxValidator": ".validation",
+    "Violation": ".validation",
+    "validate": ".validation",
+  },
+)
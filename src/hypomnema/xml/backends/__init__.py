@@ -1,14 +1,28 @@
+from typing import TYPE_CHECKING, Any
 from warnings import warn
 
-from .base import XmlBackend
-from .standard import StandardBackend
+from hypomnema._lazy import lazy_attributes
 
+if TYPE_CHECKING:
+  from .base import XmlBackend
+  from .lxml import LxmlBackend
+  from .standard import StandardBackend
 
-try:
-  from .lxml import LxmlBackend  # noqa: F401
+__all__ = ["XmlBackend", "StandardBackend", "LxmlBackend"]
 
-except ImportError as e:
-  warn(f"lxml not installed, Only StandardBackend will be available. Error: {e}")
-  LxmlBackend = None  # type: ignore[assignment]
+_getattr, __dir__ = lazy_attributes(
+  __name__, {"XmlBackend": ".base", "StandardBackend": ".standard", "LxmlBackend": ".lxml"}
+)
 
-__all__ = ["XmlBackend", "StandardBackend", "LxmlBackend"]
+
+def __getattr__(name: str) -> Any:
+  # lxml is an optional dependency: it is only imported when LxmlBackend is
+  # first requested, and LxmlBackend is None if it is not installed.
+  if name != "LxmlBackend":
+    return _getattr(name)
+  try:
+    return _getattr(name)
+  except ImportError as e:
+    warn(f"lxml not installed, Only StandardBackend will be available. Error: {e}")
+    globals()[name] = None
+    return None
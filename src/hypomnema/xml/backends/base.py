@@ -1,9 +1,13 @@
 from typing import overload, Literal
 from logging import Logger, getLogger
+from codecs import getincrementalencoder
 from contextlib import nullcontext
+from copy import deepcopy
 from pathlib import Path
 from io import BufferedIOBase
 from hypomnema.xml.utils import make_usable_path, normalize_encoding, is_ncname, QName
+from hypomnema.xml.output import AtomicWriter, DEFAULT_BUFFER_SIZE, FsyncPolicy
+from hypomnema.xml.progress import ProgressReporter
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Iterator, Generator, Iterable, Mapping, MutableMapping
 from os import PathLike
@@ -323,6 +327,25 @@ class XmlBackend[TypeOfElement](ABC):
     """
     ...
 
+  def get_line(self, element: TypeOfElement) -> int | None:
+    """Return the line an element starts at in the parsed source.
+
+    Only used to locate diagnostics. Backends that do not track source
+    positions return None, which is the default.
+
+    Parameters
+    ----------
+    element : T_Element
+        The element to locate.
+
+    Returns
+    -------
+    int | None
+        The 1-based line of the element's opening tag, or None if unknown.
+
+    """
+    return None
+
   @abstractmethod
   def set_tail(self, element: TypeOfElement, tail: str | None) -> None:
     """Set the trailing text of an element.
@@ -380,7 +403,13 @@ class XmlBackend[TypeOfElement](ABC):
     ...
 
   @abstractmethod
-  def parse(self, path: str | bytes | PathLike, encoding: str = "utf-8") -> TypeOfElement:
+  def parse(
+    self,
+    path: str | bytes | PathLike,
+    encoding: str = "utf-8",
+    *,
+    progress: ProgressReporter | None = None,
+  ) -> TypeOfElement:
     """Parse an XML file and return the root element.
 
     Parameters
@@ -390,6 +419,9 @@ class XmlBackend[TypeOfElement](ABC):
         or PathLike object.
     encoding : str, optional
         The encoding to use when reading the file. Defaults to ``"utf-8"``.
+    progress : ProgressReporter | None, optional
+        Reporter the bytes read are counted to, as the ``"parse"``
+        operation. Defaults to None.
 
     Returns
     -------
@@ -410,10 +442,19 @@ class XmlBackend[TypeOfElement](ABC):
 
   @abstractmethod
   def write(
-    self, element: TypeOfElement, path: str | bytes | PathLike, encoding: str = "utf-8"
+    self,
+    element: TypeOfElement,
+    path: str | bytes | PathLike,
+    encoding: str = "utf-8",
+    *,
+    fsync: FsyncPolicy = "none",
+    progress: ProgressReporter | None = None,
   ) -> None:
     """Write an element tree to an XML file.
 
+    The file is written atomically through an ``AtomicWriter``: it is
+    replaced only once fully written, and left untouched on error.
+
     Parameters
     ----------
     element : T_Element
@@ -422,6 +463,11 @@ class XmlBackend[TypeOfElement](ABC):
         The destination path for the XML file.
     encoding : str, optional
         The encoding to use when writing the file. Defaults to ``"utf-8"``.
+    fsync : {"none", "file", "full"}, optional
+        The durability policy, see ``AtomicWriter``. Defaults to ``"none"``.
+    progress : ProgressReporter | None, optional
+        Reporter the bytes written are counted to, as the ``"write"``
+        operation. Defaults to None.
 
     Raises
     ------
@@ -455,6 +501,28 @@ class XmlBackend[TypeOfElement](ABC):
     """
     ...
 
+  def detach(self, element: TypeOfElement) -> TypeOfElement:
+    """Return a copy of an element that stays intact when the original is cleared.
+
+    ``iterparse`` clears the elements it yields as soon as the next one is
+    requested. Detaching an element right after it is yielded lets it be
+    processed later, e.g. by another thread, while parsing goes on.
+    The default implementation returns a deep copy.
+
+    Parameters
+    ----------
+    element : T_Element
+        The element to detach.
+
+    Returns
+    -------
+    T_Element
+        An element with the same tag, attributes, text and children, which
+        is not affected by clearing ``element``.
+
+    """
+    return deepcopy(element)
+
   @abstractmethod
   def to_bytes(
     self, element: TypeOfElement, encoding: str = "utf-8", self_closing: bool = False
@@ -485,6 +553,34 @@ class XmlBackend[TypeOfElement](ABC):
     """
     ...
 
+  def to_string(self, element: TypeOfElement, self_closing: bool = False) -> str:
+    """Convert an element to its XML representation as a string.
+
+    Writers use it to encode many elements at once, in the target encoding.
+    The default implementation decodes the UTF-8 output of ``to_bytes``;
+    backends override it to serialize to text directly.
+
+    Parameters
+    ----------
+    element : T_Element
+        The element to serialize.
+    self_closing : bool, optional
+        If True, empty elements are written as self-closing tags. Defaults
+        to False, as in ``to_bytes``.
+
+    Returns
+    -------
+    str
+        The XML representation of the element, without XML declaration.
+
+    Raises
+    ------
+    TypeError
+        If ``element`` is not a valid element type for this backend.
+
+    """
+    return self.to_bytes(element, "utf-8", self_closing).decode("utf-8")
+
   def register_namespace(self, prefix: str | None, uri: str) -> None:
     """Register a namespace mapping for use in tag and attribute resolution.
 
@@ -527,6 +623,8 @@ class XmlBackend[TypeOfElement](ABC):
     tag_filter: str | Collection[str] | None = None,
     *,
     nsmap: Mapping[str | None, str] | None = None,
+    keep_yielded: int = 1,
+    progress: ProgressReporter | None = None,
   ) -> Iterator[TypeOfElement]:
     """Iteratively parse an XML file, yielding elements as they are closed.
 
@@ -558,6 +656,15 @@ class XmlBackend[TypeOfElement](ABC):
     nsmap : Mapping[str, str] | None, optional
         Namespace map to use for resolving prefixed tag names in the filter.
         If not provided, uses the backend's global namespace map.
+    keep_yielded : int, optional
+        Number of yielded elements that are kept intact before being cleared.
+        Elements that are safe to clear are cleared in groups of
+        ``keep_yielded``, when the element following the group is requested,
+        so the last ``keep_yielded`` elements can be processed together.
+        Defaults to 1.
+    progress : ProgressReporter | None, optional
+        Reporter the bytes read and the yielded elements are counted to, as
+        the ``"iterparse"`` operation. Defaults to None.
 
     Yields
     ------
@@ -569,7 +676,7 @@ class XmlBackend[TypeOfElement](ABC):
     FileNotFoundError
         If the specified file does not exist.
     ValueError
-        If the file is not valid XML.
+        If the file is not valid XML, or if ``keep_yielded`` is lower than 1.
 
     Notes
     -----
@@ -582,9 +689,16 @@ class XmlBackend[TypeOfElement](ABC):
     ...
 
   def _iterparse(
-    self, ctx: Iterator[tuple[str, TypeOfElement]], tag_filter: set[str] | None
+    self,
+    ctx: Iterator[tuple[str, TypeOfElement]],
+    tag_filter: set[str] | None,
+    keep_yielded: int = 1,
+    progress: ProgressReporter | None = None,
   ) -> Generator[TypeOfElement]:
+    if keep_yielded < 1:
+      raise ValueError(f"keep_yielded must be at least 1, got {keep_yielded}")
     elements_pending_yield: list[TypeOfElement] = []
+    elements_pending_clear: list[TypeOfElement] = []
 
     for event, elem in ctx:
       if event == "start":
@@ -597,7 +711,16 @@ class XmlBackend[TypeOfElement](ABC):
         continue
       if elem is elements_pending_yield[-1]:
         elements_pending_yield.pop()
+        if progress is not None:
+          progress.add_elements()
         yield elem
+        if not elements_pending_yield and keep_yielded > 1:
+          elements_pending_clear.append(elem)
+          if len(elements_pending_clear) >= keep_yielded:
+            for pending in elements_pending_clear:
+              self.clear(pending)
+            elements_pending_clear.clear()
+          continue
       if not elements_pending_yield:
         self.clear(elem)
 
@@ -609,8 +732,11 @@ class XmlBackend[TypeOfElement](ABC):
     *,
     root_elem: TypeOfElement | None = None,
     max_number_of_elements_in_buffer: int = 1000,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
     write_xml_declaration: bool = True,
     write_doctype: bool = True,
+    fsync: FsyncPolicy = "none",
+    progress: ProgressReporter | None = None,
   ) -> None:
     """Iteratively write elements to an XML file with streaming.
 
@@ -624,7 +750,8 @@ class XmlBackend[TypeOfElement](ABC):
     ----------
     path : str | bytes | PathLike | BufferedIOBase
         The destination path or file-like object for the XML output.
-        If a PathLike or string, the file is created (or overwritten).
+        If a PathLike or string, the file is created (or replaced)
+        atomically through an ``AtomicWriter``.
         If a BufferedIOBase, it must be opened in binary write mode.
     elements : Iterable[T_Element]
         The elements to write. Elements are processed lazily and buffered
@@ -639,15 +766,27 @@ class XmlBackend[TypeOfElement](ABC):
         The number of elements to buffer before flushing.
         Larger values may improve performance but increase memory usage.
         Must be at least 1. Defaults to 1000.
+    buffer_size : int, optional
+        The number of characters to buffer before encoding and flushing
+        them, whichever of the two limits is reached first. When writing to
+        a path, it is also the size in bytes of the writes made to disk.
+        Must be at least 1. Defaults to ``DEFAULT_BUFFER_SIZE`` (1 MiB).
     write_declaration : bool, optional
         If True (default), include the xml declaration.
     write_doctype : bool, optional
         If True (default), include the TMX DOCTYPE declaration.
+    fsync : {"none", "file", "full"}, optional
+        The durability policy when writing to a path, see ``AtomicWriter``.
+        Ignored for file-like objects. Defaults to ``"none"``.
+    progress : ProgressReporter | None, optional
+        Reporter the written elements and bytes are counted to, as the
+        ``"iterwrite"`` operation. Defaults to None.
 
     Raises
     ------
     ValueError
-        If ``max_number_of_elements_in_buffer`` is less than 1.
+        If ``max_number_of_elements_in_buffer`` or ``buffer_size`` is less
+        than 1.
     OSError
         If the file cannot be written.
 
@@ -666,37 +805,147 @@ class XmlBackend[TypeOfElement](ABC):
     Elements are written as self-closing tags (e.g., ``<elem/>``) when
     they have no text content.
 
+    Elements are serialized with ``to_string`` and encoded in batches by a
+    single incremental encoder, with characters the encoding cannot
+    represent written as character references. For UTF-16 and UTF-32 the
+    byte order mark is written once, at the start of the file.
+
+    """
+    if max_number_of_elements_in_buffer < 1 or buffer_size < 1:
+      raise ValueError("max_number_of_elements_in_buffer and buffer_size must be >= 1")
+    tracking = progress.track("iterwrite") if progress is not None else nullcontext()
+    with tracking:
+      self.write_strings(
+        path,
+        map(self.to_string, elements),
+        encoding,
+        root_elem=root_elem,
+        max_number_of_strings_in_buffer=max_number_of_elements_in_buffer,
+        buffer_size=buffer_size,
+        write_xml_declaration=write_xml_declaration,
+        write_doctype=write_doctype,
+        fsync=fsync,
+        progress=progress,
+      )
+
+  def write_strings(
+    self,
+    path: str | bytes | PathLike | BufferedIOBase,
+    strings: Iterable[str],
+    encoding: str = "utf-8",
+    *,
+    root_elem: TypeOfElement | None = None,
+    prefix: str = "",
+    suffix: str = "",
+    max_number_of_strings_in_buffer: int = 1000,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    write_xml_declaration: bool = True,
+    write_doctype: bool = True,
+    fsync: FsyncPolicy = "none",
+    progress: ProgressReporter | None = None,
+  ) -> int:
+    """Write already serialized elements to an XML file with streaming.
+
+    The writer behind ``iterwrite``, for callers that serialize elements
+    themselves: ``strings`` are written between the opening and closing
+    tags of the root element, after ``prefix`` and before ``suffix``.
+
+    Parameters
+    ----------
+    path : str | bytes | PathLike | BufferedIOBase
+        The destination, as for ``iterwrite``.
+    strings : Iterable[str]
+        The serialized elements to write, consumed lazily.
+    encoding : str, optional
+        The encoding to use for the output file. Defaults to ``"utf-8"``.
+    root_elem : T_Element | None, optional
+        The root element, as for ``iterwrite``. Defaults to a
+        ``<tmx version="1.4">`` element.
+    prefix : str, optional
+        Markup written right after the opening tag of the root element,
+        e.g. a serialized `<header>` and ``"<body>"``. Defaults to "".
+    suffix : str, optional
+        Markup written right before its closing tag. Defaults to "".
+    max_number_of_strings_in_buffer : int, optional
+        The number of strings to buffer before flushing. Must be at least 1.
+        Defaults to 1000.
+    buffer_size : int, optional
+        As for ``iterwrite``. Defaults to ``DEFAULT_BUFFER_SIZE`` (1 MiB).
+    write_xml_declaration : bool, optional
+        If True (default), include the xml declaration.
+    write_doctype : bool, optional
+        If True (default), include the TMX DOCTYPE declaration.
+    fsync : {"none", "file", "full"}, optional
+        As for ``iterwrite``. Defaults to ``"none"``.
+    progress : ProgressReporter | None, optional
+        Reporter the written strings and bytes are counted to. The caller
+        tracks the operation they belong to. Defaults to None.
+
+    Returns
+    -------
+    int
+        The number of written strings.
+
+    Raises
+    ------
+    ValueError
+        If ``max_number_of_strings_in_buffer`` or ``buffer_size`` is less
+        than 1, or if the closing tag of the root element cannot be found.
+    OSError
+        If the file cannot be written.
     """
-    if max_number_of_elements_in_buffer < 1:
-      raise ValueError("buffer_size must be >= 1")
+    if max_number_of_strings_in_buffer < 1 or buffer_size < 1:
+      raise ValueError("max_number_of_strings_in_buffer and buffer_size must be >= 1")
     if isinstance(path, (str, bytes, PathLike)):
       path = make_usable_path(path)
     _encoding = normalize_encoding(encoding)
     if root_elem is None:
       root_elem = self.create_element("tmx", attributes={"version": "1.4"})
 
-    root_string = self.to_bytes(root_elem, _encoding, self_closing=False)
-    pos = root_string.rfind(b"</")
+    root_string = self.to_string(root_elem, self_closing=False)
+    pos = root_string.rfind("</")
     if pos == -1:
       raise ValueError(
-        "Cannot find closing tag for root element after converting to bytes with 'self_closing=True'. Please check to_bytes() implementation.",
-        root_string.decode(_encoding),
+        "Cannot find closing tag for root element after converting to string with 'self_closing=False'. Please check to_string() implementation.",
+        root_string,
       )
 
-    buffer = []
-    ctx = open(path, "wb") if isinstance(path, Path) else nullcontext(path)
+    # Elements are serialized to text and encoded in batches by a single
+    # encoder, so the codec is resolved once and a BOM is only written once
+    encode = getincrementalencoder(_encoding)(errors="xmlcharrefreplace").encode
+    buffer: list[str] = []
+    if write_xml_declaration:
+      buffer.append(f'<?xml version="1.0" encoding="{_encoding}"?>\n')
+    if write_doctype:
+      buffer.append('<!DOCTYPE tmx SYSTEM "tmx14.dtd">\n')
+    buffer.append(root_string[:pos])
+    buffer.append(prefix)
+    buffered = 0
+    count = 0
+    ctx = (
+      AtomicWriter(path, buffer_size=buffer_size, fsync=fsync)
+      if isinstance(path, Path)
+      else nullcontext(path)
+    )
 
     with ctx as output:
-      if write_xml_declaration:
-        output.write(b'<?xml version="1.0" encoding="' + _encoding.encode(_encoding) + b'"?>\n')
-      if write_doctype:
-        output.write(b'<!DOCTYPE tmx SYSTEM "tmx14.dtd">\n')
-      output.write(root_string[:pos])
-      for elem in elements:
-        buffer.append(self.to_bytes(elem, _encoding))
-        if len(buffer) == max_number_of_elements_in_buffer:
-          output.write(b"".join(buffer))
+      for data in strings:
+        buffer.append(data)
+        buffered += len(data)
+        count += 1
+        if progress is not None:
+          progress.add_elements()
+        if len(buffer) >= max_number_of_strings_in_buffer or buffered >= buffer_size:
+          chunk = encode("".join(buffer))
+          output.write(chunk)
+          if progress is not None:
+            progress.add_bytes(len(chunk))
           buffer.clear()
-      if buffer:
-        output.write(b"".join(buffer))
-      output.write(root_string[pos:])
+          buffered = 0
+      buffer.append(suffix)
+      buffer.append(root_string[pos:])
+      chunk = encode("".join(buffer), final=True)
+      output.write(chunk)
+      if progress is not None:
+        progress.add_bytes(len(chunk))
+    return count
@@ -2,7 +2,11 @@ from typing import overload, Literal
 from collections.abc import Mapping, Collection, Generator, Iterator
 from hypomnema.xml.utils import QName, prep_tag_set, make_usable_path, normalize_encoding
 from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.output import AtomicWriter, FsyncPolicy
+from hypomnema.xml.progress import ProgressReporter
 import lxml.etree as et
+from contextlib import nullcontext
+from copy import deepcopy
 from os import PathLike
 
 __all__ = ["LxmlBackend"]
@@ -249,6 +253,11 @@ class LxmlBackend(XmlBackend[et._Element]):
       raise TypeError(f"Element is not an lxml.etree._Element: {type(element)}")
     return element.tail
 
+  def get_line(self, element: et._Element) -> int | None:
+    if not isinstance(element, et._Element):
+      raise TypeError(f"Element is not an lxml.etree._Element: {type(element)}")
+    return element.sourceline
+
   def set_tail(self, element: et._Element, tail: str | None) -> None:
     if not isinstance(element, et._Element):
       raise TypeError(f"Element is not an lxml.etree._Element: {type(element)}")
@@ -279,7 +288,13 @@ class LxmlBackend(XmlBackend[et._Element]):
       if tag_filter is None or child.tag in tag_filter:
         yield child
 
-  def parse(self, path: str | bytes | PathLike, encoding: str = "utf-8") -> et._Element:
+  def parse(
+    self,
+    path: str | bytes | PathLike,
+    encoding: str = "utf-8",
+    *,
+    progress: ProgressReporter | None = None,
+  ) -> et._Element:
     """Parse an XML file and return the root element.
 
     This implementation uses lxml's XMLParser with ``recover=True``,
@@ -291,6 +306,8 @@ class LxmlBackend(XmlBackend[et._Element]):
         The path to the XML file to parse.
     encoding : str, optional
         The encoding to use when reading the file. Defaults to ``"utf-8"``.
+    progress : ProgressReporter | None, optional
+        Reporter the bytes read are counted to. Defaults to None.
 
     Returns
     -------
@@ -299,18 +316,26 @@ class LxmlBackend(XmlBackend[et._Element]):
 
     """
     path = make_usable_path(path, mkdir=False)
-    root = et.parse(
-      path, parser=et.XMLParser(encoding=normalize_encoding(encoding), recover=True)
-    ).getroot()
-    return root
+    parser = et.XMLParser(encoding=normalize_encoding(encoding), recover=True)
+    if progress is None:
+      return et.parse(path, parser=parser).getroot()
+    with progress.reading("parse", path) as source:
+      return et.parse(source, parser=parser).getroot()
 
   def write(
-    self, element: et._Element, path: str | bytes | PathLike, encoding: str = "utf-8"
+    self,
+    element: et._Element,
+    path: str | bytes | PathLike,
+    encoding: str = "utf-8",
+    *,
+    fsync: FsyncPolicy = "none",
+    progress: ProgressReporter | None = None,
   ) -> None:
     """Write an element tree to an XML file.
 
     This implementation uses lxml's ``xmlfile`` context manager for
-    efficient writing with proper XML declaration handling.
+    efficient writing with proper XML declaration handling, into an
+    ``AtomicWriter``.
 
     Parameters
     ----------
@@ -320,20 +345,31 @@ class LxmlBackend(XmlBackend[et._Element]):
         The destination path for the XML file.
     encoding : str, optional
         The encoding to use when writing the file. Defaults to ``"utf-8"``.
+    fsync : {"none", "file", "full"}, optional
+        The durability policy, see ``AtomicWriter``. Defaults to ``"none"``.
+    progress : ProgressReporter | None, optional
+        Reporter the bytes written are counted to. Defaults to None.
 
     """
     if not isinstance(element, et._Element):
       raise TypeError(f"Element is not an lxml.etree._Element: {type(element)}")
-    path = make_usable_path(path, mkdir=True)
-    with et.xmlfile(path, encoding=normalize_encoding(encoding)) as f:
-      f.write_declaration()
-      f.write(element)
+    tracking = progress.track("write") if progress is not None else nullcontext()
+    with tracking, AtomicWriter(path, fsync=fsync, progress=progress) as output:
+      with et.xmlfile(output, encoding=normalize_encoding(encoding)) as f:
+        f.write_declaration()
+        f.write(element)
 
   def clear(self, element: et._Element) -> None:
     if not isinstance(element, et._Element):
       raise TypeError(f"Element is not an lxml.etree._Element: {type(element)}")
     element.clear()
 
+  def detach(self, element: et._Element) -> et._Element:
+    if not isinstance(element, et._Element):
+      raise TypeError(f"Element is not an lxml.etree._Element: {type(element)}")
+    # lxml frees the subtree of a cleared element, the copy lives in its own document
+    return deepcopy(element)
+
   def to_bytes(
     self, element: et._Element, encoding: str = "utf-8", self_closing: bool = False
   ) -> bytes:
@@ -343,12 +379,21 @@ class LxmlBackend(XmlBackend[et._Element]):
       element.text = ""
     return et.tostring(element, encoding=normalize_encoding(encoding), xml_declaration=False)
 
+  def to_string(self, element: et._Element, self_closing: bool = False) -> str:
+    if not isinstance(element, et._Element):
+      raise TypeError(f"Element is not an lxml.etree._Element: {type(element)}")
+    if not self_closing and not element.text:
+      element.text = ""
+    return et.tostring(element, encoding="unicode")
+
   def iterparse(
     self,
     path: str | bytes | PathLike,
     tag_filter: LxmlTagType | Collection[LxmlTagType] | None = None,
     *,
     nsmap: Mapping[str | None, str] | None = None,
+    keep_yielded: int = 1,
+    progress: ProgressReporter | None = None,
   ) -> Iterator[et._Element]:
     _nsmap = nsmap if nsmap is not None else self._global_nsmap
     match tag_filter:
@@ -361,5 +406,10 @@ class LxmlBackend(XmlBackend[et._Element]):
       case _:
         raise TypeError(f"Unexpected tag filter type: {type(tag_filter)}")
     path = make_usable_path(path, mkdir=False)
-    ctx = et.iterparse(path, events=("start", "end"))
-    yield from self._iterparse(ctx, tag_filter)
+    if progress is None:
+      ctx = et.iterparse(path, events=("start", "end"))
+      yield from self._iterparse(ctx, tag_filter, keep_yielded)
+      return
+    with progress.reading("iterparse", path) as source:
+      ctx = et.iterparse(source, events=("start", "end"))
+      yield from self._iterparse(ctx, tag_filter, keep_yielded, progress)
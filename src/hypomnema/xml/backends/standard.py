@@ -2,7 +2,11 @@ from typing import overload, Literal
 from collections.abc import Mapping, Collection, Generator, Iterator
 from hypomnema.xml.utils import QName, prep_tag_set, make_usable_path, normalize_encoding
 from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.output import AtomicWriter, FsyncPolicy
+from hypomnema.xml.progress import ProgressReporter
 import xml.etree.ElementTree as et
+from contextlib import nullcontext
+from copy import copy
 from os import PathLike
 
 __all__ = ["StandardBackend"]
@@ -178,19 +182,35 @@ class StandardBackend(XmlBackend[et.Element]):
       if tag_filter is None or child.tag in tag_filter:
         yield child
 
-  def parse(self, path: str | bytes | PathLike, encoding: str = "utf-8") -> et.Element:
+  def parse(
+    self,
+    path: str | bytes | PathLike,
+    encoding: str = "utf-8",
+    *,
+    progress: ProgressReporter | None = None,
+  ) -> et.Element:
     path = make_usable_path(path, mkdir=False)
-    root = et.parse(path, parser=et.XMLParser(encoding=normalize_encoding(encoding))).getroot()
-    return root
+    parser = et.XMLParser(encoding=normalize_encoding(encoding))
+    if progress is None:
+      return et.parse(path, parser=parser).getroot()
+    with progress.reading("parse", path) as source:
+      return et.parse(source, parser=parser).getroot()
 
   def write(
-    self, element: et.Element, path: str | bytes | PathLike, encoding: str = "utf-8"
+    self,
+    element: et.Element,
+    path: str | bytes | PathLike,
+    encoding: str = "utf-8",
+    *,
+    fsync: FsyncPolicy = "none",
+    progress: ProgressReporter | None = None,
   ) -> None:
     """Write an element tree to an XML file.
 
     This implementation uses ``ElementTree.write`` with ``short_empty_elements=False``,
     ensuring all empty elements have explicit closing tags (e.g., ``<elem></elem>``
-    rather than ``<elem/>``).
+    rather than ``<elem/>``). Its small writes are gathered by an
+    ``AtomicWriter`` into large ones.
 
     Parameters
     ----------
@@ -200,20 +220,32 @@ class StandardBackend(XmlBackend[et.Element]):
         The destination path for the XML file.
     encoding : str, optional
         The encoding to use when writing the file. Defaults to ``"utf-8"``.
+    fsync : {"none", "file", "full"}, optional
+        The durability policy, see ``AtomicWriter``. Defaults to ``"none"``.
+    progress : ProgressReporter | None, optional
+        Reporter the bytes written are counted to. Defaults to None.
 
     """
     if not isinstance(element, et.Element):
       raise TypeError(f"Element is not an xml.ElementTree.Element: {type(element)}")
-    path = make_usable_path(path, mkdir=True)
-    et.ElementTree(element).write(
-      path, normalize_encoding(encoding), xml_declaration=True, short_empty_elements=False
-    )
+    tracking = progress.track("write") if progress is not None else nullcontext()
+    with tracking, AtomicWriter(path, fsync=fsync, progress=progress) as output:
+      et.ElementTree(element).write(
+        output, normalize_encoding(encoding), xml_declaration=True, short_empty_elements=False
+      )
 
   def clear(self, element: et.Element) -> None:
     if not isinstance(element, et.Element):
       raise TypeError(f"Element is not an xml.ElementTree.Element: {type(element)}")
     element.clear()
 
+  def detach(self, element: et.Element) -> et.Element:
+    if not isinstance(element, et.Element):
+      raise TypeError(f"Element is not an xml.ElementTree.Element: {type(element)}")
+    # Clearing an element only drops its own references, so a shallow copy
+    # keeps the children (which iterparse never clears before their ancestor)
+    return copy(element)
+
   def to_bytes(
     self, element: et.Element, encoding: str = "utf-8", self_closing: bool = False
   ) -> bytes:
@@ -226,14 +258,26 @@ class StandardBackend(XmlBackend[et.Element]):
       short_empty_elements=self_closing,
     )
 
+  def to_string(self, element: et.Element, self_closing: bool = False) -> str:
+    if not isinstance(element, et.Element):
+      raise TypeError(f"Element is not an xml.ElementTree.Element: {type(element)}")
+    return et.tostring(element, encoding="unicode", short_empty_elements=self_closing)
+
   def iterparse(
     self,
     path: str | bytes | PathLike,
     tag_filter: str | Collection[str] | None = None,
     *,
     nsmap: Mapping[str | None, str] | None = None,
+    keep_yielded: int = 1,
+    progress: ProgressReporter | None = None,
   ) -> Iterator[et.Element]:
     tag_filter = prep_tag_set(tag_filter, nsmap if nsmap is not None else self._global_nsmap)
     path = make_usable_path(path, mkdir=False)
-    ctx = et.iterparse(path, events=("start", "end"))
-    yield from self._iterparse(ctx, tag_filter)
+    if progress is None:
+      ctx = et.iterparse(path, events=("start", "end"))
+      yield from self._iterparse(ctx, tag_filter, keep_yielded)
+      return
+    with progress.reading("iterparse", path) as source:
+      ctx = et.iterparse(source, events=("start", "end"))
+      yield from self._iterparse(ctx, tag_filter, keep_yielded, progress)
@@ -15,6 +15,10 @@ from ._handlers import (
   HiDeserializer,
 )
 from .deserializer import Deserializer
+from .expat import ExpatDeserializer
+from .interning import AttributeInterner, DEFAULT_INTERNED_ATTRIBUTES
+from .lazy import LazyContent
+from .projection import Projection
 
 
 __all__ = [
@@ -34,4 +38,12 @@ __all__ = [
   "HiDeserializer",
   # Main Deserializer
   "Deserializer",
+  "ExpatDeserializer",
+  # Interning
+  "AttributeInterner",
+  "DEFAULT_INTERNED_ATTRIBUTES",
+  # Lazy loading
+  "LazyContent",
+  # Projection
+  "Projection",
 ]
@@ -1,3 +1,6 @@
+from logging import Logger
+
+from hypomnema.api.text import TextProjector
 from hypomnema.xml.utils import check_tag
 from hypomnema.base.errors import XmlDeserializationError
 from hypomnema.base.types import (
@@ -18,7 +21,13 @@ from hypomnema.base.types import (
   Header,
   Tuv,
 )
-from hypomnema.xml.deserialization.base import BaseElementDeserializer
+from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.deserialization.base import BaseElementDeserializer, InlineElementDeserializer
+from hypomnema.xml.deserialization.interning import AttributeInterner
+from hypomnema.xml.deserialization.lazy import LazyContent
+from hypomnema.xml.deserialization.projection import Projection
+from hypomnema.xml.diagnostics import Diagnostics
+from hypomnema.xml.policy import DeserializationPolicy
 
 __all__ = [
   "NoteDeserializer",
@@ -35,6 +44,9 @@ __all__ = [
   "TmxDeserializer",
 ]
 
+# Reduces a <seg> to its text when inline markup is not deserialized.
+_TEXT = TextProjector("strip")
+
 
 class NoteDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Note]):
   """Deserializer for the TMX `<note>` element."""
@@ -59,31 +71,30 @@ class NoteDeserializer[BackendElementType](BaseElementDeserializer[BackendElemen
         If the element has no text content or contains invalid child elements
         and the respective policy behavior is "raise".
     """
-    check_tag(self.backend.get_tag(element), "note", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "note", self.logger, self.policy, self.diagnostics)
     lang = self._parse_attribute_as_str(element, "xml:lang", required=False)
     o_encoding = self._parse_attribute_as_str(element, "o-encoding", required=False)
     text = self.backend.get_text(element)
 
     if text is None:
-      self.logger.log(
-        self.policy.empty_content.log_level, "Element <note> does not have any text content"
+      behavior = self._handle_violation(
+        "empty_content",
+        XmlDeserializationError,
+        "Element <note> does not have any text content",
+        element=element,
       )
-      if self.policy.empty_content.behavior == "raise":
-        raise XmlDeserializationError("Element <note> does not have any text content")
-      if self.policy.empty_content.behavior == "empty":
+      if behavior == "empty":
         self.logger.log(self.policy.empty_content.log_level, "Falling back to an empty string")
         text = ""
 
     for child in self.backend.iter_children(element):
-      self.logger.log(
-        self.policy.invalid_child_element.log_level,
+      self._handle_violation(
+        "invalid_child_element",
+        XmlDeserializationError,
         "Invalid child element <%s> in <note>",
         self.backend.get_tag(child),
+        element=child,
       )
-      if self.policy.invalid_child_element.behavior == "raise":
-        raise XmlDeserializationError(
-          f"Invalid child element <{self.backend.get_tag(child)}> in <note>"
-        )
     return Note(text=text, lang=lang, o_encoding=o_encoding)  # type: ignore[arg-type]
 
 
@@ -110,32 +121,31 @@ class PropDeserializer[BackendElementType](BaseElementDeserializer[BackendElemen
         If the element has no text content or contains invalid child elements
         and the respective policy behavior is "raise".
     """
-    check_tag(self.backend.get_tag(element), "prop", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "prop", self.logger, self.policy, self.diagnostics)
     _type = self._parse_attribute_as_str(element, "type", required=True)
     lang = self._parse_attribute_as_str(element, "xml:lang", required=False)
     o_encoding = self._parse_attribute_as_str(element, "o-encoding", required=False)
     text = self.backend.get_text(element)
 
     if text is None:
-      self.logger.log(
-        self.policy.empty_content.log_level, "Element <prop> does not have any text content"
+      behavior = self._handle_violation(
+        "empty_content",
+        XmlDeserializationError,
+        "Element <prop> does not have any text content",
+        element=element,
       )
-      if self.policy.empty_content.behavior == "raise":
-        raise XmlDeserializationError("Element <prop> does not have any text content")
-      if self.policy.empty_content.behavior == "empty":
+      if behavior == "empty":
         self.logger.log(self.policy.empty_content.log_level, "Falling back to an empty string")
         text = ""
 
     for child in self.backend.iter_children(element):
-      self.logger.log(
-        self.policy.invalid_child_element.log_level,
+      self._handle_violation(
+        "invalid_child_element",
+        XmlDeserializationError,
         "Invalid child element <%s> in <prop>",
         self.backend.get_tag(child),
+        element=child,
       )
-      if self.policy.invalid_child_element.behavior == "raise":
-        raise XmlDeserializationError(
-          f"Invalid child element <{self.backend.get_tag(child)}> in <prop>"
-        )
     return Prop(text=text, type=_type, lang=lang, o_encoding=o_encoding)  # type: ignore[arg-type]
 
 
@@ -162,15 +172,17 @@ class HeaderDeserializer[BackendElementType](BaseElementDeserializer[BackendElem
         If extra text is found or an invalid child element is encountered
         and the respective policy behavior is "raise".
     """
-    check_tag(self.backend.get_tag(element), "header", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "header", self.logger, self.policy, self.diagnostics)
 
     if (text := self.backend.get_text(element)) is not None:
       if text.strip():
-        self.logger.log(
-          self.policy.extra_text.log_level, "Element <header> has extra text content '%s'", text
+        self._handle_violation(
+          "extra_text",
+          XmlDeserializationError,
+          "Element <header> has extra text content '%s'",
+          text,
+          element=element,
         )
-        if self.policy.extra_text.behavior == "raise":
-          raise XmlDeserializationError(f"Element <header> has extra text content '{text}'")
 
     creationtool = self._parse_attribute_as_str(element, "creationtool", required=True)
     creationtoolversion = self._parse_attribute_as_str(
@@ -201,11 +213,13 @@ class HeaderDeserializer[BackendElementType](BaseElementDeserializer[BackendElem
         if isinstance(note, Note):
           notes.append(note)
       else:
-        self.logger.log(
-          self.policy.invalid_child_element.log_level, "Invalid child element <%s> in <header>", tag
+        self._handle_violation(
+          "invalid_child_element",
+          XmlDeserializationError,
+          "Invalid child element <%s> in <header>",
+          tag,
+          element=child,
         )
-        if self.policy.invalid_child_element.behavior == "raise":
-          raise XmlDeserializationError(f"Invalid child element <{tag}> in <header>")
 
     return Header(
       creationtool=creationtool,  # type: ignore[arg-type]
@@ -225,12 +239,14 @@ class HeaderDeserializer[BackendElementType](BaseElementDeserializer[BackendElem
     )
 
 
-class BptDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Bpt]):
+class BptDeserializer[BackendElementType](InlineElementDeserializer[BackendElementType, Bpt]):
   """Deserializer for the TMX `<bpt>` (Begin Paired Tag) element."""
 
-  def _deserialize(self, element: BackendElementType) -> Bpt:
+  content_tags = ("sub",)
+
+  def _deserialize_shell(self, element: BackendElementType) -> Bpt:
     """
-    Convert a `<bpt>` XML element into a Bpt object.
+    Build a Bpt object from the attributes of a `<bpt>` XML element.
 
     Parameters
     ----------
@@ -240,22 +256,23 @@ class BptDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
     Returns
     -------
     Bpt
-        The deserialized Bpt instance.
+        The deserialized Bpt instance, with empty content.
     """
-    check_tag(self.backend.get_tag(element), "bpt", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "bpt", self.logger, self.policy, self.diagnostics)
     i = self._parse_attribute_as_int(element, "i", True)
     x = self._parse_attribute_as_int(element, "x", False)
     type = self._parse_attribute_as_str(element, "type", False)
-    content = self._deserialize_content(element, ("sub",))
-    return Bpt(i=i, x=x, type=type, content=content)  # type: ignore[arg-type]
+    return Bpt(i=i, x=x, type=type, content=[])  # type: ignore[arg-type]
 
 
-class EptDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Ept]):
+class EptDeserializer[BackendElementType](InlineElementDeserializer[BackendElementType, Ept]):
   """Deserializer for the TMX `<ept>` (End Paired Tag) element."""
 
-  def _deserialize(self, element: BackendElementType) -> Ept:
+  content_tags = ("sub",)
+
+  def _deserialize_shell(self, element: BackendElementType) -> Ept:
     """
-    Convert an `<ept>` XML element into an Ept object.
+    Build an Ept object from the attributes of a `<ept>` XML element.
 
     Parameters
     ----------
@@ -265,20 +282,21 @@ class EptDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
     Returns
     -------
     Ept
-        The deserialized Ept instance.
+        The deserialized Ept instance, with empty content.
     """
-    check_tag(self.backend.get_tag(element), "ept", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "ept", self.logger, self.policy, self.diagnostics)
     i = self._parse_attribute_as_int(element, "i", True)
-    content = self._deserialize_content(element, ("sub",))
-    return Ept(i=i, content=content)  # type: ignore[arg-type]
+    return Ept(i=i, content=[])  # type: ignore[arg-type]
 
 
-class ItDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, It]):
+class ItDeserializer[BackendElementType](InlineElementDeserializer[BackendElementType, It]):
   """Deserializer for the TMX `<it>` (Isolated Tag) element."""
 
-  def _deserialize(self, element: BackendElementType) -> It:
+  content_tags = ("sub",)
+
+  def _deserialize_shell(self, element: BackendElementType) -> It:
     """
-    Convert an `<it>` XML element into an It object.
+    Build an It object from the attributes of a `<it>` XML element.
 
     Parameters
     ----------
@@ -288,22 +306,23 @@ class ItDeserializer[BackendElementType](BaseElementDeserializer[BackendElementT
     Returns
     -------
     It
-        The deserialized It instance.
+        The deserialized It instance, with empty content.
     """
-    check_tag(self.backend.get_tag(element), "it", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "it", self.logger, self.policy, self.diagnostics)
     pos = self._parse_attribute_as_enum(element, "pos", Pos, True)
     x = self._parse_attribute_as_int(element, "x", False)
     type = self._parse_attribute_as_str(element, "type", False)
-    content = self._deserialize_content(element, ("sub",))
-    return It(pos=pos, x=x, type=type, content=content)  # type: ignore[arg-type]
+    return It(pos=pos, x=x, type=type, content=[])  # type: ignore[arg-type]
 
 
-class PhDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Ph]):
+class PhDeserializer[BackendElementType](InlineElementDeserializer[BackendElementType, Ph]):
   """Deserializer for the TMX `<ph>` (Placeholder) element."""
 
-  def _deserialize(self, element: BackendElementType) -> Ph:
+  content_tags = ("sub",)
+
+  def _deserialize_shell(self, element: BackendElementType) -> Ph:
     """
-    Convert a `<ph>` XML element into a Ph object.
+    Build a Ph object from the attributes of a `<ph>` XML element.
 
     Parameters
     ----------
@@ -313,22 +332,23 @@ class PhDeserializer[BackendElementType](BaseElementDeserializer[BackendElementT
     Returns
     -------
     Ph
-        The deserialized Ph instance.
+        The deserialized Ph instance, with empty content.
     """
-    check_tag(self.backend.get_tag(element), "ph", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "ph", self.logger, self.policy, self.diagnostics)
     x = self._parse_attribute_as_int(element, "x", False)
     assoc = self._parse_attribute_as_enum(element, "assoc", Assoc, False)
     type = self._parse_attribute_as_str(element, "type", False)
-    content = self._deserialize_content(element, ("sub",))
-    return Ph(x=x, assoc=assoc, type=type, content=content)  # type: ignore[arg-type]
+    return Ph(x=x, assoc=assoc, type=type, content=[])  # type: ignore[arg-type]
 
 
-class SubDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Sub]):
+class SubDeserializer[BackendElementType](InlineElementDeserializer[BackendElementType, Sub]):
   """Deserializer for the TMX `<sub>` (Sub-flow) element."""
 
-  def _deserialize(self, element: BackendElementType) -> Sub:
+  content_tags = ("bpt", "ept", "ph", "it", "hi")
+
+  def _deserialize_shell(self, element: BackendElementType) -> Sub:
     """
-    Convert a `<sub>` XML element into a Sub object.
+    Build a Sub object from the attributes of a `<sub>` XML element.
 
     Parameters
     ----------
@@ -338,21 +358,22 @@ class SubDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
     Returns
     -------
     Sub
-        The deserialized Sub instance.
+        The deserialized Sub instance, with empty content.
     """
-    check_tag(self.backend.get_tag(element), "sub", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "sub", self.logger, self.policy, self.diagnostics)
     datatype = self._parse_attribute_as_str(element, "datatype", False)
     type = self._parse_attribute_as_str(element, "type", False)
-    content = self._deserialize_content(element, ("bpt", "ept", "ph", "it", "hi"))
-    return Sub(datatype=datatype, type=type, content=content)
+    return Sub(datatype=datatype, type=type, content=[])
 
 
-class HiDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Hi]):
+class HiDeserializer[BackendElementType](InlineElementDeserializer[BackendElementType, Hi]):
   """Deserializer for the TMX `<hi>` (Highlight) element."""
 
-  def _deserialize(self, element: BackendElementType) -> Hi:
+  content_tags = ("bpt", "ept", "ph", "it", "hi")
+
+  def _deserialize_shell(self, element: BackendElementType) -> Hi:
     """
-    Convert a `<hi>` XML element into a Hi object.
+    Build a Hi object from the attributes of a `<hi>` XML element.
 
     Parameters
     ----------
@@ -362,17 +383,73 @@ class HiDeserializer[BackendElementType](BaseElementDeserializer[BackendElementT
     Returns
     -------
     Hi
-        The deserialized Hi instance.
+        The deserialized Hi instance, with empty content.
     """
-    check_tag(self.backend.get_tag(element), "hi", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "hi", self.logger, self.policy, self.diagnostics)
     x = self._parse_attribute_as_int(element, "x", False)
     type = self._parse_attribute_as_str(element, "type", False)
-    content = self._deserialize_content(element, ("bpt", "ept", "ph", "it", "hi"))
-    return Hi(x=x, type=type, content=content)
+    return Hi(x=x, type=type, content=[])
 
 
 class TuvDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Tuv]):
-  """Deserializer for the TMX `<tuv>` (Translation Unit Variant) element."""
+  """
+  Deserializer for the TMX `<tuv>` (Translation Unit Variant) element.
+
+  Parameters
+  ----------
+  lazy_content : bool, optional
+      If True, the `<seg>` element is not deserialized right away: the
+      resulting `Tuv.content` is a `LazyContent` proxy that deserializes it
+      on first access. Defaults to False.
+  projection : Projection | None, optional
+      The parts of the `<tuv>` to deserialize. If None (default), everything
+      is deserialized.
+
+  Attributes
+  ----------
+  lazy_content : bool
+      Whether segment content is deserialized lazily.
+  projection : Projection
+      The parts of the `<tuv>` that are deserialized.
+  """
+
+  def __init__(
+    self,
+    backend: XmlBackend,
+    policy: DeserializationPolicy,
+    logger: Logger,
+    *,
+    interner: AttributeInterner | None = None,
+    diagnostics: Diagnostics | None = None,
+    lazy_content: bool = False,
+    projection: Projection | None = None,
+  ):
+    super().__init__(backend, policy, logger, interner=interner, diagnostics=diagnostics)
+    self.lazy_content = lazy_content
+    self.projection = projection or Projection()
+    self.skipped_attributes = self.projection.skipped_attributes("tuv")
+
+  def _deserialize_seg(self, seg: BackendElementType) -> list[InlineElement | str]:
+    """
+    Convert a `<seg>` XML element into mixed content.
+
+    Parameters
+    ----------
+    seg : BackendElementType
+        The `<seg>` element to deserialize.
+
+    Returns
+    -------
+    list[InlineElement | str]
+        The deserialized segment content.
+    """
+    if not self.projection.inline_markup:
+      if text := _TEXT.project_element(self.backend, seg):
+        return [text]
+      result: list[InlineElement | str] = []
+      self._handle_empty_content("seg", result, seg)
+      return result
+    return self._deserialize_content(seg, ("bpt", "ept", "ph", "it", "hi"))
 
   def _deserialize(self, element: BackendElementType) -> Tuv:
     """
@@ -394,15 +471,17 @@ class TuvDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
         If extra text is found, multiple `<seg>` elements are present, or
         the `<seg>` element is missing and respective policy behavior is "raise".
     """
-    check_tag(self.backend.get_tag(element), "tuv", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "tuv", self.logger, self.policy, self.diagnostics)
 
     if (text := self.backend.get_text(element)) is not None:
       if text.strip():
-        self.logger.log(
-          self.policy.extra_text.log_level, "Element <tuv> has extra text content '%s'", text
+        self._handle_violation(
+          "extra_text",
+          XmlDeserializationError,
+          "Element <tuv> has extra text content '%s'",
+          text,
+          element=element,
         )
-        if self.policy.extra_text.behavior == "raise":
-          raise XmlDeserializationError(f"Element <tuv> has extra text content '{text}'")
 
     lang = self._parse_attribute_as_str(element, "xml:lang", True)
     o_encoding = self._parse_attribute_as_str(element, "o-encoding", False)
@@ -419,42 +498,57 @@ class TuvDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
 
     props: list[Prop] = []
     notes: list[Note] = []
-    content: list[str | InlineElement] | None = None
+    content: list[str | InlineElement] | LazyContent | None = None
     seg_found = False
 
     for child in self.backend.iter_children(element):
       tag = self.backend.get_tag(child)
       if tag == "prop":
+        if not self.projection.props:
+          continue
         prop = self.emit(child)
         if isinstance(prop, Prop):
           props.append(prop)
       elif tag == "note":
+        if not self.projection.notes:
+          continue
         note = self.emit(child)
         if isinstance(note, Note):
           notes.append(note)
       elif tag == "seg":
         if seg_found:
-          self.logger.log(self.policy.multiple_seg.log_level, "Multiple <seg> elements in <tuv>")
-          if self.policy.multiple_seg.behavior == "raise":
-            raise XmlDeserializationError("Multiple <seg> elements in <tuv>")
-          if self.policy.multiple_seg.behavior == "keep_first":
+          behavior = self._handle_violation(
+            "multiple_seg",
+            XmlDeserializationError,
+            "Multiple <seg> elements in <tuv>",
+            element=child,
+          )
+          if behavior == "keep_first" or behavior == "collect":
             continue
         seg_found = True
-        content = self._deserialize_content(child, ("bpt", "ept", "ph", "it", "hi"))
+        if not self.projection.wants_tuv("content"):
+          content = []
+        elif self.lazy_content:
+          content = LazyContent(self._deserialize_seg, child, self.diagnostics)
+        else:
+          content = self._deserialize_seg(child)
       else:
-        self.logger.log(
-          self.policy.invalid_child_element.log_level, "Invalid child element <%s> in <tuv>", tag
+        self._handle_violation(
+          "invalid_child_element",
+          XmlDeserializationError,
+          "Invalid child element <%s> in <tuv>",
+          tag,
+          element=child,
         )
-        if self.policy.invalid_child_element.behavior == "raise":
-          raise XmlDeserializationError(f"Invalid child element <{tag}> in <tuv>")
 
     if not seg_found:
-      self.logger.log(
-        self.policy.missing_seg.log_level, "Element <tuv> is missing a <seg> child element"
+      behavior = self._handle_violation(
+        "missing_seg",
+        XmlDeserializationError,
+        "Element <tuv> is missing a <seg> child element",
+        element=element,
       )
-      if self.policy.missing_seg.behavior == "raise":
-        raise XmlDeserializationError("Element <tuv> is missing a <seg> child element")
-      elif self.policy.missing_seg.behavior == "ignore":
+      if behavior == "ignore" or behavior == "collect":
         content = []
       else:
         self.logger.log(self.policy.missing_seg.log_level, "Falling back to an empty string")
@@ -480,7 +574,35 @@ class TuvDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
 
 
 class TuDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Tu]):
-  """Deserializer for the TMX `<tu>` (Translation Unit) element."""
+  """
+  Deserializer for the TMX `<tu>` (Translation Unit) element.
+
+  Parameters
+  ----------
+  projection : Projection | None, optional
+      The parts of the `<tu>` to deserialize. `<tuv>` elements in a language
+      that is not part of the projection are skipped without being emitted.
+      If None (default), everything is deserialized.
+
+  Attributes
+  ----------
+  projection : Projection
+      The parts of the `<tu>` that are deserialized.
+  """
+
+  def __init__(
+    self,
+    backend: XmlBackend,
+    policy: DeserializationPolicy,
+    logger: Logger,
+    *,
+    interner: AttributeInterner | None = None,
+    diagnostics: Diagnostics | None = None,
+    projection: Projection | None = None,
+  ):
+    super().__init__(backend, policy, logger, interner=interner, diagnostics=diagnostics)
+    self.projection = projection or Projection()
+    self.skipped_attributes = self.projection.skipped_attributes("tu")
 
   def _deserialize(self, element: BackendElementType) -> Tu:
     """
@@ -501,75 +623,92 @@ class TuDeserializer[BackendElementType](BaseElementDeserializer[BackendElementT
     XmlDeserializationError
         If extra text or an invalid child element is encountered and policy is "raise".
     """
-    check_tag(self.backend.get_tag(element), "tu", self.logger, self.policy)
-
-    if (text := self.backend.get_text(element)) is not None:
-      if text.strip():
-        self.logger.log(
-          self.policy.extra_text.log_level, "Element <tu> has extra text content '%s'", text
-        )
-        if self.policy.extra_text.behavior == "raise":
-          raise XmlDeserializationError(f"Element <tu> has extra text content '{text}'")
-
-    tuid = self._parse_attribute_as_str(element, "tuid", False)
-    o_encoding = self._parse_attribute_as_str(element, "o-encoding", False)
-    datatype = self._parse_attribute_as_str(element, "datatype", False)
-    usagecount = self._parse_attribute_as_int(element, "usagecount", False)
-    lastusagedate = self._parse_attribute_as_datetime(element, "lastusagedate", False)
-    creationtool = self._parse_attribute_as_str(element, "creationtool", False)
-    creationtoolversion = self._parse_attribute_as_str(element, "creationtoolversion", False)
-    creationdate = self._parse_attribute_as_datetime(element, "creationdate", False)
-    creationid = self._parse_attribute_as_str(element, "creationid", False)
-    changedate = self._parse_attribute_as_datetime(element, "changedate", False)
-    segtype = self._parse_attribute_as_enum(element, "segtype", Segtype, False)
-    changeid = self._parse_attribute_as_str(element, "changeid", False)
-    o_tmf = self._parse_attribute_as_str(element, "o-tmf", False)
-    srclang = self._parse_attribute_as_str(element, "srclang", False)
-
-    props: list[Prop] = []
-    notes: list[Note] = []
-    variants: list[Tuv] = []
+    check_tag(self.backend.get_tag(element), "tu", self.logger, self.policy, self.diagnostics)
+    if self.diagnostics is not None:
+      self.diagnostics.tuid = self.backend.get_attribute(element, "tuid")
+
+    try:
+      if (text := self.backend.get_text(element)) is not None:
+        if text.strip():
+          self._handle_violation(
+            "extra_text",
+            XmlDeserializationError,
+            "Element <tu> has extra text content '%s'",
+            text,
+            element=element,
+          )
 
-    for child in self.backend.iter_children(element):
-      tag = self.backend.get_tag(child)
-      if tag == "prop":
-        prop = self.emit(child)
-        if isinstance(prop, Prop):
-          props.append(prop)
-      elif tag == "note":
-        note = self.emit(child)
-        if isinstance(note, Note):
-          notes.append(note)
-      elif tag == "tuv":
-        tuv = self.emit(child)
-        if isinstance(tuv, Tuv):
-          variants.append(tuv)
-      else:
-        self.logger.log(
-          self.policy.invalid_child_element.log_level, "Invalid child element <%s> in <tu>", tag
-        )
-        if self.policy.invalid_child_element.behavior == "raise":
-          raise XmlDeserializationError(f"Invalid child element <{tag}> in <tu>")
+      tuid = self._parse_attribute_as_str(element, "tuid", False)
+      o_encoding = self._parse_attribute_as_str(element, "o-encoding", False)
+      datatype = self._parse_attribute_as_str(element, "datatype", False)
+      usagecount = self._parse_attribute_as_int(element, "usagecount", False)
+      lastusagedate = self._parse_attribute_as_datetime(element, "lastusagedate", False)
+      creationtool = self._parse_attribute_as_str(element, "creationtool", False)
+      creationtoolversion = self._parse_attribute_as_str(element, "creationtoolversion", False)
+      creationdate = self._parse_attribute_as_datetime(element, "creationdate", False)
+      creationid = self._parse_attribute_as_str(element, "creationid", False)
+      changedate = self._parse_attribute_as_datetime(element, "changedate", False)
+      segtype = self._parse_attribute_as_enum(element, "segtype", Segtype, False)
+      changeid = self._parse_attribute_as_str(element, "changeid", False)
+      o_tmf = self._parse_attribute_as_str(element, "o-tmf", False)
+      srclang = self._parse_attribute_as_str(element, "srclang", False)
+
+      props: list[Prop] = []
+      notes: list[Note] = []
+      variants: list[Tuv] = []
+
+      for child in self.backend.iter_children(element):
+        tag = self.backend.get_tag(child)
+        if tag == "prop":
+          if not self.projection.props:
+            continue
+          prop = self.emit(child)
+          if isinstance(prop, Prop):
+            props.append(prop)
+        elif tag == "note":
+          if not self.projection.notes:
+            continue
+          note = self.emit(child)
+          if isinstance(note, Note):
+            notes.append(note)
+        elif tag == "tuv":
+          if not self.projection.wants_language(self.backend.get_attribute(child, "xml:lang")):
+            continue
+          tuv = self.emit(child)
+          if isinstance(tuv, Tuv):
+            variants.append(tuv)
+        else:
+          self._handle_violation(
+            "invalid_child_element",
+            XmlDeserializationError,
+            "Invalid child element <%s> in <tu>",
+            tag,
+            element=child,
+          )
 
-    return Tu(
-      tuid=tuid,
-      o_encoding=o_encoding,
-      datatype=datatype,
-      usagecount=usagecount,
-      lastusagedate=lastusagedate,
-      creationtool=creationtool,
-      creationtoolversion=creationtoolversion,
-      creationdate=creationdate,
-      creationid=creationid,
-      changedate=changedate,
-      segtype=segtype,
-      changeid=changeid,
-      o_tmf=o_tmf,
-      srclang=srclang,
-      props=props,
-      notes=notes,
-      variants=variants,
-    )
+      return Tu(
+        tuid=tuid,
+        o_encoding=o_encoding,
+        datatype=datatype,
+        usagecount=usagecount,
+        lastusagedate=lastusagedate,
+        creationtool=creationtool,
+        creationtoolversion=creationtoolversion,
+        creationdate=creationdate,
+        creationid=creationid,
+        changedate=changedate,
+        segtype=segtype,
+        changeid=changeid,
+        o_tmf=o_tmf,
+        srclang=srclang,
+        props=props,
+        notes=notes,
+        variants=variants,
+      )
+    finally:
+      # Also on error, so that a reused sink does not keep a stale tuid
+      if self.diagnostics is not None:
+        self.diagnostics.tuid = None
 
 
 class TmxDeserializer[BackendElementType](BaseElementDeserializer[BackendElementType, Tmx]):
@@ -595,7 +734,7 @@ class TmxDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
         If multiple headers are found, the header is missing, or invalid
         children exist and the policy is set to "raise".
     """
-    check_tag(self.backend.get_tag(element), "tmx", self.logger, self.policy)
+    check_tag(self.backend.get_tag(element), "tmx", self.logger, self.policy, self.diagnostics)
     version = self._parse_attribute_as_str(element, "version", True)
     header_found: bool = False
     header: Header | None = None
@@ -603,22 +742,25 @@ class TmxDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
 
     if (text := self.backend.get_text(element)) is not None:
       if text.strip():
-        self.logger.log(
-          self.policy.extra_text.log_level, "Element <tmx> has extra text content '%s'", text
+        self._handle_violation(
+          "extra_text",
+          XmlDeserializationError,
+          "Element <tmx> has extra text content '%s'",
+          text,
+          element=element,
         )
-        if self.policy.extra_text.behavior == "raise":
-          raise XmlDeserializationError(f"Element <tmx> has extra text content '{text}'")
 
     for child in self.backend.iter_children(element):
       tag = self.backend.get_tag(child)
       if tag == "header":
         if header_found:
-          self.logger.log(
-            self.policy.multiple_headers.log_level, "Multiple <header> elements in <tmx>"
+          behavior = self._handle_violation(
+            "multiple_headers",
+            XmlDeserializationError,
+            "Multiple <header> elements in <tmx>",
+            element=child,
           )
-          if self.policy.multiple_headers.behavior == "raise":
-            raise XmlDeserializationError("Multiple <header> elements in <tmx>")
-          if self.policy.multiple_headers.behavior == "keep_first":
+          if behavior == "keep_first" or behavior == "collect":
             continue
         header_found = True
         header_obj = self.emit(child)
@@ -631,18 +773,21 @@ class TmxDeserializer[BackendElementType](BaseElementDeserializer[BackendElement
             if isinstance(tu_obj, Tu):
               body.append(tu_obj)
       else:
-        self.logger.log(
-          self.policy.invalid_child_element.log_level, "Invalid child element <%s> in <tmx>", tag
+        self._handle_violation(
+          "invalid_child_element",
+          XmlDeserializationError,
+          "Invalid child element <%s> in <tmx>",
+          tag,
+          element=child,
         )
-        if self.policy.invalid_child_element.behavior == "raise":
-          raise XmlDeserializationError(f"Invalid child element <{tag}> in <tmx>")
 
     if not header_found:
-      self.logger.log(
-        self.policy.missing_header.log_level, "Element <tmx> is missing a <header> child element"
+      self._handle_violation(
+        "missing_header",
+        XmlDeserializationError,
+        "Element <tmx> is missing a <header> child element",
+        element=element,
       )
-      if self.policy.missing_header.behavior == "raise":
-        raise XmlDeserializationError("Element <tmx> is missing a <header> child element")
 
     return Tmx(
       version=version,  # type: ignore[arg-type]
@@ -2,14 +2,17 @@ from enum import StrEnum
 from abc import ABC, abstractmethod
 from datetime import datetime
 from logging import Logger
-from typing import Callable
+from typing import Any, Callable, Mapping
 
 from hypomnema.base.errors import AttributeDeserializationError, XmlDeserializationError
 from hypomnema.base.types import BaseElement, InlineElement, Sub
 from hypomnema.xml.backends.base import XmlBackend
+from hypomnema.xml.deserialization.interning import AttributeInterner
+from hypomnema.xml.diagnostics import Diagnostics
 from hypomnema.xml.policy import DeserializationPolicy
+from hypomnema.xml.utils import parse_datetime
 
-__all__ = ["BaseElementDeserializer"]
+__all__ = ["BaseElementDeserializer", "InlineElementDeserializer"]
 
 
 class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement](ABC):
@@ -24,6 +27,12 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
       The configuration for handling errors and logging during deserialization.
   logger : Logger
       The logging instance for reporting policy violations.
+  interner : AttributeInterner | None, optional
+      Pools used to share repeated attribute values between deserialized
+      objects. If None (default), every value is kept as-is.
+  diagnostics : Diagnostics | None, optional
+      Sink every policy violation is reported to. If None (default),
+      violations are only logged.
 
   Attributes
   ----------
@@ -33,13 +42,32 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
       The deserialization configuration.
   logger : Logger
       The logging instance.
+  interner : AttributeInterner | None
+      The attribute value pools, if any.
+  diagnostics : Diagnostics | None
+      The sink violations are reported to, if any.
+  skipped_attributes : frozenset[str]
+      Names of the attributes that are never read: parsing them always
+      returns None. Empty by default.
   """
 
-  def __init__(self, backend: XmlBackend, policy: DeserializationPolicy, logger: Logger):
+  def __init__(
+    self,
+    backend: XmlBackend,
+    policy: DeserializationPolicy,
+    logger: Logger,
+    *,
+    interner: AttributeInterner | None = None,
+    diagnostics: Diagnostics | None = None,
+  ):
     self.backend: XmlBackend[TypeOfBackendElement] = backend
     self.policy = policy
     self.logger = logger
+    self.interner = interner
+    self.diagnostics = diagnostics
+    self.skipped_attributes: frozenset[str] = frozenset()
     self._emit: Callable[[TypeOfBackendElement], BaseElement | None] | None = None
+    self._handlers: Mapping[str, BaseElementDeserializer] | None = None
 
   def _set_emit(self, emit: Callable[[TypeOfBackendElement], BaseElement | None]) -> None:
     """
@@ -52,6 +80,21 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
     """
     self._emit = emit
 
+  def _set_handlers(self, handlers: Mapping[str, "BaseElementDeserializer"]) -> None:
+    """
+    Set the tag-to-handler mapping used to deserialize inline content.
+
+    When set, nested inline elements handled by an ``InlineElementDeserializer``
+    are deserialized in place by ``_deserialize_content`` instead of going
+    through ``emit``.
+
+    Parameters
+    ----------
+    handlers : Mapping[str, BaseElementDeserializer]
+        The handlers of the dispatching deserializer.
+    """
+    self._handlers = handlers
+
   def emit(self, obj: TypeOfBackendElement) -> BaseElement | None:
     """
     Invoke the dispatcher to deserialize an XML element.
@@ -91,6 +134,59 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
     """
     ...
 
+  def _handle_violation(
+    self,
+    policy: str,
+    error: type[Exception],
+    message: str,
+    *args: Any,
+    element: TypeOfBackendElement | None = None,
+    attribute: str | None = None,
+  ) -> str:
+    """
+    Log a policy violation, report it to the diagnostics sink and raise if required.
+
+    Parameters
+    ----------
+    policy : str
+        The name of the ``DeserializationPolicy`` field governing the violation.
+    error : type[Exception]
+        The exception raised if the policy behavior is "raise".
+    message : str
+        The %-style message template, used for the log, the diagnostic and
+        the exception.
+    *args : Any
+        The arguments of ``message``.
+    element : TypeOfBackendElement | None, optional
+        The offending element, used to locate the diagnostic.
+    attribute : str | None, optional
+        The offending attribute, if any.
+
+    Returns
+    -------
+    str
+        The behavior of the policy, for the caller to apply.
+
+    Raises
+    ------
+    Exception
+        An instance of ``error`` if the policy behavior is "raise".
+    """
+    value = getattr(self.policy, policy)
+    self.logger.log(value.log_level, message, *args)
+    if self.diagnostics is not None:
+      self.diagnostics.report(
+        policy,
+        value.behavior,
+        message % args,
+        tag=None if element is None else self.backend.get_tag(element),
+        attribute=attribute,
+        line=None if element is None else self.backend.get_line(element),
+      )
+    if value.behavior == "raise":
+      raise error(message % args)
+    return value.behavior
+
   def _handle_missing_attribute(
     self, element: TypeOfBackendElement, attribute: str, required: bool
   ) -> None:
@@ -112,11 +208,14 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
         If the attribute is required and the policy behavior is "raise".
     """
     if required:
-      self.logger.log(
-        self.policy.required_attribute_missing.log_level, "Required attribute %r is None", attribute
+      self._handle_violation(
+        "required_attribute_missing",
+        AttributeDeserializationError,
+        "Required attribute %r is None",
+        attribute,
+        element=element,
+        attribute=attribute,
       )
-      if self.policy.required_attribute_missing.behavior == "raise":
-        raise AttributeDeserializationError(f"Required attribute {attribute!r} is None")
     return
 
   def _parse_attribute_as_datetime(
@@ -125,6 +224,9 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
     """
     Retrieve and parse an attribute value as an ISO 8601 datetime.
 
+    Parsed values are memoized in a bounded cache shared by every handler,
+    see ``hypomnema.xml.utils.parse_datetime``.
+
     Parameters
     ----------
     element : TypeOfBackendElement
@@ -144,23 +246,30 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
     AttributeDeserializationError
         If parsing fails or a required attribute is missing and policy is "raise".
     """
+    if attribute in self.skipped_attributes:
+      return
     value = self.backend.get_attribute(element, attribute)
     if value is None:
       self._handle_missing_attribute(element, attribute, required)
       return
+    if self.interner is not None and (shared := self.interner.get(attribute, value)) is not None:
+      return shared
     try:
-      return datetime.fromisoformat(value)
-    except ValueError as e:
-      self.logger.log(
-        self.policy.invalid_attribute_value.log_level,
+      parsed = parse_datetime(value)
+    except ValueError:
+      self._handle_violation(
+        "invalid_attribute_value",
+        AttributeDeserializationError,
         "Cannot convert %r to a datetime object for attribute %s",
         value,
         attribute,
+        element=element,
+        attribute=attribute,
       )
-      if self.policy.invalid_attribute_value.behavior == "raise":
-        raise AttributeDeserializationError(
-          f"Cannot convert {value!r} to a datetime object for attribute {attribute}"
-        ) from e
+      return
+    if self.interner is not None:
+      return self.interner.put(attribute, value, parsed)
+    return parsed
 
   def _parse_attribute_as_int(
     self, element: TypeOfBackendElement, attribute: str, required: bool
@@ -187,23 +296,24 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
     AttributeDeserializationError
         If parsing fails or a required attribute is missing and policy is "raise".
     """
+    if attribute in self.skipped_attributes:
+      return
     value = self.backend.get_attribute(element, attribute)
     if value is None:
       self._handle_missing_attribute(element, attribute, required)
       return
     try:
       return int(value)
-    except ValueError as e:
-      self.logger.log(
-        self.policy.invalid_attribute_value.log_level,
+    except ValueError:
+      self._handle_violation(
+        "invalid_attribute_value",
+        AttributeDeserializationError,
         "Cannot convert %r to an int for attribute %s",
         value,
         attribute,
+        element=element,
+        attribute=attribute,
       )
-      if self.policy.invalid_attribute_value.behavior == "raise":
-        raise AttributeDeserializationError(
-          f"Cannot convert {value!r} to an int for attribute {attribute}"
-        ) from e
       return
 
   def _parse_attribute_as_enum[EnumType: StrEnum](
@@ -234,23 +344,24 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
         If the value is not a valid enum member or a required attribute is
         missing and policy is "raise".
     """
+    if attribute in self.skipped_attributes:
+      return
     value = self.backend.get_attribute(element, attribute)
     if value is None:
       self._handle_missing_attribute(element, attribute, required)
       return
     try:
       return enum_type(value)
-    except ValueError as e:
-      self.logger.log(
-        self.policy.invalid_attribute_value.log_level,
+    except ValueError:
+      self._handle_violation(
+        "invalid_attribute_value",
+        AttributeDeserializationError,
         "Value %r is not a valid enum value for attribute %s",
         value,
         attribute,
+        element=element,
+        attribute=attribute,
       )
-      if self.policy.invalid_attribute_value.behavior == "raise":
-        raise AttributeDeserializationError(
-          f"Value {value!r} is not a valid enum value for attribute {attribute}"
-        ) from e
       return
 
   def _parse_attribute_as_str(
@@ -271,21 +382,59 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
     Returns
     -------
     str | None
-        The attribute string, or None if missing.
+        The attribute string, or None if missing. If an interner is set, the
+        shared copy of the string is returned.
     """
+    if attribute in self.skipped_attributes:
+      return
     value = self.backend.get_attribute(element, attribute)
     if value is None:
       self._handle_missing_attribute(element, attribute, required)
       return
+    if self.interner is not None:
+      return self.interner.intern(attribute, value)
     return value
 
+  def _handle_empty_content(
+    self, source_tag: str, result: list[Any], element: TypeOfBackendElement | None = None
+  ) -> None:
+    """
+    Apply the empty_content policy to the content of an element, if empty.
+
+    Parameters
+    ----------
+    source_tag : str
+        The tag of the element.
+    result : list
+        The deserialized content. An empty string is appended to it if it is
+        empty and the policy behavior is "empty".
+    element : TypeOfBackendElement | None, optional
+        The element, used to locate the diagnostic.
+
+    Raises
+    ------
+    XmlDeserializationError
+        If the content is empty and the policy behavior is "raise".
+    """
+    if result:
+      return
+    behavior = self._handle_violation(
+      "empty_content", XmlDeserializationError, "Element <%s> is empty", source_tag, element=element
+    )
+    if behavior == "empty":
+      self.logger.log(self.policy.empty_content.log_level, "Falling back to an empty string")
+      result.append("")
+
   def _deserialize_content(
     self, source: TypeOfBackendElement, allowed: tuple[str, ...]
   ) -> list[InlineElement | Sub | str]:
     """
     Extract text and child elements from an XML element.
 
-    Handles recursive parsing of children and associated tail text.
+    Handles parsing of children and associated tail text. Nested elements
+    whose handler is an ``InlineElementDeserializer`` are deserialized with
+    an explicit stack rather than through recursive ``emit`` calls, so any
+    nesting depth is supported. Other children are dispatched with ``emit``.
 
     Parameters
     ----------
@@ -305,35 +454,119 @@ class BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElemen
         If an invalid child tag is encountered, or the element is empty,
         and the respective policy behavior is "raise".
     """
-    source_tag = self.backend.get_tag(source)
-    result = []
-    if (text := self.backend.get_text(source)) is not None:
+    backend = self.backend
+    handlers = self._handlers
+    result: list[Any] = []
+    if (text := backend.get_text(source)) is not None:
       result.append(text)
-    for child in self.backend.iter_children(source):
-      tag = self.backend.get_tag(child)
-      if tag not in allowed:
-        self.logger.log(
-          self.policy.invalid_child_element.log_level,
+    # Each frame is (handler, element, allowed tags, content, children, object)
+    stack: list[tuple[BaseElementDeserializer, Any, tuple[str, ...], list[Any], Any, Any]] = [
+      (self, source, allowed, result, iter(backend.iter_children(source)), None)
+    ]
+    while stack:
+      handler, element, allowed_tags, content, children, obj = stack[-1]
+      child = next(children, None)
+      if child is None:
+        stack.pop()
+        handler._handle_empty_content(backend.get_tag(element), content, element)
+        if obj is not None:
+          parent_content = stack[-1][3]
+          parent_content.append(obj)
+          if (tail := backend.get_tail(element)) is not None:
+            parent_content.append(tail)
+        continue
+      tag = backend.get_tag(child)
+      if tag not in allowed_tags:
+        handler._handle_violation(
+          "invalid_child_element",
+          XmlDeserializationError,
           "Incorrect child element in %s: expected one of %s, got %s",
-          source_tag,
-          ", ".join(allowed),
+          backend.get_tag(element),
+          ", ".join(allowed_tags),
           tag,
+          element=child,
         )
-        if self.policy.invalid_child_element.behavior == "raise":
-          raise XmlDeserializationError(
-            f"Incorrect child element in {source_tag}: expected one of {', '.join(allowed)}, got {tag}"
+        continue
+      child_handler = handlers.get(tag) if handlers is not None else None
+      if isinstance(child_handler, InlineElementDeserializer) and child_handler._is_stackable():
+        child_obj = child_handler._deserialize_shell(child)
+        child_content = child_obj.content
+        if (text := backend.get_text(child)) is not None:
+          child_content.append(text)
+        stack.append(
+          (
+            child_handler,
+            child,
+            child_handler.content_tags,
+            child_content,
+            iter(backend.iter_children(child)),
+            child_obj,
           )
+        )
         continue
-      child_obj = self.emit(child)
+      child_obj = handler.emit(child)
       if child_obj is not None:
-        result.append(child_obj)
-      if (tail := self.backend.get_tail(child)) is not None:
-        result.append(tail)
-    if result == []:
-      self.logger.log(self.policy.empty_content.log_level, "Element <%s> is empty", source_tag)
-      if self.policy.empty_content.behavior == "raise":
-        raise XmlDeserializationError(f"Element <{source_tag}> is empty")
-      if self.policy.empty_content.behavior == "empty":
-        self.logger.log(self.policy.empty_content.log_level, "Falling back to an empty string")
-        result.append("")
+        content.append(child_obj)
+      if (tail := backend.get_tail(child)) is not None:
+        content.append(tail)
     return result
+
+
+class InlineElementDeserializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement](
+  BaseElementDeserializer[TypeOfBackendElement, TypeOfTmxElement]
+):
+  """
+  Base class for deserializers of elements with mixed content (`<bpt>`, `<hi>`...).
+
+  Deserialization is split in two steps: ``_deserialize_shell`` builds the
+  object from the element's attributes, with empty content, and the content
+  is then filled in from the element's children. This lets
+  ``_deserialize_content`` deserialize arbitrarily nested inline elements
+  iteratively.
+
+  Attributes
+  ----------
+  content_tags : tuple[str, ...]
+      The permitted tags for child elements.
+  """
+
+  content_tags: tuple[str, ...] = ()
+
+  @abstractmethod
+  def _deserialize_shell(self, element: TypeOfBackendElement) -> TypeOfTmxElement:
+    """
+    Build the object for an element from its attributes only.
+
+    Parameters
+    ----------
+    element : TypeOfBackendElement
+        The XML element to deserialize.
+
+    Returns
+    -------
+    TypeOfTmxElement
+        The object, with an empty ``content`` list.
+    """
+    ...
+
+  def _is_stackable(self) -> bool:
+    """Whether the element can be deserialized in two steps (``_deserialize`` is not overridden)."""
+    return getattr(self._deserialize, "__func__", None) is InlineElementDeserializer._deserialize
+
+  def _deserialize(self, element: TypeOfBackendElement) -> TypeOfTmxElement:
+    """
+    Convert an XML element with mixed content into its TMX object.
+
+    Parameters
+    ----------
+    element : TypeOfBackendElement
+        The XML element to deserialize.
+
+    Returns
+    -------
+    TypeOfTmxElement
+        The deserialized instance.
+    """
+    obj = self._deserialize_shell(element)
+    obj.content = self._deserialize_content(element, self.content_tags)  # type: ignore[attr-defined]
+    return obj
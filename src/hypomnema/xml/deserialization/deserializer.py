@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from logging import Logger, getLogger
 
 from hypomnema.base.errors import MissingHandlerError
@@ -18,6 +19,9 @@ from hypomnema.xml.deserialization._handlers import (
   TuvDeserializer,
 )
 from hypomnema.xml.deserialization.base import BaseElementDeserializer
+from hypomnema.xml.deserialization.interning import AttributeInterner
+from hypomnema.xml.deserialization.projection import Projection
+from hypomnema.xml.diagnostics import Diagnostics
 from hypomnema.xml.policy import DeserializationPolicy
 
 
@@ -41,6 +45,21 @@ class Deserializer[TypeofBackendElement]:
   handlers : dict[str, BaseElementDeserializer] | None, optional
       A mapping of XML tags to their respective deserializer instances. If None,
       default TMX handlers are used.
+  interner : AttributeInterner | None, optional
+      Pools used to share repeated attribute values between deserialized
+      objects. Shared by every handler that does not already have its own.
+      If None (default), no interning is done.
+  lazy_content : bool, optional
+      If True, the default `<tuv>` handler keeps `<seg>` elements as-is and
+      only deserializes them on first access of `Tuv.content`. Defaults to
+      False.
+  projection : Projection | None, optional
+      The parts of `<tu>` and `<tuv>` elements the default handlers
+      deserialize. If None (default), everything is deserialized.
+  diagnostics : Diagnostics | None, optional
+      Sink every policy violation is reported to. Shared by every handler
+      that does not already have its own. If None (default), violations are
+      only logged.
 
   Attributes
   ----------
@@ -52,6 +71,14 @@ class Deserializer[TypeofBackendElement]:
       The active logger.
   handlers : dict[str, BaseElementDeserializer]
       The registered tag-to-handler mapping.
+  interner : AttributeInterner | None
+      The attribute value pools, if any.
+  lazy_content : bool
+      Whether segment content is deserialized lazily.
+  projection : Projection
+      The parts of `<tu>` and `<tuv>` elements that are deserialized.
+  diagnostics : Diagnostics | None
+      The sink violations are reported to, if any.
   """
 
   def __init__(
@@ -60,10 +87,19 @@ class Deserializer[TypeofBackendElement]:
     policy: DeserializationPolicy | None = None,
     logger: Logger | None = None,
     handlers: dict[str, BaseElementDeserializer[TypeofBackendElement, BaseElement]] | None = None,
+    *,
+    interner: AttributeInterner | None = None,
+    lazy_content: bool = False,
+    projection: Projection | None = None,
+    diagnostics: Diagnostics | None = None,
   ):
     self.backend: XmlBackend[TypeofBackendElement] = backend
     self.policy: DeserializationPolicy = policy or DeserializationPolicy()
     self.logger: Logger = logger or getLogger(str(self))
+    self.interner: AttributeInterner | None = interner
+    self.lazy_content: bool = lazy_content
+    self.projection: Projection = projection or Projection()
+    self.diagnostics: Diagnostics | None = diagnostics
     if handlers is None:
       self.logger.info("Using default handlers")
       handlers = self._get_default_handlers()
@@ -74,6 +110,12 @@ class Deserializer[TypeofBackendElement]:
     for handler in self.handlers.values():
       if handler._emit is None:
         handler._set_emit(self.deserialize)
+      if handler.interner is None:
+        handler.interner = self.interner
+      if handler.diagnostics is None:
+        handler.diagnostics = self.diagnostics
+      if handler._handlers is None:
+        handler._set_handlers(self.handlers)
 
   def _get_default_handlers(
     self,
@@ -87,49 +129,89 @@ class Deserializer[TypeofBackendElement]:
         A dictionary mapping TMX tags to their default deserializer instances.
     """
     return {
-      "note": NoteDeserializer(self.backend, self.policy, self.logger),
-      "prop": PropDeserializer(self.backend, self.policy, self.logger),
-      "header": HeaderDeserializer(self.backend, self.policy, self.logger),
-      "tu": TuDeserializer(self.backend, self.policy, self.logger),
-      "tuv": TuvDeserializer(self.backend, self.policy, self.logger),
-      "bpt": BptDeserializer(self.backend, self.policy, self.logger),
-      "ept": EptDeserializer(self.backend, self.policy, self.logger),
-      "it": ItDeserializer(self.backend, self.policy, self.logger),
-      "ph": PhDeserializer(self.backend, self.policy, self.logger),
-      "sub": SubDeserializer(self.backend, self.policy, self.logger),
-      "hi": HiDeserializer(self.backend, self.policy, self.logger),
-      "tmx": TmxDeserializer(self.backend, self.policy, self.logger),
+      "note": NoteDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "prop": PropDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "header": HeaderDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "tu": TuDeserializer(
+        self.backend,
+        self.policy,
+        self.logger,
+        interner=self.interner,
+        diagnostics=self.diagnostics,
+        projection=self.projection,
+      ),
+      "tuv": TuvDeserializer(
+        self.backend,
+        self.policy,
+        self.logger,
+        interner=self.interner,
+        diagnostics=self.diagnostics,
+        lazy_content=self.lazy_content,
+        projection=self.projection,
+      ),
+      "bpt": BptDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "ept": EptDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "it": ItDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "ph": PhDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "sub": SubDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "hi": HiDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
+      "tmx": TmxDeserializer(
+        self.backend, self.policy, self.logger, interner=self.interner, diagnostics=self.diagnostics
+      ),
     }
 
-  def deserialize(self, element: TypeofBackendElement) -> BaseElement | None:
+  def _resolve_handler(
+    self, tag: str
+  ) -> BaseElementDeserializer[TypeofBackendElement, BaseElement] | None:
     """
-    Dispatch an XML element to a handler and return the resulting TMX object.
+    Find the handler for a tag, applying the missing_handler policy.
 
     Parameters
     ----------
-    element : TypeofBackendElement
-        The backend XML element to deserialize.
+    tag : str
+        The tag of the element to deserialize.
 
     Returns
     -------
-    BaseElement | None
-        The deserialized TMX object, or None if the policy is set to "ignore"
-        on missing handlers.
+    BaseElementDeserializer | None
+        The handler, or None if the policy is set to "ignore" on missing
+        handlers.
 
     Raises
     ------
     MissingHandlerError
-        If no handler is found for the element tag and the policy is set to
-        "raise", or if "default" fallback fails to find a handler.
+        If no handler is found for the tag and the policy is set to "raise",
+        or if "default" fallback fails to find a handler.
     """
-    tag = self.backend.get_tag(element)
-    self.logger.debug("Deserializing <%s>", tag)
     handler = self.handlers.get(tag)
     if handler is None:
+      behavior = self.policy.missing_handler.behavior
       self.logger.log(self.policy.missing_handler.log_level, "Missing handler for <%s>", tag)
-      if self.policy.missing_handler.behavior == "raise":
+      if self.diagnostics is not None:
+        self.diagnostics.report(
+          "missing_handler", behavior, f"Missing handler for <{tag}>", tag=tag
+        )
+      if behavior == "raise":
         raise MissingHandlerError(f"Missing handler for <{tag}>") from None
-      elif self.policy.missing_handler.behavior == "ignore":
+      elif behavior == "ignore" or behavior == "collect":
         return None
       else:
         self.logger.log(
@@ -138,4 +220,74 @@ class Deserializer[TypeofBackendElement]:
         handler = self._get_default_handlers().get(tag)
         if handler is None:
           raise MissingHandlerError(f"Missing handler for <{tag}>") from None
+    return handler
+
+  def deserialize(self, element: TypeofBackendElement) -> BaseElement | None:
+    """
+    Dispatch an XML element to a handler and return the resulting TMX object.
+
+    Parameters
+    ----------
+    element : TypeofBackendElement
+        The backend XML element to deserialize.
+
+    Returns
+    -------
+    BaseElement | None
+        The deserialized TMX object, or None if the policy is set to "ignore"
+        on missing handlers.
+
+    Raises
+    ------
+    MissingHandlerError
+        If no handler is found for the element tag and the policy is set to
+        "raise", or if "default" fallback fails to find a handler.
+    """
+    tag = self.backend.get_tag(element)
+    self.logger.debug("Deserializing <%s>", tag)
+    handler = self._resolve_handler(tag)
+    if handler is None:
+      return None
     return handler._deserialize(element)
+
+  def deserialize_many(self, elements: Iterable[TypeofBackendElement]) -> list[BaseElement | None]:
+    """
+    Deserialize a batch of XML elements in one call.
+
+    Equivalent to calling ``deserialize`` on each element, but the handler
+    lookup and the missing_handler policy are resolved once per distinct tag
+    in the batch instead of once per element, and a single debug message is
+    logged for the whole batch. This is meant for large runs of sibling
+    elements, typically the `<tu>` elements of a file.
+
+    Parameters
+    ----------
+    elements : Iterable[TypeofBackendElement]
+        The backend XML elements to deserialize.
+
+    Returns
+    -------
+    list[BaseElement | None]
+        The deserialized TMX objects, in the same order as ``elements``. An
+        entry is None if its element has no handler and the policy is set to
+        "ignore".
+
+    Raises
+    ------
+    MissingHandlerError
+        If no handler is found for a tag and the policy is set to "raise",
+        or if "default" fallback fails to find a handler.
+    """
+    get_tag = self.backend.get_tag
+    handlers: dict[str, BaseElementDeserializer[TypeofBackendElement, BaseElement] | None] = {}
+    results: list[BaseElement | None] = []
+    append = results.append
+    for element in elements:
+      tag = get_tag(element)
+      if tag in handlers:
+        handler = handlers[tag]
+      else:
+        handler = handlers[tag] = self._resolve_handler(tag)
+      append(None if handler is None else handler._deserialize(element))
+    self.logger.debug("Deserialized %d elements", len(results))
+    return results
@@ -0,0 +1,750 @@
+"""
+Deserializer driving ``xml.parsers.expat`` directly.
+
+``ExpatDeserializer`` builds TMX objects straight from expat's callbacks,
+without creating any intermediate element tree and without going through
+the ``XmlBackend`` API. It only depends on the standard library.
+"""
+
+from collections.abc import Collection, Generator
+from datetime import datetime
+from enum import StrEnum
+from logging import Logger, getLogger
+from os import PathLike
+from typing import Any, Literal
+from xml.parsers import expat
+
+from hypomnema.base.errors import AttributeDeserializationError, XmlDeserializationError
+from hypomnema.base.types import (
+  Assoc,
+  BaseElement,
+  Bpt,
+  Ept,
+  Header,
+  Hi,
+  It,
+  Note,
+  Ph,
+  Pos,
+  Prop,
+  Segtype,
+  Sub,
+  Tmx,
+  Tu,
+  Tuv,
+)
+from hypomnema.xml.deserialization.interning import AttributeInterner
+from hypomnema.xml.diagnostics import Diagnostics
+from hypomnema.xml.policy import DeserializationPolicy
+from hypomnema.xml.progress import ProgressReporter
+from hypomnema.xml.utils import make_usable_path, parse_datetime
+
+__all__ = ["ExpatDeserializer"]
+
+
+type _Kind = Literal["str", "int", "datetime"] | type[StrEnum]
+type _AttributeSpec = tuple[str, str, _Kind, bool]
+
+_DATES: tuple[_AttributeSpec, ...] = (
+  ("creationtool", "creationtool", "str", False),
+  ("creationtoolversion", "creationtoolversion", "str", False),
+  ("creationdate", "creationdate", "datetime", False),
+  ("creationid", "creationid", "str", False),
+  ("changedate", "changedate", "datetime", False),
+)
+
+# Attributes of each element, in the order the handlers parse them:
+# (attribute name, field name, kind, required)
+_ATTRIBUTES: dict[str, tuple[_AttributeSpec, ...]] = {
+  "tmx": (("version", "version", "str", True),),
+  "header": (
+    ("creationtool", "creationtool", "str", True),
+    ("creationtoolversion", "creationtoolversion", "str", True),
+    ("segtype", "segtype", Segtype, True),
+    ("o-tmf", "o_tmf", "str", True),
+    ("adminlang", "adminlang", "str", True),
+    ("srclang", "srclang", "str", True),
+    ("datatype", "datatype", "str", True),
+    ("o-encoding", "o_encoding", "str", False),
+    ("creationdate", "creationdate", "datetime", False),
+    ("creationid", "creationid", "str", False),
+    ("changedate", "changedate", "datetime", False),
+    ("changeid", "changeid", "str", False),
+  ),
+  "prop": (
+    ("type", "type", "str", True),
+    ("xml:lang", "lang", "str", False),
+    ("o-encoding", "o_encoding", "str", False),
+  ),
+  "note": (("xml:lang", "lang", "str", False), ("o-encoding", "o_encoding", "str", False)),
+  "tu": (
+    ("tuid", "tuid", "str", False),
+    ("o-encoding", "o_encoding", "str", False),
+    ("datatype", "datatype", "str", False),
+    ("usagecount", "usagecount", "int", False),
+    ("lastusagedate", "lastusagedate", "datetime", False),
+    *_DATES,
+    ("segtype", "segtype", Segtype, False),
+    ("changeid", "changeid", "str", False),
+    ("o-tmf", "o_tmf", "str", False),
+    ("srclang", "srclang", "str", False),
+  ),
+  "tuv": (
+    ("xml:lang", "lang", "str", True),
+    ("o-encoding", "o_encoding", "str", False),
+    ("datatype", "datatype", "str", False),
+    ("usagecount", "usagecount", "int", False),
+    ("lastusagedate", "lastusagedate", "datetime", False),
+    *_DATES,
+    ("changeid", "changeid", "str", False),
+    ("o-tmf", "o_tmf", "str", False),
+  ),
+  "seg": (),
+  "body": (),
+  "bpt": (("i", "i", "int", True), ("x", "x", "int", False), ("type", "type", "str", False)),
+  "ept": (("i", "i", "int", True),),
+  "it": (("pos", "pos", Pos, True), ("x", "x", "int", False), ("type", "type", "str", False)),
+  "ph": (
+    ("x", "x", "int", False),
+    ("assoc", "assoc", Assoc, False),
+    ("type", "type", "str", False),
+  ),
+  "sub": (("datatype", "datatype", "str", False), ("type", "type", "str", False)),
+  "hi": (("x", "x", "int", False), ("type", "type", "str", False)),
+}
+
+_CODE_CHILDREN = ("sub",)
+_SEG_CHILDREN = ("bpt", "ept", "ph", "it", "hi")
+
+# Permitted children of elements with mixed content
+_CONTENT_CHILDREN: dict[str, tuple[str, ...]] = {
+  "seg": _SEG_CHILDREN,
+  "bpt": _CODE_CHILDREN,
+  "ept": _CODE_CHILDREN,
+  "it": _CODE_CHILDREN,
+  "ph": _CODE_CHILDREN,
+  "sub": _SEG_CHILDREN,
+  "hi": _SEG_CHILDREN,
+}
+
+# Permitted children of structural elements
+_STRUCTURE_CHILDREN: dict[str, tuple[str, ...]] = {
+  "tmx": ("header", "body"),
+  "header": ("prop", "note"),
+  "tu": ("prop", "note", "tuv"),
+  "tuv": ("prop", "note", "seg"),
+  "prop": (),
+  "note": (),
+}
+
+_CLASSES: dict[str, type[BaseElement]] = {
+  "tmx": Tmx,
+  "header": Header,
+  "prop": Prop,
+  "note": Note,
+  "tu": Tu,
+  "tuv": Tuv,
+  "bpt": Bpt,
+  "ept": Ept,
+  "it": It,
+  "ph": Ph,
+  "sub": Sub,
+  "hi": Hi,
+}
+
+_SUPPORTED_TAGS: frozenset[str] = frozenset(_CLASSES)
+
+
+class _Frame:
+  """An element being built."""
+
+  __slots__ = (
+    "tag",
+    "fields",
+    "mixed",
+    "chunks",
+    "text",
+    "has_children",
+    "content",
+    "drop_tail",
+    "found",
+  )
+
+  def __init__(self, tag: str, fields: dict[str, Any], content: list[Any] | None) -> None:
+    self.tag = tag
+    self.fields = fields
+    # Whether character data is part of the content (text and tails)
+    self.mixed = tag in _CONTENT_CHILDREN
+    self.chunks: list[str] = []
+    # Text before the first child, for elements without mixed content
+    self.text: str | None = None
+    self.has_children = False
+    # Mixed content, variants of a <tu>, or units of a <tmx> or <body>
+    self.content = content
+    self.drop_tail = False
+    # Whether a <header> (in <tmx>) or a <seg> (in <tuv>) was found
+    self.found = False
+
+
+class _Builder:
+  """Expat callbacks building the objects of one parse."""
+
+  __slots__ = (
+    "policy",
+    "logger",
+    "interner",
+    "diagnostics",
+    "parser",
+    "tags",
+    "stack",
+    "skip_depth",
+    "ready",
+  )
+
+  def __init__(self, owner: ExpatDeserializer, parser: Any, tags: frozenset[str]) -> None:
+    self.policy = owner.policy
+    self.logger = owner.logger
+    self.interner = owner.interner
+    self.diagnostics = owner.diagnostics
+    self.parser = parser
+    self.tags = tags
+    self.stack: list[_Frame] = []
+    # Depth inside an element that is skipped, 0 when not in one
+    self.skip_depth = 0
+    self.ready: list[BaseElement] = []
+
+  def check_root(self, tag: str, attributes: dict[str, str]) -> None:
+    if tag != "tmx":
+      raise XmlDeserializationError("Root element is not a tmx")
+    self.parser.StartElementHandler = self.start
+    self.start(tag, attributes)
+
+  def start(self, tag: str, attributes: dict[str, str]) -> None:
+    if self.skip_depth:
+      self.skip_depth += 1
+      return
+    stack = self.stack
+    if not stack:
+      if tag in self.tags:
+        stack.append(self._open(tag, attributes))
+      return
+    parent = stack[-1]
+    self._flush(parent)
+    parent.has_children = True
+    if not self._accepts(parent, tag):
+      self.skip_depth = 1
+      return
+    stack.append(self._open(tag, attributes))
+
+  def end(self, tag: str) -> None:
+    if self.skip_depth:
+      self.skip_depth -= 1
+      return
+    stack = self.stack
+    if not stack:
+      return
+    frame = stack.pop()
+    self._flush(frame)
+    obj = self._close(frame)
+    if stack:
+      parent = stack[-1]
+      if tag == "prop":
+        parent.fields["props"].append(obj)
+      elif tag == "note":
+        parent.fields["notes"].append(obj)
+      elif tag == "seg":
+        parent.fields["content"] = obj
+      elif tag == "header":
+        parent.fields["header"] = obj
+      elif tag == "body":
+        parent.content.extend(obj)  # type: ignore[union-attr]
+      else:
+        parent.content.append(obj)  # type: ignore[union-attr]
+    if tag in self.tags:
+      self.ready.append(obj)
+
+  def characters(self, data: str) -> None:
+    if self.stack and not self.skip_depth:
+      self.stack[-1].chunks.append(data)
+
+  def _flush(self, frame: _Frame) -> None:
+    """Place the character data read so far as text or tail."""
+    chunks = frame.chunks
+    drop_tail, frame.drop_tail = frame.drop_tail, False
+    if not chunks:
+      return
+    text = "".join(chunks)
+    chunks.clear()
+    if frame.mixed:
+      if not drop_tail:
+        frame.content.append(text)  # type: ignore[union-attr]
+    elif not frame.has_children:
+      frame.text = text
+      if frame.tag in ("tmx", "header", "tu", "tuv") and text.strip():
+        self._extra_text(frame.tag, text)
+
+  def _accepts(self, parent: _Frame, tag: str) -> bool:
+    """Check whether ``tag`` is a valid child of ``parent``, applying the policies."""
+    parent_tag = parent.tag
+    if (allowed := _CONTENT_CHILDREN.get(parent_tag)) is not None:
+      if tag in allowed:
+        return True
+      self._incorrect_child(parent_tag, allowed, tag)
+      parent.drop_tail = True
+      return False
+    if parent_tag == "body":
+      return tag == "tu"
+    if tag not in _STRUCTURE_CHILDREN[parent_tag]:
+      self._invalid_child(parent_tag, tag)
+      return False
+    if tag == "seg" or tag == "header":
+      if parent.found:
+        if not self._multiple(parent_tag, tag):
+          return False
+      parent.found = True
+    return True
+
+  def _open(self, tag: str, attributes: dict[str, str]) -> _Frame:
+    if tag == "tu" and self.diagnostics is not None:
+      self.diagnostics.tuid = attributes.get("tuid")
+    fields = self._parse_attributes(tag, attributes)
+    content: list[Any] | None = None
+    if tag in _CONTENT_CHILDREN or tag in ("tmx", "body", "tu"):
+      content = []
+    if tag in ("header", "tu", "tuv"):
+      fields["props"] = []
+      fields["notes"] = []
+    elif tag == "tmx":
+      fields["header"] = None
+    return _Frame(tag, fields, content)
+
+  def _close(self, frame: _Frame) -> Any:
+    tag = frame.tag
+    fields = frame.fields
+    if tag in _CONTENT_CHILDREN:
+      content = frame.content
+      assert content is not None
+      if not content:
+        self._empty_content(tag, content)
+      if tag == "seg":
+        return content
+      return _CLASSES[tag](**fields, content=content)
+    if tag == "tu":
+      if self.diagnostics is not None:
+        self.diagnostics.tuid = None
+      return Tu(**fields, variants=frame.content)  # type: ignore[arg-type]
+    if tag == "tuv":
+      if not frame.found:
+        fields["content"] = self._missing_seg()
+      return Tuv(**fields)
+    if tag in ("prop", "note"):
+      text = frame.text
+      if text is None:
+        text = self._missing_text(tag)
+      return _CLASSES[tag](**fields, text=text)
+    if tag == "body":
+      return frame.content
+    if tag == "tmx":
+      if not frame.found:
+        self._missing_header()
+      return Tmx(**fields, body=frame.content)  # type: ignore[arg-type]
+    return _CLASSES[tag](**fields)
+
+  def _violation(
+    self,
+    policy: str,
+    error: type[Exception],
+    message: str,
+    *args: Any,
+    tag: str | None = None,
+    attribute: str | None = None,
+  ) -> str:
+    """Log a policy violation, report it to the diagnostics sink, raise if required."""
+    value = getattr(self.policy, policy)
+    self.logger.log(value.log_level, message, *args)
+    if self.diagnostics is not None:
+      self.diagnostics.report(
+        policy,
+        value.behavior,
+        message % args,
+        tag=tag,
+        attribute=attribute,
+        line=self.parser.CurrentLineNumber,
+        column=self.parser.CurrentColumnNumber,
+      )
+    if value.behavior == "raise":
+      raise error(message % args)
+    return value.behavior
+
+  def _parse_attributes(self, tag: str, attributes: dict[str, str]) -> dict[str, Any]:
+    """Convert the attributes of an element into dataclass fields."""
+    fields: dict[str, Any] = {}
+    interner = self.interner
+    for attribute, name, kind, required in _ATTRIBUTES[tag]:
+      value = attributes.get(attribute)
+      if value is None:
+        if required:
+          self._violation(
+            "required_attribute_missing",
+            AttributeDeserializationError,
+            "Required attribute %r is None",
+            attribute,
+            tag=tag,
+            attribute=attribute,
+          )
+        fields[name] = None
+      elif kind == "str":
+        fields[name] = value if interner is None else interner.intern(attribute, value)
+      elif kind == "int":
+        fields[name] = self._parse_int(tag, attribute, value)
+      elif kind == "datetime":
+        fields[name] = self._parse_datetime(tag, attribute, value)
+      else:
+        fields[name] = self._parse_enum(tag, attribute, value, kind)  # type: ignore[arg-type]
+    return fields
+
+  def _parse_int(self, tag: str, attribute: str, value: str) -> int | None:
+    try:
+      return int(value)
+    except ValueError:
+      self._violation(
+        "invalid_attribute_value",
+        AttributeDeserializationError,
+        "Cannot convert %r to an int for attribute %s",
+        value,
+        attribute,
+        tag=tag,
+        attribute=attribute,
+      )
+      return None
+
+  def _parse_datetime(self, tag: str, attribute: str, value: str) -> datetime | None:
+    interner = self.interner
+    if interner is not None and (shared := interner.get(attribute, value)) is not None:
+      return shared
+    try:
+      parsed = parse_datetime(value)
+    except ValueError:
+      self._violation(
+        "invalid_attribute_value",
+        AttributeDeserializationError,
+        "Cannot convert %r to a datetime object for attribute %s",
+        value,
+        attribute,
+        tag=tag,
+        attribute=attribute,
+      )
+      return None
+    if interner is not None:
+      return interner.put(attribute, value, parsed)
+    return parsed
+
+  def _parse_enum[EnumType: StrEnum](
+    self, tag: str, attribute: str, value: str, enum_type: type[EnumType]
+  ) -> EnumType | None:
+    try:
+      return enum_type(value)
+    except ValueError:
+      self._violation(
+        "invalid_attribute_value",
+        AttributeDeserializationError,
+        "Value %r is not a valid enum value for attribute %s",
+        value,
+        attribute,
+        tag=tag,
+        attribute=attribute,
+      )
+      return None
+
+  def _extra_text(self, tag: str, text: str) -> None:
+    self._violation(
+      "extra_text",
+      XmlDeserializationError,
+      "Element <%s> has extra text content '%s'",
+      tag,
+      text,
+      tag=tag,
+    )
+
+  def _invalid_child(self, parent_tag: str, tag: str) -> None:
+    self._violation(
+      "invalid_child_element",
+      XmlDeserializationError,
+      "Invalid child element <%s> in <%s>",
+      tag,
+      parent_tag,
+      tag=tag,
+    )
+
+  def _incorrect_child(self, parent_tag: str, allowed: tuple[str, ...], tag: str) -> None:
+    self._violation(
+      "invalid_child_element",
+      XmlDeserializationError,
+      "Incorrect child element in %s: expected one of %s, got %s",
+      parent_tag,
+      ", ".join(allowed),
+      tag,
+      tag=tag,
+    )
+
+  def _multiple(self, parent_tag: str, tag: str) -> bool:
+    """Apply the multiple_seg/multiple_headers policy, return whether to keep the new element."""
+    behavior = self._violation(
+      "multiple_seg" if tag == "seg" else "multiple_headers",
+      XmlDeserializationError,
+      "Multiple <%s> elements in <%s>",
+      tag,
+      parent_tag,
+      tag=tag,
+    )
+    return behavior == "keep_last"
+
+  def _empty_content(self, tag: str, content: list[Any]) -> None:
+    behavior = self._violation(
+      "empty_content", XmlDeserializationError, "Element <%s> is empty", tag, tag=tag
+    )
+    if behavior == "empty":
+      self.logger.log(self.policy.empty_content.log_level, "Falling back to an empty string")
+      content.append("")
+
+  def _missing_text(self, tag: str) -> str | None:
+    behavior = self._violation(
+      "empty_content",
+      XmlDeserializationError,
+      "Element <%s> does not have any text content",
+      tag,
+      tag=tag,
+    )
+    if behavior == "empty":
+      self.logger.log(self.policy.empty_content.log_level, "Falling back to an empty string")
+      return ""
+    return None
+
+  def _missing_seg(self) -> list[str]:
+    behavior = self._violation(
+      "missing_seg",
+      XmlDeserializationError,
+      "Element <tuv> is missing a <seg> child element",
+      tag="tuv",
+    )
+    if behavior != "empty":
+      return []
+    self.logger.log(self.policy.missing_seg.log_level, "Falling back to an empty string")
+    return [""]
+
+  def _missing_header(self) -> None:
+    self._violation(
+      "missing_header",
+      XmlDeserializationError,
+      "Element <tmx> is missing a <header> child element",
+      tag="tmx",
+    )
+
+
+class ExpatDeserializer:
+  """
+  Zero-dependency deserializer driving ``xml.parsers.expat`` directly.
+
+  The regular ``Deserializer`` works on elements built by an ``XmlBackend``
+  and reads them back through the backend API. This deserializer instead
+  builds `Tu`, `Tuv`, inline elements, etc. straight from expat's SAX-style
+  callbacks: no element tree is ever created, and elements outside of the
+  requested tags are not even materialized. It is typically several times
+  faster than ``load`` with the ``StandardBackend``, without requiring lxml.
+
+  The same ``DeserializationPolicy`` is applied, with the same messages, as
+  with the default handlers. Custom handlers, projections and lazy content
+  are not supported.
+
+  Parameters
+  ----------
+  policy : DeserializationPolicy | None, optional
+      The configuration for error handling and logging. Defaults to a
+      standard DeserializationPolicy.
+  logger : Logger | None, optional
+      The logger for reporting policy violations. Defaults to the module
+      logger.
+  interner : AttributeInterner | None, optional
+      Pools used to share repeated attribute values between deserialized
+      objects. If None (default), no interning is done.
+  encoding : str | None, optional
+      Overrides the encoding declared in the file. Defaults to None (the
+      declared encoding, or UTF-8, is used).
+  buffer_size : int, optional
+      Number of bytes read from the file and fed to expat at a time.
+      Defaults to 65536.
+  diagnostics : Diagnostics | None, optional
+      Sink every policy violation is reported to, with its line and column.
+      If None (default), violations are only logged.
+
+  Attributes
+  ----------
+  policy : DeserializationPolicy
+      The active deserialization policy.
+  logger : Logger
+      The active logger.
+  interner : AttributeInterner | None
+      The attribute value pools, if any.
+  encoding : str | None
+      The encoding override, if any.
+  buffer_size : int
+      Number of bytes fed to expat at a time.
+  diagnostics : Diagnostics | None
+      The sink violations are reported to, if any.
+
+  Examples
+  --------
+  >>> deserializer = ExpatDeserializer()
+  >>> tmx = deserializer.parse("translations.tmx")
+  >>> for tu in deserializer.iterparse("large.tmx"):
+  >>>     print(tu.tuid)
+  """
+
+  def __init__(
+    self,
+    policy: DeserializationPolicy | None = None,
+    logger: Logger | None = None,
+    *,
+    interner: AttributeInterner | None = None,
+    encoding: str | None = None,
+    buffer_size: int = 65536,
+    diagnostics: Diagnostics | None = None,
+  ):
+    if buffer_size < 1:
+      raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+    self.policy: DeserializationPolicy = policy or DeserializationPolicy()
+    self.logger: Logger = logger or getLogger("hypomnema.xml.deserialization.expat")
+    self.interner: AttributeInterner | None = interner
+    self.encoding: str | None = encoding
+    self.buffer_size: int = buffer_size
+    self.diagnostics: Diagnostics | None = diagnostics
+
+  def parse(self, path: PathLike | str, *, progress: ProgressReporter | None = None) -> Tmx:
+    """
+    Deserialize a whole TMX file.
+
+    Parameters
+    ----------
+    path : PathLike | str
+        Path to the TMX file.
+    progress : ProgressReporter | None, optional
+        Reporter the bytes read are counted to, as the ``"parse"``
+        operation. Defaults to None.
+
+    Returns
+    -------
+    Tmx
+        The deserialized Tmx instance.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    IsADirectoryError
+        If the path is a directory.
+    XmlDeserializationError
+        If the root element is not a `<tmx>`, or on a policy violation whose
+        behavior is "raise".
+    xml.parsers.expat.ExpatError
+        If the file is not well-formed XML.
+    """
+    for obj in self._parse(path, frozenset({"tmx"}), True, progress):
+      assert isinstance(obj, Tmx)
+      return obj
+    raise XmlDeserializationError("Root element is not a tmx")
+
+  def iterparse(
+    self,
+    path: PathLike | str,
+    tag_filter: str | Collection[str] = "tu",
+    *,
+    progress: ProgressReporter | None = None,
+  ) -> Generator[BaseElement]:
+    """
+    Stream the elements of a TMX file matching a tag filter.
+
+    The file is fed to expat ``buffer_size`` bytes at a time and only the
+    elements matching ``tag_filter`` (and their descendants) are built, so
+    memory usage does not depend on the size of the file.
+
+    Parameters
+    ----------
+    path : PathLike | str
+        Path to the TMX file.
+    tag_filter : str | Collection[str], optional
+        Tag(s) of the elements to yield. Defaults to "tu".
+    progress : ProgressReporter | None, optional
+        Reporter the bytes read and the yielded elements are counted to, as
+        the ``"iterparse"`` operation. Defaults to None.
+
+    Yields
+    ------
+    BaseElement
+        The deserialized elements, in the order they are closed.
+
+    Raises
+    ------
+    ValueError
+        If ``tag_filter`` contains a tag that is not a TMX element.
+    FileNotFoundError
+        If the file does not exist.
+    IsADirectoryError
+        If the path is a directory.
+    XmlDeserializationError
+        On a policy violation whose behavior is "raise".
+    xml.parsers.expat.ExpatError
+        If the file is not well-formed XML.
+    """
+    tags = frozenset((tag_filter,) if isinstance(tag_filter, str) else tag_filter)
+    if unknown := tags - _SUPPORTED_TAGS:
+      raise ValueError(f"Unsupported tag(s) in tag_filter: {', '.join(sorted(unknown))}")
+    return self._parse(path, tags, False, progress)
+
+  def _parse(
+    self,
+    path: PathLike | str,
+    tags: frozenset[str],
+    check_root: bool,
+    progress: ProgressReporter | None,
+  ) -> Generator[BaseElement]:
+    _path = make_usable_path(path, mkdir=False)
+    if not _path.exists():
+      raise FileNotFoundError(f"File {_path} does not exist")
+    if not _path.is_file():
+      raise IsADirectoryError(f"Path {_path} is a directory")
+    return self._run(_path, tags, check_root, progress)
+
+  def _run(
+    self, path: Any, tags: frozenset[str], check_root: bool, progress: ProgressReporter | None
+  ) -> Generator[BaseElement]:
+    parser = expat.ParserCreate(self.encoding)
+    builder = _Builder(self, parser, tags)
+    parser.buffer_text = True
+    parser.StartElementHandler = builder.check_root if check_root else builder.start
+    parser.EndElementHandler = builder.end
+    parser.CharacterDataHandler = builder.characters
+    ready = builder.ready
+    # Only the elements of iterparse are counted, parse yields a single Tmx
+    counted = progress if not check_root else None
+    if progress is None:
+      source = open(path, "rb")
+    else:
+      source = progress.reading("parse" if check_root else "iterparse", path)
+    try:
+      with source as file:
+        while data := file.read(self.buffer_size):
+          parser.Parse(data, False)
+          if ready:
+            if counted is not None:
+              counted.add_elements(len(ready))
+            yield from ready
+            ready.clear()
+        parser.Parse(b"", True)
+        if counted is not None:
+          counted.add_elements(len(ready))
+      yield from ready
+    finally:
+      # The parse may stop inside a <tu>, on an error or when the caller
+      # stops iterating: do not leave its tuid on the sink
+      if self.diagnostics is not None:
+        self.diagnostics.tuid = None
@@ -0,0 +1,162 @@
+from collections.abc import Collection, Hashable
+from typing import Any
+
+__all__ = ["AttributeInterner", "DEFAULT_INTERNED_ATTRIBUTES"]
+
+
+DEFAULT_INTERNED_ATTRIBUTES: frozenset[str] = frozenset(
+  {
+    "xml:lang",
+    "srclang",
+    "adminlang",
+    "creationtool",
+    "creationtoolversion",
+    "creationid",
+    "changeid",
+    "datatype",
+    "o-tmf",
+    "o-encoding",
+    "type",
+    "creationdate",
+    "changedate",
+    "lastusagedate",
+  }
+)
+"""Attributes whose values typically repeat across a whole file."""
+
+
+class AttributeInterner:
+  """
+  Bounded, per-attribute pools of shared attribute values.
+
+  Translation memories repeat the same few values (languages, tool names,
+  user ids, dates...) across millions of elements. When a deserializer is
+  given an interner, every value of a configured attribute is looked up in
+  that attribute's pool, so identical values end up sharing a single object
+  instead of each deserialized element holding its own copy.
+
+  An interner can be shared by deserializers running on several threads.
+  Concurrent lookups may at worst store the same value twice, which only
+  costs a missed sharing.
+
+  Parameters
+  ----------
+  attributes : Collection[str], optional
+      Names of the attributes to intern, as written in the TMX file
+      (e.g. ``"xml:lang"``, ``"o-tmf"``). Defaults to
+      ``DEFAULT_INTERNED_ATTRIBUTES``.
+  max_size : int, optional
+      Maximum number of distinct values kept per attribute. When a pool is
+      full it is emptied before the next value is added, so that memory
+      stays bounded on attributes with unexpectedly many distinct values
+      (e.g. ids). Defaults to 65536.
+
+  Attributes
+  ----------
+  attributes : frozenset[str]
+      Names of the interned attributes.
+  max_size : int
+      Maximum number of distinct values kept per attribute.
+
+  Raises
+  ------
+  ValueError
+      If ``max_size`` is less than 1.
+  """
+
+  __slots__ = ("attributes", "max_size", "_pools")
+
+  def __init__(
+    self, attributes: Collection[str] = DEFAULT_INTERNED_ATTRIBUTES, *, max_size: int = 65536
+  ) -> None:
+    if max_size < 1:
+      raise ValueError("max_size must be >= 1")
+    self.attributes: frozenset[str] = frozenset(attributes)
+    self.max_size: int = max_size
+    self._pools: dict[str, dict[Hashable, Any]] = {attribute: {} for attribute in self.attributes}
+
+  def __contains__(self, attribute: object) -> bool:
+    return attribute in self._pools
+
+  def __len__(self) -> int:
+    return sum(len(pool) for pool in self._pools.values())
+
+  def get(self, attribute: str, key: Hashable) -> Any | None:
+    """
+    Return the shared value stored for ``key``, if any.
+
+    Parameters
+    ----------
+    attribute : str
+        The name of the attribute.
+    key : Hashable
+        The key the value was stored under, usually the raw attribute string.
+
+    Returns
+    -------
+    Any | None
+        The shared value, or None if the attribute is not interned or the
+        key is unknown.
+    """
+    pool = self._pools.get(attribute)
+    if pool is None:
+      return None
+    return pool.get(key)
+
+  def put[T](self, attribute: str, key: Hashable, value: T) -> T:
+    """
+    Store ``value`` as the shared value for ``key`` and return it.
+
+    Does nothing if the attribute is not interned.
+
+    Parameters
+    ----------
+    attribute : str
+        The name of the attribute.
+    key : Hashable
+        The key to store the value under, usually the raw attribute string.
+    value : T
+        The value to share.
+
+    Returns
+    -------
+    T
+        ``value``, unchanged.
+    """
+    pool = self._pools.get(attribute)
+    if pool is None:
+      return value
+    if len(pool) >= self.max_size:
+      pool.clear()
+    pool[key] = value
+    return value
+
+  def intern(self, attribute: str, value: str) -> str:
+    """
+    Return the shared copy of a string attribute value.
+
+    Parameters
+    ----------
+    attribute : str
+        The name of the attribute.
+    value : str
+        The attribute value as read from the XML element.
+
+    Returns
+    -------
+    str
+        A string equal to ``value``. If the attribute is interned, this is
+        the same object for every equal value seen so far.
+    """
+    pool = self._pools.get(attribute)
+    if pool is None:
+      return value
+    shared = pool.get(value)
+    if shared is not None:
+      return shared
+    return self.put(attribute, value, value)
+
+  def clear(self) -> None:
+    """Drop every shared value, keeping the configuration."""
+    for pool in self._pools.values():
+      pool.clear()
@@ -0,0 +1,114 @@
+from collections.abc import Callable, Iterable, Iterator, MutableSequence
+from typing import Any, overload
+
+from hypomnema.base.types import InlineElement
+from hypomnema.xml.diagnostics import Diagnostics
+
+__all__ = ["LazyContent"]
+
+
+class LazyContent[TypeOfBackendElement](MutableSequence[InlineElement | str]):
+  """
+  Mixed content list that is only deserialized on first access.
+
+  Used as ``Tuv.content`` when a deserializer runs in lazy mode. It keeps a
+  reference to the backend ``<seg>`` element and the function able to turn
+  it into the usual list of strings and inline elements. The first time the
+  content is read or modified, the segment is deserialized, the element
+  reference is dropped, and the proxy behaves exactly like that list from
+  then on.
+
+  Parameters
+  ----------
+  loader : Callable[[TypeOfBackendElement], list[InlineElement | str]]
+      Function deserializing the source element into mixed content.
+  source : TypeOfBackendElement
+      The backend ``<seg>`` element to deserialize.
+  diagnostics : Diagnostics | None, optional
+      Sink the loader reports violations to. Its current ``tuid``, that of
+      the enclosing `<tu>`, is captured and restored while the content is
+      deserialized. Defaults to None.
+
+  Notes
+  -----
+  Since deserialization is deferred, any policy violation inside the segment
+  (e.g. an invalid inline element with a "raise" behavior) is raised when
+  the content is first accessed rather than when the ``<tuv>`` is loaded.
+  """
+
+  __slots__ = ("_loader", "_source", "_items", "_diagnostics", "_tuid")
+
+  def __init__(
+    self,
+    loader: Callable[[TypeOfBackendElement], list[InlineElement | str]],
+    source: TypeOfBackendElement,
+    diagnostics: Diagnostics | None = None,
+  ) -> None:
+    self._loader: Callable[[TypeOfBackendElement], list[InlineElement | str]] | None = loader
+    self._source: TypeOfBackendElement | None = source
+    self._items: list[InlineElement | str] | None = None
+    self._diagnostics = diagnostics
+    self._tuid = diagnostics.tuid if diagnostics is not None else None
+
+  @property
+  def is_loaded(self) -> bool:
+    """Whether the segment has already been deserialized."""
+    return self._items is not None
+
+  def _load(self) -> list[InlineElement | str]:
+    items = self._items
+    if items is None:
+      assert self._loader is not None
+      if (diagnostics := self._diagnostics) is None:
+        items = self._loader(self._source)  # type: ignore[arg-type]
+      else:
+        previous, diagnostics.tuid = diagnostics.tuid, self._tuid
+        try:
+          items = self._loader(self._source)  # type: ignore[arg-type]
+        finally:
+          diagnostics.tuid = previous
+      self._items = items
+      self._loader = None
+      self._source = None
+      self._diagnostics = None
+    return items
+
+  @overload
+  def __getitem__(self, index: int) -> InlineElement | str: ...
+  @overload
+  def __getitem__(self, index: slice) -> list[InlineElement | str]: ...
+  def __getitem__(self, index: int | slice) -> InlineElement | str | list[InlineElement | str]:
+    return self._load()[index]
+
+  @overload
+  def __setitem__(self, index: int, value: InlineElement | str) -> None: ...
+  @overload
+  def __setitem__(self, index: slice, value: Iterable[InlineElement | str]) -> None: ...
+  def __setitem__(self, index: Any, value: Any) -> None:
+    self._load()[index] = value
+
+  def __delitem__(self, index: int | slice) -> None:
+    del self._load()[index]
+
+  def __len__(self) -> int:
+    return len(self._load())
+
+  def __iter__(self) -> Iterator[InlineElement | str]:
+    return iter(self._load())
+
+  def insert(self, index: int, value: InlineElement | str) -> None:
+    self._load().insert(index, value)
+
+  def __eq__(self, other: object) -> bool:
+    if isinstance(other, LazyContent):
+      return self._load() == other._load()
+    if isinstance(other, list):
+      return self._load() == other
+    return NotImplemented
+
+  __hash__ = None  # type: ignore[assignment]
+
+  def __repr__(self) -> str:
+    if self._items is None:
+      return f"{self.__class__.__name__}(<not loaded>)"
+    return f"{self.__class__.__name__}({self._items!r})"
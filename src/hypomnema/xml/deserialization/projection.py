@@ -0,0 +1,154 @@
+from collections.abc import Collection
+from dataclasses import dataclass, fields
+from typing import Literal
+
+from hypomnema.base.languages import language_matches
+from hypomnema.base.types import Tu, Tuv
+
+__all__ = ["Projection"]
+
+
+_TU_FIELDS = frozenset(f.name for f in fields(Tu)) - {"props", "notes", "variants"}
+_TUV_FIELDS = frozenset(f.name for f in fields(Tuv)) - {"props", "notes"}
+
+
+def _check_fields(
+  names: Collection[str] | None, allowed: frozenset[str], element: str
+) -> frozenset[str] | None:
+  if names is None:
+    return None
+  if isinstance(names, str):
+    names = (names,)
+  _names = frozenset(names)
+  if unknown := _names - allowed:
+    raise ValueError(f"Unknown {element} field(s): {', '.join(sorted(unknown))}")
+  return _names
+
+
+@dataclass(slots=True, frozen=True, kw_only=True, init=False)
+class Projection:
+  """
+  Selection of the parts of `<tu>` and `<tuv>` elements to deserialize.
+
+  Anything left out of the projection is not parsed at all and keeps its
+  default value (None or an empty list) on the resulting objects. The
+  default projection keeps everything.
+
+  Parameters
+  ----------
+  tu_fields : Collection[str] | None, optional
+      Names of the ``Tu`` attribute fields to deserialize (e.g. ``"tuid"``,
+      ``"creationdate"``). If None (default), all of them are deserialized.
+  tuv_fields : Collection[str] | None, optional
+      Names of the ``Tuv`` fields to deserialize, ``"content"`` included.
+      ``lang`` is always deserialized. If None (default), all of them are
+      deserialized.
+  languages : Collection[str] | None, optional
+      Languages of the `<tuv>` elements to keep. Other `<tuv>` elements are
+      dropped before being deserialized. If None (default), every `<tuv>` is
+      kept.
+  language_matching : {"exact", "basic"}, optional
+      How ``xml:lang`` values are compared to ``languages``. "exact" (default)
+      requires identical strings, "basic" treats ``languages`` as BCP-47
+      language ranges (see ``hypomnema.base.languages.language_matches``), so
+      that ``"en"`` also keeps ``"en-US"`` and ``"EN_gb"``.
+  props : bool, optional
+      Whether `<prop>` children of `<tu>` and `<tuv>` are deserialized.
+      Defaults to True.
+  notes : bool, optional
+      Whether `<note>` children of `<tu>` and `<tuv>` are deserialized.
+      Defaults to True.
+  inline_markup : bool, optional
+      Whether inline elements are deserialized. If False, the content of
+      each `<seg>` is reduced to a single string holding its text, without
+      the native code of `<bpt>`, `<ept>`, `<it>` and `<ph>` elements (the
+      text of `<hi>` and unknown elements is kept), as projected by
+      ``TextProjector("strip").project_element``. Defaults to True.
+
+  Raises
+  ------
+  ValueError
+      If an unknown field name or language matching scheme is given.
+
+  Examples
+  --------
+  >>> projection = Projection(
+  ...   tu_fields=["tuid"],
+  ...   tuv_fields=["content"],
+  ...   languages=["en", "fr"],
+  ...   props=False,
+  ...   notes=False,
+  ...   inline_markup=False,
+  ... )
+  """
+
+  tu_fields: frozenset[str] | None
+  tuv_fields: frozenset[str] | None
+  languages: frozenset[str] | None
+  language_matching: Literal["exact", "basic"]
+  props: bool
+  notes: bool
+  inline_markup: bool
+
+  def __init__(
+    self,
+    *,
+    tu_fields: Collection[str] | None = None,
+    tuv_fields: Collection[str] | None = None,
+    languages: Collection[str] | None = None,
+    language_matching: Literal["exact", "basic"] = "exact",
+    props: bool = True,
+    notes: bool = True,
+    inline_markup: bool = True,
+  ) -> None:
+    object.__setattr__(self, "tu_fields", _check_fields(tu_fields, _TU_FIELDS, "Tu"))
+    object.__setattr__(self, "tuv_fields", _check_fields(tuv_fields, _TUV_FIELDS, "Tuv"))
+    if isinstance(languages, str):
+      languages = (languages,)
+    object.__setattr__(self, "languages", None if languages is None else frozenset(languages))
+    if language_matching not in ("exact", "basic"):
+      raise ValueError(f"Unknown language matching {language_matching!r}")
+    object.__setattr__(self, "language_matching", language_matching)
+    object.__setattr__(self, "props", props)
+    object.__setattr__(self, "notes", notes)
+    object.__setattr__(self, "inline_markup", inline_markup)
+
+  def skipped_attributes(self, tag: str) -> frozenset[str]:
+    """
+    Return the names of the XML attributes left out of the projection.
+
+    Parameters
+    ----------
+    tag : str
+        Either ``"tu"`` or ``"tuv"``.
+
+    Returns
+    -------
+    frozenset[str]
+        The attribute names as written in the TMX file (e.g. ``"o-tmf"``).
+    """
+    if tag == "tu":
+      allowed, wanted = _TU_FIELDS, self.tu_fields
+    elif tag == "tuv":
+      allowed, wanted = _TUV_FIELDS - {"lang", "content"}, self.tuv_fields
+    else:
+      raise ValueError(f"Unknown tag {tag!r}, expected 'tu' or 'tuv'")
+    if wanted is None:
+      return frozenset()
+    return frozenset(name.replace("_", "-") for name in allowed - wanted)
+
+  def wants_tu(self, name: str) -> bool:
+    """Whether the ``Tu`` field ``name`` is part of the projection."""
+    return self.tu_fields is None or name in self.tu_fields
+
+  def wants_tuv(self, name: str) -> bool:
+    """Whether the ``Tuv`` field ``name`` is part of the projection."""
+    return self.tuv_fields is None or name in self.tuv_fields
+
+  def wants_language(self, lang: str | None) -> bool:
+    """Whether a `<tuv>` with the given ``xml:lang`` is part of the projection."""
+    if self.languages is None:
+      return True
+    if self.language_matching == "exact":
+      return lang in self.languages
+    return any(language_matches(lang, language_range) for language_range in self.languages)
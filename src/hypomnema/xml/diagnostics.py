@@ -0,0 +1,160 @@
+"""
+Structured reports of deserialization policy violations.
+
+Every policy check done while deserializing can be reported to a
+``Diagnostics`` sink, whatever the policy behavior is. Combined with the
+"collect" behavior, which records a violation and carries on, this gives the
+full list of problems in a file in a single pass.
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from threading import local
+
+__all__ = ["Diagnostic", "Diagnostics"]
+
+
+@dataclass(slots=True, frozen=True)
+class Diagnostic:
+  """
+  A policy violation found while deserializing.
+
+  Attributes
+  ----------
+  policy : str
+      The name of the ``DeserializationPolicy`` field that governs the
+      violation, e.g. ``"missing_seg"``.
+  behavior : str
+      The behavior the policy applied ("raise", "collect", "ignore"...).
+  message : str
+      Human readable description, the same as the logged message.
+  tag : str | None
+      The tag of the offending element, if known.
+  attribute : str | None
+      The name of the offending attribute, for attribute violations.
+  tuid : str | None
+      The ``tuid`` of the enclosing `<tu>`, if any.
+  line : int | None
+      1-based line of the offending element, if the parser reports it.
+  column : int | None
+      0-based column of the offending element, if the parser reports it.
+  """
+
+  policy: str
+  behavior: str
+  message: str
+  tag: str | None = None
+  attribute: str | None = None
+  tuid: str | None = None
+  line: int | None = None
+  column: int | None = None
+
+
+class Diagnostics:
+  """
+  Sink collecting the policy violations of one or more deserializations.
+
+  A single instance can be passed to ``load``, a ``Deserializer`` or an
+  ``ExpatDeserializer``: every handler reports to it. Subclasses can override
+  ``record`` to stream diagnostics elsewhere instead of keeping them.
+
+  A sink can be shared by threads deserializing concurrently (see the
+  ``workers`` argument of ``load``): ``tuid`` is tracked per thread and
+  ``record`` may be called from any of them, in no particular order.
+
+  Attributes
+  ----------
+  records : list[Diagnostic]
+      The diagnostics recorded so far, in the order they were found.
+  tuid : str | None
+      The ``tuid`` of the `<tu>` being deserialized by the current thread,
+      maintained by the `<tu>` handlers and attached to every diagnostic.
+
+  Examples
+  --------
+  >>> diagnostics = Diagnostics()
+  >>> tmx = load("vendor.tmx", policy=DeserializationPolicy.collecting(), diagnostics=diagnostics)
+  >>> for diagnostic in diagnostics:
+  >>>     print(diagnostic.tuid, diagnostic.message)
+  """
+
+  __slots__ = ("records", "_context")
+
+  def __init__(self) -> None:
+    self.records: list[Diagnostic] = []
+    self._context = local()
+
+  @property
+  def tuid(self) -> str | None:
+    return getattr(self._context, "tuid", None)
+
+  @tuid.setter
+  def tuid(self, tuid: str | None) -> None:
+    self._context.tuid = tuid
+
+  def record(self, diagnostic: Diagnostic) -> None:
+    """
+    Record a diagnostic.
+
+    Parameters
+    ----------
+    diagnostic : Diagnostic
+        The diagnostic to record.
+    """
+    self.records.append(diagnostic)
+
+  def report(
+    self,
+    policy: str,
+    behavior: str,
+    message: str,
+    *,
+    tag: str | None = None,
+    attribute: str | None = None,
+    line: int | None = None,
+    column: int | None = None,
+  ) -> None:
+    """
+    Build a diagnostic, attach the current ``tuid`` to it and record it.
+
+    Parameters
+    ----------
+    policy : str
+        The name of the policy field that governs the violation.
+    behavior : str
+        The behavior the policy applied.
+    message : str
+        Description of the violation.
+    tag : str | None, optional
+        The tag of the offending element.
+    attribute : str | None, optional
+        The name of the offending attribute.
+    line : int | None, optional
+        1-based line of the offending element.
+    column : int | None, optional
+        0-based column of the offending element.
+    """
+    self.record(Diagnostic(policy, behavior, message, tag, attribute, self.tuid, line, column))
+
+  def counts(self) -> Counter[str]:
+    """
+    Count the recorded diagnostics by policy.
+
+    Returns
+    -------
+    Counter[str]
+        The number of diagnostics of each policy field.
+    """
+    return Counter(diagnostic.policy for diagnostic in self.records)
+
+  def clear(self) -> None:
+    """Forget every recorded diagnostic."""
+    self.records.clear()
+    self.tuid = None
+
+  def __iter__(self) -> Iterator[Diagnostic]:
+    return iter(self.records)
+
+  def __len__(self) -> int:
+    return len(self.records)
@@ -0,0 +1,238 @@
+"""
+Atomic, buffered file output.
+
+Files are written to a temporary file next to their destination, in large
+batched ``write`` calls, and moved over the destination with ``os.replace``
+once complete. A reader (or a crash) never sees a half-written file: the
+destination holds either its previous content or the new one.
+"""
+
+import os
+from collections.abc import Iterable
+from os import PathLike
+from pathlib import Path
+from types import TracebackType
+from typing import Literal, Self
+
+from hypomnema.xml.progress import ProgressReporter
+from hypomnema.xml.utils import make_usable_path
+
+__all__ = ["AtomicWriter", "DEFAULT_BUFFER_SIZE", "FsyncPolicy", "fsync_directory"]
+
+type FsyncPolicy = Literal["none", "file", "full"]
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+"""Number of bytes buffered before they are written to disk (1 MiB)."""
+
+# Number of chunks handed to a single writev() call. POSIX guarantees at
+# least 16; every platform Python supports allows 1024.
+_MAX_CHUNKS = 1024
+
+
+def fsync_directory(path: Path) -> None:
+  """Make the creation, removal or renaming of ``path`` durable."""
+  try:
+    fd = os.open(path.parent, os.O_RDONLY)
+  except OSError:
+    # Directories cannot be opened on some platforms (Windows)
+    return
+  try:
+    os.fsync(fd)
+  finally:
+    os.close(fd)
+
+
+def _write_all(fd: int, data: bytes | memoryview) -> None:
+  view = memoryview(data)
+  while view:
+    view = view[os.write(fd, view) :]
+
+
+class AtomicWriter:
+  """
+  Write a file atomically, through a large byte-size based buffer.
+
+  Used as a context manager: the data goes to a temporary file in the
+  destination's directory, which replaces the destination when the block
+  exits normally. If it exits with an exception, the temporary file is
+  removed and the destination is left untouched.
+
+  Written chunks are kept as-is until ``buffer_size`` bytes are pending, then
+  handed to the OS in a single ``os.writev`` call where available, without
+  joining them first.
+
+  Parameters
+  ----------
+  path : str | bytes | PathLike
+      The destination file. Missing parent directories are created.
+  buffer_size : int, optional
+      Number of bytes to accumulate before writing them. Defaults to
+      ``DEFAULT_BUFFER_SIZE`` (1 MiB).
+  fsync : {"none", "file", "full"}, optional
+      How durable the result must be once the block exits:
+
+      - ``"none"`` (default): the replace is atomic, but the data may still
+        be in the OS cache. A process crash cannot leave a partial file; a
+        power loss may.
+      - ``"file"``: the temporary file is synced before it replaces the
+        destination, so the destination never points to unwritten data.
+      - ``"full"``: the directory is also synced after the replace, so the
+        new file survives a power loss.
+  progress : ProgressReporter | None, optional
+      Reporter the bytes are counted to as they are written to disk.
+      Defaults to None.
+
+  Raises
+  ------
+  ValueError
+      If ``buffer_size`` is lower than 1 or ``fsync`` is not a valid policy.
+
+  Examples
+  --------
+  >>> with AtomicWriter("out.tmx", fsync="file") as output:
+  >>>     output.write(b"<tmx>")
+  >>>     output.writelines(chunks)
+  >>>     output.write(b"</tmx>")
+
+  Notes
+  -----
+  If the destination exists, its permission bits are copied to the new file.
+  Otherwise the file is created with the default mode, as ``open`` would.
+  """
+
+  __slots__ = ("path", "buffer_size", "fsync", "progress", "_fd", "_temp", "_chunks", "_pending")
+  path: Path
+  buffer_size: int
+  fsync: FsyncPolicy
+  progress: ProgressReporter | None
+  _fd: int
+  _temp: Path | None
+  _chunks: list[bytes]
+  _pending: int
+
+  def __init__(
+    self,
+    path: str | bytes | PathLike,
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    fsync: FsyncPolicy = "none",
+    progress: ProgressReporter | None = None,
+  ) -> None:
+    if buffer_size < 1:
+      raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+    if fsync not in ("none", "file", "full"):
+      raise ValueError(f"Invalid fsync policy: {fsync!r}")
+    self.path = make_usable_path(path, mkdir=True)
+    self.buffer_size = buffer_size
+    self.fsync = fsync
+    self.progress = progress
+    self._fd = -1
+    self._temp = None
+    self._chunks = []
+    self._pending = 0
+
+  def __enter__(self) -> Self:
+    if self._temp is not None:
+      raise RuntimeError("AtomicWriter is already open")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+      temp = self.path.with_name(f".{self.path.name}.{os.urandom(4).hex()}.tmp")
+      try:
+        self._fd = os.open(temp, flags, 0o666)
+        break
+      except FileExistsError:
+        continue
+    self._temp = temp
+    try:
+      os.chmod(temp, os.stat(self.path).st_mode & 0o7777)
+    except FileNotFoundError:
+      pass
+    except BaseException:
+      self._abort()
+      raise
+    return self
+
+  def __exit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc: BaseException | None,
+    traceback: TracebackType | None,
+  ) -> None:
+    if exc_type is not None:
+      self._abort()
+      return
+    try:
+      self.flush()
+      if self.fsync != "none":
+        os.fsync(self._fd)
+      os.close(self._fd)
+      self._fd = -1
+      os.replace(self._temp, self.path)  # type: ignore[arg-type]
+    except BaseException:
+      self._abort()
+      raise
+    self._temp = None
+    if self.fsync == "full":
+      fsync_directory(self.path)
+
+  def _abort(self) -> None:
+    self._chunks.clear()
+    self._pending = 0
+    if self._fd != -1:
+      os.close(self._fd)
+      self._fd = -1
+    if self._temp is not None:
+      self._temp.unlink(missing_ok=True)
+      self._temp = None
+
+  def writable(self) -> bool:
+    return True
+
+  def write(self, data: bytes) -> int:
+    """
+    Buffer ``data``, writing the buffer out once it holds ``buffer_size`` bytes.
+
+    Returns
+    -------
+    int
+        The number of bytes accepted, always ``len(data)``.
+
+    Raises
+    ------
+    ValueError
+        If the writer is not open.
+    """
+    if self._temp is None:
+      raise ValueError("write to a closed AtomicWriter")
+    size = len(data)
+    if size:
+      # Chunks outlive the call: copy buffers the caller may reuse
+      self._chunks.append(data if type(data) is bytes else bytes(data))
+      self._pending += size
+      if self._pending >= self.buffer_size or len(self._chunks) >= _MAX_CHUNKS:
+        self.flush()
+    return size
+
+  def writelines(self, chunks: Iterable[bytes]) -> None:
+    """Buffer every chunk of ``chunks``, as repeated calls to ``write``."""
+    for chunk in chunks:
+      self.write(chunk)
+
+  def flush(self) -> None:
+    """Write out the buffered chunks."""
+    if self._temp is None:
+      raise ValueError("flush of a closed AtomicWriter")
+    chunks = self._chunks
+    if not chunks:
+      return
+    if len(chunks) == 1 or not hasattr(os, "writev"):
+      _write_all(self._fd, b"".join(chunks))
+    else:
+      written = os.writev(self._fd, chunks)
+      if written < self._pending:
+        # Short write: finish the rest from where the kernel stopped
+        _write_all(self._fd, memoryview(b"".join(chunks))[written:])
+    if self.progress is not None:
+      self.progress.add_bytes(self._pending)
+    chunks.clear()
+    self._pending = 0
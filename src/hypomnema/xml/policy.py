@@ -40,45 +40,73 @@ class DeserializationPolicy:
   """
   Configuration policy for TMX to Python object conversion.
 
+  Every field accepts the "collect" behavior: the violation is reported to
+  the ``Diagnostics`` sink of the deserializer, if any, and deserialization
+  carries on as with "ignore" (or "keep_first" for ``multiple_headers`` and
+  ``multiple_seg``). Whatever the behavior, violations are reported to the
+  sink, so a policy where every field is "collect" (see ``collecting``)
+  gathers every problem of a file in a single pass.
+
   Attributes
   ----------
-  missing_handler : PolicyValue[Literal["raise", "ignore", "default"]]
+  missing_handler : PolicyValue[Literal["raise", "collect", "ignore", "default"]]
       Action when no handler is registered for a TMX element.
       "default" attempts fallback to internal library handlers.
-  invalid_tag : PolicyValue[Literal["raise", "ignore"]]
+  invalid_tag : PolicyValue[Literal["raise", "collect", "ignore"]]
       Action when an unexpected XML tag is encountered.
-  required_attribute_missing : PolicyValue[Literal["raise", "ignore"]]
+  required_attribute_missing : PolicyValue[Literal["raise", "collect", "ignore"]]
       Action when a mandatory TMX attribute is absent.
-  invalid_attribute_value : PolicyValue[Literal["raise", "ignore"]]
+  invalid_attribute_value : PolicyValue[Literal["raise", "collect", "ignore"]]
       Action when an attribute value violates TMX specifications.
-  extra_text : PolicyValue[Literal["raise", "ignore"]]
+  extra_text : PolicyValue[Literal["raise", "collect", "ignore"]]
       Action when unexpected non-whitespace text is found within elements.
-  invalid_child_element : PolicyValue[Literal["raise", "ignore"]]
+  invalid_child_element : PolicyValue[Literal["raise", "collect", "ignore"]]
       Action when a child element is not permitted by TMX structure.
-  multiple_headers : PolicyValue[Literal["raise", "keep_first", "keep_last"]]
+  multiple_headers : PolicyValue[Literal["raise", "collect", "keep_first", "keep_last"]]
       Action when more than one `<header>` element exists in `<tmx>`.
-  missing_header : PolicyValue[Literal["raise", "ignore"]]
+  missing_header : PolicyValue[Literal["raise", "collect", "ignore"]]
       Action when the mandatory `<header>` element is missing.
-  missing_seg : PolicyValue[Literal["raise", "ignore"]]
+  missing_seg : PolicyValue[Literal["raise", "collect", "ignore"]]
       Action when a `<tu>` or `<tuv>` is missing the required `<seg>` element.
-  multiple_seg : PolicyValue[Literal["raise", "keep_first", "keep_last"]]
+  multiple_seg : PolicyValue[Literal["raise", "collect", "keep_first", "keep_last"]]
       Action when a `<tuv>` contains more than one `<seg>` element.
-  empty_content : PolicyValue[Literal["raise", "ignore", "empty"]]
+  empty_content : PolicyValue[Literal["raise", "collect", "ignore", "empty"]]
       Action when an element has no text content. "empty" converts
       None to an empty string.
   """
 
-  missing_handler: PolicyValue[Literal["raise", "ignore", "default"]] = _default("raise")
-  invalid_tag: PolicyValue[Literal["raise", "ignore"]] = _default("raise")
-  required_attribute_missing: PolicyValue[Literal["raise", "ignore"]] = _default("raise")
-  invalid_attribute_value: PolicyValue[Literal["raise", "ignore"]] = _default("raise")
-  extra_text: PolicyValue[Literal["raise", "ignore"]] = _default("raise")
-  invalid_child_element: PolicyValue[Literal["raise", "ignore"]] = _default("raise")
-  multiple_headers: PolicyValue[Literal["raise", "keep_first", "keep_last"]] = _default("raise")
-  missing_header: PolicyValue[Literal["raise", "ignore"]] = _default("raise")
-  missing_seg: PolicyValue[Literal["raise", "ignore", "empty"]] = _default("raise")
-  multiple_seg: PolicyValue[Literal["raise", "keep_first", "keep_last"]] = _default("raise")
-  empty_content: PolicyValue[Literal["raise", "ignore", "empty"]] = _default("raise")
+  missing_handler: PolicyValue[Literal["raise", "collect", "ignore", "default"]] = _default("raise")
+  invalid_tag: PolicyValue[Literal["raise", "collect", "ignore"]] = _default("raise")
+  required_attribute_missing: PolicyValue[Literal["raise", "collect", "ignore"]] = _default("raise")
+  invalid_attribute_value: PolicyValue[Literal["raise", "collect", "ignore"]] = _default("raise")
+  extra_text: PolicyValue[Literal["raise", "collect", "ignore"]] = _default("raise")
+  invalid_child_element: PolicyValue[Literal["raise", "collect", "ignore"]] = _default("raise")
+  multiple_headers: PolicyValue[Literal["raise", "collect", "keep_first", "keep_last"]] = _default(
+    "raise"
+  )
+  missing_header: PolicyValue[Literal["raise", "collect", "ignore"]] = _default("raise")
+  missing_seg: PolicyValue[Literal["raise", "collect", "ignore", "empty"]] = _default("raise")
+  multiple_seg: PolicyValue[Literal["raise", "collect", "keep_first", "keep_last"]] = _default(
+    "raise"
+  )
+  empty_content: PolicyValue[Literal["raise", "collect", "ignore", "empty"]] = _default("raise")
+
+  @classmethod
+  def collecting(cls, log_level: int = logging.DEBUG) -> DeserializationPolicy:
+    """
+    Build a policy that collects every violation instead of raising.
+
+    Parameters
+    ----------
+    log_level : int, optional
+        The logging level of every violation. Defaults to DEBUG.
+
+    Returns
+    -------
+    DeserializationPolicy
+        A policy whose fields all have the "collect" behavior.
+    """
+    return cls(**{name: PolicyValue("collect", log_level) for name in cls.__dataclass_fields__})
 
 
 @dataclass(slots=True, kw_only=True)
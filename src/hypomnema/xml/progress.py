@@ -0,0 +1,321 @@
+"""
+Progress and throughput reports of long-running reads and writes.
+
+A ``ProgressReporter`` passed to ``load``, ``save``, ``save_stream`` or a
+backend's ``parse``, ``iterparse``, ``write`` and ``iterwrite`` counts the
+bytes read from or written to the file and the elements processed. At most
+once per ``interval``, and once more at the end, it hands a ``Progress``
+snapshot to a callback and feeds a ``MetricsSink`` counters and rate
+samples, e.g. to chart ingestion throughput on a dashboard.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from os import fstat
+from pathlib import Path
+from time import monotonic
+from typing import Any, BinaryIO
+
+__all__ = ["MetricsSink", "Progress", "ProgressReporter"]
+
+
+@dataclass(slots=True, frozen=True)
+class Progress:
+  """
+  A snapshot of a running operation.
+
+  Attributes
+  ----------
+  operation : str
+      The name of the operation, e.g. ``"load"`` or ``"iterwrite"``.
+  bytes : int
+      Number of bytes read from the file (its position), or written to it.
+  total_bytes : int | None
+      Size of the file being read, None when writing.
+  elements : int
+      Number of elements processed: parsed and yielded, or written.
+  elapsed : float
+      Seconds since the operation started.
+  done : bool
+      Whether the operation is over. The last snapshot of an operation is
+      always reported, whatever the interval.
+  """
+
+  operation: str
+  bytes: int
+  total_bytes: int | None
+  elements: int
+  elapsed: float
+  done: bool
+
+  @property
+  def bytes_per_second(self) -> float:
+    """Average number of bytes processed per second, 0.0 at the start."""
+    return self.bytes / self.elapsed if self.elapsed else 0.0
+
+  @property
+  def elements_per_second(self) -> float:
+    """Average number of elements processed per second, 0.0 at the start."""
+    return self.elements / self.elapsed if self.elapsed else 0.0
+
+  @property
+  def fraction(self) -> float | None:
+    """Part of the file read so far, between 0 and 1, None if the size is unknown."""
+    if not self.total_bytes:
+      return None
+    return min(self.bytes / self.total_bytes, 1.0)
+
+
+class MetricsSink:
+  """
+  Sink of the counters and rate samples of a ``ProgressReporter``.
+
+  This implementation keeps them in memory. Subclasses can override
+  ``increment`` and ``observe`` to forward them to a metrics library
+  instead, as a counter and a histogram (or summary) respectively.
+
+  Metric names are ``<prefix>.<operation>.<metric>``, where metric is:
+
+  - ``bytes`` and ``elements``, counters incremented at every report;
+  - ``bytes_per_second`` and ``elements_per_second``, the rates over the
+    interval since the previous report;
+  - ``seconds``, the duration of the operation, observed once at the end.
+
+  Attributes
+  ----------
+  counters : Counter[str]
+      The value of every counter.
+  samples : dict[str, list[float]]
+      The values observed for every histogram, in order.
+
+  Examples
+  --------
+  >>> class StatsdSink(MetricsSink):
+  >>>     def increment(self, name, value):
+  >>>         statsd.incr(name, value)
+  >>>     def observe(self, name, value):
+  >>>         statsd.timing(name, value)
+  """
+
+  __slots__ = ("counters", "samples")
+
+  def __init__(self) -> None:
+    self.counters: Counter[str] = Counter()
+    self.samples: dict[str, list[float]] = {}
+
+  def increment(self, name: str, value: int) -> None:
+    """Add ``value`` to the counter ``name``."""
+    self.counters[name] += value
+
+  def observe(self, name: str, value: float) -> None:
+    """Record a sample of the histogram ``name``."""
+    self.samples.setdefault(name, []).append(value)
+
+
+class _Reader:
+  """Binary file wrapper reporting every read to a ``ProgressReporter``."""
+
+  __slots__ = ("file", "progress")
+
+  def __init__(self, file: BinaryIO, progress: ProgressReporter) -> None:
+    self.file = file
+    self.progress = progress
+
+  def read(self, size: int = -1) -> bytes:
+    data = self.file.read(size)
+    self.progress.add_bytes(len(data))
+    return data
+
+
+class ProgressReporter:
+  """
+  Counts the bytes and elements of an operation and reports them periodically.
+
+  The operations that accept a reporter call ``start`` (or ``track``), then
+  ``add_bytes`` and ``add_elements`` as they go, and ``finish``. When an
+  operation runs another one (``load`` runs ``iterparse``), the inner
+  operation counts towards the outer one, which is the one reported. A
+  reporter can be reused for several operations in a row, but not for
+  concurrent ones.
+
+  Parameters
+  ----------
+  callback : Callable[[Progress], Any] | None, optional
+      Called with a snapshot at most once per ``interval`` seconds, and
+      with the final snapshot at the end of each operation. Defaults to
+      None.
+  interval : float, optional
+      Minimum number of seconds between two reports. Defaults to 1.0.
+  metrics : MetricsSink | None, optional
+      Sink fed at every report, see ``MetricsSink``. Defaults to None.
+  prefix : str, optional
+      First part of the metric names. Defaults to "hypomnema".
+
+  Attributes
+  ----------
+  callback : Callable[[Progress], Any] | None
+      The callback.
+  interval : float
+      The minimum number of seconds between two reports.
+  metrics : MetricsSink | None
+      The metrics sink.
+  prefix : str
+      The first part of the metric names.
+  last : Progress | None
+      The last snapshot reported, None before the first report.
+
+  Raises
+  ------
+  ValueError
+      If ``interval`` is negative.
+
+  Examples
+  --------
+  >>> def show(progress):
+  >>>     print(f"{progress.fraction:.0%} {progress.elements_per_second:,.0f} TU/s")
+  >>> for tu in load("large.tmx", filter="tu", progress=ProgressReporter(show, interval=5)):
+  >>>     ...
+  """
+
+  __slots__ = (
+    "callback",
+    "interval",
+    "metrics",
+    "prefix",
+    "last",
+    "_operation",
+    "_total",
+    "_bytes",
+    "_elements",
+    "_started",
+    "_next",
+    "_reported",
+    "_depth",
+  )
+
+  def __init__(
+    self,
+    callback: Callable[[Progress], Any] | None = None,
+    *,
+    interval: float = 1.0,
+    metrics: MetricsSink | None = None,
+    prefix: str = "hypomnema",
+  ) -> None:
+    if interval < 0:
+      raise ValueError(f"interval must be at least 0, got {interval}")
+    self.callback: Callable[[Progress], Any] | None = callback
+    self.interval: float = interval
+    self.metrics: MetricsSink | None = metrics
+    self.prefix: str = prefix
+    self.last: Progress | None = None
+    self._operation = ""
+    self._total: int | None = None
+    self._bytes = self._elements = 0
+    self._started = self._next = 0.0
+    # Time, bytes and elements of the previous report, for the rate samples
+    self._reported: tuple[float, int, int] = (0.0, 0, 0)
+    self._depth = 0
+
+  def start(self, operation: str, total_bytes: int | None = None) -> None:
+    """
+    Start counting an operation.
+
+    Parameters
+    ----------
+    operation : str
+        The name of the operation.
+    total_bytes : int | None, optional
+        The size of the file being read, if known. Defaults to None.
+    """
+    self._depth += 1
+    if self._depth > 1:
+      if self._total is None:
+        self._total = total_bytes
+      return
+    self._operation = operation
+    self._total = total_bytes
+    self._bytes = self._elements = 0
+    self._started = now = monotonic()
+    self._next = now + self.interval
+    self._reported = (now, 0, 0)
+
+  def add_bytes(self, count: int) -> None:
+    """Count ``count`` more bytes read or written, and report if it is time to."""
+    self._bytes += count
+    if (now := monotonic()) >= self._next:
+      self._report(now, False)
+
+  def add_elements(self, count: int = 1) -> None:
+    """Count ``count`` more elements processed, and report if it is time to."""
+    self._elements += count
+    if (now := monotonic()) >= self._next:
+      self._report(now, False)
+
+  def finish(self) -> None:
+    """End the current operation and report its final snapshot."""
+    self._depth -= 1
+    if self._depth == 0:
+      self._report(monotonic(), True)
+
+  @contextmanager
+  def track(self, operation: str, total_bytes: int | None = None) -> Generator[None]:
+    """
+    Count an operation for the duration of a ``with`` block.
+
+    Parameters
+    ----------
+    operation : str
+        The name of the operation.
+    total_bytes : int | None, optional
+        The size of the file being read, if known. Defaults to None.
+    """
+    self.start(operation, total_bytes)
+    try:
+      yield
+    finally:
+      self.finish()
+
+  @contextmanager
+  def reading(self, operation: str, path: Path) -> Generator[Any]:
+    """
+    Open a file and count an operation reading it.
+
+    Parameters
+    ----------
+    operation : str
+        The name of the operation.
+    path : Path
+        The file to read.
+
+    Yields
+    ------
+    Any
+        A binary file-like object, with only a ``read`` method, that counts
+        the bytes read.
+    """
+    with open(path, "rb") as file, self.track(operation, fstat(file.fileno()).st_size):
+      yield _Reader(file, self)
+
+  def _report(self, now: float, done: bool) -> None:
+    self._next = now + self.interval
+    progress = Progress(
+      self._operation, self._bytes, self._total, self._elements, now - self._started, done
+    )
+    if (metrics := self.metrics) is not None:
+      name = f"{self.prefix}.{self._operation}"
+      since, reported_bytes, reported_elements = self._reported
+      if new_bytes := self._bytes - reported_bytes:
+        metrics.increment(f"{name}.bytes", new_bytes)
+      if new_elements := self._elements - reported_elements:
+        metrics.increment(f"{name}.elements", new_elements)
+      if (span := now - since) > 0:
+        metrics.observe(f"{name}.bytes_per_second", new_bytes / span)
+        metrics.observe(f"{name}.elements_per_second", new_elements / span)
+      if done:
+        metrics.observe(f"{name}.seconds", progress.elapsed)
+    self._reported = (now, self._bytes, self._elements)
+    self.last = progress
+    if self.callback is not None:
+      self.callback(progress)
@@ -16,7 +16,7 @@ from hypomnema.base.types import (
   Tu,
   Tuv,
 )
-from hypomnema.xml.serialization.base import BaseElementSerializer
+from hypomnema.xml.serialization.base import BaseElementSerializer, InlineElementSerializer
 
 __all__ = [
   "PropSerializer",
@@ -237,12 +237,14 @@ class TmxSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendEle
     return element
 
 
-class BptSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElement, Bpt]):
+class BptSerializer[TypeOfBackendElement](InlineElementSerializer[TypeOfBackendElement, Bpt]):
   """Serializer for the TMX `<bpt>` (Begin Paired Tag) element."""
 
-  def _serialize(self, obj: Bpt) -> TypeOfBackendElement | None:
+  content_types = (Sub,)
+
+  def _serialize_shell(self, obj: Bpt) -> TypeOfBackendElement | None:
     """
-    Convert a Bpt object into a `<bpt>` XML element.
+    Create the `<bpt>` element of a Bpt object, without its content.
 
     Parameters
     ----------
@@ -260,16 +262,17 @@ class BptSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendEle
     self._set_int_attribute(element, obj.i, "i", required=True)
     self._set_int_attribute(element, obj.x, "x", required=False)
     self._set_str_attribute(element, obj.type, "type", required=False)
-    self._serialize_content_into(obj, element, (Sub,))
     return element
 
 
-class EptSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElement, Ept]):
+class EptSerializer[TypeOfBackendElement](InlineElementSerializer[TypeOfBackendElement, Ept]):
   """Serializer for the TMX `<ept>` (End Paired Tag) element."""
 
-  def _serialize(self, obj: Ept) -> TypeOfBackendElement | None:
+  content_types = (Sub,)
+
+  def _serialize_shell(self, obj: Ept) -> TypeOfBackendElement | None:
     """
-    Convert an Ept object into an `<ept>` XML element.
+    Create the `<ept>` element of an Ept object, without its content.
 
     Parameters
     ----------
@@ -285,16 +288,17 @@ class EptSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendEle
       return None
     element = self.backend.create_element("ept")
     self._set_int_attribute(element, obj.i, "i", required=True)
-    self._serialize_content_into(obj, element, (Sub,))
     return element
 
 
-class HiSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElement, Hi]):
+class HiSerializer[TypeOfBackendElement](InlineElementSerializer[TypeOfBackendElement, Hi]):
   """Serializer for the TMX `<hi>` (Highlight) element."""
 
-  def _serialize(self, obj: Hi) -> TypeOfBackendElement | None:
+  content_types = (Bpt, Ept, Ph, It, Hi)
+
+  def _serialize_shell(self, obj: Hi) -> TypeOfBackendElement | None:
     """
-    Convert a Hi object into a `<hi>` XML element.
+    Create the `<hi>` element of a Hi object, without its content.
 
     Parameters
     ----------
@@ -311,16 +315,17 @@ class HiSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElem
     element = self.backend.create_element("hi")
     self._set_int_attribute(element, obj.x, "x", required=False)
     self._set_str_attribute(element, obj.type, "type", required=False)
-    self._serialize_content_into(obj, element, (Bpt, Ept, Ph, It, Hi))
     return element
 
 
-class ItSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElement, It]):
+class ItSerializer[TypeOfBackendElement](InlineElementSerializer[TypeOfBackendElement, It]):
   """Serializer for the TMX `<it>` (Isolated Tag) element."""
 
-  def _serialize(self, obj: It) -> TypeOfBackendElement | None:
+  content_types = (Sub,)
+
+  def _serialize_shell(self, obj: It) -> TypeOfBackendElement | None:
     """
-    Convert an It object into an `<it>` XML element.
+    Create the `<it>` element of an It object, without its content.
 
     Parameters
     ----------
@@ -338,16 +343,17 @@ class ItSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElem
     self._set_enum_attribute(element, obj.pos, "pos", Pos, required=True)
     self._set_int_attribute(element, obj.x, "x", required=False)
     self._set_str_attribute(element, obj.type, "type", required=False)
-    self._serialize_content_into(obj, element, (Sub,))
     return element
 
 
-class PhSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElement, Ph]):
+class PhSerializer[TypeOfBackendElement](InlineElementSerializer[TypeOfBackendElement, Ph]):
   """Serializer for the TMX `<ph>` (Placeholder) element."""
 
-  def _serialize(self, obj: Ph) -> TypeOfBackendElement | None:
+  content_types = (Sub,)
+
+  def _serialize_shell(self, obj: Ph) -> TypeOfBackendElement | None:
     """
-    Convert a Ph object into a `<ph>` XML element.
+    Create the `<ph>` element of a Ph object, without its content.
 
     Parameters
     ----------
@@ -365,16 +371,17 @@ class PhSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElem
     self._set_int_attribute(element, obj.x, "x", required=False)
     self._set_enum_attribute(element, obj.assoc, "assoc", Assoc, required=False)
     self._set_str_attribute(element, obj.type, "type", required=False)
-    self._serialize_content_into(obj, element, (Sub,))
     return element
 
 
-class SubSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendElement, Sub]):
+class SubSerializer[TypeOfBackendElement](InlineElementSerializer[TypeOfBackendElement, Sub]):
   """Serializer for the TMX `<sub>` (Sub-flow) element."""
 
-  def _serialize(self, obj: Sub) -> TypeOfBackendElement | None:
+  content_types = (Bpt, Ept, Ph, It, Hi)
+
+  def _serialize_shell(self, obj: Sub) -> TypeOfBackendElement | None:
     """
-    Convert a Sub object into a `<sub>` XML element.
+    Create the `<sub>` element of a Sub object, without its content.
 
     Parameters
     ----------
@@ -391,5 +398,4 @@ class SubSerializer[TypeOfBackendElement](BaseElementSerializer[TypeOfBackendEle
     element = self.backend.create_element("sub")
     self._set_str_attribute(element, obj.datatype, "datatype", required=False)
     self._set_str_attribute(element, obj.type, "type", required=False)
-    self._serialize_content_into(obj, element, (Bpt, Ept, Ph, It, Hi))
     return element
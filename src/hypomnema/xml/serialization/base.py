@@ -1,15 +1,20 @@
 from enum import StrEnum
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from logging import Logger
+from typing import Any
 
 from hypomnema.base.errors import AttributeSerializationError, XmlSerializationError
 from hypomnema.base.types import InlineElement, Tuv, BaseElement, Sub
 from hypomnema.xml.backends.base import XmlBackend
 from hypomnema.xml.policy import SerializationPolicy
+from hypomnema.xml.utils import format_datetime
 
-__all__ = ["BaseElementSerializer"]
+__all__ = ["BaseElementSerializer", "InlineElementSerializer"]
+
+# End of a content list, distinct from a None item, which is invalid content
+_DONE = object()
 
 
 class BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement](ABC):
@@ -42,6 +47,7 @@ class BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement]
     self.policy: SerializationPolicy = policy
     self.logger: Logger = logger
     self._emit: Callable[[BaseElement], TypeOfBackendElement | None] | None = None
+    self._handlers: Mapping[type, BaseElementSerializer] | None = None
 
   def _set_emit(self, emit: Callable[[BaseElement], TypeOfBackendElement | None]) -> None:
     """
@@ -55,6 +61,21 @@ class BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement]
     """
     self._emit = emit
 
+  def _set_handlers(self, handlers: Mapping[type, "BaseElementSerializer"]) -> None:
+    """
+    Set the type-to-handler mapping used to serialize inline content.
+
+    When set, nested inline objects handled by an ``InlineElementSerializer``
+    are serialized in place by ``_serialize_content_into`` instead of going
+    through ``emit``.
+
+    Parameters
+    ----------
+    handlers : Mapping[type, BaseElementSerializer]
+        The handlers of the dispatching serializer.
+    """
+    self._handlers = handlers
+
   def emit(self, obj: BaseElement) -> TypeOfBackendElement | None:
     """
     Invoke the dispatcher to serialize a BaseElement object.
@@ -133,6 +154,9 @@ class BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement]
     """
     Serialize and set a datetime attribute in ISO 8601 format.
 
+    Formatted values are memoized in a bounded cache shared by every handler,
+    see ``hypomnema.xml.utils.format_datetime``.
+
     Parameters
     ----------
     target : BackendElementType
@@ -156,7 +180,7 @@ class BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement]
       if self.policy.invalid_attribute_type.behavior == "raise":
         raise AttributeSerializationError(f"Attribute {attribute!r} is not a datetime object")
       return
-    self.backend.set_attribute(target, attribute, value.isoformat(), unsafe=True)
+    self.backend.set_attribute(target, attribute, format_datetime(value), unsafe=True)
 
   def _set_int_attribute(
     self, target: TypeOfBackendElement, value: int | None, attribute: str, required: bool
@@ -266,6 +290,11 @@ class BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement]
     """
     Iteratively serialize mixed text and XML elements into a target element.
 
+    Nested objects whose handler is an ``InlineElementSerializer`` are
+    serialized with an explicit stack rather than through recursive ``emit``
+    calls, so any nesting depth is supported. Other objects are dispatched
+    with ``emit``.
+
     Parameters
     ----------
     source : InlineElement | Tuv
@@ -278,40 +307,66 @@ class BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement]
     Raises
     ------
     XmlSerializationError
-        If a child object type is not a string or in the allowed tuple,        and policy behavior is "raise".
+        If a child object type is not a string or in the allowed tuple,
+        and policy behavior is "raise".
     """
-    last_child: TypeOfBackendElement | None = None
-    for item in source.content:
+    backend = self.backend
+    handlers = self._handlers
+    # Each frame is [handler, source, target, allowed types, items, last child]
+    stack: list[list[Any]] = [[self, source, target, allowed, iter(source.content), None]]
+    while stack:
+      frame = stack[-1]
+      if (item := next(frame[4], _DONE)) is _DONE:
+        stack.pop()
+        continue
+      handler, parent, element, allowed_types, _, last_child = frame
+
       if isinstance(item, str):
         if last_child is None:
-          text = self.backend.get_text(target) or ""
-          self.backend.set_text(target, text + item)
+          text = backend.get_text(element) or ""
+          backend.set_text(element, text + item)
         else:
-          tail = self.backend.get_tail(last_child) or ""
-          self.backend.set_tail(last_child, tail + item)
-
-      elif isinstance(item, allowed):
-        child_elem = self.emit(item)
+          tail = backend.get_tail(last_child) or ""
+          backend.set_tail(last_child, tail + item)
+
+      elif isinstance(item, allowed_types):
+        child_handler = handlers.get(type(item)) if handlers is not None else None
+        if isinstance(child_handler, InlineElementSerializer) and child_handler._is_stackable():
+          child_elem = child_handler._serialize_shell(item)
+          if child_elem is not None:
+            backend.append_child(element, child_elem)
+            frame[5] = child_elem
+            stack.append(
+              [
+                child_handler,
+                item,
+                child_elem,
+                child_handler.content_types,
+                iter(item.content),  # type: ignore[union-attr]
+                None,
+              ]
+            )
+          continue
+        child_elem = handler.emit(item)
         if child_elem is not None:
-          self.backend.append_child(target, child_elem)
-          last_child = child_elem
+          backend.append_child(element, child_elem)
+          frame[5] = child_elem
 
       else:
-        allowed_names = ", ".join(x.__name__ for x in allowed)
-        self.logger.log(
-          self.policy.invalid_content_type.log_level,
+        allowed_names = ", ".join(x.__name__ for x in allowed_types)
+        handler.logger.log(
+          handler.policy.invalid_content_type.log_level,
           "Incorrect child element in %s: expected one of %s, got %r",
-          source.__class__.__name__,
+          parent.__class__.__name__,
           allowed_names,
           item.__class__.__name__,
         )
-        if self.policy.invalid_content_type.behavior == "raise":
+        if handler.policy.invalid_content_type.behavior == "raise":
           raise XmlSerializationError(
-            f"Incorrect child element in {source.__class__.__name__}:"
+            f"Incorrect child element in {parent.__class__.__name__}:"
             f" expected one of {allowed_names},"
             f" got {item.__class__.__name__!r}"
           )
-        continue
 
   def _serialize_children[TypeofChildItem: BaseElement](
     self,
@@ -353,3 +408,63 @@ class BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement]
           raise XmlSerializationError(
             f"Invalid child element {child.__class__.__name__!r} when serializing <{self.backend.get_tag(target)}>"
           )
+
+
+class InlineElementSerializer[TypeOfBackendElement, TypeOfTmxElement: BaseElement](
+  BaseElementSerializer[TypeOfBackendElement, TypeOfTmxElement]
+):
+  """
+  Base class for serializers of objects with mixed content (Bpt, Hi...).
+
+  Serialization is split in two steps: ``_serialize_shell`` builds the
+  element and sets its attributes, and the object's content is then
+  serialized into it. This lets ``_serialize_content_into`` serialize
+  arbitrarily nested inline objects iteratively.
+
+  Attributes
+  ----------
+  content_types : tuple[type[BaseElement], ...]
+      The permitted types for inline child elements.
+  """
+
+  content_types: tuple[type[BaseElement], ...] = ()
+
+  @abstractmethod
+  def _serialize_shell(self, obj: TypeOfTmxElement) -> TypeOfBackendElement | None:
+    """
+    Create the element for an object, with its attributes but no content.
+
+    Parameters
+    ----------
+    obj : TmxElementType
+        The TMX object instance to convert.
+
+    Returns
+    -------
+    BackendElementType | None
+        The element, or None if the object cannot be serialized.
+    """
+    ...
+
+  def _is_stackable(self) -> bool:
+    """Whether the object can be serialized in two steps (``_serialize`` is not overridden)."""
+    return getattr(self._serialize, "__func__", None) is InlineElementSerializer._serialize
+
+  def _serialize(self, obj: TypeOfTmxElement) -> TypeOfBackendElement | None:
+    """
+    Convert an object with mixed content into its XML element.
+
+    Parameters
+    ----------
+    obj : TmxElementType
+        The TMX object instance to convert.
+
+    Returns
+    -------
+    BackendElementType | None
+        The resulting XML element.
+    """
+    element = self._serialize_shell(obj)
+    if element is not None:
+      self._serialize_content_into(obj, element, self.content_types)  # type: ignore[arg-type]
+    return element
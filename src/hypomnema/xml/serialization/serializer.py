@@ -45,6 +45,8 @@ class Serializer[TypeOfBackendElement]:
     for handler in self.handlers.values():
       if handler._emit is None:
         handler._set_emit(self.serialize)
+      if handler._handlers is None:
+        handler._set_handlers(self.handlers)
 
   def _get_default_handlers(self) -> dict[type, BaseElementSerializer]:
     return {
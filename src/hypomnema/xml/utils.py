@@ -1,9 +1,12 @@
-from unicodedata import category
+import re
 from pathlib import Path
 from hypomnema.base.errors import XmlSerializationError, InvalidTagError
 from hypomnema.xml.policy import SerializationPolicy, DeserializationPolicy
+from hypomnema.xml.diagnostics import Diagnostics
 from codecs import lookup
 from collections.abc import Mapping, Iterable
+from datetime import datetime, timedelta
+from functools import lru_cache
 from logging import Logger
 from typing import TypeIs, Any
 from encodings import normalize_encoding as python_normalize_encoding
@@ -45,6 +48,69 @@ def normalize_encoding(encoding: str | None) -> str:
     raise ValueError(f"Unknown encoding: {normalized_encoding}") from e
 
 
+DATETIME_CACHE_SIZE = 8192
+"""Maximum number of distinct values kept by the datetime parsing and formatting caches."""
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def parse_datetime(value: str) -> datetime:
+  """Parse an ISO 8601 string into a datetime, memoizing the result.
+
+  Translation memories usually carry far fewer distinct timestamps than
+  date attributes, so parsed values are kept in a bounded LRU cache shared
+  by every deserializer. Equal strings therefore also share the same
+  (immutable) datetime object.
+
+  Parameters
+  ----------
+  value : str
+      The ISO 8601 string to parse.
+
+  Returns
+  -------
+  datetime
+      The parsed datetime.
+
+  Raises
+  ------
+  ValueError
+      If ``value`` is not a valid ISO 8601 string. Failures are not cached.
+
+  """
+  return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _format_datetime(value: datetime, offset: timedelta | None) -> str:
+  return value.isoformat()
+
+
+def format_datetime(value: datetime) -> str:
+  """Format a datetime as an ISO 8601 string, memoizing the result.
+
+  Counterpart of ``parse_datetime`` for serialization, backed by a bounded
+  LRU cache shared by every serializer.
+
+  Parameters
+  ----------
+  value : datetime
+      The datetime to format.
+
+  Returns
+  -------
+  str
+      The result of ``value.isoformat()``.
+
+  Notes
+  -----
+  Aware datetimes representing the same instant compare (and hash) equal
+  even when their UTC offsets differ, so the offset is part of the cache
+  key to keep each value's own representation.
+
+  """
+  return _format_datetime(value, value.utcoffset())
+
+
 def prep_tag_set(
   tags: str | QName | Iterable[str | QName] | None, nsmap: Mapping[str | None, str]
 ) -> set[str] | None:
@@ -137,7 +203,13 @@ def assert_object_type[ExpectedType](
   return True
 
 
-def check_tag(tag: str, expected_tag: str, logger: Logger, policy: DeserializationPolicy) -> None:
+def check_tag(
+  tag: str,
+  expected_tag: str,
+  logger: Logger,
+  policy: DeserializationPolicy,
+  diagnostics: Diagnostics | None = None,
+) -> None:
   """Check if a tag matches the expected tag.
 
   This function compares a tag against an expected value, logs a
@@ -154,6 +226,8 @@ def check_tag(tag: str, expected_tag: str, logger: Logger, policy: Deserializati
       Logger instance for diagnostic messages.
   policy : DeserializationPolicy
       Policy object controlling behavior when tags mismatch.
+  diagnostics : Diagnostics | None, optional
+      Sink the mismatch is reported to, if any.
 
   Raises
   ------
@@ -165,6 +239,13 @@ def check_tag(tag: str, expected_tag: str, logger: Logger, policy: Deserializati
     logger.log(
       policy.invalid_tag.log_level, "Incorrect tag: expected %s, got %s", expected_tag, tag
     )
+    if diagnostics is not None:
+      diagnostics.report(
+        "invalid_tag",
+        policy.invalid_tag.behavior,
+        f"Incorrect tag: expected {expected_tag}, got {tag}",
+        tag=tag,
+      )
     if policy.invalid_tag.behavior == "raise":
       raise InvalidTagError(f"Incorrect tag: expected {expected_tag}, got {tag}")
 
@@ -201,26 +282,20 @@ def make_usable_path(path: str | bytes | PathLike, *, mkdir: bool = True) -> Pat
   return final_path
 
 
-_NAME_START_CATEGORIES = {"Lu", "Ll", "Lt", "Lm", "Lo", "Nl"}
-_NAME_CHAR_CATEGORIES = _NAME_START_CATEGORIES | {"Nd", "Mc", "Mn", "Pc"}
-
-
-def _is_letter(char: str) -> bool:
-  """True if char is an XML 1.0 Letter (Name-start)."""
-  cat = category(char)
-  if cat in _NAME_START_CATEGORIES:
-    return True
-  return char == "_"  # ASCII underscore is explicitly allowed
-
+NCNAME_CACHE_SIZE = 4096
+"""Maximum number of distinct names kept by the ``is_ncname`` cache."""
 
-def _is_ncname_char(char: str) -> bool:
-  """True if char is allowed anywhere in an NCName after the first char."""
-  cat = category(char)
-  if cat in _NAME_CHAR_CATEGORIES:
-    return True
-  return char in (".", "-", "_")
+# NameStartChar and NameChar from XML 1.0 (Fifth Edition), without the colon.
+_NAME_START_CHAR = (
+  "A-Z_a-z\u00c0-\u00d6\u00d8-\u00f6\u00f8-\u02ff\u0370-\u037d\u037f-\u1fff\u200c-\u200d"
+  "\u2070-\u218f\u2c00-\u2fef\u3001-\ud7ff\uf900-\ufdcf\ufdf0-\ufffd\U00010000-\U000effff"
+)
+_NAME_CHAR = _NAME_START_CHAR + "\\-.0-9\u00b7\u0300-\u036f\u203f-\u2040"
+_NCNAME = re.compile(f"[{_NAME_START_CHAR}][{_NAME_CHAR}]*")
+_ASCII_NCNAME = re.compile("[A-Z_a-z][-.0-9A-Z_a-z]*")
 
 
+@lru_cache(maxsize=NCNAME_CACHE_SIZE)
 def is_ncname(name: str) -> bool:
   """Return True if *name* is a valid XML 1.0 NCName.
 
@@ -243,21 +318,14 @@ def is_ncname(name: str) -> bool:
   This implements the NCName production from XML Namespaces 1.0:
   NCName ::= NameStartChar (NameChar)*
 
-  The ASCII underscore (``_``) is explicitly allowed as a NameStartChar
-  even though it's not a Letter category in Unicode.
-
-  See Also
-  --------
-  _is_letter : Check if a character is a valid XML NameStartChar.
-  _is_ncname_char : Check if a character is a valid XML NameChar.
-
+  with the character ranges of XML 1.0 (Fifth Edition), minus the colon.
+  Both productions are precompiled regular expressions, and ASCII names
+  are matched against a smaller expression. Results are memoized, as the
+  same few prefixes and local names are validated over and over.
   """
-  """Return True if *name* is a valid XML 1.0 NCName."""
-  if not name:
-    return False
-  if not _is_letter(name[0]):
-    return False
-  return all(_is_ncname_char(ch) for ch in name[1:])
+  if name.isascii():
+    return _ASCII_NCNAME.fullmatch(name) is not None
+  return _NCNAME.fullmatch(name) is not None
 
 
 def _split_qualified_tag(
@@ -0,0 +1,483 @@
+"""
+Validation of TMX files without deserialization.
+
+``TmxValidator`` runs the checks of the deserialization handlers directly on
+``xml.parsers.expat`` events and reports every violation with its position
+in the file. No element tree and no TMX object is ever built.
+"""
+
+from collections.abc import Generator
+from dataclasses import dataclass
+from enum import StrEnum
+from os import PathLike
+from typing import Any
+from xml.parsers import expat
+
+from hypomnema.xml.deserialization.expat import _ATTRIBUTES, _CONTENT_CHILDREN, _STRUCTURE_CHILDREN
+from hypomnema.xml.policy import DeserializationPolicy
+from hypomnema.xml.utils import make_usable_path, parse_datetime
+
+__all__ = ["Violation", "TmxValidator", "validate"]
+
+
+@dataclass(slots=True, frozen=True)
+class Violation:
+  """
+  A problem found in a TMX file.
+
+  Attributes
+  ----------
+  check : str
+      What was checked: the name of the ``DeserializationPolicy`` field that
+      governs the problem (e.g. ``"missing_seg"``), ``"unpaired_code"`` for
+      `<bpt>`/`<ept>` pairing, or ``"not_well_formed"`` if the file is not
+      well-formed XML.
+  message : str
+      Human readable description, the same as the one the handlers use.
+  line : int
+      1-based line of the start tag of the offending element.
+  column : int
+      0-based column of the start tag of the offending element.
+  """
+
+  check: str
+  message: str
+  line: int
+  column: int
+
+
+# Values accepted for each enum attribute
+_ENUM_VALUES: dict[type[StrEnum], frozenset[str]] = {
+  kind: frozenset(kind)
+  for specs in _ATTRIBUTES.values()
+  for _, _, kind, _ in specs
+  if isinstance(kind, type)
+}
+
+# Attributes that can be invalid, i.e. required or not plain strings, in the order the
+# handlers parse them: (attribute name, kind, required)
+_CHECKED_ATTRIBUTES: dict[str, tuple[tuple[str, Any, bool], ...]] = {
+  tag: tuple(
+    (attribute, kind, required)
+    for attribute, _, kind, required in specs
+    if required or kind != "str"
+  )
+  for tag, specs in _ATTRIBUTES.items()
+}
+
+
+class _Scope:
+  """An element being validated."""
+
+  __slots__ = (
+    "tag",
+    "line",
+    "column",
+    "mixed",
+    "chunks",
+    "has_content",
+    "drop_tail",
+    "has_children",
+    "found",
+  )
+
+  def __init__(self, tag: str, line: int, column: int) -> None:
+    self.tag = tag
+    self.line = line
+    self.column = column
+    self.mixed = tag in _CONTENT_CHILDREN
+    # Text before the first child, for elements without mixed content
+    self.chunks: list[str] | None = None
+    # Whether a mixed content element has text or a valid child
+    self.has_content = False
+    # Whether the text following an invalid child of a mixed content element is dropped
+    self.drop_tail = False
+    self.has_children = False
+    # Whether a <header> (in <tmx>) or a <seg> (in <tuv>) was found
+    self.found = False
+
+
+class _Checker:
+  """Expat callbacks validating one file."""
+
+  __slots__ = ("policy", "parser", "check_pairing", "stack", "skip_depth", "codes", "violations")
+
+  def __init__(self, policy: DeserializationPolicy, parser: Any, check_pairing: bool) -> None:
+    self.policy = policy
+    self.parser = parser
+    self.check_pairing = check_pairing
+    self.stack: list[_Scope] = []
+    # Depth inside an element that is skipped, 0 when not in one
+    self.skip_depth = 0
+    # Open <bpt> elements of each <seg> or <sub>, by i: (line, column)
+    self.codes: list[dict[str, tuple[int, int]]] = []
+    self.violations: list[Violation] = []
+
+  def report(self, check: str, message: str, line: int, column: int) -> None:
+    self.violations.append(Violation(check, message, line, column))
+
+  def raises(self, check: str) -> bool:
+    """Whether the policy makes ``check`` fail deserialization or collects it."""
+    return getattr(self.policy, check).behavior in ("raise", "collect")
+
+  def check_root(self, tag: str, attributes: dict[str, str]) -> None:
+    self.parser.StartElementHandler = self.start
+    if tag != "tmx":
+      self.report(
+        "invalid_tag",
+        "Root element is not a tmx",
+        self.parser.CurrentLineNumber,
+        self.parser.CurrentColumnNumber,
+      )
+      self.skip_depth = 1
+      return
+    self.start(tag, attributes)
+
+  def start(self, tag: str, attributes: dict[str, str]) -> None:
+    if self.skip_depth:
+      self.skip_depth += 1
+      return
+    line, column = self.parser.CurrentLineNumber, self.parser.CurrentColumnNumber
+    stack = self.stack
+    if stack:
+      parent = stack[-1]
+      if parent.chunks is not None and not parent.has_children:
+        self._check_text(parent)
+      parent.has_children = True
+      if not self._accepts(parent, tag, line, column):
+        parent.drop_tail = parent.mixed
+        self.skip_depth = 1
+        return
+      parent.has_content = True
+      parent.drop_tail = False
+    self._check_attributes(tag, attributes, line, column)
+    if self.check_pairing:
+      self._check_code(tag, attributes, line, column)
+    stack.append(_Scope(tag, line, column))
+
+  def end(self, tag: str) -> None:
+    if self.skip_depth:
+      self.skip_depth -= 1
+      return
+    scope = self.stack.pop()
+    if scope.chunks is not None and not scope.has_children:
+      self._check_text(scope)
+    if scope.mixed:
+      if not scope.has_content and self.raises("empty_content"):
+        self.report("empty_content", f"Element <{tag}> is empty", scope.line, scope.column)
+    elif tag == "prop" or tag == "note":
+      if scope.chunks is None and self.raises("empty_content"):
+        self.report(
+          "empty_content",
+          f"Element <{tag}> does not have any text content",
+          scope.line,
+          scope.column,
+        )
+    elif tag == "tuv":
+      if not scope.found and self.raises("missing_seg"):
+        self.report(
+          "missing_seg", "Element <tuv> is missing a <seg> child element", scope.line, scope.column
+        )
+    elif tag == "tmx":
+      if not scope.found and self.raises("missing_header"):
+        self.report(
+          "missing_header",
+          "Element <tmx> is missing a <header> child element",
+          scope.line,
+          scope.column,
+        )
+    if self.check_pairing and (tag == "seg" or tag == "sub"):
+      for i, (line, column) in self.codes.pop().items():
+        self.report("unpaired_code", f"<bpt> with i={i} has no matching <ept>", line, column)
+
+  def characters(self, data: str) -> None:
+    if self.skip_depth or not self.stack:
+      return
+    scope = self.stack[-1]
+    if scope.mixed:
+      if not scope.drop_tail:
+        scope.has_content = True
+    elif not scope.has_children:
+      if scope.chunks is None:
+        scope.chunks = []
+      scope.chunks.append(data)
+
+  def _check_text(self, scope: _Scope) -> None:
+    """Check the text found before the first child of a structural element."""
+    if scope.tag not in ("tmx", "header", "tu", "tuv") or not self.raises("extra_text"):
+      return
+    text = "".join(scope.chunks)  # type: ignore[arg-type]
+    if text.strip():
+      self.report(
+        "extra_text",
+        f"Element <{scope.tag}> has extra text content '{text}'",
+        scope.line,
+        scope.column,
+      )
+
+  def _accepts(self, parent: _Scope, tag: str, line: int, column: int) -> bool:
+    """Check whether ``tag`` is a valid child of ``parent``."""
+    parent_tag = parent.tag
+    if (allowed := _CONTENT_CHILDREN.get(parent_tag)) is not None:
+      if tag in allowed:
+        return True
+      if self.raises("invalid_child_element"):
+        self.report(
+          "invalid_child_element",
+          f"Incorrect child element in {parent_tag}: expected one of {', '.join(allowed)}, got {tag}",
+          line,
+          column,
+        )
+      return False
+    if parent_tag == "body":
+      return tag == "tu"
+    if tag not in _STRUCTURE_CHILDREN[parent_tag]:
+      if self.raises("invalid_child_element"):
+        self.report(
+          "invalid_child_element", f"Invalid child element <{tag}> in <{parent_tag}>", line, column
+        )
+      return False
+    if tag == "seg" or tag == "header":
+      if parent.found:
+        check = "multiple_seg" if tag == "seg" else "multiple_headers"
+        behavior = getattr(self.policy, check).behavior
+        if behavior == "raise" or behavior == "collect":
+          self.report(check, f"Multiple <{tag}> elements in <{parent_tag}>", line, column)
+        if behavior == "keep_first" or behavior == "collect":
+          return False
+      parent.found = True
+    return True
+
+  def _check_attributes(self, tag: str, attributes: dict[str, str], line: int, column: int) -> None:
+    for attribute, kind, required in _CHECKED_ATTRIBUTES[tag]:
+      value = attributes.get(attribute)
+      if value is None:
+        if required and self.raises("required_attribute_missing"):
+          self.report(
+            "required_attribute_missing", f"Required attribute {attribute!r} is None", line, column
+          )
+        continue
+      if kind == "str":
+        continue
+      if kind == "int":
+        try:
+          int(value)
+          continue
+        except ValueError:
+          message = f"Cannot convert {value!r} to an int for attribute {attribute}"
+      elif kind == "datetime":
+        try:
+          parse_datetime(value)
+          continue
+        except ValueError:
+          message = f"Cannot convert {value!r} to a datetime object for attribute {attribute}"
+      elif value in _ENUM_VALUES[kind]:  # type: ignore[index]
+        continue
+      else:
+        message = f"Value {value!r} is not a valid enum value for attribute {attribute}"
+      if self.raises("invalid_attribute_value"):
+        self.report("invalid_attribute_value", message, line, column)
+
+  def _check_code(self, tag: str, attributes: dict[str, str], line: int, column: int) -> None:
+    """Track the pairing of `<bpt>` and `<ept>` elements within a `<seg>` or `<sub>`."""
+    if tag == "seg" or tag == "sub":
+      self.codes.append({})
+      return
+    if (tag != "bpt" and tag != "ept") or (i := attributes.get("i")) is None:
+      return
+    codes = self.codes[-1]
+    if tag == "bpt":
+      if i in codes:
+        self.report("unpaired_code", f"Duplicate <bpt> with i={i}", line, column)
+      codes[i] = (line, column)
+    elif codes.pop(i, None) is None:
+      self.report("unpaired_code", f"<ept> with i={i} has no matching <bpt>", line, column)
+
+
+class TmxValidator:
+  """
+  Checks TMX files against a ``DeserializationPolicy`` without building objects.
+
+  The file is streamed through ``xml.parsers.expat`` and the checks of the
+  deserialization handlers (required attributes, int, date and enum values,
+  permitted children, extra text, empty content, missing or repeated
+  `<seg>` and `<header>`) are applied on the parser's events. Nothing but
+  the reported violations is kept in memory, and validation runs close to
+  raw parse speed.
+
+  A violation is reported for every problem whose policy behavior is
+  "raise" or "collect", i.e. every problem that would make ``load`` fail
+  with the same policy, or that it would report to its diagnostics.
+  Problems the policy tolerates ("ignore", "keep_first"...) are not
+  reported. Unlike ``load``, validation does not stop at the first problem.
+
+  `<bpt>` and `<ept>` elements are additionally checked to be paired
+  through their ``i`` attribute within each `<seg>` (and each `<sub>`),
+  which the handlers do not enforce.
+
+  Parameters
+  ----------
+  policy : DeserializationPolicy | None, optional
+      The policy to validate against. Defaults to a standard
+      DeserializationPolicy, which reports every problem.
+  encoding : str | None, optional
+      Overrides the encoding declared in the file. Defaults to None (the
+      declared encoding, or UTF-8, is used).
+  check_pairing : bool, optional
+      Whether to check that `<bpt>` and `<ept>` elements are paired.
+      Defaults to True.
+  buffer_size : int, optional
+      Number of bytes read from the file and fed to expat at a time.
+      Defaults to 65536.
+
+  Attributes
+  ----------
+  policy : DeserializationPolicy
+      The policy validated against.
+  encoding : str | None
+      The encoding override, if any.
+  check_pairing : bool
+      Whether `<bpt>`/`<ept>` pairing is checked.
+  buffer_size : int
+      Number of bytes fed to expat at a time.
+
+  Examples
+  --------
+  >>> validator = TmxValidator()
+  >>> for violation in validator.iter_violations("upload.tmx"):
+  >>>     print(f"{violation.line}:{violation.column}: {violation.message}")
+  """
+
+  __slots__ = ("policy", "encoding", "check_pairing", "buffer_size")
+
+  def __init__(
+    self,
+    policy: DeserializationPolicy | None = None,
+    *,
+    encoding: str | None = None,
+    check_pairing: bool = True,
+    buffer_size: int = 65536,
+  ) -> None:
+    if buffer_size < 1:
+      raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+    self.policy: DeserializationPolicy = policy or DeserializationPolicy()
+    self.encoding: str | None = encoding
+    self.check_pairing: bool = check_pairing
+    self.buffer_size: int = buffer_size
+
+  def validate(self, path: PathLike | str) -> list[Violation]:
+    """
+    Validate a TMX file.
+
+    Parameters
+    ----------
+    path : PathLike | str
+        Path to the TMX file.
+
+    Returns
+    -------
+    list[Violation]
+        The violations found, in document order. The file is valid if the
+        list is empty.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    IsADirectoryError
+        If the path is a directory.
+    """
+    return list(self.iter_violations(path))
+
+  def iter_violations(self, path: PathLike | str) -> Generator[Violation]:
+    """
+    Stream the violations of a TMX file as they are found.
+
+    If the file is not well-formed XML, a ``"not_well_formed"`` violation is
+    yielded last and validation stops there.
+
+    Parameters
+    ----------
+    path : PathLike | str
+        Path to the TMX file.
+
+    Yields
+    ------
+    Violation
+        The violations found, in document order, except for unpaired
+        `<bpt>` elements, which are reported when their `<seg>` closes.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    IsADirectoryError
+        If the path is a directory.
+    """
+    _path = make_usable_path(path, mkdir=False)
+    if not _path.exists():
+      raise FileNotFoundError(f"File {_path} does not exist")
+    if not _path.is_file():
+      raise IsADirectoryError(f"Path {_path} is a directory")
+    return self._run(_path)
+
+  def _run(self, path: Any) -> Generator[Violation]:
+    parser = expat.ParserCreate(self.encoding)
+    checker = _Checker(self.policy, parser, self.check_pairing)
+    parser.buffer_text = True
+    parser.StartElementHandler = checker.check_root
+    parser.EndElementHandler = checker.end
+    parser.CharacterDataHandler = checker.characters
+    violations = checker.violations
+    with open(path, "rb") as file:
+      try:
+        while data := file.read(self.buffer_size):
+          parser.Parse(data, False)
+          if violations:
+            yield from violations
+            violations.clear()
+        parser.Parse(b"", True)
+      except expat.ExpatError as e:
+        yield from violations
+        yield Violation("not_well_formed", expat.ErrorString(e.code), e.lineno, e.offset)
+        return
+    yield from violations
+
+
+def validate(
+  path: PathLike | str,
+  policy: DeserializationPolicy | None = None,
+  *,
+  encoding: str | None = None,
+  check_pairing: bool = True,
+) -> list[Violation]:
+  """
+  Validate a TMX file without deserializing it.
+
+  Shortcut for ``TmxValidator(policy, ...).validate(path)``.
+
+  Parameters
+  ----------
+  path : PathLike | str
+      Path to the TMX file.
+  policy : DeserializationPolicy | None, optional
+      The policy to validate against. Defaults to a standard
+      DeserializationPolicy, which reports every problem.
+  encoding : str | None, optional
+      Overrides the encoding declared in the file. Defaults to None.
+  check_pairing : bool, optional
+      Whether to check that `<bpt>` and `<ept>` elements are paired.
+      Defaults to True.
+
+  Returns
+  -------
+  list[Violation]
+      The violations found, in document order. The file is valid if the
+      list is empty.
+
+  Examples
+  --------
+  >>> if violations := validate("upload.tmx"):
+  >>>     reject(violations)
+  """
+  return TmxValidator(policy, encoding=encoding, check_pairing=check_pairing).validate(path)
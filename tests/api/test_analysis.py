@@ -0,0 +1,91 @@
+from datetime import UTC, datetime
+
+import pytest
+from hypomnema.api import LanguageStats, TmxStats, stats
+from hypomnema.base.errors import XmlDeserializationError
+
+_TMX = """<?xml version="1.0" encoding="{encoding}"?>
+<tmx version="1.4">
+<header creationtool="t" creationtoolversion="1" segtype="sentence" o-tmf="t" adminlang="en"
+  srclang="en" datatype="plaintext"><prop type="x-client">ACME</prop></header>
+<body>
+<tu tuid="1" creationdate="20240105T120000Z" changedate="20240301T000000Z">
+  <prop type="x-domain">legal</prop>
+  <tuv xml:lang="en-US"><seg>Click <bpt i="1">&lt;b&gt;</bpt>here<ept i="1">&lt;/b&gt;</ept> now</seg></tuv>
+  <tuv xml:lang="fr_fr" creationdate="20230101T000000Z"><seg>Cliquez <hi>ici</hi></seg></tuv>
+</tu>
+<tu tuid="2" creationdate="not a date">
+  <prop type="x-domain">it</prop><prop type="x-note">n</prop>
+  <tuv xml:lang="EN-us"><seg>Open the <ph>{{0}}<sub>file name</sub></ph> file</seg></tuv>
+  <tuv xml:lang="fr-FR" changedate="20250101T000000"><seg>Ouvrez le fichier é</seg></tuv>
+  <tuv><seg>x</seg></tuv>
+</tu>
+</body>
+</tmx>
+"""
+
+
+def _write(path, encoding="utf-8"):
+  path.write_bytes(_TMX.format(encoding=encoding).encode(encoding))
+  return path
+
+
+class TestStatsHappy:
+  @pytest.mark.parametrize("encoding", ["utf-8", "utf-16", "latin-1"])
+  def test_stats(self, tmp_path, encoding):
+    report = stats(_write(tmp_path / "a.tmx", encoding))
+    assert (report.files, report.tus, report.tuvs) == (1, 2, 5)
+    assert report.languages == {
+      "en-US": LanguageStats(tuvs=2, words=6, characters=28, inline_tags=4),
+      "fr-FR": LanguageStats(tuvs=2, words=6, characters=30, inline_tags=1),
+      "": LanguageStats(tuvs=1, words=1, characters=1, inline_tags=0),
+    }
+    assert report.languages["en-US"].inline_density == 2.0
+    assert report.props == {"x-domain": 2, "x-client": 1, "x-note": 1}
+    assert report.first_created == datetime(2023, 1, 1, tzinfo=UTC)
+    assert report.last_created == datetime(2024, 1, 5, 12, tzinfo=UTC)
+    assert report.first_changed == datetime(2024, 3, 1, tzinfo=UTC)
+    assert report.last_changed == datetime(2025, 1, 1, tzinfo=UTC)
+
+  @pytest.mark.parametrize("jobs", [None, 2])
+  def test_several_files(self, tmp_path, jobs):
+    one = stats(_write(tmp_path / "a.tmx"))
+    report = stats([_write(tmp_path / "a.tmx"), _write(tmp_path / "b.tmx")], jobs=jobs)
+    assert (report.files, report.tus, report.tuvs) == (2, 4, 10)
+    assert report.languages["en-US"].words == 2 * one.languages["en-US"].words
+    assert report.props["x-domain"] == 4
+    assert report.first_created == one.first_created
+
+  def test_empty_file(self, tmp_path):
+    path = tmp_path / "empty.tmx"
+    path.write_text('<tmx version="1.4"><header/><body/></tmx>')
+    assert stats(path) == TmxStats(files=1)
+
+  def test_as_dict(self, tmp_path):
+    data = stats(_write(tmp_path / "a.tmx")).as_dict()
+    assert data["tus"] == 2
+    assert list(data["languages"]) == ["", "en-US", "fr-FR"]
+    assert data["languages"]["en-US"]["inline_density"] == 2.0
+    assert data["first_created"] == "2023-01-01T00:00:00+00:00"
+    assert stats([]).as_dict()["last_changed"] is None
+
+
+class TestStatsError:
+  def test_not_well_formed(self, tmp_path):
+    path = tmp_path / "broken.tmx"
+    path.write_text("<tmx><body><tu></body></tmx>")
+    with pytest.raises(XmlDeserializationError, match="Cannot parse"):
+      stats(path)
+
+  def test_missing_file(self, tmp_path):
+    with pytest.raises(FileNotFoundError):
+      stats([_write(tmp_path / "a.tmx"), tmp_path / "missing.tmx"])
+
+  def test_directory(self, tmp_path):
+    with pytest.raises(IsADirectoryError):
+      stats(tmp_path)
+
+  @pytest.mark.parametrize("kwargs", [{"jobs": 0}, {"buffer_size": 0}])
+  def test_invalid_arguments(self, tmp_path, kwargs):
+    with pytest.raises(ValueError, match="must be at least 1"):
+      stats(_write(tmp_path / "a.tmx"), **kwargs)
@@ -10,8 +10,10 @@ from hypomnema import (
   XmlSerializationError,
   SerializationPolicy,
   PolicyValue,
+  StandardBackend,
+  AttributeDeserializationError,
 )
-from hypomnema.api import load, save
+from hypomnema.api import load, save, save_stream
 from hypomnema.api.helpers import create_tmx, create_header, create_tu, create_tuv
 
 
@@ -92,6 +94,44 @@ class TestLoadSaveHappy:
     elements = list(load(file, filter="tu"))
     assert len(elements) == 2
 
+  @pytest.mark.parametrize("chunk_size", [1, 2, 5])
+  def test_load_filter_chunk_size(self, tmp_path, chunk_size):
+    file = tmp_path / "test.tmx"
+    save(self.tmx, file)
+
+    elements = list(load(file, filter=["tu", "header"], chunk_size=chunk_size))
+    assert elements == list(load(file, filter=["tu", "header"]))
+    assert elements == [self.tmx.header, *self.tmx.body]
+
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  @pytest.mark.parametrize("workers, chunk_size", [(1, None), (2, 1), (4, 2)])
+  def test_load_filter_workers(self, tmp_path, backend_class, workers, chunk_size):
+    file = tmp_path / "test.tmx"
+    self.tmx.body = [
+      create_tu(tuid=str(i), variants=[create_tuv("en", content=[str(i)])]) for i in range(50)
+    ]
+    save(self.tmx, file)
+
+    elements = list(
+      load(
+        file,
+        filter=["tu", "header"],
+        backend=backend_class(),
+        workers=workers,
+        chunk_size=chunk_size,
+      )
+    )
+    assert elements == [self.tmx.header, *self.tmx.body]
+
+  def test_load_filter_workers_lazy_content(self, tmp_path):
+    file = tmp_path / "test.tmx"
+    save(self.tmx, file)
+
+    tus = list(load(file, filter="tu", workers=2, chunk_size=1, lazy_content=True))
+    assert [tuv.content for tu in tus for tuv in tu.variants] == [
+      tuv.content for tu in self.tmx.body for tuv in tu.variants
+    ]
+
   def test_load_generator_is_lazy(self, tmp_path):
     file = tmp_path / "test.tmx"
     save(self.tmx, file)
@@ -108,6 +148,29 @@ class TestLoadSaveHappy:
   def test_save_with_lxml_backend(self):
     save(self.tmx, "/tmp/test.tmx", backend=LxmlBackend())
 
+  def test_save_roundtrip_with_each_backend(self, tmp_path):
+    # StrictBackend.write only takes (element, path, encoding)
+    file = tmp_path / "test.tmx"
+    save(self.tmx, file, backend=self.backend)
+    assert load(file, backend=self.backend) == self.tmx
+
+  @pytest.mark.parametrize("encoding", ["utf-8", "utf-16", "latin-1"])
+  def test_save_stream_roundtrip(self, tmp_path, encoding):
+    file = tmp_path / "test.tmx"
+    count = save_stream(
+      iter(self.tmx.body), file, header=self.tmx.header, encoding=encoding, backend=self.backend
+    )
+    assert count == 2
+    assert load(file, encoding=encoding, backend=self.backend) == self.tmx
+    assert file.read_bytes().count("<?xml".encode(encoding)) == 1
+
+  def test_save_stream_default_header(self, tmp_path):
+    file = tmp_path / "test.tmx"
+    assert save_stream([], file) == 0
+    loaded = load(file)
+    assert loaded.header == create_header()
+    assert loaded.body == []
+
   def test_load_nonexistent_file_raises(self):
     with pytest.raises(FileNotFoundError):
       load("/nonexistent/path/file.tmx")
@@ -116,6 +179,14 @@ class TestLoadSaveHappy:
     with pytest.raises(IsADirectoryError):
       load("/tmp")
 
+  def test_load_invalid_chunk_size_raises(self, tmp_path):
+    with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+      load(tmp_path / "test.tmx", filter="tu", chunk_size=0)
+
+  def test_load_invalid_workers_raises(self, tmp_path):
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+      load(tmp_path / "test.tmx", filter="tu", workers=0)
+
 
 class TestLoadSaveError:
   def test_save_invalid_type_raises(self):
@@ -128,8 +199,24 @@ class TestLoadSaveError:
     with pytest.raises(XmlSerializationError, match="serializer returned None"):
       save(tmx, file, policy=SerializationPolicy(missing_handler=PolicyValue("ignore", 10)))
 
+  def test_save_stream_serializer_returns_none_raises(self, tmp_path):
+    file = tmp_path / "test.tmx"
+    policy = SerializationPolicy(missing_handler=PolicyValue("ignore", 10))
+    with pytest.raises(XmlSerializationError, match="serializer returned None for Mock"):
+      save_stream([Mock(spec=Tu)], file, policy=policy)
+    assert not file.exists()
+
   def test_load_invalid_root_element_raises(self, tmp_path):
     file = tmp_path / "test.tmx"
     file.write_text("<nope/>")
     with pytest.raises(XmlDeserializationError, match="Root element is not a tmx"):
       load(file)
+
+  def test_load_filter_workers_error_is_raised_in_order(self, tmp_path):
+    file = tmp_path / "test.tmx"
+    tus = "".join(f'<tu tuid="{i}"><tuv xml:lang="en"><seg>{i}</seg></tuv></tu>' for i in range(20))
+    file.write_text(f'<tmx version="1.4"><body>{tus}<tu usagecount="x"/>{tus}</body></tmx>')
+    elements = load(file, filter="tu", workers=4, chunk_size=3)
+    assert [next(elements).tuid for _ in range(18)] == [str(i) for i in range(18)]
+    with pytest.raises(AttributeDeserializationError, match="Cannot convert 'x' to an int"):
+      list(elements)
@@ -0,0 +1,140 @@
+from operator import eq
+
+import pytest
+from hypomnema.api import (
+  DuplicateCluster,
+  DuplicateFinder,
+  default_normalizer,
+  find_duplicates,
+  load,
+  remove_duplicates,
+  save,
+)
+from hypomnema.api.helpers import create_bpt, create_ept, create_header, create_tmx, create_tu
+from hypomnema.api.helpers import create_tuv
+from hypomnema.base.types import Tu
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+
+_TEXTS = [
+  "Click here to save the document.",
+  "Press the button to print the current page.",
+  "Click here to save the document!",
+  "The file could not be opened.",
+  "Click  here, to save the document",
+  "Press the button to print the current page now.",
+  "Ελληνικά: το αρχείο δεν άνοιξε.",
+  "Ελληνικά - το αρχείο δεν άνοιξε",
+]
+
+
+def _tu(tuid: str, text: str, lang: str = "en") -> Tu:
+  return create_tu(
+    tuid=tuid, variants=[create_tuv(lang, content=[text]), create_tuv("fr", content=[tuid])]
+  )
+
+
+def _tmx():
+  return create_tmx(
+    header=create_header(creationtool="tool", creationtoolversion="1.0", srclang="en"),
+    body=[_tu(str(i), text) for i, text in enumerate(_TEXTS)],
+  )
+
+
+class TestDuplicateFinderHappy:
+  def test_clusters(self):
+    finder = DuplicateFinder("en")
+    finder.add_many(_tu(str(i), text) for i, text in enumerate(_TEXTS))
+    assert len(finder) == len(_TEXTS)
+    assert finder.clusters() == [
+      DuplicateCluster([0, 2, 4], ["0", "2", "4"]),
+      DuplicateCluster([1, 5], ["1", "5"]),
+      DuplicateCluster([6, 7], ["6", "7"]),
+    ]
+
+  def test_exact_threshold(self):
+    finder = DuplicateFinder("en", threshold=1)
+    finder.add_many(_tu(str(i), text) for i, text in enumerate(_TEXTS))
+    assert [cluster.positions for cluster in finder.clusters()] == [[0, 2, 4], [6, 7]]
+
+  def test_language_and_markup(self):
+    finder = DuplicateFinder("en")
+    assert finder.add(_tu("a", "Save the document.", "en-US")) == 0
+    assert finder.add(_tu("b", "Save the document.", "de")) == 1
+    tagged = create_tu(
+      tuid="c",
+      variants=[
+        create_tuv(
+          "EN-gb",
+          content=["Save ", create_bpt(1, content=["<b>"]), "the", create_ept(1), " document"],
+        )
+      ],
+    )
+    assert finder.add(tagged) == 2
+    assert finder.add(_tu("d", "...", "en")) == 3
+    assert finder.clusters() == [DuplicateCluster([0, 2], ["a", "c"])]
+
+  def test_exact_language(self):
+    finder = DuplicateFinder("en", exact=True)
+    finder.add(_tu("a", "Save the document", "en-US"))
+    finder.add(_tu("b", "Save the document", "en-US"))
+    assert finder.clusters() == []
+
+  def test_custom_normalizer(self):
+    finder = DuplicateFinder(
+      "en", threshold=1, normalize=lambda text: default_normalizer(text.casefold())
+    )
+    finder.add(_tu("a", "SAVE the document"))
+    finder.add(_tu("b", "save the Document!"))
+    assert finder.clusters() == [DuplicateCluster([0, 1], ["a", "b"])]
+
+  def test_signature_estimates_similarity(self):
+    finder = DuplicateFinder("en", num_perm=128)
+    a = finder.signature("the quick brown fox jumps over the lazy dog")
+    b = finder.signature("the quick brown fox jumps over the lazy cat")
+    c = finder.signature("an entirely different sentence")
+    assert len(a) == 128
+    assert a == finder.signature("the quick brown fox jumps over the lazy dog")
+    assert sum(map(eq, a, b)) / 128 > 0.7
+    assert sum(map(eq, a, c)) / 128 < 0.2
+
+  def test_short_text(self):
+    finder = DuplicateFinder("en", shingle_size=8)
+    finder.add(_tu("a", "OK"))
+    finder.add(_tu("b", "OK!"))
+    assert finder.clusters() == [DuplicateCluster([0, 1], ["a", "b"])]
+
+
+class TestDuplicateFinderError:
+  @pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+      ({"threshold": 0}, "threshold must be in"),
+      ({"threshold": 1.5}, "threshold must be in"),
+      ({"num_perm": 0}, "num_perm must be at least 1"),
+      ({"shingle_size": 0}, "shingle_size must be at least 1"),
+    ],
+  )
+  def test_invalid_arguments(self, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+      DuplicateFinder("en", **kwargs)
+
+
+class TestFileDeduplicationHappy:
+  @pytest.fixture(autouse=True, params=[StandardBackend, LxmlBackend], ids=["Standard", "Lxml"])
+  def setup(self, request, tmp_path):
+    self.backend = request.param()
+    self.path = tmp_path / "in.tmx"
+    self.output = tmp_path / "out.tmx"
+    save(_tmx(), self.path)
+
+  def test_find_duplicates(self):
+    clusters = find_duplicates(self.path, "en", backend=self.backend)
+    assert [cluster.tuids for cluster in clusters] == [["0", "2", "4"], ["1", "5"], ["6", "7"]]
+
+  def test_remove_duplicates(self):
+    clusters = remove_duplicates(self.path, self.output, "en", backend=self.backend)
+    assert len(clusters) == 3
+    result = load(self.output)
+    assert result.header == _tmx().header
+    assert result.body == [tu for tu in _tmx().body if tu.tuid in {"0", "1", "3", "6"}]
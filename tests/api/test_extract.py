@@ -0,0 +1,147 @@
+import pytest
+from hypomnema.api import extract_bilingual, iter_bilingual, load, save
+from hypomnema.api.helpers import create_bpt, create_ept, create_header, create_tmx
+from hypomnema.api.helpers import create_tu, create_tuv
+from hypomnema.base.types import Tu
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.deserialization.projection import Projection
+
+
+class TestExtractBilingualHappy:
+  @pytest.fixture(autouse=True, params=[StandardBackend, LxmlBackend], ids=["Standard", "Lxml"])
+  def setup(self, request, tmp_path):
+    self.backend = request.param()
+    self.tmp_path = tmp_path
+    self.path = tmp_path / "multilingual.tmx"
+    self.tmx = create_tmx(
+      header=create_header(creationtool="tool", creationtoolversion="1.0", srclang="de"),
+      body=[
+        create_tu(
+          tuid="1",
+          srclang="de",
+          variants=[
+            create_tuv("de", content=["Hallo"]),
+            create_tuv(
+              "en-US",
+              content=[
+                "Click ",
+                create_bpt(i=1, content=["<b>"]),
+                "here",
+                create_ept(i=1, content=["</b>"]),
+              ],
+            ),
+            create_tuv("fr-FR", content=["Bonjour\nle monde"]),
+          ],
+        ),
+        create_tu(
+          tuid="2",
+          variants=[create_tuv("de", content=["Nur Deutsch"]), create_tuv("fr", content=["Ok"])],
+        ),
+        create_tu(
+          tuid="3",
+          variants=[
+            create_tuv("fr", content=["Un"]),
+            create_tuv("en", content=["One"]),
+            create_tuv("en-GB", content=["One (GB)"]),
+          ],
+        ),
+      ],
+    )
+    save(self.tmx, self.path)
+
+  def test_iter_bilingual(self):
+    tus = list(iter_bilingual(self.path, "en", "fr", backend=self.backend))
+    assert [tu.tuid for tu in tus] == ["1", "3"]
+    assert [[tuv.lang for tuv in tu.variants] for tu in tus] == [["en-US", "fr-FR"], ["en", "fr"]]
+    assert tus[0].variants == [self.tmx.body[0].variants[1], self.tmx.body[0].variants[2]]
+    assert tus[0].srclang == "en-US"
+    assert tus[1].srclang is None
+
+  def test_iter_bilingual_exact(self):
+    tus = list(iter_bilingual(self.path, "en", "fr", exact=True, backend=self.backend))
+    assert [tu.tuid for tu in tus] == ["3"]
+
+  def test_other_languages_are_not_deserialized(self, mocker):
+    spy = mocker.patch.object(Projection, "wants_language", autospec=True, return_value=False)
+    assert list(iter_bilingual(self.path, "en", "fr", backend=self.backend)) == []
+    assert spy.call_count == 8
+
+  def test_extract_tmx(self):
+    output = self.tmp_path / "out" / "en-fr.tmx"
+    assert extract_bilingual(self.path, "en", "fr", output, backend=self.backend) == 2
+    tmx = load(output, backend=self.backend)
+    assert tmx.header.srclang == "en"
+    assert tmx.header.creationtool == "tool"
+    assert [tu.tuid for tu in tmx.body] == ["1", "3"]
+    assert tmx.body[0].variants == [self.tmx.body[0].variants[1], self.tmx.body[0].variants[2]]
+
+  def test_extract_tmx_utf16(self):
+    output = self.tmp_path / "en-fr.tmx"
+    assert extract_bilingual(self.path, "en", "fr", output, encoding="utf-16") == 2
+    assert output.read_bytes().count(b"\xff\xfe") == 1
+    assert [tu.tuid for tu in load(output, encoding="utf-16").body] == ["1", "3"]
+
+  def test_extract_text(self):
+    source = self.tmp_path / "train.en"
+    target = self.tmp_path / "train.fr"
+    count = extract_bilingual(
+      self.path, "en", "fr", source, target_output=target, backend=self.backend
+    )
+    assert count == 2
+    assert source.read_text(encoding="utf-8") == "Click here\nOne\n"
+    assert target.read_text(encoding="utf-8") == "Bonjour le monde\nUn\n"
+
+  def test_extract_text_utf16(self):
+    source = self.tmp_path / "train.en"
+    target = self.tmp_path / "train.fr"
+    extract_bilingual(self.path, "en", "fr", source, target_output=target, encoding="utf-16")
+    assert source.read_bytes().count(b"\xff\xfe") == 1
+    assert source.read_text(encoding="utf-16") == "Click here\nOne\n"
+    assert target.read_text(encoding="utf-16") == "Bonjour le monde\nUn\n"
+
+
+class TestExtractBilingualError:
+  def test_missing_file(self, tmp_path):
+    with pytest.raises(FileNotFoundError):
+      list(iter_bilingual(tmp_path / "missing.tmx", "en", "fr"))
+
+  @pytest.mark.parametrize("as_text", [False, True])
+  def test_missing_file_keeps_outputs(self, tmp_path, as_text):
+    source = tmp_path / "train.en"
+    target = tmp_path / "train.fr"
+    source.write_text("old source")
+    target.write_text("old target")
+    with pytest.raises(FileNotFoundError):
+      extract_bilingual(
+        tmp_path / "missing.tmx", "en", "fr", source, target_output=target if as_text else None
+      )
+    assert source.read_text() == "old source"
+    assert target.read_text() == "old target"
+
+  def test_failure_keeps_text_outputs(self, tmp_path):
+    path = tmp_path / "broken.tmx"
+    path.write_text(
+      '<tmx version="1.4"><header/><body>'
+      '<tu><tuv xml:lang="en"><seg>a</seg></tuv><tuv xml:lang="fr"><seg>b</seg></tuv></tu>'
+      "<tu><tuv></body></tmx>"
+    )
+    source = tmp_path / "train.en"
+    target = tmp_path / "train.fr"
+    source.write_text("old source")
+    target.write_text("old target")
+    with pytest.raises(SyntaxError):
+      extract_bilingual(path, "en", "fr", source, target_output=target)
+    assert source.read_text() == "old source"
+    assert target.read_text() == "old target"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["broken.tmx", "train.en", "train.fr"]
+
+  def test_directory(self, tmp_path):
+    with pytest.raises(IsADirectoryError):
+      extract_bilingual(tmp_path, "en", "fr", tmp_path / "out.tmx")
+
+  def test_tu_without_pair_is_skipped(self, tmp_path):
+    path = tmp_path / "mono.tmx"
+    save(create_tmx(body=[create_tu(variants=[create_tuv("en", content=["a"])])]), path)
+    assert list(iter_bilingual(path, "en", "fr")) == []
+    assert all(isinstance(tu, Tu) for tu in iter_bilingual(path, "en", "en"))
@@ -0,0 +1,206 @@
+import shutil
+
+import pytest
+from hypomnema.api import append, load, recover, save, update
+from hypomnema.api.helpers import create_tu, create_tuv
+from hypomnema.base.errors import XmlDeserializationError
+from hypomnema.base.types import Tu
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+
+
+def _tu(tuid: str, text: str = "text") -> Tu:
+  return create_tu(tuid=tuid, variants=[create_tuv("en", content=[text])])
+
+
+class TestAppendHappy:
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  @pytest.mark.parametrize("count", [0, 2], ids=["empty", "non-empty"])
+  def test_append(self, tmp_path, backend_class, count, make_tmx):
+    path = tmp_path / "memory.tmx"
+    tmx = make_tmx(count)
+    save(tmx, path, backend=backend_class())
+
+    assert append(path, [_tu("a"), _tu("b")], backend=backend_class()) == 2
+    assert append(path, iter([_tu("c")])) == 1
+    assert load(path).body == [*tmx.body, _tu("a"), _tu("b"), _tu("c")]
+    assert not (tmp_path / "memory.tmx.journal").exists()
+
+  @pytest.mark.parametrize("encoding", ["utf-16", "latin-1"])
+  def test_keeps_file_encoding(self, tmp_path, encoding, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(1), path, encoding=encoding)
+    append(path, [_tu("new", "Ελληνικά é")])
+    assert load(path, encoding=encoding).body[-1] == _tu("new", "Ελληνικά é")
+
+  def test_byte_order_mark(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(1), path)
+    path.write_bytes(b"\xef\xbb\xbf" + path.read_bytes())
+    append(path, [_tu("new", "é")])
+    assert path.read_bytes().startswith(b"\xef\xbb\xbf<?xml")
+    assert load(path).body[-1] == _tu("new", "é")
+
+  def test_trailing_whitespace(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(1), path)
+    path.write_bytes(path.read_bytes().replace(b"</body></tmx>", b"</body>\n</tmx>\n\n"))
+    append(path, [_tu("new")])
+    assert path.read_bytes().endswith(b"</body>\n</tmx>\n\n")
+    assert [tu.tuid for tu in load(path).body] == ["0", "new"]
+
+  def test_nothing_to_append(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(1), path)
+    before = path.read_bytes()
+    assert append(path, []) == 0
+    assert path.read_bytes() == before
+
+  def test_recover_interrupted_append(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    crashed = tmp_path / "crashed.tmx"
+    save(make_tmx(2), path)
+    before = path.read_bytes()
+
+    def tus():
+      yield _tu("a")
+      # Snapshot the file and its journal as a crash would leave them
+      shutil.copy(path, crashed)
+      shutil.copy(tmp_path / "memory.tmx.journal", tmp_path / "crashed.tmx.journal")
+      yield _tu("b")
+
+    append(path, tus())
+    assert crashed.read_bytes() != before
+    assert recover(crashed)
+    assert crashed.read_bytes() == before
+    assert not (tmp_path / "crashed.tmx.journal").exists()
+    assert not recover(crashed)
+
+  def test_append_recovers_first(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(1), path)
+    journal = tmp_path / "memory.tmx.journal"
+    offset = path.read_bytes().rfind(b"</body>")
+    journal.write_bytes(b"%d\n</body></tmx>" % offset)
+    with open(path, "r+b") as file:
+      file.seek(offset)
+      file.write(b"<tu tuid='partial'><tuv xml:la")
+      file.truncate()
+
+    append(path, [_tu("new")])
+    assert [tu.tuid for tu in load(path).body] == ["0", "new"]
+
+
+class TestUpdateHappy:
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  def test_update(self, tmp_path, backend_class, make_tmx):
+    path = tmp_path / "memory.tmx"
+    tmx = make_tmx(5)
+    save(tmx, path, backend=backend_class())
+
+    first, last = _tu("3", "fixed typo"), _tu("1", "a much longer text than before")
+    first.usagecount = 7
+    assert update(path, [first, last], backend=backend_class()) == 2
+    tmx.body[1], tmx.body[3] = last, first
+    assert load(path) == tmx
+    assert not (tmp_path / "memory.tmx.journal").exists()
+
+  def test_only_rewrites_from_first_update(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(100), path)
+    before = path.read_bytes()
+    update(path, [_tu("90", "new")])
+    after = path.read_bytes()
+    offset = before.find(b'<tu tuid="90"')
+    assert after[:offset] == before[:offset]
+    assert after[offset:].startswith(b'<tu tuid="90"><tuv xml:lang="en"><seg>new</seg>')
+
+  def test_self_closing_and_whitespace(self, tmp_path):
+    path = tmp_path / "memory.tmx"
+    path.write_text(
+      '<tmx version="1.4"><header/><body>\n  <tu tuid="a"/>\n  <tu tuid="b" >x</tu >'
+      '<!-- c --><tu tuid="c"/></body></tmx>'
+    )
+    update(path, [_tu("a", "A"), _tu("b", "B")])
+    assert path.read_text() == (
+      '<tmx version="1.4"><header/><body>\n  <tu tuid="a"><tuv xml:lang="en"><seg>A</seg></tuv>'
+      '</tu>\n  <tu tuid="b"><tuv xml:lang="en"><seg>B</seg></tuv></tu><!-- c --><tu tuid="c"/>'
+      "</body></tmx>"
+    )
+
+  def test_first_duplicate_is_replaced(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    tmx = make_tmx(2)
+    tmx.body.append(_tu("0", "duplicate"))
+    save(tmx, path)
+    update(path, [_tu("0", "old"), _tu("0", "new")])
+    assert [tuv.content for tu in load(path).body for tuv in tu.variants] == [
+      ["new"],
+      ["text 1"],
+      ["duplicate"],
+    ]
+
+  @pytest.mark.parametrize("encoding", ["utf-16", "latin-1"])
+  def test_keeps_file_encoding(self, tmp_path, encoding, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(3), path, encoding=encoding)
+    update(path, [_tu("1", "Ελληνικά é")])
+    assert load(path, encoding=encoding).body == [
+      _tu("0", "text 0"),
+      _tu("1", "Ελληνικά é"),
+      _tu("2", "text 2"),
+    ]
+
+  def test_nothing_to_update(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(1), path)
+    assert update(path, []) == 0
+
+
+class TestUpdateError:
+  def test_missing_tuid_leaves_file_unchanged(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(3), path)
+    before = path.read_bytes()
+    with pytest.raises(KeyError, match="No <tu> with tuid 7, 8"):
+      update(path, [_tu("1"), _tu("8"), _tu("7")])
+    assert path.read_bytes() == before
+
+  def test_no_tuid(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(1), path)
+    with pytest.raises(ValueError, match="without a tuid"):
+      update(path, [create_tu()])
+
+  def test_not_well_formed(self, tmp_path):
+    path = tmp_path / "memory.tmx"
+    path.write_text('<tmx><body><tu tuid="1"></body></tmx>')
+    with pytest.raises(XmlDeserializationError, match="Cannot parse"):
+      update(path, [_tu("1")])
+
+
+class TestAppendError:
+  def test_serialization_error_restores_file(self, tmp_path, make_tmx):
+    path = tmp_path / "memory.tmx"
+    save(make_tmx(1), path)
+    before = path.read_bytes()
+    with pytest.raises(TypeError, match="Expected a Tu, got a str"):
+      append(path, [_tu("a"), "not a tu"])  # type: ignore[list-item]
+    assert path.read_bytes() == before
+    assert not (tmp_path / "memory.tmx.journal").exists()
+
+  @pytest.mark.parametrize("content", ["<tmx><body></body>", "<tmx><body></body></tmx><!-- x -->"])
+  def test_no_closing_tags(self, tmp_path, content):
+    path = tmp_path / "memory.tmx"
+    path.write_text(content)
+    with pytest.raises(XmlDeserializationError, match="does not end with closing"):
+      append(path, [_tu("a")])
+    assert path.read_text() == content
+
+  def test_missing_file(self, tmp_path):
+    with pytest.raises(FileNotFoundError):
+      append(tmp_path / "missing.tmx", [_tu("a")])
+
+  def test_directory(self, tmp_path):
+    with pytest.raises(IsADirectoryError):
+      append(tmp_path, [_tu("a")])
@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+from hypomnema.api import Pipeline, StageStats, load, save
+from hypomnema.api.helpers import create_header, create_tmx, create_tu, create_tuv
+from hypomnema.base.types import Tu
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+
+
+def _upper(tu: Tu) -> Tu:
+  for tuv in tu.variants:
+    tuv.content = [part.upper() for part in tuv.content]
+  return tu
+
+
+class TestPipelineHappy:
+  @pytest.fixture(autouse=True, params=[StandardBackend, LxmlBackend], ids=["Standard", "Lxml"])
+  def setup(self, request, tmp_path):
+    self.backend = request.param()
+    self.path = tmp_path / "in.tmx"
+    self.output = tmp_path / "out.tmx"
+    self.tmx = create_tmx(
+      header=create_header(creationtool="tool", creationtoolversion="1.0", srclang="en"),
+      body=[
+        create_tu(
+          tuid=str(i),
+          variants=[create_tuv("en", content=[f"text {i}"]), create_tuv("fr", content=["texte"])],
+        )
+        for i in range(10)
+      ],
+    )
+    save(self.tmx, self.path)
+
+  def test_write(self):
+    count = (
+      Pipeline(self.path, backend=self.backend)
+      .filter(lambda tu: int(tu.tuid) % 2 == 0)
+      .map(_upper)
+      .write(self.output)
+    )
+    assert count == 5
+    result = load(self.output)
+    assert result.header == self.tmx.header
+    assert [tu.tuid for tu in result.body] == ["0", "2", "4", "6", "8"]
+    assert result.body[1].variants[0].content == ["TEXT 2"]
+
+  @pytest.mark.parametrize("encoding", ["utf-16", "latin-1"])
+  def test_write_encoding(self, encoding):
+    assert Pipeline(self.path, backend=self.backend).write(self.output, encoding=encoding) == 10
+    assert self.output.read_bytes().count("<?xml".encode(encoding)) == 1
+    assert load(self.output, encoding=encoding) == self.tmx
+
+  def test_iterate(self):
+    tus = list(Pipeline(self.path, backend=self.backend))
+    assert tus == self.tmx.body
+
+  def test_flat_map_batch_and_tee(self):
+    seen = []
+    batches = []
+
+    def split(tu: Tu) -> list[Tu]:
+      return [create_tu(tuid=f"{tu.tuid}-{tuv.lang}", variants=[tuv]) for tuv in tu.variants]
+
+    def keep_first_of_batch(tus: list[Tu]) -> list[Tu]:
+      batches.append(len(tus))
+      return tus[:1]
+
+    pipeline = (
+      Pipeline(self.path, backend=self.backend)
+      .flat_map(split)
+      .tee(lambda tu: seen.append(tu.tuid))
+      .batch(keep_first_of_batch, 3)
+    )
+    assert [tu.tuid for tu in pipeline] == ["0-en", "1-fr", "3-en", "4-fr", "6-en", "7-fr", "9-en"]
+    assert len(seen) == 20
+    assert batches == [3, 3, 3, 3, 3, 3, 2]
+
+  @pytest.mark.parametrize("workers", [1, 3])
+  def test_parallel_map(self, workers):
+    threads = set()
+
+    def record(tu: Tu) -> Tu:
+      threads.add(threading.current_thread().name)
+      return _upper(tu)
+
+    tus = list(Pipeline(self.path, backend=self.backend, workers=2).map(record, workers=workers))
+    assert [tu.tuid for tu in tus] == [str(i) for i in range(10)]
+    assert tus[3].variants[0].content == ["TEXT 3"]
+    assert all(name.startswith("hypomnema") for name in threads)
+
+  def test_stats(self):
+    pipeline = Pipeline(self.path, backend=self.backend)
+    pipeline.filter(lambda tu: tu.tuid != "0", name="drop-zero").map(_upper)
+    pipeline.write(self.output)
+    assert [(s.name, s.items_in, s.items_out) for s in pipeline.stats] == [
+      ("read", 10, 10),
+      ("drop-zero", 10, 9),
+      ("map:_upper", 9, 9),
+      ("write", 9, 9),
+    ]
+    assert all(s.seconds > 0 and s.throughput > 0 for s in pipeline.stats)
+
+    pipeline.run()
+    assert pipeline.stats[1] == StageStats("drop-zero", 10, 9, pipeline.stats[1].seconds)
+    assert pipeline.writer.items_in == 0
+
+  def test_explicit_header(self):
+    header = create_header(creationtool="other", creationtoolversion="2.0", srclang="fr")
+    Pipeline(self.path, backend=self.backend).write(self.output, header=header)
+    assert load(self.output).header == header
+
+  def test_empty_output(self):
+    assert (
+      Pipeline(self.path, backend=self.backend).filter(lambda tu: False).write(self.output) == 0
+    )
+    result = load(self.output)
+    assert result.header == self.tmx.header
+    assert result.body == []
+
+
+class TestPipelineError:
+  def test_write_to_input_file(self, tmp_path):
+    path = tmp_path / "in.tmx"
+    save(create_tmx(header=create_header()), path)
+    with pytest.raises(ValueError, match="Cannot write a pipeline to its input file"):
+      Pipeline(path).write(path)
+
+  def test_missing_input_file(self, tmp_path):
+    with pytest.raises(FileNotFoundError):
+      Pipeline(tmp_path / "missing.tmx").run()
+
+  def test_stage_error_is_raised(self, tmp_path):
+    path = tmp_path / "in.tmx"
+    save(create_tmx(header=create_header(), body=[create_tu(tuid="1")]), path)
+
+    def fail(tu):
+      raise RuntimeError(tu.tuid)
+
+    with pytest.raises(RuntimeError, match="1"):
+      Pipeline(path).map(fail, workers=2).run()
+
+  def test_stage_error_keeps_output(self, tmp_path):
+    path = tmp_path / "in.tmx"
+    output = tmp_path / "out.tmx"
+    save(create_tmx(header=create_header(), body=[create_tu(tuid="1"), create_tu(tuid="2")]), path)
+    output.write_bytes(b"old")
+
+    def fail(tu):
+      if tu.tuid == "2":
+        raise RuntimeError(tu.tuid)
+      return tu
+
+    with pytest.raises(RuntimeError, match="2"):
+      Pipeline(path).map(fail).write(output)
+    assert output.read_bytes() == b"old"
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["in.tmx", "out.tmx"]
+
+  @pytest.mark.parametrize(
+    "add_stage",
+    [lambda p: p.map(_upper, workers=0), lambda p: p.batch(list, 0)],
+    ids=["workers", "size"],
+  )
+  def test_invalid_arguments(self, tmp_path, add_stage):
+    with pytest.raises(ValueError, match="must be at least 1"):
+      add_stage(Pipeline(tmp_path / "in.tmx"))
@@ -0,0 +1,68 @@
+import pytest
+from hypomnema.api.helpers import create_bpt, create_ept, create_hi, create_it, create_ph
+from hypomnema.api.helpers import create_sub, create_tuv
+from hypomnema.api.text import TextProjector, to_text
+from hypomnema.base.types import Pos
+from hypomnema.xml.serialization.serializer import Serializer
+
+
+def make_tuv():
+  return create_tuv(
+    "en",
+    content=[
+      "Click ",
+      create_bpt(i=1, content=["<a title='", create_sub(content=["Home"]), "'>"]),
+      "here",
+      create_ept(i=1, content=["</a>"]),
+      create_hi(content=[" now", create_ph(x=3, content=["<br/>"]), "!"]),
+      create_it(pos=Pos.BEGIN, content=["<i>"]),
+      ".",
+    ],
+  )
+
+
+EXPECTED = {
+  "strip": "Click here now!.",
+  "placeholder": "Click {bpt1}here{ept1} now{ph3}!{it}.",
+  "native": "Click <a title='Home'>here</a> now<br/>!<i>.",
+}
+
+
+class TestTextProjectorHappy:
+  @pytest.mark.parametrize("mode", EXPECTED)
+  def test_project(self, mode):
+    assert TextProjector(mode).project(make_tuv()) == EXPECTED[mode]
+    assert to_text(make_tuv().content, mode) == EXPECTED[mode]
+
+  @pytest.mark.parametrize("mode", EXPECTED)
+  def test_project_element(self, backend, mode):
+    seg = next(backend.iter_children(Serializer(backend).serialize(make_tuv())))
+    assert TextProjector(mode).project_element(backend, seg) == EXPECTED[mode]
+
+  def test_custom_placeholder(self):
+    projector = TextProjector("placeholder", placeholder=lambda tag, ident: f"<{tag}>")
+    assert projector.project(make_tuv()) == "Click <bpt>here<ept> now<ph>!<it>."
+
+  def test_batch(self, backend):
+    projector = TextProjector()
+    tuvs = [make_tuv(), create_tuv("fr", content=["Bonjour"])]
+    assert projector.project_many(tuvs) == [EXPECTED["strip"], "Bonjour"]
+    serializer = Serializer(backend)
+    segs = [next(backend.iter_children(serializer.serialize(tuv))) for tuv in tuvs]
+    assert projector.project_elements(backend, segs) == [EXPECTED["strip"], "Bonjour"]
+
+  def test_deep_nesting(self):
+    content: list = ["end"]
+    for _ in range(5000):
+      content = [create_hi(content=content)]
+    assert to_text(content) == "end"
+
+
+class TestTextProjectorError:
+  def test_unknown_mode(self):
+    with pytest.raises(ValueError, match="Unknown text mode 'html'"):
+      TextProjector("html")  # type: ignore[arg-type]
+
+  def test_unexpected_item(self):
+    with pytest.raises(TypeError, match="Unexpected item in content: int"):
+      to_text([1])  # type: ignore[list-item]
@@ -0,0 +1,149 @@
+import tracemalloc
+from datetime import UTC, datetime, timedelta, timezone
+import pytest
+from hypomnema.api import load, save
+from hypomnema.api.helpers import create_bpt, create_ept, create_header, create_hi, create_it
+from hypomnema.api.helpers import create_note, create_ph, create_prop, create_sub, create_tmx
+from hypomnema.api.helpers import create_tu, create_tuv
+from hypomnema.base.compact import CompactTuStore
+from hypomnema.base.types import Assoc, Pos, Segtype, Tu
+from hypomnema.xml.deserialization.deserializer import Deserializer
+from hypomnema.xml.serialization.serializer import Serializer
+
+
+def make_tu(i=0):
+  return create_tu(
+    tuid=f"tu{i}",
+    srclang="en",
+    segtype=Segtype.SENTENCE,
+    usagecount=0,
+    creationdate=datetime(2025, 1, 1, 12, tzinfo=UTC),
+    changedate=datetime(2025, 2, 1, 8, 30, tzinfo=timezone(timedelta(hours=-5))),
+    lastusagedate=datetime(1960, 5, 4, 3, 2, 1, 999),
+    props=[create_prop("legal", "x-domain", lang="en")],
+    notes=[create_note("a note")],
+    variants=[
+      create_tuv(
+        "en",
+        usagecount=12,
+        props=[create_prop("v", "x-variant")],
+        content=[
+          f"Click {i} ",
+          create_bpt(i=1, x=2, content=["<a title='", create_sub(content=["Home"]), "'>"]),
+          "here",
+          create_ept(i=1, content=["</a>"]),
+          create_hi(
+            type="bold", content=[" now", create_ph(assoc=Assoc.P, content=["<br/>"]), "!"]
+          ),
+          create_it(pos=Pos.BEGIN, content=["<i>"]),
+        ],
+      ),
+      create_tuv("fr", content=[f"Cliquez {i}"], notes=[create_note("n", lang="fr")]),
+    ],
+  )
+
+
+def make_plain_tu(i=0):
+  date = datetime(2024, 1, 1, tzinfo=UTC)
+  return create_tu(
+    tuid=str(i),
+    creationdate=date,
+    creationid="user",
+    variants=[
+      create_tuv("en-US", creationdate=date, content=[f"This is source sentence number {i}."]),
+      create_tuv("fr-FR", creationdate=date, content=[f"Ceci est la phrase source numéro {i}."]),
+    ],
+  )
+
+
+class TestCompactTuStoreHappy:
+  def test_roundtrip(self):
+    tus = [create_tu(usagecount=-1), create_tu(variants=[create_tuv("de")])]
+    tus += [make_tu(i) for i in range(3)] + [create_tu()]
+    store = CompactTuStore(tus)
+    assert len(store) == 6
+    assert list(store) == tus
+    assert store[1] == tus[1]
+    assert store[-1] == tus[-1]
+    assert store[1:4] == tus[1:4]
+    assert store[0].usagecount == -1
+    assert store[::-2] == tus[::-2]
+
+  def test_dates_keep_instant_and_offset(self):
+    tu = CompactTuStore([make_tu()])[0]
+    assert tu.creationdate is not None and tu.creationdate.tzinfo is UTC
+    assert tu.changedate is not None
+    assert tu.changedate.utcoffset() == timedelta(hours=-5)
+    assert tu.changedate.hour == 8
+    assert tu.lastusagedate == datetime(1960, 5, 4, 3, 2, 1, 999)
+    assert tu.lastusagedate.tzinfo is None
+
+  def test_items_are_new_objects(self):
+    store = CompactTuStore([make_tu()])
+    first = store[0]
+    first.variants[0].content.append("changed")
+    assert store[0] == make_tu()
+    assert store[0] is not store[0]
+
+  def test_append_and_extend(self):
+    store = CompactTuStore()
+    store.append(make_tu(0))
+    store.extend(make_tu(i) for i in range(1, 4))
+    assert [tu.tuid for tu in store] == ["tu0", "tu1", "tu2", "tu3"]
+
+  def test_values_are_shared(self):
+    store = CompactTuStore([make_tu(i) for i in range(10)])
+    assert store[0].variants[0].lang is store[9].variants[0].lang
+
+  def test_as_tmx_body(self, backend):
+    store = CompactTuStore([make_tu(i) for i in range(3)])
+    tmx = create_tmx(header=create_header(creationtoolversion="1.0"), body=store)
+    element = Serializer(backend).serialize(tmx)
+    loaded = Deserializer(backend).deserialize(element)
+    assert loaded.body == list(store)  # type: ignore[union-attr]
+
+  @pytest.mark.parametrize("make", [make_tu, make_plain_tu], ids=["markup", "plain"])
+  def test_memory_is_lower(self, tmp_path, make):
+    path = tmp_path / "large.tmx"
+    header = create_header(creationtoolversion="1.0")
+    save(create_tmx(header=header, body=[make(i) for i in range(2000)]), path)
+    tracemalloc.start()
+    try:
+      before = tracemalloc.get_traced_memory()[0]
+      tus = load(path).body
+      objects = tracemalloc.get_traced_memory()[0] - before
+      before = tracemalloc.get_traced_memory()[0]
+      store = CompactTuStore(tus)
+      compact = tracemalloc.get_traced_memory()[0] - before
+    finally:
+      tracemalloc.stop()
+    assert len(store) == 2000
+    assert compact * 5 < objects
+    assert 0 < store.nbytes < objects
+
+
+class TestCompactTuStoreError:
+  def test_index_out_of_range(self):
+    store = CompactTuStore([make_tu()])
+    with pytest.raises(IndexError, match="CompactTuStore index out of range"):
+      store[1]
+    with pytest.raises(IndexError):
+      store[-2]
+
+  def test_not_a_tu(self):
+    with pytest.raises(TypeError, match="Expected a Tu, got Tuv"):
+      CompactTuStore().append(create_tuv("en"))  # type: ignore[arg-type]
+
+  def test_unknown_content(self):
+    tu = create_tu(variants=[create_tuv("en", content=[object()])])  # type: ignore[list-item]
+    store = CompactTuStore([make_tu()])
+    with pytest.raises(TypeError, match="Cannot store object in a CompactTuStore"):
+      store.append(tu)
+    store.append(make_tu(1))
+    assert list(store) == [make_tu(), make_tu(1)]
+
+  def test_is_read_only(self):
+    store = CompactTuStore([make_tu()])
+    assert isinstance(store[0], Tu)
+    assert not hasattr(store, "__setitem__")
+    assert repr(store) == "CompactTuStore(<1 units>)"
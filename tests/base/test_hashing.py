@@ -0,0 +1,137 @@
+from datetime import UTC, datetime, timedelta, timezone
+import pytest
+from hypomnema.base.hashing import DATE_FIELDS, digest, DigestCache
+from hypomnema.base.types import Segtype
+from hypomnema.api.helpers import (
+  create_bpt,
+  create_ept,
+  create_hi,
+  create_note,
+  create_prop,
+  create_sub,
+  create_tu,
+  create_tuv,
+)
+
+
+def make_tu(**kwargs):
+  return create_tu(
+    tuid=kwargs.get("tuid", "tu1"),
+    srclang="en",
+    segtype=Segtype.SENTENCE,
+    creationdate=kwargs.get("creationdate", datetime(2025, 1, 1, tzinfo=UTC)),
+    props=[create_prop("x-domain", "legal")],
+    notes=[create_note("a note")],
+    variants=[
+      create_tuv(
+        "en",
+        content=[
+          "Click ",
+          create_bpt(i=1, content=["<b>"]),
+          "here",
+          create_ept(i=1, content=["</b>"]),
+        ],
+      ),
+      create_tuv("fr", content=kwargs.get("fr_content", ["Cliquez ici"])),
+    ],
+  )
+
+
+class TestDigestHappy:
+  def test_equal_elements_have_equal_digests(self):
+    tu1, tu2 = make_tu(), make_tu()
+    assert tu1 == tu2
+    assert tu1 is not tu2
+    assert digest(tu1) == digest(tu2)
+
+  def test_different_content_changes_digest(self):
+    assert digest(make_tu()) != digest(make_tu(fr_content=["Cliquez là"]))
+
+  def test_digest_is_usable_as_set_member(self):
+    keys = {digest(make_tu()), digest(make_tu()), digest(make_tu(tuid="tu2"))}
+    assert len(keys) == 2
+
+  def test_exclude_fields(self):
+    tu1 = make_tu(tuid="a", creationdate=datetime(2020, 1, 1, tzinfo=UTC))
+    tu2 = make_tu(tuid="b", creationdate=datetime(2021, 1, 1, tzinfo=UTC))
+    assert digest(tu1) != digest(tu2)
+    assert digest(tu1, exclude=DATE_FIELDS | {"tuid"}) == digest(
+      tu2, exclude=DATE_FIELDS | {"tuid"}
+    )
+
+  def test_same_instant_in_different_timezones(self):
+    utc = make_tu(creationdate=datetime(2025, 1, 1, 12, tzinfo=UTC))
+    cet = make_tu(creationdate=datetime(2025, 1, 1, 13, tzinfo=timezone(timedelta(hours=1))))
+    assert utc == cet
+    assert digest(utc) == digest(cet)
+
+  def test_strenum_hashes_like_its_value(self):
+    tu1 = make_tu()
+    tu2 = make_tu()
+    tu2.segtype = "sentence"  # type: ignore[assignment]
+    assert tu1 == tu2
+    assert digest(tu1) == digest(tu2)
+
+  def test_text_boundaries_are_unambiguous(self):
+    a = create_tuv("en", content=["ab", "c"])
+    b = create_tuv("en", content=["a", "bc"])
+    assert digest(a) != digest(b)
+
+  def test_none_and_empty_string_differ(self):
+    assert digest(create_tuv("en", datatype=None)) != digest(create_tuv("en", datatype=""))
+
+  def test_element_type_is_part_of_digest(self):
+    assert digest(create_hi(content=["x"])) != digest(create_sub(content=["x"]))
+
+  def test_digest_size(self):
+    assert len(digest(make_tu())) == 16
+    assert len(digest(make_tu(), digest_size=32)) == 32
+
+  def test_deep_nesting_does_not_recurse(self):
+    node = create_hi(content=["leaf"])
+    for _ in range(5000):
+      node = create_hi(content=[node])
+    assert len(digest(node)) == 16
+
+
+class TestDigestError:
+  def test_undigestable_value(self):
+    tuv = create_tuv("en", content=[1.5])  # type: ignore[list-item]
+    with pytest.raises(TypeError, match="Cannot digest value"):
+      digest(tuv)
+
+
+class TestDigestCache:
+  def test_get_caches_digest(self, mocker):
+    spy = mocker.spy(DigestCache, "refresh")
+    cache = DigestCache()
+    tu = make_tu()
+    first = cache.get(tu)
+    second = cache.get(tu)
+    assert first == second == digest(tu)
+    assert spy.call_count == 1
+    assert tu in cache
+    assert len(cache) == 1
+
+  def test_stale_until_refreshed(self):
+    cache = DigestCache()
+    tu = make_tu()
+    before = cache.get(tu)
+    tu.tuid = "changed"
+    assert cache.get(tu) == before
+    assert cache.refresh(tu) == digest(tu) != before
+
+  def test_invalidate(self):
+    cache = DigestCache(exclude=DATE_FIELDS)
+    tu1, tu2 = make_tu(), make_tu()
+    cache.get(tu1)
+    cache.get(tu2)
+    cache.invalidate(tu1)
+    assert tu1 not in cache
+    assert tu2 in cache
+    cache.invalidate()
+    assert len(cache) == 0
+
+  def test_exclude_is_forwarded(self):
+    cache = DigestCache(exclude={"tuid"})
+    assert cache.get(make_tu(tuid="a")) == cache.get(make_tu(tuid="b"))
@@ -0,0 +1,35 @@
+import pytest
+from hypomnema.base.languages import language_matches, normalize_language_tag
+
+
+class TestNormalizeLanguageTag:
+  @pytest.mark.parametrize(
+    "tag, expected",
+    [
+      ("EN", "en"),
+      ("en_us", "en-US"),
+      ("zh-hant-tw", "zh-Hant-TW"),
+      ("es-419", "es-419"),
+      ("SR_LATN_rs", "sr-Latn-RS"),
+      ("de-CH-x-phonebk", "de-CH-x-phonebk"),
+      ("en-US-u-ca-gregory", "en-US-u-ca-gregory"),
+    ],
+  )
+  def test_normalize(self, tag, expected):
+    assert normalize_language_tag(tag) == expected
+
+
+class TestLanguageMatches:
+  @pytest.mark.parametrize(
+    "tag, language_range",
+    [("en", "en"), ("en-US", "en"), ("EN_gb", "en"), ("zh-Hant-TW", "zh-hant"), ("fr", "*")],
+  )
+  def test_matches(self, tag, language_range):
+    assert language_matches(tag, language_range)
+
+  @pytest.mark.parametrize(
+    "tag, language_range",
+    [("en", "en-US"), ("eng", "en"), ("fr-CA", "en"), (None, "en"), (None, "*")],
+  )
+  def test_does_not_match(self, tag, language_range):
+    assert not language_matches(tag, language_range)
@@ -1,6 +1,8 @@
 import logging
 from tests.strict_backend import StrictBackend
 import pytest
+from hypomnema.api.helpers import create_header, create_tmx, create_tu, create_tuv
+from hypomnema.base.types import Tmx
 from hypomnema.xml.backends.standard import StandardBackend
 from hypomnema.xml.backends.lxml import LxmlBackend
 
@@ -27,3 +29,19 @@ def test_logger():
   test_logger = logging.getLogger("test")
   test_logger.setLevel(1)
   return test_logger
+
+
+@pytest.fixture
+def make_tmx():
+  """Factory fixture building a Tmx whose ``count`` TUs each hold one "en" variant."""
+
+  def _make_tmx(count: int) -> Tmx:
+    return create_tmx(
+      header=create_header(creationtool="tool", creationtoolversion="1.0", srclang="en"),
+      body=[
+        create_tu(tuid=str(i), variants=[create_tuv("en", content=[f"text {i}"])])
+        for i in range(count)
+      ],
+    )
+
+  return _make_tmx
@@ -0,0 +1,11 @@
+import logging
+
+from hypomnema.xml.policy import DeserializationPolicy, PolicyValue
+
+
+def make_policy(**behaviors: str) -> DeserializationPolicy:
+  """A default DeserializationPolicy with the given behaviors, logged at DEBUG level."""
+  policy = DeserializationPolicy()
+  for name, behavior in behaviors.items():
+    setattr(policy, name, PolicyValue(behavior, logging.DEBUG))
+  return policy
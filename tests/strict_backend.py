@@ -120,10 +120,13 @@ class StrictBackend(XmlBackend[int]):
       elem, encoding=normalize_encoding(encoding), xml_declaration=False, short_empty_elements=False
     )
 
-  def iterparse(self, path, tag_filter=None, *, nsmap=None):
+  def iterparse(self, path, tag_filter=None, *, nsmap=None, keep_yielded=1):
+    if keep_yielded < 1:
+      raise ValueError(f"keep_yielded must be at least 1, got {keep_yielded}")
     tags = prep_tag_set(tag_filter, nsmap if nsmap is not None else self._global_nsmap)
     context = et.iterparse(path, events=("start", "end"))
     pending_yield_stack = []
+    pending_clear = []
 
     for event, elem in context:
       if event == "start":
@@ -138,6 +141,13 @@ class StrictBackend(XmlBackend[int]):
       if elem is pending_yield_stack[-1]:
         pending_yield_stack.pop()
         yield self._register(elem)
+        if not pending_yield_stack and keep_yielded > 1:
+          pending_clear.append(elem)
+          if len(pending_clear) >= keep_yielded:
+            for pending in pending_clear:
+              pending.clear()
+            pending_clear.clear()
+          continue
 
       if not pending_yield_stack:
         self.clear(elem)
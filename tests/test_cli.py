@@ -0,0 +1,188 @@
+import json
+
+import pytest
+from hypomnema.api import load, save
+from hypomnema.api.helpers import create_header, create_prop, create_tmx, create_tu, create_tuv
+from hypomnema.cli import main
+
+
+def _tmx(count=3, tool="tool"):
+  return create_tmx(
+    header=create_header(creationtool=tool, creationtoolversion="1.0", srclang="en"),
+    body=[
+      create_tu(
+        tuid=str(i),
+        props=[create_prop("legal" if i % 2 else "it", "x-domain")],
+        variants=[
+          create_tuv("en-US", content=[f"Hello\tworld {i}"]),
+          create_tuv("fr", content=["Bonjour"]),
+          *([create_tuv("de", content=["Hallo"])] if i % 3 == 0 else []),
+        ],
+      )
+      for i in range(count)
+    ],
+  )
+
+
+@pytest.fixture
+def tmx_file(tmp_path):
+  path = tmp_path / "memory.tmx"
+  save(_tmx(), path)
+  return path
+
+
+@pytest.fixture
+def other_file(tmp_path):
+  path = tmp_path / "other" / "second.tmx"
+  save(_tmx(2, tool="other"), path)
+  return path
+
+
+class TestValidateCommandHappy:
+  def test_valid(self, tmx_file, other_file, capsys):
+    assert main(["validate", "-j", "2", str(tmx_file), str(other_file)]) == 0
+    assert capsys.readouterr().out == ""
+
+  def test_problems(self, tmp_path, capsys):
+    path = tmp_path / "bad.tmx"
+    path.write_text(
+      '<tmx version="1.4"><header/><body><tu><tuv><seg>a</seg></tuv></tu></body></tmx>'
+    )
+    assert main(["validate", str(path)]) == 1
+    captured = capsys.readouterr()
+    assert f"{path}:1:" in captured.out
+    assert "problems found" in captured.err
+
+
+class TestStatsCommandHappy:
+  def test_table(self, tmx_file, capsys):
+    assert main(["stats", str(tmx_file)]) == 0
+    output = capsys.readouterr().out
+    assert "TUs" in output and " 3\n" in output
+    assert "en-US" in output and "x-domain" in output
+
+  def test_json(self, tmx_file, capsys):
+    assert main(["stats", "--json", "-j", "2", str(tmx_file), str(tmx_file)]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["files"] == 2
+    assert data["tus"] == 6
+    assert data["languages"]["en-US"]["words"] == 18
+
+  def test_progress(self, tmx_file, capsys):
+    assert main(["stats", "--progress", str(tmx_file)]) == 0
+    assert "1 files in" in capsys.readouterr().err
+
+
+class TestSplitMergeCommandHappy:
+  @pytest.mark.parametrize("backend", ["standard", "lxml"])
+  def test_split(self, tmp_path, backend, capsys):
+    path = tmp_path / "memory.tmx"
+    save(_tmx(5), path)
+    assert (
+      main(["split", str(path), "-n", "2", "-o", str(tmp_path / "parts"), "--backend", backend])
+      == 0
+    )
+    parts = sorted((tmp_path / "parts").iterdir())
+    assert [part.name for part in parts] == [
+      "memory-0001.tmx",
+      "memory-0002.tmx",
+      "memory-0003.tmx",
+    ]
+    loaded = [load(part) for part in parts]
+    assert [[tu.tuid for tu in tmx.body] for tmx in loaded] == [["0", "1"], ["2", "3"], ["4"]]
+    assert all(tmx.header == _tmx().header for tmx in loaded)
+
+  def test_merge(self, tmx_file, other_file, tmp_path, capsys):
+    output = tmp_path / "merged.tmx"
+    assert main(["merge", str(tmx_file), str(other_file), "-o", str(output), "--progress"]) == 0
+    merged = load(output)
+    assert merged.header == _tmx().header
+    assert merged.body == _tmx().body + _tmx(2).body
+    captured = capsys.readouterr()
+    assert f"{output}: 5 TUs" in captured.out
+    assert "5 TUs in" in captured.err
+
+
+class TestConvertCommandHappy:
+  def test_tsv(self, tmx_file, tmp_path):
+    output = tmp_path / "out.tsv"
+    assert main(["convert", str(tmx_file), "-o", str(output), "-l", "en", "-l", "de"]) == 0
+    assert output.read_text(encoding="utf-8") == "en\tde\nHello world 0\tHallo\n"
+
+  def test_jsonl_several_files(self, tmx_file, other_file, tmp_path):
+    output = tmp_path / "out"
+    args = ["convert", "-f", "jsonl", "-j", "2", str(tmx_file), str(other_file), "-o", str(output)]
+    assert main(args) == 0
+    assert sorted(path.name for path in output.iterdir()) == ["memory.jsonl", "second.jsonl"]
+    rows = [json.loads(line) for line in (output / "memory.jsonl").read_text().splitlines()]
+    assert rows[0] == {"tuid": "0", "en-US": "Hello\tworld 0", "fr": "Bonjour", "de": "Hallo"}
+    assert len(rows) == 3
+
+
+class TestFilterCommandHappy:
+  def test_languages(self, tmx_file, tmp_path):
+    output = tmp_path / "out.tmx"
+    assert main(["filter", str(tmx_file), "-o", str(output), "-l", "EN", "-l", "de"]) == 0
+    body = load(output).body
+    assert [tu.tuid for tu in body] == ["0"]
+    assert [tuv.lang for tuv in body[0].variants] == ["en-US", "de"]
+
+  @pytest.mark.parametrize(
+    ("prop", "tuids"), [("x-domain", ["0", "1", "2"]), ("x-domain=it", ["0", "2"])]
+  )
+  def test_props(self, tmx_file, tmp_path, prop, tuids):
+    output = tmp_path / "out.tmx"
+    assert main(["filter", str(tmx_file), "-o", str(output), "-p", prop]) == 0
+    assert [tu.tuid for tu in load(output).body] == tuids
+
+
+class TestReencodeCommandHappy:
+  def test_reencode(self, tmx_file, tmp_path):
+    output = tmp_path / "out.tmx"
+    assert main(["reencode", str(tmx_file), "-o", str(output), "--to", "UTF16"]) == 0
+    assert output.read_bytes().startswith(b"\xff\xfe<\x00?\x00")
+    assert load(output, encoding="utf-16") == load(tmx_file)
+
+
+class TestCommandError:
+  def test_missing_file(self, tmp_path, capsys):
+    assert main(["stats", str(tmp_path / "missing.tmx")]) == 1
+    assert "does not exist" in capsys.readouterr().err
+
+  @pytest.mark.parametrize(
+    ("args", "match"),
+    [
+      (["filter", "-o", "out.tmx"], "at least one --lang or --prop"),
+      (["filter", "-o", "out.tmx", "-p", "=x"], "Invalid --prop"),
+      (["convert", "-o", "out.tsv"], "--lang is required"),
+      (["reencode", "-o", "out.tmx", "--to", "nope"], "Unknown encoding"),
+      (["validate", "-j", "0"], "jobs must be at least 1"),
+    ],
+  )
+  def test_invalid_options(self, tmx_file, tmp_path, capsys, args, match):
+    command, *options = args
+    options = [
+      str(tmp_path / option) if option.startswith("out.") else option for option in options
+    ]
+    assert main([command, str(tmx_file), *options]) == 1
+    assert match in capsys.readouterr().err
+    assert not list(tmp_path.glob("out.*"))
+
+  def test_invalid_jobs(self, tmx_file, capsys):
+    assert main(["stats", str(tmx_file), "-j", "0"]) == 1
+    assert "jobs must be at least 1" in capsys.readouterr().err
+
+  def test_split_invalid_size(self, tmx_file, capsys):
+    assert main(["split", str(tmx_file), "-n", "0"]) == 1
+    assert "--size must be at least 1" in capsys.readouterr().err
+
+  def test_several_files_need_a_directory(self, tmx_file, other_file, tmp_path, capsys):
+    output = tmp_path / "file.tmx"
+    output.touch()
+    assert main(["filter", str(tmx_file), str(other_file), "-o", str(output), "-l", "en"]) == 1
+    assert "must be a directory" in capsys.readouterr().err
+
+  def test_no_command(self):
+    with pytest.raises(SystemExit) as exc_info:
+      main([])
+    assert exc_info.value.code == 2
@@ -0,0 +1,57 @@
+import random
+import threading
+import time
+
+import pytest
+from hypomnema._concurrency import ordered_map
+
+
+class TestOrderedMapHappy:
+  @pytest.mark.parametrize("workers", [1, 2, 8])
+  def test_results_are_in_order(self, workers):
+    def slow_square(x):
+      time.sleep(random.random() / 1000)
+      return x * x
+
+    assert list(ordered_map(slow_square, range(100), workers=workers)) == [
+      x * x for x in range(100)
+    ]
+
+  def test_runs_on_worker_threads(self):
+    names = set(ordered_map(lambda _: threading.current_thread().name, range(10), workers=2))
+    assert all(name.startswith("hypomnema") for name in names)
+
+  @pytest.mark.parametrize("max_pending", [1, 3])
+  def test_pending_items_are_bounded(self, max_pending):
+    pulled = []
+
+    def items():
+      for i in range(10):
+        pulled.append(i)
+        yield i
+
+    results = ordered_map(lambda x: x, items(), workers=2, max_pending=max_pending)
+    assert next(results) == 0
+    assert len(pulled) == max_pending
+    assert list(results) == list(range(1, 10))
+
+  def test_empty(self):
+    assert list(ordered_map(lambda x: x, [], workers=4)) == []
+
+
+class TestOrderedMapError:
+  def test_exception_is_raised_when_due(self):
+    def fail_on_five(x):
+      if x == 5:
+        raise KeyError(x)
+      return x
+
+    results = ordered_map(fail_on_five, range(10), workers=4)
+    assert [next(results) for _ in range(5)] == [0, 1, 2, 3, 4]
+    with pytest.raises(KeyError):
+      next(results)
+
+  @pytest.mark.parametrize("kwargs", [{"workers": 0}, {"workers": 2, "max_pending": 0}])
+  def test_invalid_arguments(self, kwargs):
+    with pytest.raises(ValueError, match="must be at least 1"):
+      ordered_map(lambda x: x, range(3), **kwargs)
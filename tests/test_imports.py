@@ -0,0 +1,94 @@
+import subprocess
+import sys
+
+import pytest
+
+import hypomnema
+import hypomnema.api
+import hypomnema.base
+import hypomnema.xml
+import hypomnema.xml.backends
+
+PACKAGES = [hypomnema, hypomnema.api, hypomnema.base, hypomnema.xml, hypomnema.xml.backends]
+
+
+def _imported_modules(statement: str) -> dict[str, int]:
+  """Run ``statement`` in a fresh interpreter and return the cumulative import time of each module."""
+  result = subprocess.run(
+    [sys.executable, "-X", "importtime", "-c", statement],
+    capture_output=True,
+    text=True,
+    check=True,
+  )
+  modules = {}
+  for line in result.stderr.splitlines():
+    if not line.startswith("import time:") or "|" not in line:
+      continue
+    _, cumulative, name = line.split("|")
+    if cumulative.strip().isdigit():
+      modules[name.strip()] = int(cumulative)
+  return modules
+
+
+class TestLazyImportsHappy:
+  def test_import_does_not_load_backends_or_handlers(self):
+    modules = _imported_modules("import hypomnema")
+    assert "hypomnema.base.types" in modules
+    for name in (
+      "lxml",
+      "lxml.etree",
+      "hypomnema.xml.backends.lxml",
+      "hypomnema.xml.backends.standard",
+      "hypomnema.xml.deserialization",
+      "hypomnema.xml.serialization",
+      "hypomnema.api.core",
+      "hypomnema.base.compact",
+      "unicodedata",
+    ):
+      assert name not in modules
+
+  def test_load_does_not_import_lxml(self):
+    modules = _imported_modules("from hypomnema import load, StandardBackend")
+    assert "hypomnema.xml.backends.standard" in modules
+    assert "hypomnema.xml.serialization.serializer" in modules
+    assert "lxml.etree" not in modules
+    assert "hypomnema.xml.backends.lxml" not in modules
+
+  def test_lxml_backend_is_imported_on_first_use(self):
+    modules = _imported_modules("import hypomnema; hypomnema.LxmlBackend")
+    assert "lxml.etree" in modules
+
+  @pytest.mark.parametrize("package", PACKAGES, ids=lambda package: package.__name__)
+  def test_all_names_are_available(self, package):
+    for name in package.__all__:
+      assert getattr(package, name) is not None
+      assert name in dir(package)
+
+  def test_same_objects_as_submodules(self):
+    from hypomnema.api.core import load
+    from hypomnema.xml.backends.lxml import LxmlBackend
+
+    assert hypomnema.load is load
+    assert hypomnema.api.load is load
+    assert hypomnema.LxmlBackend is LxmlBackend
+    assert hypomnema.xml.LxmlBackend is LxmlBackend
+
+  def test_star_import(self):
+    namespace = {}
+    exec("from hypomnema import *", namespace)
+    assert namespace["ExpatDeserializer"] is hypomnema.ExpatDeserializer
+
+
+class TestLazyImportsError:
+  @pytest.mark.parametrize("package", PACKAGES, ids=lambda package: package.__name__)
+  def test_unknown_attribute(self, package):
+    with pytest.raises(
+      AttributeError, match=f"module '{package.__name__}' has no attribute 'nope'"
+    ):
+      package.nope
+
+  def test_lxml_not_installed(self, monkeypatch):
+    monkeypatch.delitem(hypomnema.xml.backends.__dict__, "LxmlBackend", raising=False)
+    monkeypatch.setitem(sys.modules, "hypomnema.xml.backends.lxml", None)
+    with pytest.warns(UserWarning, match="lxml not installed"):
+      assert hypomnema.xml.backends.LxmlBackend is None
@@ -54,7 +54,7 @@ class MockBackend(XmlBackend):
   def to_bytes(self, element, encoding="utf-8", self_closing=False):
     return b"<element></element>"
 
-  def iterparse(self, path, tag_filter=None, *, nsmap=None):
+  def iterparse(self, path, tag_filter=None, *, nsmap=None, keep_yielded=1):
     yield from []
 
 
@@ -146,6 +146,23 @@ class TestBaseXmlBackendHappy:
     assert b"<custom version='2.0'>" in content
     assert b"</custom>" in content
 
+  def test_write_strings(self):
+    """Test write_strings wraps prefix, strings and suffix in the root element."""
+    buffer = BytesIO()
+    count = self.backend.write_strings(
+      buffer,
+      iter(["<a/>", "<b/>", "<c/>"]),
+      "utf-16",
+      prefix="<head/><body>",
+      suffix="</body>",
+      max_number_of_strings_in_buffer=2,
+      write_doctype=False,
+    )
+    assert count == 3
+    assert buffer.getvalue().decode("utf-16") == (
+      '<?xml version="1.0" encoding="utf-16"?>\n<element><head/><body><a/><b/><c/></body></element>'
+    )
+
 
 class TestBaseXmlBackendError:
   """Tests for error conditions in XmlBackend methods."""
@@ -200,3 +217,9 @@ class TestBaseXmlBackendError:
 
     with pytest.raises(ValueError, match="Cannot find closing tag"):
       self.backend.iterwrite(BytesIO(), [], root_elem="bad_root")
+
+  def test_write_strings_invalid_root_element_no_closing_tag(self):
+    """Test write_strings fails if root has no closing tag."""
+    self.backend.to_string = lambda element, self_closing=False: "<unclosed"
+    with pytest.raises(ValueError, match="Cannot find closing tag"):
+      self.backend.write_strings(BytesIO(), [])
@@ -275,6 +275,13 @@ class TestLxmlXmlBackendHappy:
     result = self.backend.to_bytes(elem, self_closing=False)
     assert b"</root>" in result
 
+  def test_to_string_matches_to_bytes(self):
+    """Test that to_string is the text of to_bytes."""
+    elem = self.backend.create_element("root", attributes={"id": "é"})
+    self.backend.set_text(elem, "Ελληνικά & <b>")
+    assert self.backend.to_string(elem) == self.backend.to_bytes(elem).decode("utf-8")
+    assert self.backend.to_string(self.backend.create_element("root")) == "<root></root>"
+
   def test_write_and_parse_roundtrip(self, tmp_path):
     """Test writing and parsing an XML file."""
     output_file = tmp_path / "test.xml"
@@ -309,6 +316,29 @@ class TestLxmlXmlBackendHappy:
     elements = list(self.backend.iterparse(xml_file))
     assert len(elements) >= 2
 
+  def test_iterparse_keep_yielded(self, tmp_path):
+    """Test that yielded elements are kept intact in groups of keep_yielded."""
+    xml_file = tmp_path / "test.xml"
+    children = "".join(f"<child>{i}</child>" for i in range(5))
+    xml_file.write_text(f'<?xml version="1.0"?><root>{children}</root>')
+
+    elements = self.backend.iterparse(xml_file, tag_filter="child", keep_yielded=2)
+    first, second = next(elements), next(elements)
+    assert [self.backend.get_text(e) for e in (first, second)] == ["0", "1"]
+    third = next(elements)
+    assert self.backend.get_text(first) is None
+    assert self.backend.get_text(second) is None
+    fourth = next(elements)
+    assert [self.backend.get_text(e) for e in (third, fourth)] == ["2", "3"]
+    assert [self.backend.get_text(e) for e in elements] == ["4"]
+
+  def test_iterparse_keep_yielded_invalid(self, tmp_path):
+    """Test that keep_yielded must be positive."""
+    xml_file = tmp_path / "test.xml"
+    xml_file.write_text('<?xml version="1.0"?><root><child/></root>')
+    with pytest.raises(ValueError, match="keep_yielded must be at least 1"):
+      list(self.backend.iterparse(xml_file, keep_yielded=0))
+
 
 class TestLxmlXmlBackendError:
   """Tests for error conditions in LxmlBackend methods."""
@@ -402,6 +432,11 @@ class TestLxmlXmlBackendError:
     with pytest.raises(TypeError, match="Element is not an lxml.etree._Element"):
       self.backend.to_bytes("not_an_element")
 
+  def test_to_string_invalid_element(self):
+    """Test that invalid element type raises TypeError."""
+    with pytest.raises(TypeError, match="Element is not an lxml.etree._Element"):
+      self.backend.to_string("not_an_element")
+
   def test_write_invalid_element(self):
     """Test that invalid element type raises TypeError."""
     with pytest.raises(TypeError, match="Element is not an lxml.etree._Element"):
@@ -1,5 +1,6 @@
 import logging
 import pytest
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
 from hypomnema.xml.utils import (
   normalize_encoding,
@@ -9,6 +10,8 @@ from hypomnema.xml.utils import (
   make_usable_path,
   is_ncname,
   QName,
+  parse_datetime,
+  format_datetime,
 )
 from hypomnema.xml.policy import SerializationPolicy, DeserializationPolicy, PolicyValue
 from hypomnema.base.errors import XmlSerializationError, InvalidTagError
@@ -121,6 +124,20 @@ class TestIsNcnameHappy:
     """Test NCName with mixed valid characters."""
     assert is_ncname("_my-element.name123") is True
 
+  def test_is_ncname_unicode_name_chars(self):
+    """Test NCName with non-ASCII NameChars after the first character."""
+    assert is_ncname("a\u00b7b") is True
+    assert is_ncname("e\u0301t\u203fe") is True
+    assert is_ncname("\u65e5\u672c\u8a9e") is True
+    assert is_ncname("\U00010400x") is True
+
+  def test_is_ncname_is_cached(self):
+    """Test that validated names are memoized."""
+    is_ncname.cache_clear()
+    assert is_ncname("cached") is True
+    assert is_ncname("cached") is True
+    assert is_ncname.cache_info().hits == 1
+
 
 class TestIsNcnameError:
   """Tests for invalid NCName detection."""
@@ -153,6 +170,18 @@ class TestIsNcnameError:
     """Test that NCName cannot contain space."""
     assert is_ncname("my element") is False
 
+  def test_is_ncname_invalid_unicode(self):
+    """Test non-ASCII characters outside the NCName production."""
+    assert is_ncname("\u00b7element") is False
+    assert is_ncname("\u0301element") is False
+    assert is_ncname("\u00d7") is False
+    assert is_ncname("my\u00a0element") is False
+
+  def test_is_ncname_trailing_newline(self):
+    """Test that a trailing newline is not accepted."""
+    assert is_ncname("element\n") is False
+    assert is_ncname("\u00e9l\u00e9ment\n") is False
+
 
 class TestQNameHappy:
   """Tests for successful QName creation and operations."""
@@ -488,3 +517,45 @@ class TestCheckTagError:
     policy = DeserializationPolicy(invalid_tag=PolicyValue("raise", logging.DEBUG))
     with pytest.raises(InvalidTagError, match="expected expected, got wrong"):
       check_tag("wrong", "expected", self.logger, policy)
+
+
+class TestDatetimeCachesHappy:
+  """Tests for the memoized datetime parsing and formatting."""
+
+  def test_parse_datetime(self):
+    """Test parsing returns the same value as fromisoformat."""
+    assert parse_datetime("2025-01-02T03:04:05Z") == datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+  def test_parse_datetime_shares_objects(self):
+    """Test equal strings parse to the same object."""
+    first = parse_datetime("".join(["2024-05-06T07:08:09", "Z"]))
+    second = parse_datetime("".join(["2024-05-06T07:08:09", "Z"]))
+    assert first is second
+
+  def test_format_datetime(self):
+    """Test formatting returns the same value as isoformat."""
+    dt = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+    assert format_datetime(dt) == dt.isoformat()
+
+  def test_format_datetime_keeps_offset(self):
+    """Test equal instants with different offsets keep their own representation."""
+    utc = datetime(2025, 1, 1, 12, tzinfo=UTC)
+    cet = datetime(2025, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+    assert utc == cet
+    assert format_datetime(utc) == "2025-01-01T12:00:00+00:00"
+    assert format_datetime(cet) == "2025-01-01T13:00:00+01:00"
+
+  def test_format_naive_datetime(self):
+    """Test naive datetimes are formatted without offset."""
+    assert format_datetime(datetime(2025, 1, 1)) == "2025-01-01T00:00:00"
+
+
+class TestDatetimeCachesError:
+  """Tests for invalid datetime strings."""
+
+  def test_parse_invalid_datetime(self):
+    """Test invalid strings raise and are not cached."""
+    with pytest.raises(ValueError):
+      parse_datetime("not-a-date")
+    with pytest.raises(ValueError):
+      parse_datetime("not-a-date")
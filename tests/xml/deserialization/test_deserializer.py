@@ -2,8 +2,11 @@ import pytest
 import logging
 from hypomnema.xml.deserialization.deserializer import Deserializer
 from hypomnema.xml.policy import DeserializationPolicy, PolicyValue
-from hypomnema.base.errors import MissingHandlerError
-from hypomnema.base.types import Prop
+from hypomnema.base.errors import MissingHandlerError, XmlDeserializationError
+from hypomnema.base.types import Hi, Prop, Sub
+from hypomnema.xml.deserialization._handlers import HiDeserializer
+
+DEPTH = 5000
 
 
 class BaseDeserializerTest:
@@ -56,6 +59,87 @@ class TestDeserializerHappy(BaseDeserializerTest):
     assert result == "mock_obj"
     mock_handler._deserialize.assert_called_once_with(elem)
 
+  def test_deserialize_many(self):
+    elements = []
+    for index in range(3):
+      prop = self.backend.create_element("prop")
+      self.backend.set_attribute(prop, "type", f"t{index}")
+      self.backend.set_text(prop, f"v{index}")
+      elements.append(prop)
+    note = self.backend.create_element("note")
+    self.backend.set_text(note, "n")
+    elements.insert(1, note)
+    spy = self.mocker.spy(self.deserializer, "_resolve_handler")
+
+    objs = self.deserializer.deserialize_many(iter(elements))
+    assert objs == [self.deserializer.deserialize(element) for element in elements]
+    assert [type(obj).__name__ for obj in objs] == ["Prop", "Note", "Prop", "Prop"]
+    assert [call.args[0] for call in spy.call_args_list[:2]] == ["prop", "note"]
+    assert spy.call_count == 2 + len(elements)
+
+  def test_deserialize_many_unknown_tag_ignore(self):
+    self.deserializer.policy.missing_handler = PolicyValue("ignore", logging.DEBUG)
+    prop = self.backend.create_element("prop")
+    self.backend.set_attribute(prop, "type", "t")
+    self.backend.set_text(prop, "v")
+    elements = [
+      self.backend.create_element("unknown"),
+      prop,
+      self.backend.create_element("unknown"),
+    ]
+    assert self.deserializer.deserialize_many(elements) == [None, Prop(text="v", type="t"), None]
+
+  def test_deserialize_many_empty(self):
+    assert self.deserializer.deserialize_many([]) == []
+
+  def make_nested_hi(self, depth):
+    root = current = self.backend.create_element("hi")
+    for level in range(depth):
+      self.backend.set_text(current, str(level))
+      child = self.backend.create_element("hi")
+      self.backend.set_tail(child, "tail")
+      self.backend.append_child(current, child)
+      current = child
+    self.backend.set_text(current, "leaf")
+    return root
+
+  def test_deeply_nested_inline_content(self):
+    obj = self.deserializer.deserialize(self.make_nested_hi(DEPTH))
+    for level in range(DEPTH):
+      assert isinstance(obj, Hi)
+      assert obj.content[0] == str(level)
+      assert obj.content[2] == "tail"
+      obj = obj.content[1]
+    assert obj == Hi(content=["leaf"])
+
+  def test_nested_sub_in_codes(self):
+    bpt = self.backend.create_element("bpt")
+    self.backend.set_attribute(bpt, "i", "1")
+    self.backend.set_text(bpt, "<a href='")
+    sub = self.backend.create_element("sub")
+    self.backend.set_text(sub, "link")
+    self.backend.set_tail(sub, "'>")
+    self.backend.append_child(bpt, sub)
+    obj = self.deserializer.deserialize(bpt)
+    assert obj.content == ["<a href='", Sub(content=["link"]), "'>"]
+
+  def test_overridden_inline_handler_is_used(self):
+    class UpperHiDeserializer(HiDeserializer):
+      def _deserialize(self, element):
+        hi = super()._deserialize(element)
+        hi.type = "custom"
+        return hi
+
+    handlers = self.deserializer._get_default_handlers()
+    handlers["hi"] = UpperHiDeserializer(
+      self.backend, self.deserializer.policy, logging.getLogger()
+    )
+    deserializer = Deserializer(self.backend, handlers=handlers)
+    obj = deserializer.deserialize(self.make_nested_hi(3))
+    while isinstance(obj, Hi):
+      assert obj.type == "custom"
+      obj = obj.content[1] if len(obj.content) > 1 else None
+
 
 class TestDeserializerError(BaseDeserializerTest):
   def test_deserialize_unknown_tag_raise(self):
@@ -68,3 +152,27 @@ class TestDeserializerError(BaseDeserializerTest):
     elem = self.backend.create_element("truly_unknown")
     with pytest.raises(MissingHandlerError, match="Missing handler"):
       self.deserializer.deserialize(elem)
+
+  def test_deserialize_many_unknown_tag_raise(self):
+    self.deserializer.policy.missing_handler = PolicyValue("raise", logging.DEBUG)
+    with pytest.raises(MissingHandlerError, match="Missing handler for <unknown>"):
+      self.deserializer.deserialize_many([self.backend.create_element("unknown")])
+
+  def test_deeply_nested_invalid_child_raise(self):
+    root = current = self.backend.create_element("hi")
+    for _ in range(DEPTH):
+      child = self.backend.create_element("hi")
+      self.backend.append_child(current, child)
+      current = child
+    self.backend.append_child(current, self.backend.create_element("sub"))
+    with pytest.raises(XmlDeserializationError, match="Incorrect child element in hi"):
+      self.deserializer.deserialize(root)
+
+  def test_deeply_nested_empty_content_raise(self):
+    root = current = self.backend.create_element("hi")
+    for _ in range(DEPTH):
+      child = self.backend.create_element("hi")
+      self.backend.append_child(current, child)
+      current = child
+    with pytest.raises(XmlDeserializationError, match="Element <hi> is empty"):
+      self.deserializer.deserialize(root)
@@ -0,0 +1,222 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from xml.parsers.expat import ExpatError
+
+import pytest
+from hypomnema.api import load, save
+from hypomnema.api.helpers import create_bpt, create_ept, create_header, create_hi, create_note
+from hypomnema.api.helpers import create_ph, create_prop, create_sub, create_tmx, create_tu
+from hypomnema.api.helpers import create_tuv
+from hypomnema.base.errors import AttributeDeserializationError, XmlDeserializationError
+from hypomnema.base.types import Header, Tu
+from hypomnema.xml.deserialization.expat import ExpatDeserializer
+from hypomnema.xml.deserialization.interning import AttributeInterner
+from tests.policies import make_policy
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+
+class TestExpatDeserializerHappy:
+  @pytest.fixture(autouse=True)
+  def setup(self, tmp_path):
+    self.path = tmp_path / "test.tmx"
+    date = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    self.tmx = create_tmx(
+      header=create_header(
+        creationtool="tool",
+        creationtoolversion="1.0",
+        srclang="en",
+        creationdate=date,
+        props=[create_prop("x-domain", "IT")],
+        notes=[create_note("header note")],
+      ),
+      body=[
+        create_tu(
+          tuid=str(index),
+          srclang="en",
+          usagecount=index,
+          creationdate=date,
+          notes=[create_note("a note", lang="en")],
+          variants=[
+            create_tuv(
+              "en",
+              content=[
+                "Click ",
+                create_bpt(
+                  i=1, type="bold", content=["<a href='", create_sub(content=["x"]), "'>"]
+                ),
+                "here",
+                create_ept(i=1, content=["</a>"]),
+                " & ",
+                create_hi(type="em", content=["more ", create_ph(x=1, content=["{0}"]), " text"]),
+              ],
+            ),
+            create_tuv("fr", props=[create_prop("x-status", "ok")], content=["Cliquez ici"]),
+          ],
+        )
+        for index in range(5)
+      ],
+    )
+    save(self.tmx, self.path)
+    self.deserializer = ExpatDeserializer()
+
+  def test_parse_matches_load(self):
+    tmx = self.deserializer.parse(self.path)
+    assert tmx == load(self.path)
+    assert tmx == self.tmx
+
+  def test_parse_conformance_file(self):
+    path = DATA_DIR / "standard.tmx"
+    assert self.deserializer.parse(path) == load(path)
+
+  def test_iterparse(self):
+    tus = list(self.deserializer.iterparse(self.path))
+    assert all(isinstance(tu, Tu) for tu in tus)
+    assert tus == list(load(self.path, filter="tu"))
+
+  def test_iterparse_multiple_tags(self):
+    elements = list(self.deserializer.iterparse(self.path, ["header", "tu"]))
+    assert isinstance(elements[0], Header)
+    assert elements == [self.tmx.header, *self.tmx.body]
+
+  def test_iterparse_nested_tags(self):
+    elements = list(self.deserializer.iterparse(self.path, ("tuv", "bpt")))
+    assert elements == list(load(self.path, filter=("tuv", "bpt")))
+
+  def test_small_buffer_size(self):
+    deserializer = ExpatDeserializer(buffer_size=7)
+    assert deserializer.parse(self.path) == self.tmx
+    assert list(deserializer.iterparse(self.path)) == self.tmx.body
+
+  def test_interner(self):
+    tus = list(ExpatDeserializer(interner=AttributeInterner()).iterparse(self.path))
+    assert tus[0].variants[0].lang is tus[1].variants[0].lang
+    assert tus[0].creationdate is tus[1].creationdate
+
+  def test_encoding_override(self, tmp_path):
+    path = tmp_path / "latin.tmx"
+    path.write_bytes(
+      b'<tmx version="1.4"><header creationtool="t" creationtoolversion="1" segtype="block"'
+      b' o-tmf="t" adminlang="en" srclang="en" datatype="plaintext"/><body><tu><tuv xml:lang="fr">'
+      b"<seg>caf\xe9</seg></tuv></tu></body></tmx>"
+    )
+    tmx = ExpatDeserializer(encoding="iso-8859-1").parse(path)
+    assert tmx.body[0].variants[0].content == ["café"]
+
+
+# (document, policy) pairs on which the expat deserializer must behave exactly like ``load``
+_HEADER = (
+  '<header creationtool="t" creationtoolversion="1" segtype="block" o-tmf="t" adminlang="en"'
+  ' srclang="en" datatype="plaintext"/>'
+)
+_CASES = {
+  "invalid_inline_child": ('<seg>a<sub>b</sub>c<bpt i="1">d</bpt>e</seg>', {}),
+  "invalid_inline_child_ignore": (
+    '<seg>a<sub>b</sub>c<bpt i="1">d</bpt>e</seg>',
+    {"invalid_child_element": "ignore"},
+  ),
+  "empty_seg": ("<seg/>", {}),
+  "empty_seg_ignore": ("<seg/>", {"empty_content": "ignore"}),
+  "empty_code_empty": ('<seg>a<ph x="1"/></seg>', {"empty_content": "empty"}),
+  "missing_seg": ("", {}),
+  "missing_seg_empty": ("", {"missing_seg": "empty"}),
+  "multiple_seg": ("<seg>a</seg><seg>b</seg>", {}),
+  "multiple_seg_keep_first": ("<seg>a</seg><seg>b</seg>", {"multiple_seg": "keep_first"}),
+  "multiple_seg_keep_last": ("<seg>a</seg><seg>b</seg>", {"multiple_seg": "keep_last"}),
+  "extra_text": ("text<seg>a</seg>", {}),
+  "extra_text_ignore": ("text<seg>a</seg>", {"extra_text": "ignore"}),
+  "invalid_child": ("<seg>a</seg><foo/>", {}),
+  "missing_required_attribute": ("<seg><bpt>a</bpt></seg>", {}),
+  "missing_required_attribute_ignore": (
+    "<seg><bpt>a</bpt></seg>",
+    {"required_attribute_missing": "ignore"},
+  ),
+  "invalid_int": ('<seg><bpt i="one">a</bpt></seg>', {}),
+  "invalid_enum_ignore": (
+    '<seg><it pos="middle">a</it></seg>',
+    {"invalid_attribute_value": "ignore"},
+  ),
+  "empty_prop": ('<prop type="x"/><seg>a</seg>', {}),
+  "empty_prop_empty": ('<prop type="x"/><seg>a</seg>', {"empty_content": "empty"}),
+  "prop_child_ignore": (
+    '<prop type="x">a<b/>c</prop><seg>a</seg>',
+    {"invalid_child_element": "ignore"},
+  ),
+}
+
+
+class TestExpatDeserializerPolicies:
+  @pytest.mark.parametrize("case", list(_CASES))
+  def test_same_behavior_as_load(self, tmp_path, case):
+    tuv_content, behaviors = _CASES[case]
+    path = tmp_path / "test.tmx"
+    path.write_text(
+      f'<tmx version="1.4">{_HEADER}<body><tu><tuv xml:lang="en">{tuv_content}</tuv></tu>'
+      "</body></tmx>",
+      encoding="utf-8",
+    )
+    policy = make_policy(**behaviors)
+    try:
+      expected = load(path, policy=policy)
+    except Exception as e:
+      with pytest.raises(type(e)) as info:
+        ExpatDeserializer(policy).parse(path)
+      assert str(info.value) == str(e)
+    else:
+      assert ExpatDeserializer(policy).parse(path) == expected
+
+  @pytest.mark.parametrize("behavior", ["raise", "keep_first", "keep_last"])
+  def test_multiple_headers(self, tmp_path, behavior):
+    path = tmp_path / "test.tmx"
+    second = _HEADER.replace('creationtool="t"', 'creationtool="u"')
+    path.write_text(f'<tmx version="1.4">{_HEADER}{second}<body/></tmx>', encoding="utf-8")
+    policy = make_policy(multiple_headers=behavior)
+    if behavior == "raise":
+      with pytest.raises(XmlDeserializationError, match="Multiple <header> elements in <tmx>"):
+        ExpatDeserializer(policy).parse(path)
+    else:
+      assert ExpatDeserializer(policy).parse(path) == load(path, policy=policy)
+
+
+class TestExpatDeserializerError:
+  def test_root_is_not_tmx(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text("<root><tmx/></root>", encoding="utf-8")
+    with pytest.raises(XmlDeserializationError, match="Root element is not a tmx"):
+      ExpatDeserializer().parse(path)
+
+  def test_missing_header(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text('<tmx version="1.4"><body/></tmx>', encoding="utf-8")
+    with pytest.raises(XmlDeserializationError, match="missing a <header>"):
+      ExpatDeserializer().parse(path)
+
+  def test_missing_version(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text(f"<tmx>{_HEADER}<body/></tmx>", encoding="utf-8")
+    with pytest.raises(AttributeDeserializationError, match="'version'"):
+      ExpatDeserializer().parse(path)
+
+  def test_malformed_xml(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text('<tmx version="1.4"><body>', encoding="utf-8")
+    with pytest.raises(ExpatError):
+      list(ExpatDeserializer().iterparse(path))
+
+  def test_unsupported_tag_filter(self, tmp_path):
+    with pytest.raises(ValueError, match="Unsupported tag\\(s\\) in tag_filter: body, seg"):
+      ExpatDeserializer().iterparse(tmp_path / "test.tmx", ["tu", "seg", "body"])
+
+  def test_missing_file(self, tmp_path):
+    with pytest.raises(FileNotFoundError):
+      ExpatDeserializer().parse(tmp_path / "missing.tmx")
+    with pytest.raises(FileNotFoundError):
+      ExpatDeserializer().iterparse(tmp_path / "missing.tmx")
+
+  def test_directory(self, tmp_path):
+    with pytest.raises(IsADirectoryError):
+      ExpatDeserializer().parse(tmp_path)
+
+  def test_invalid_buffer_size(self):
+    with pytest.raises(ValueError, match="buffer_size must be at least 1"):
+      ExpatDeserializer(buffer_size=0)
@@ -0,0 +1,96 @@
+import pytest
+from hypomnema.base.types import Tu
+from hypomnema.xml.deserialization.deserializer import Deserializer
+from hypomnema.xml.deserialization.interning import AttributeInterner
+from hypomnema.xml.policy import DeserializationPolicy
+
+
+class TestAttributeInterner:
+  def test_intern_returns_shared_object(self):
+    interner = AttributeInterner({"xml:lang"})
+    first = interner.intern("xml:lang", "".join(["en-", "US"]))
+    second = interner.intern("xml:lang", "".join(["en-", "US"]))
+    assert first == second == "en-US"
+    assert first is second
+
+  def test_attribute_not_configured(self):
+    interner = AttributeInterner({"xml:lang"})
+    value = "".join(["to", "ol"])
+    assert interner.intern("creationtool", value) is value
+    assert "creationtool" not in interner
+    assert len(interner) == 0
+
+  def test_pool_is_bounded(self):
+    interner = AttributeInterner({"tuid"}, max_size=2)
+    interner.intern("tuid", "a")
+    interner.intern("tuid", "b")
+    assert len(interner) == 2
+    interner.intern("tuid", "c")
+    assert len(interner) == 1
+    assert interner.get("tuid", "a") is None
+    assert interner.get("tuid", "c") == "c"
+
+  def test_get_and_put(self):
+    interner = AttributeInterner({"creationdate"})
+    value = object()
+    assert interner.get("creationdate", "raw") is None
+    assert interner.put("creationdate", "raw", value) is value
+    assert interner.get("creationdate", "raw") is value
+    assert interner.put("changedate", "raw", value) is value
+    assert interner.get("changedate", "raw") is None
+
+  def test_clear(self):
+    interner = AttributeInterner()
+    interner.intern("xml:lang", "en")
+    interner.clear()
+    assert len(interner) == 0
+    assert "xml:lang" in interner
+
+  def test_invalid_max_size(self):
+    with pytest.raises(ValueError, match="max_size must be >= 1"):
+      AttributeInterner(max_size=0)
+
+
+class TestDeserializerInterning:
+  @pytest.fixture(autouse=True)
+  def setup(self, backend):
+    self.backend = backend
+
+  def make_tu(self, tuid):
+    tu = self.backend.create_element("tu")
+    self.backend.set_attribute(tu, "tuid", tuid)
+    for lang in ("en", "fr"):
+      tuv = self.backend.create_element("tuv")
+      self.backend.set_attribute(tuv, "xml:lang", "".join([lang, "-XX"]))
+      self.backend.set_attribute(tuv, "creationtool", "".join(["To", "ol"]))
+      self.backend.set_attribute(
+        tuv, "creationdate", "".join(["2025-01-01T00:00:00", "Z"]), unsafe=True
+      )
+      seg = self.backend.create_element("seg")
+      self.backend.set_text(seg, "text")
+      self.backend.append_child(tuv, seg)
+      self.backend.append_child(tu, tuv)
+    return tu
+
+  def test_values_are_shared_across_elements(self):
+    deserializer = Deserializer(self.backend, DeserializationPolicy(), interner=AttributeInterner())
+    tu1 = deserializer.deserialize(self.make_tu("1"))
+    tu2 = deserializer.deserialize(self.make_tu("2"))
+    assert isinstance(tu1, Tu) and isinstance(tu2, Tu)
+    assert tu1.variants[0].lang is tu2.variants[0].lang
+    assert tu1.variants[0].creationtool is tu2.variants[1].creationtool
+    assert tu1.variants[0].creationdate is tu2.variants[1].creationdate
+    assert tu1.tuid == "1" and tu2.tuid == "2"
+
+  def test_interner_is_shared_by_all_default_handlers(self):
+    interner = AttributeInterner()
+    deserializer = Deserializer(self.backend, DeserializationPolicy(), interner=interner)
+    assert all(handler.interner is interner for handler in deserializer.handlers.values())
+
+  def test_no_interner_by_default(self):
+    deserializer = Deserializer(self.backend, DeserializationPolicy())
+    tu1 = deserializer.deserialize(self.make_tu("1"))
+    tu2 = deserializer.deserialize(self.make_tu("2"))
+    assert isinstance(tu1, Tu) and isinstance(tu2, Tu)
+    assert tu1.variants[0].creationtool == tu2.variants[0].creationtool
+    assert tu1.variants[0].creationtool is not tu2.variants[0].creationtool
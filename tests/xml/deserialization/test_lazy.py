@@ -0,0 +1,145 @@
+import logging
+import pytest
+from hypomnema.api import load, save
+from hypomnema.api.helpers import create_bpt, create_ept, create_header, create_tmx
+from hypomnema.api.helpers import create_tu, create_tuv
+from hypomnema.base.errors import XmlDeserializationError
+from hypomnema.base.types import Bpt, Tu, Tuv
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.deserialization.deserializer import Deserializer
+from hypomnema.xml.deserialization.lazy import LazyContent
+from hypomnema.xml.policy import DeserializationPolicy, PolicyValue
+from hypomnema.xml.serialization.serializer import Serializer
+
+
+class TestLazyContentHappy:
+  @pytest.fixture(autouse=True)
+  def setup(self, mocker, backend):
+    self.mocker = mocker
+    self.backend = backend
+    self.lazy = Deserializer(backend, DeserializationPolicy(), lazy_content=True)
+    self.eager = Deserializer(backend, DeserializationPolicy())
+
+  def make_tuv(self):
+    tuv = self.backend.create_element("tuv")
+    self.backend.set_attribute(tuv, "xml:lang", "en")
+    seg = self.backend.create_element("seg")
+    self.backend.set_text(seg, "Click ")
+    bpt = self.backend.create_element("bpt")
+    self.backend.set_attribute(bpt, "i", "1")
+    self.backend.set_text(bpt, "<b>")
+    self.backend.set_tail(bpt, "here")
+    self.backend.append_child(seg, bpt)
+    self.backend.append_child(tuv, seg)
+    return tuv
+
+  def test_content_is_not_deserialized_until_accessed(self):
+    spy = self.mocker.spy(self.lazy.handlers["bpt"], "_deserialize")
+    tuv = self.lazy.deserialize(self.make_tuv())
+    assert isinstance(tuv, Tuv)
+    assert isinstance(tuv.content, LazyContent)
+    assert not tuv.content.is_loaded
+    assert tuv.lang == "en"
+    assert spy.call_count == 0
+
+    assert tuv.content[0] == "Click "
+    assert tuv.content.is_loaded
+    assert spy.call_count == 1
+    assert isinstance(tuv.content[1], Bpt)
+    assert list(tuv.content) == ["Click ", Bpt(i=1, content=["<b>"]), "here"]
+    assert spy.call_count == 1
+
+  def test_equal_to_eager_result(self):
+    lazy_tuv = self.lazy.deserialize(self.make_tuv())
+    eager_tuv = self.eager.deserialize(self.make_tuv())
+    assert lazy_tuv == eager_tuv
+    assert eager_tuv == lazy_tuv
+
+  def test_mutation(self):
+    tuv = self.lazy.deserialize(self.make_tuv())
+    assert isinstance(tuv, Tuv)
+    tuv.content.append("!")
+    tuv.content[0] = "Press "
+    del tuv.content[1]
+    assert tuv.content == ["Press ", "here", "!"]
+    assert len(tuv.content) == 3
+
+  def test_serialization_roundtrip(self):
+    tuv = self.lazy.deserialize(self.make_tuv())
+    assert isinstance(tuv, Tuv)
+    serializer = Serializer(self.backend)
+    elem = serializer.serialize(tuv)
+    assert self.eager.deserialize(elem) == self.eager.deserialize(self.make_tuv())
+
+  def test_repr(self):
+    tuv = self.lazy.deserialize(self.make_tuv())
+    assert isinstance(tuv, Tuv)
+    assert repr(tuv.content) == "LazyContent(<not loaded>)"
+    tuv.content[0]
+    assert repr(tuv.content).startswith("LazyContent(['Click ', ")
+
+
+class TestLazyContentError:
+  @pytest.fixture(autouse=True)
+  def setup(self, backend):
+    self.backend = backend
+    self.deserializer = Deserializer(backend, DeserializationPolicy(), lazy_content=True)
+
+  def test_policy_violation_is_raised_on_access(self):
+    tuv = self.backend.create_element("tuv")
+    self.backend.set_attribute(tuv, "xml:lang", "en")
+    seg = self.backend.create_element("seg")
+    self.backend.append_child(seg, self.backend.create_element("bad"))
+    self.backend.append_child(tuv, seg)
+    obj = self.deserializer.deserialize(tuv)
+    assert isinstance(obj, Tuv)
+    with pytest.raises(XmlDeserializationError, match="Incorrect child element in seg"):
+      obj.content[0]
+
+  def test_missing_seg_is_not_lazy(self):
+    self.deserializer.policy.missing_seg = PolicyValue("empty", logging.DEBUG)
+    tuv = self.backend.create_element("tuv")
+    self.backend.set_attribute(tuv, "xml:lang", "en")
+    obj = self.deserializer.deserialize(tuv)
+    assert isinstance(obj, Tuv)
+    assert obj.content == [""]
+
+
+class TestLazyLoad:
+  @pytest.fixture(autouse=True, params=[StandardBackend, LxmlBackend], ids=["Standard", "Lxml"])
+  def setup(self, request, tmp_path):
+    self.backend = request.param()
+    self.path = tmp_path / "lazy.tmx"
+    self.tmx = create_tmx(
+      header=create_header(),
+      body=[
+        create_tu(
+          tuid=str(i),
+          variants=[
+            create_tuv(
+              "en",
+              content=[
+                f"Hello {i} ",
+                create_bpt(i=1, content=["<b>"]),
+                "x",
+                create_ept(i=1, content=["</b>"]),
+              ],
+            ),
+            create_tuv("fr", content=[f"Bonjour {i}"]),
+          ],
+        )
+        for i in range(5)
+      ],
+    )
+    save(self.tmx, self.path)
+
+  def test_load_lazy(self):
+    tmx = load(self.path, backend=self.backend, lazy_content=True)
+    assert isinstance(tmx.body[0].variants[0].content, LazyContent)
+    assert tmx == self.tmx
+
+  def test_streaming_lazy_content_survives_element_clearing(self):
+    tus = list(load(self.path, "tu", backend=self.backend, lazy_content=True))
+    assert all(isinstance(tu, Tu) for tu in tus)
+    assert tus == self.tmx.body
@@ -0,0 +1,245 @@
+import logging
+import pytest
+from hypomnema.api import load, save
+from hypomnema.api.text import TextProjector
+from hypomnema.api.helpers import create_bpt, create_ept, create_header, create_tmx
+from hypomnema.api.helpers import create_note, create_prop, create_tu, create_tuv
+from hypomnema.base.errors import XmlDeserializationError
+from hypomnema.base.types import Tu, Tuv
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.deserialization.deserializer import Deserializer
+from hypomnema.xml.deserialization.projection import Projection
+from hypomnema.xml.policy import DeserializationPolicy, PolicyValue
+
+
+class TestProjection:
+  def test_default_wants_everything(self):
+    projection = Projection()
+    assert projection.wants_tu("tuid")
+    assert projection.wants_tuv("content")
+    assert projection.wants_language("de")
+    assert projection.skipped_attributes("tu") == frozenset()
+    assert projection.skipped_attributes("tuv") == frozenset()
+
+  def test_skipped_attributes_use_xml_names(self):
+    projection = Projection(tu_fields=["tuid"], tuv_fields=["content"])
+    assert "o-tmf" in projection.skipped_attributes("tu")
+    assert "tuid" not in projection.skipped_attributes("tu")
+    assert "creationdate" in projection.skipped_attributes("tuv")
+    assert "xml:lang" not in projection.skipped_attributes("tuv")
+    assert "lang" not in projection.skipped_attributes("tuv")
+
+  def test_single_string_is_one_name(self):
+    projection = Projection(tu_fields="tuid", languages="en")
+    assert projection.tu_fields == frozenset({"tuid"})
+    assert projection.languages == frozenset({"en"})
+
+  def test_unknown_field(self):
+    with pytest.raises(ValueError, match="Unknown Tu field\\(s\\): foo"):
+      Projection(tu_fields=["tuid", "foo"])
+    with pytest.raises(ValueError, match="Unknown Tuv field\\(s\\): variants"):
+      Projection(tuv_fields=["variants"])
+
+  def test_basic_language_matching(self):
+    projection = Projection(languages=["en", "zh-Hant"], language_matching="basic")
+    assert projection.wants_language("en-US")
+    assert projection.wants_language("zh-hant-TW")
+    assert not projection.wants_language("zh-Hans")
+    assert not projection.wants_language(None)
+    assert not Projection(languages=["en"]).wants_language("en-US")
+
+  def test_unknown_language_matching(self):
+    with pytest.raises(ValueError, match="Unknown language matching 'fuzzy'"):
+      Projection(language_matching="fuzzy")  # type: ignore[arg-type]
+
+  def test_unknown_tag(self):
+    with pytest.raises(ValueError, match="Unknown tag 'seg'"):
+      Projection().skipped_attributes("seg")
+
+
+class TestProjectionDeserialization:
+  @pytest.fixture(autouse=True)
+  def setup(self, mocker, backend):
+    self.mocker = mocker
+    self.backend = backend
+
+  def make_tu(self):
+    tu = self.backend.create_element("tu")
+    self.backend.set_attribute(tu, "tuid", "1")
+    self.backend.set_attribute(tu, "o-tmf", "tmf")
+    prop = self.backend.create_element("prop")
+    self.backend.set_attribute(prop, "type", "x-domain")
+    self.backend.set_text(prop, "legal")
+    self.backend.append_child(tu, prop)
+    note = self.backend.create_element("note")
+    self.backend.set_text(note, "checked")
+    self.backend.append_child(tu, note)
+    for lang, text in (("en", "Click "), ("fr", "Cliquez "), ("de", "Klicken ")):
+      tuv = self.backend.create_element("tuv")
+      self.backend.set_attribute(tuv, "xml:lang", lang)
+      self.backend.set_attribute(tuv, "creationtool", "Tool")
+      self.backend.set_attribute(tuv, "creationdate", "20250101T000000Z", unsafe=True)
+      seg = self.backend.create_element("seg")
+      self.backend.set_text(seg, text)
+      bpt = self.backend.create_element("bpt")
+      self.backend.set_attribute(bpt, "i", "1")
+      self.backend.set_text(bpt, "<b>")
+      self.backend.set_tail(bpt, "here")
+      self.backend.append_child(seg, bpt)
+      hi = self.backend.create_element("hi")
+      self.backend.set_text(hi, " now")
+      ph = self.backend.create_element("ph")
+      self.backend.set_text(ph, "<br/>")
+      self.backend.set_tail(ph, "!")
+      self.backend.append_child(hi, ph)
+      self.backend.set_tail(hi, ".")
+      self.backend.append_child(seg, hi)
+      self.backend.append_child(tuv, seg)
+      self.backend.append_child(tu, tuv)
+    return tu
+
+  def test_full_projection_is_default(self):
+    full = Deserializer(self.backend, projection=Projection()).deserialize(self.make_tu())
+    default = Deserializer(self.backend).deserialize(self.make_tu())
+    assert full == default
+
+  def test_fields(self):
+    projection = Projection(tu_fields=["tuid"], tuv_fields=["creationtool", "content"])
+    tu = Deserializer(self.backend, projection=projection).deserialize(self.make_tu())
+    assert isinstance(tu, Tu)
+    assert tu.tuid == "1"
+    assert tu.o_tmf is None
+    tuv = tu.variants[0]
+    assert tuv.lang == "en"
+    assert tuv.creationtool == "Tool"
+    assert tuv.creationdate is None
+    assert len(tuv.content) == 5
+
+  def test_languages_are_not_emitted(self):
+    deserializer = Deserializer(self.backend, projection=Projection(languages=["en", "de"]))
+    spy = self.mocker.spy(deserializer.handlers["tuv"], "_deserialize")
+    tu = deserializer.deserialize(self.make_tu())
+    assert isinstance(tu, Tu)
+    assert [tuv.lang for tuv in tu.variants] == ["en", "de"]
+    assert spy.call_count == 2
+
+  def test_props_and_notes(self):
+    deserializer = Deserializer(self.backend, projection=Projection(props=False, notes=False))
+    prop_spy = self.mocker.spy(deserializer.handlers["prop"], "_deserialize")
+    tu = deserializer.deserialize(self.make_tu())
+    assert isinstance(tu, Tu)
+    assert tu.props == []
+    assert tu.notes == []
+    assert prop_spy.call_count == 0
+
+  def test_text_only_content(self):
+    deserializer = Deserializer(self.backend, projection=Projection(inline_markup=False))
+    bpt_spy = self.mocker.spy(deserializer.handlers["bpt"], "_deserialize")
+    tu = deserializer.deserialize(self.make_tu())
+    assert isinstance(tu, Tu)
+    assert tu.variants[1].content == ["Cliquez here now!."]
+    assert bpt_spy.call_count == 0
+
+  def test_text_only_content_matches_text_projector(self):
+    tuv = self.backend.create_element("tuv")
+    self.backend.set_attribute(tuv, "xml:lang", "en")
+    seg = self.backend.create_element("seg")
+    self.backend.set_text(seg, "a")
+    unknown = self.backend.create_element("g")
+    self.backend.set_text(unknown, "b")
+    self.backend.set_tail(unknown, "c")
+    self.backend.append_child(seg, unknown)
+    self.backend.append_child(tuv, seg)
+    deserializer = Deserializer(self.backend, projection=Projection(inline_markup=False))
+    tuv_obj = deserializer.deserialize(tuv)
+    assert isinstance(tuv_obj, Tuv)
+    assert tuv_obj.content == [TextProjector("strip").project_element(self.backend, seg)]
+    assert tuv_obj.content == ["abc"]
+
+  def test_no_content(self):
+    deserializer = Deserializer(self.backend, projection=Projection(tuv_fields=["creationtool"]))
+    tu = deserializer.deserialize(self.make_tu())
+    assert isinstance(tu, Tu)
+    assert all(tuv.content == [] for tuv in tu.variants)
+
+
+class TestProjectionDeserializationError:
+  @pytest.fixture(autouse=True)
+  def setup(self, backend):
+    self.backend = backend
+    self.policy = DeserializationPolicy()
+    self.deserializer = Deserializer(
+      backend, self.policy, projection=Projection(inline_markup=False)
+    )
+
+  def make_tuv(self):
+    tuv = self.backend.create_element("tuv")
+    self.backend.set_attribute(tuv, "xml:lang", "en")
+    seg = self.backend.create_element("seg")
+    bpt = self.backend.create_element("bpt")
+    self.backend.set_text(bpt, "<b>")
+    self.backend.append_child(seg, bpt)
+    self.backend.append_child(tuv, seg)
+    return tuv
+
+  def test_empty_text_raises(self):
+    with pytest.raises(XmlDeserializationError, match="Element <seg> is empty"):
+      self.deserializer.deserialize(self.make_tuv())
+
+  def test_empty_text_fallback(self):
+    self.policy.empty_content = PolicyValue("empty", logging.DEBUG)
+    tuv = self.deserializer.deserialize(self.make_tuv())
+    assert isinstance(tuv, Tuv)
+    assert tuv.content == [""]
+
+  def test_empty_text_ignore(self):
+    self.policy.empty_content = PolicyValue("ignore", logging.DEBUG)
+    tuv = self.deserializer.deserialize(self.make_tuv())
+    assert isinstance(tuv, Tuv)
+    assert tuv.content == []
+
+
+class TestProjectionLoad:
+  @pytest.fixture(autouse=True, params=[StandardBackend, LxmlBackend], ids=["Standard", "Lxml"])
+  def setup(self, request, tmp_path):
+    self.backend = request.param()
+    self.path = tmp_path / "projection.tmx"
+    tmx = create_tmx(
+      header=create_header(),
+      body=[
+        create_tu(
+          tuid=str(i),
+          props=[create_prop("legal", "x-domain")],
+          notes=[create_note("checked")],
+          variants=[
+            create_tuv(
+              "en",
+              content=[
+                f"Hello {i} ",
+                create_bpt(i=1, content=["<b>"]),
+                "x",
+                create_ept(i=1, content=["</b>"]),
+              ],
+            ),
+            create_tuv("fr", content=[f"Bonjour {i}"]),
+          ],
+        )
+        for i in range(3)
+      ],
+    )
+    save(tmx, self.path)
+
+  def test_load_projection(self):
+    projection = Projection(
+      tu_fields=["tuid"], languages=["en"], props=False, notes=False, inline_markup=False
+    )
+    tus = list(load(self.path, "tu", backend=self.backend, projection=projection))
+    assert all(isinstance(tu, Tu) for tu in tus)
+    assert [tu.tuid for tu in tus] == ["0", "1", "2"]  # type: ignore[union-attr]
+    assert [tu.variants[0].content for tu in tus] == [  # type: ignore[union-attr]
+      ["Hello 0 x"],
+      ["Hello 1 x"],
+      ["Hello 2 x"],
+    ]
+    assert all(len(tu.variants) == 1 and not tu.props for tu in tus)  # type: ignore[union-attr]
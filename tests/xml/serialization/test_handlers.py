@@ -322,6 +322,21 @@ class TestTuvSerializerError(BaseSerializationTest):
     with pytest.raises(XmlSerializationError, match="Incorrect child element"):
       self.serializer.serialize(tuv)
 
+  def test_none_in_content(self):
+    tuv = Tuv(lang="en", content=["a", None, "b", Ph(content=["x"])])
+    with pytest.raises(XmlSerializationError, match="got 'NoneType'"):
+      self.serializer.serialize(tuv)
+
+  def test_none_in_content_ignore(self):
+    self.serializer.policy.invalid_content_type = PolicyValue("ignore", logging.DEBUG)
+    tuv = Tuv(lang="en", content=["a", None, "b", Ph(content=["x"]), "c"])
+    seg = self.assert_child_count(self.serializer.serialize(tuv), 1, "seg")[0]
+    self.assert_text(seg, "ab")
+    (ph,) = self.assert_child_count(seg, 1)
+    self.assert_tag(ph, "ph")
+    self.assert_text(ph, "x")
+    assert self.backend.get_tail(ph) == "c"
+
 
 class TestTuSerializerHappy(BaseSerializationTest):
   def test_tu_structure(self):
@@ -2,8 +2,11 @@ import pytest
 import logging
 from hypomnema.xml.serialization.serializer import Serializer
 from hypomnema.xml.policy import SerializationPolicy, PolicyValue
-from hypomnema.base.errors import MissingHandlerError
-from hypomnema.base.types import Prop
+from hypomnema.base.errors import MissingHandlerError, XmlSerializationError
+from hypomnema.base.types import Bpt, Hi, Prop, Sub
+from hypomnema.xml.serialization._handlers import HiSerializer
+
+DEPTH = 5000
 
 
 class UnknownType:
@@ -52,6 +55,49 @@ class TestSerializerHappy(BaseSerializerTest):
     result = self.serializer.serialize(obj)
     assert result is None
 
+  def make_nested_hi(self, depth):
+    root = current = Hi(content=[])
+    for level in range(depth):
+      child = Hi(content=[])
+      current.content.extend([str(level), child, "tail"])
+      current = child
+    current.content.append("leaf")
+    return root
+
+  def test_deeply_nested_inline_content(self):
+    elem = self.serializer.serialize(self.make_nested_hi(DEPTH))
+    for level in range(DEPTH):
+      assert self.backend.get_tag(elem) == "hi"
+      assert self.backend.get_text(elem) == str(level)
+      (child,) = self.backend.iter_children(elem)
+      assert self.backend.get_tail(child) == "tail"
+      elem = child
+    assert self.backend.get_text(elem) == "leaf"
+    assert list(self.backend.iter_children(elem)) == []
+
+  def test_nested_sub_in_codes(self):
+    bpt = Bpt(i=1, content=["<a href='", Sub(content=["link"]), "'>"])
+    elem = self.serializer.serialize(bpt)
+    assert self.backend.get_text(elem) == "<a href='"
+    (sub,) = self.backend.iter_children(elem)
+    assert self.backend.get_tag(sub) == "sub"
+    assert self.backend.get_text(sub) == "link"
+    assert self.backend.get_tail(sub) == "'>"
+
+  def test_overridden_inline_handler_is_used(self):
+    class TypedHiSerializer(HiSerializer):
+      def _serialize(self, obj):
+        obj.type = "custom"
+        return super()._serialize(obj)
+
+    handlers = self.serializer._get_default_handlers()
+    handlers[Hi] = TypedHiSerializer(self.backend, self.serializer.policy, logging.getLogger())
+    serializer = Serializer(self.backend, handlers=handlers)
+    elem = serializer.serialize(self.make_nested_hi(3))
+    for _ in range(4):
+      assert self.backend.get_attribute(elem, "type") == "custom"
+      elem = next(iter(self.backend.iter_children(elem)), None)
+
 
 class TestSerializerError(BaseSerializerTest):
   def test_serialize_unknown_type_raise(self):
@@ -65,3 +111,13 @@ class TestSerializerError(BaseSerializerTest):
     obj = UnknownType()
     with pytest.raises(MissingHandlerError, match="Missing handler"):
       self.serializer.serialize(obj)
+
+  def test_deeply_nested_invalid_content_raise(self):
+    root = current = Hi(content=[])
+    for _ in range(DEPTH):
+      child = Hi(content=[])
+      current.content.append(child)
+      current = child
+    current.content.append(Sub(content=[]))
+    with pytest.raises(XmlSerializationError, match="Incorrect child element in Hi"):
+      self.serializer.serialize(root)
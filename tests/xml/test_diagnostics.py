@@ -0,0 +1,204 @@
+import logging
+from pathlib import Path
+
+import pytest
+from hypomnema.api import load
+from hypomnema.base.errors import AttributeDeserializationError, XmlDeserializationError
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.deserialization.expat import ExpatDeserializer
+from hypomnema.xml.diagnostics import Diagnostic, Diagnostics
+from hypomnema.xml.policy import DeserializationPolicy, PolicyValue
+from hypomnema.xml.validation import validate
+
+_HEADER = (
+  '<header creationtool="t" creationtoolversion="1" segtype="block" o-tmf="t" adminlang="en"'
+  ' srclang="en" datatype="plaintext"/>'
+)
+
+# One problem per <tu>, each on its own line
+_BODY = (
+  '<tu tuid="1" usagecount="x">\n<tuv xml:lang="en"><seg>a</seg></tuv></tu>\n'
+  '<tu tuid="2">\n<tuv><seg>b</seg></tuv></tu>\n'
+  '<tu tuid="3">\n<tuv xml:lang="en"><seg>c</seg><seg>d</seg></tuv></tu>\n'
+  '<tu tuid="4">\n<tuv xml:lang="en">text<seg>e</seg></tuv></tu>\n'
+  '<tu tuid="5">\n<tuv xml:lang="en"></tuv></tu>\n'
+)
+
+_EXPECTED = [
+  ("invalid_attribute_value", "tu", "usagecount", "1", 4),
+  ("required_attribute_missing", "tuv", "xml:lang", "2", 7),
+  ("multiple_seg", "seg", None, "3", 9),
+  ("extra_text", "tuv", None, "4", 11),
+  ("missing_seg", "tuv", None, "5", 13),
+]
+
+
+@pytest.fixture
+def messy_file(tmp_path) -> Path:
+  path = tmp_path / "messy.tmx"
+  path.write_text(
+    f'<tmx version="1.4">\n{_HEADER}\n<body>\n{_BODY}</body>\n</tmx>', encoding="utf-8"
+  )
+  return path
+
+
+class TestDiagnosticsHappy:
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  def test_collect_every_violation(self, messy_file, backend_class):
+    diagnostics = Diagnostics()
+    tmx = load(
+      messy_file,
+      policy=DeserializationPolicy.collecting(),
+      backend=backend_class(),
+      diagnostics=diagnostics,
+    )
+    assert [(d.policy, d.tag, d.attribute, d.tuid) for d in diagnostics] == [
+      expected[:4] for expected in _EXPECTED
+    ]
+    assert all(d.behavior == "collect" for d in diagnostics)
+    if backend_class is LxmlBackend:
+      assert [d.line for d in diagnostics] == [expected[4] for expected in _EXPECTED]
+    else:
+      assert all(d.line is None for d in diagnostics)
+    assert diagnostics.tuid is None
+
+    tus = tmx.body
+    assert len(tus) == 5
+    assert tus[0].usagecount is None
+    assert tus[1].variants[0].lang is None
+    assert tus[2].variants[0].content == ["c"]
+    assert tus[3].variants[0].content == ["e"]
+    assert tus[4].variants[0].content == []
+
+  def test_expat_reports_line_and_column(self, messy_file):
+    diagnostics = Diagnostics()
+    deserializer = ExpatDeserializer(
+      policy=DeserializationPolicy.collecting(), diagnostics=diagnostics
+    )
+    tmx = deserializer.parse(messy_file)
+    assert [(d.policy, d.tuid, d.line) for d in diagnostics] == [
+      (policy, tuid, line) for policy, _, _, tuid, line in _EXPECTED
+    ]
+    assert diagnostics.records[1].column == 0
+    assert len(tmx.body) == 5
+    assert tmx.body[2].variants[0].content == ["c"]
+
+  def test_same_violations_as_validator(self, messy_file):
+    diagnostics = Diagnostics()
+    load(messy_file, policy=DeserializationPolicy.collecting(), diagnostics=diagnostics)
+    violations = validate(messy_file, DeserializationPolicy.collecting())
+    assert [(d.policy, d.message) for d in diagnostics] == [
+      (v.check, v.message) for v in violations
+    ]
+
+  def test_tolerated_violations_are_reported(self, messy_file):
+    diagnostics = Diagnostics()
+    policy = DeserializationPolicy.collecting()
+    policy.extra_text = PolicyValue("ignore", logging.DEBUG)
+    load(messy_file, policy=policy, diagnostics=diagnostics)
+    assert diagnostics.records[3].behavior == "ignore"
+    assert diagnostics.counts() == {
+      "invalid_attribute_value": 1,
+      "required_attribute_missing": 1,
+      "multiple_seg": 1,
+      "extra_text": 1,
+      "missing_seg": 1,
+    }
+
+  def test_without_sink(self, messy_file, caplog):
+    caplog.set_level(logging.WARNING)
+    load(messy_file, policy=DeserializationPolicy.collecting(logging.WARNING))
+    assert len(caplog.records) == 5
+
+  def test_tuid_is_tracked_per_thread(self, messy_file):
+    diagnostics = Diagnostics()
+    elements = load(
+      messy_file,
+      filter="tu",
+      policy=DeserializationPolicy.collecting(),
+      diagnostics=diagnostics,
+      workers=4,
+      chunk_size=1,
+    )
+    assert len(list(elements)) == 5
+    assert sorted((d.tuid, d.policy) for d in diagnostics) == [
+      (tuid, policy) for policy, _, _, tuid, _ in _EXPECTED
+    ]
+
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  def test_lazy_content_keeps_tuid(self, tmp_path, backend_class):
+    path = tmp_path / "content.tmx"
+    path.write_text(
+      f'<tmx version="1.4">{_HEADER}<body><tu tuid="T1"><tuv xml:lang="en">'
+      '<seg>a<prop type="x">b</prop></seg></tuv></tu><tu tuid="T2"/></body></tmx>',
+      encoding="utf-8",
+    )
+    policy = DeserializationPolicy.collecting()
+    eager = Diagnostics()
+    load(path, policy=policy, backend=backend_class(), diagnostics=eager)
+    lazy = Diagnostics()
+    tmx = load(path, policy=policy, backend=backend_class(), diagnostics=lazy, lazy_content=True)
+    assert len(lazy) == 0
+    lazy.tuid = "other"
+    assert list(tmx.body[0].variants[0].content) == ["a"]
+    assert lazy.tuid == "other"
+    assert [(d.tuid, d.policy) for d in lazy] == [(d.tuid, d.policy) for d in eager]
+    assert [(d.tuid, d.policy) for d in lazy] == [("T1", "invalid_child_element")]
+
+  def test_clear(self):
+    diagnostics = Diagnostics()
+    diagnostics.tuid = "1"
+    diagnostics.report("missing_seg", "collect", "no seg", tag="tu")
+    assert list(diagnostics) == [Diagnostic("missing_seg", "collect", "no seg", "tu", None, "1")]
+    diagnostics.clear()
+    assert len(diagnostics) == 0
+    assert diagnostics.tuid is None
+
+  def test_record_override(self, messy_file):
+    class Streaming(Diagnostics):
+      __slots__ = ("seen",)
+
+      def __init__(self):
+        super().__init__()
+        self.seen = 0
+
+      def record(self, diagnostic):
+        self.seen += 1
+
+    diagnostics = Streaming()
+    load(messy_file, policy=DeserializationPolicy.collecting(), diagnostics=diagnostics)
+    assert diagnostics.seen == 5
+    assert len(diagnostics) == 0
+
+
+class TestDiagnosticsError:
+  def test_violation_is_recorded_before_raising(self, messy_file):
+    diagnostics = Diagnostics()
+    with pytest.raises(AttributeDeserializationError, match="Cannot convert 'x' to an int"):
+      load(messy_file, diagnostics=diagnostics)
+    [diagnostic] = diagnostics
+    assert diagnostic.behavior == "raise"
+    assert diagnostic.tuid == "1"
+    assert diagnostics.tuid is None
+
+  def test_expat_violation_is_recorded_before_raising(self, messy_file):
+    diagnostics = Diagnostics()
+    with pytest.raises(AttributeDeserializationError):
+      ExpatDeserializer(diagnostics=diagnostics).parse(messy_file)
+    assert [(d.policy, d.line) for d in diagnostics] == [("invalid_attribute_value", 4)]
+    assert diagnostics.tuid is None
+
+  def test_lazy_violation_keeps_tuid_when_raising(self, tmp_path):
+    path = tmp_path / "content.tmx"
+    path.write_text(
+      f'<tmx version="1.4">{_HEADER}<body><tu tuid="T1"><tuv xml:lang="en">'
+      '<seg>a<prop type="x">b</prop></seg></tuv></tu></body></tmx>',
+      encoding="utf-8",
+    )
+    diagnostics = Diagnostics()
+    tmx = load(path, diagnostics=diagnostics, lazy_content=True)
+    with pytest.raises(XmlDeserializationError):
+      list(tmx.body[0].variants[0].content)
+    assert [(d.tuid, d.behavior) for d in diagnostics] == [("T1", "raise")]
+    assert diagnostics.tuid is None
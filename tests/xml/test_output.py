@@ -0,0 +1,137 @@
+import codecs
+import os
+
+import pytest
+from hypomnema.api import load, save
+from hypomnema.api.helpers import create_tu, create_tuv
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.output import AtomicWriter
+from hypomnema.xml.serialization.serializer import Serializer
+
+
+class TestAtomicWriterHappy:
+  def test_replaces_file(self, tmp_path):
+    path = tmp_path / "out.bin"
+    path.write_bytes(b"old")
+    with AtomicWriter(path) as output:
+      output.write(b"new ")
+      output.writelines([b"con", bytearray(b"tent")])
+      assert path.read_bytes() == b"old"
+    assert path.read_bytes() == b"new content"
+    assert os.listdir(tmp_path) == ["out.bin"]
+
+  @pytest.mark.parametrize("buffer_size", [1, 5, 1 << 20])
+  def test_buffer_size(self, tmp_path, buffer_size):
+    path = tmp_path / "out.bin"
+    chunks = [bytes([i]) * i for i in range(100)]
+    with AtomicWriter(path, buffer_size=buffer_size) as output:
+      output.writelines(chunks)
+      output.flush()
+    assert path.read_bytes() == b"".join(chunks)
+
+  def test_keeps_permissions(self, tmp_path):
+    path = tmp_path / "out.bin"
+    path.write_bytes(b"old")
+    path.chmod(0o640)
+    with AtomicWriter(path) as output:
+      output.write(b"new")
+    assert path.stat().st_mode & 0o777 == 0o640
+
+  def test_creates_parent_directories(self, tmp_path):
+    path = tmp_path / "a" / "b" / "out.bin"
+    with AtomicWriter(path) as output:
+      output.write(b"data")
+    assert path.read_bytes() == b"data"
+
+  @pytest.mark.parametrize(("fsync", "expected"), [("none", 0), ("file", 1), ("full", 2)])
+  def test_fsync_policy(self, tmp_path, monkeypatch, fsync, expected):
+    calls = []
+    real_fsync = os.fsync
+
+    def fsync_spy(fd):
+      calls.append(fd)
+      real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync_spy)
+    with AtomicWriter(tmp_path / "out.bin", fsync=fsync) as output:
+      output.write(b"data")
+    assert len(calls) == expected
+
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  def test_save(self, tmp_path, backend_class, make_tmx):
+    path = tmp_path / "out.tmx"
+    tmx = make_tmx(3)
+    save(tmx, path, backend=backend_class(), fsync="full")
+    assert load(path) == tmx
+    assert os.listdir(tmp_path) == ["out.tmx"]
+
+  def test_iterwrite_byte_buffer(self, tmp_path):
+    backend = StandardBackend()
+    elements = [backend.create_element("tu", attributes={"tuid": str(i)}) for i in range(50)]
+    backend.iterwrite(tmp_path / "out.tmx", elements, buffer_size=64, fsync="file")
+    assert [tu.tuid for tu in load(tmp_path / "out.tmx", filter="tu")] == [
+      str(i) for i in range(50)
+    ]
+
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  @pytest.mark.parametrize("encoding", ["utf-8", "utf-16", "latin-1", "ascii"])
+  def test_iterwrite_encoding(self, tmp_path, backend_class, encoding):
+    path = tmp_path / "out.tmx"
+    backend = backend_class()
+    tus = [
+      create_tu(tuid=str(i), variants=[create_tuv("en", content=["é Ελληνικά €"])])
+      for i in range(5)
+    ]
+    serializer = Serializer(backend)
+    backend.iterwrite(
+      path, (serializer.serialize(tu) for tu in tus), encoding, max_number_of_elements_in_buffer=2
+    )
+    content = path.read_bytes()
+    assert content.startswith('<?xml version="1.0"'.encode(encoding))
+    assert content.count(codecs.BOM_UTF16) == (1 if encoding == "utf-16" else 0)
+    assert list(load(path, encoding=encoding, filter="tu")) == tus
+
+
+class TestAtomicWriterError:
+  def test_error_keeps_original(self, tmp_path):
+    path = tmp_path / "out.bin"
+    path.write_bytes(b"old")
+    with pytest.raises(RuntimeError, match="boom"):
+      with AtomicWriter(path, buffer_size=1) as output:
+        output.write(b"partial")
+        raise RuntimeError("boom")
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["out.bin"]
+
+  def test_interrupted_iterwrite_keeps_original(self, tmp_path, make_tmx):
+    path = tmp_path / "out.tmx"
+    save(make_tmx(2), path)
+    before = path.read_bytes()
+    backend = StandardBackend()
+
+    def elements():
+      yield backend.create_element("tu")
+      raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+      backend.iterwrite(path, elements(), max_number_of_elements_in_buffer=1)
+    assert path.read_bytes() == before
+    assert os.listdir(tmp_path) == ["out.tmx"]
+
+  def test_write_when_closed(self, tmp_path):
+    writer = AtomicWriter(tmp_path / "out.bin")
+    with pytest.raises(ValueError, match="closed"):
+      writer.write(b"data")
+    with writer:
+      pass
+    with pytest.raises(ValueError, match="closed"):
+      writer.write(b"data")
+
+  @pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [({"buffer_size": 0}, "buffer_size must be at least 1"), ({"fsync": "always"}, "fsync")],
+  )
+  def test_invalid_arguments(self, tmp_path, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+      AtomicWriter(tmp_path / "out.bin", **kwargs)
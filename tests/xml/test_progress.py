@@ -0,0 +1,129 @@
+import pytest
+from hypomnema.api import load, save, save_stream
+from hypomnema.xml.backends.lxml import LxmlBackend
+from hypomnema.xml.backends.standard import StandardBackend
+from hypomnema.xml.deserialization.expat import ExpatDeserializer
+from hypomnema.xml.progress import MetricsSink, Progress, ProgressReporter
+
+
+@pytest.fixture
+def tmx_file(tmp_path, make_tmx):
+  path = tmp_path / "memory.tmx"
+  save(make_tmx(20), path)
+  return path
+
+
+def _reporter(**kwargs):
+  reports = []
+  return ProgressReporter(reports.append, **kwargs), reports
+
+
+class TestProgressReporterHappy:
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  def test_load(self, backend_class, tmx_file):
+    reporter, reports = _reporter()
+    load(tmx_file, backend=backend_class(), progress=reporter)
+    assert reports == [reporter.last]
+    last = reporter.last
+    assert (last.operation, last.elements, last.done) == ("load", 20, True)
+    assert last.bytes == last.total_bytes == tmx_file.stat().st_size
+    assert last.fraction == 1.0
+
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  @pytest.mark.parametrize("options", [{}, {"chunk_size": 3}, {"workers": 2}])
+  def test_load_filtered(self, backend_class, tmx_file, options):
+    reporter, reports = _reporter(interval=0)
+    tus = load(tmx_file, filter="tu", backend=backend_class(), progress=reporter, **options)
+    assert len(list(tus)) == 20
+    assert {report.operation for report in reports} == {"load"}
+    assert [report.done for report in reports].count(True) == 1
+    assert reporter.last.elements == 20
+    assert reporter.last.bytes == tmx_file.stat().st_size
+    elements = [report.elements for report in reports]
+    assert elements == sorted(elements) and len(set(elements)) > 1
+
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  def test_iterparse(self, backend_class, tmx_file):
+    reporter, _ = _reporter()
+    assert len(list(backend_class().iterparse(tmx_file, "tu", progress=reporter))) == 20
+    assert (reporter.last.operation, reporter.last.elements) == ("iterparse", 20)
+    assert reporter.last.bytes == tmx_file.stat().st_size
+
+  def test_expat(self, tmx_file):
+    reporter, _ = _reporter()
+    deserializer = ExpatDeserializer(buffer_size=64)
+    assert len(list(deserializer.iterparse(tmx_file, progress=reporter))) == 20
+    assert (reporter.last.operation, reporter.last.elements) == ("iterparse", 20)
+    assert reporter.last.bytes == tmx_file.stat().st_size
+    deserializer.parse(tmx_file, progress=reporter)
+    assert reporter.last.operation == "parse"
+    assert reporter.last.bytes == tmx_file.stat().st_size
+
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  def test_save(self, backend_class, tmp_path, make_tmx):
+    path = tmp_path / "out.tmx"
+    reporter, reports = _reporter()
+    save(make_tmx(5), path, backend=backend_class(), progress=reporter)
+    assert reports == [reporter.last]
+    assert (reporter.last.operation, reporter.last.elements) == ("save", 5)
+    assert reporter.last.bytes == path.stat().st_size
+    assert reporter.last.total_bytes is None and reporter.last.fraction is None
+
+  @pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+  def test_save_stream(self, tmp_path, encoding, make_tmx):
+    path = tmp_path / "out.tmx"
+    reporter, _ = _reporter()
+    save_stream(make_tmx(5).body, path, encoding=encoding, progress=reporter)
+    assert (reporter.last.operation, reporter.last.elements) == ("save_stream", 5)
+    assert reporter.last.bytes == path.stat().st_size
+
+  @pytest.mark.parametrize("backend_class", [StandardBackend, LxmlBackend])
+  def test_iterwrite(self, backend_class, tmp_path):
+    path = tmp_path / "out.tmx"
+    backend = backend_class()
+    elements = [backend.create_element("tu", attributes={"tuid": str(i)}) for i in range(10)]
+    reporter, reports = _reporter(interval=0)
+    backend.iterwrite(path, elements, max_number_of_elements_in_buffer=3, progress=reporter)
+    assert (reporter.last.operation, reporter.last.elements) == ("iterwrite", 10)
+    assert reporter.last.bytes == path.stat().st_size
+    assert len(reports) > 2
+
+  def test_metrics(self, tmx_file):
+    metrics = MetricsSink()
+    reporter = ProgressReporter(interval=0, metrics=metrics, prefix="test")
+    list(load(tmx_file, filter="tu", progress=reporter))
+    list(load(tmx_file, filter="tu", progress=reporter))
+    assert metrics.counters == {
+      "test.load.bytes": 2 * tmx_file.stat().st_size,
+      "test.load.elements": 40,
+    }
+    assert len(metrics.samples["test.load.seconds"]) == 2
+    assert all(rate >= 0 for rate in metrics.samples["test.load.elements_per_second"])
+
+  def test_manual(self):
+    reporter, reports = _reporter(interval=3600)
+    with reporter.track("import", total_bytes=100):
+      reporter.add_bytes(50)
+      reporter.add_elements(2)
+    assert reports == [reporter.last]
+    assert (reporter.last.bytes, reporter.last.elements, reporter.last.fraction) == (50, 2, 0.5)
+
+  def test_rates(self):
+    progress = Progress("load", 100, None, 10, 2.0, True)
+    assert (progress.bytes_per_second, progress.elements_per_second) == (50.0, 5.0)
+    assert Progress("load", 0, 0, 0, 0.0, False).bytes_per_second == 0.0
+
+
+class TestProgressReporterError:
+  def test_negative_interval(self):
+    with pytest.raises(ValueError, match="interval must be at least 0"):
+      ProgressReporter(interval=-1)
+
+  def test_reports_failed_operation(self, tmp_path):
+    path = tmp_path / "broken.tmx"
+    path.write_text("<tmx><body><tu></body></tmx>")
+    reporter, reports = _reporter()
+    with pytest.raises(SyntaxError):
+      list(load(path, filter="tu", progress=reporter))
+    assert reports[-1].done
+    assert reporter.last.bytes == path.stat().st_size
@@ -0,0 +1,199 @@
+from pathlib import Path
+
+import pytest
+from hypomnema.api import load, save
+from hypomnema.api.helpers import create_bpt, create_ept, create_header, create_note, create_prop
+from hypomnema.api.helpers import create_sub, create_tmx, create_tu, create_tuv
+from tests.policies import make_policy
+from hypomnema.xml.validation import TmxValidator, Violation, validate
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+_HEADER = (
+  '<header creationtool="t" creationtoolversion="1" segtype="block" o-tmf="t" adminlang="en"'
+  ' srclang="en" datatype="plaintext"/>'
+)
+
+
+def _write(tmp_path: Path, tuv_content: str) -> Path:
+  path = tmp_path / "test.tmx"
+  path.write_text(
+    f'<tmx version="1.4">{_HEADER}<body><tu><tuv xml:lang="en">{tuv_content}</tuv></tu>'
+    "</body></tmx>",
+    encoding="utf-8",
+  )
+  return path
+
+
+class TestValidatorHappy:
+  def test_valid_file(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    tmx = create_tmx(
+      header=create_header(creationtool="tool", creationtoolversion="1.0", srclang="en"),
+      body=[
+        create_tu(
+          tuid="1",
+          usagecount=3,
+          props=[create_prop("x-domain", "IT")],
+          notes=[create_note("a note")],
+          variants=[
+            create_tuv(
+              "en",
+              content=[
+                create_bpt(i=1, content=["<a href='", create_sub(content=["x"]), "'>"]),
+                "here",
+                create_ept(i=1, content=["</a>"]),
+              ],
+            )
+          ],
+        )
+      ],
+    )
+    save(tmx, path)
+    assert validate(path) == []
+
+  @pytest.mark.parametrize("name", ["standard.tmx", "minimal.tmx"])
+  def test_conformance_files(self, name):
+    assert validate(DATA_DIR / name) == []
+
+  def test_collects_every_violation_with_position(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text(
+      f'<tmx version="1.4">\n{_HEADER}\n<body>\n<tu usagecount="x">\n'
+      '  <tuv><seg>a</seg></tuv>\n  <tuv xml:lang="fr"><seg/></tuv>\n</tu>\n</body>\n</tmx>',
+      encoding="utf-8",
+    )
+    assert validate(path) == [
+      Violation(
+        "invalid_attribute_value", "Cannot convert 'x' to an int for attribute usagecount", 4, 0
+      ),
+      Violation("required_attribute_missing", "Required attribute 'xml:lang' is None", 5, 2),
+      Violation("empty_content", "Element <seg> is empty", 6, 21),
+    ]
+
+  def test_tolerated_problems_are_not_reported(self, tmp_path):
+    path = _write(tmp_path, "text<seg/><seg>a</seg>")
+    policy = make_policy(extra_text="ignore", empty_content="empty", multiple_seg="keep_last")
+    assert validate(path, policy) == []
+
+  def test_unpaired_codes(self, tmp_path):
+    path = _write(
+      tmp_path,
+      '<seg><bpt i="1">a</bpt><ept i="2">b</ept><bpt i="3">c</bpt><bpt i="3">d</bpt>'
+      '<ept i="3">e</ept></seg>',
+    )
+    assert [(v.check, v.message) for v in validate(path)] == [
+      ("unpaired_code", "<ept> with i=2 has no matching <bpt>"),
+      ("unpaired_code", "Duplicate <bpt> with i=3"),
+      ("unpaired_code", "<bpt> with i=1 has no matching <ept>"),
+    ]
+    assert validate(path, check_pairing=False) == []
+
+  def test_codes_are_paired_within_each_sub(self, tmp_path):
+    path = _write(
+      tmp_path,
+      '<seg><bpt i="1">a<sub><bpt i="1">b</bpt><ept i="1">c</ept></sub></bpt>'
+      '<hi><ept i="1">d</ept></hi></seg>',
+    )
+    assert validate(path) == []
+
+  def test_small_buffer_size(self, tmp_path):
+    path = _write(tmp_path, "  some text  <seg>a</seg>")
+    violations = TmxValidator(buffer_size=3).validate(path)
+    assert [v.message for v in violations] == [
+      "Element <tuv> has extra text content '  some text  '"
+    ]
+
+  def test_iter_violations(self, tmp_path):
+    path = _write(tmp_path, "")
+    violations = TmxValidator().iter_violations(path)
+    assert next(violations).check == "missing_seg"
+    assert next(violations, None) is None
+
+
+# Documents on which the validator must agree with ``load``
+_CASES = {
+  "invalid_inline_child": ('<seg>a<sub>b</sub>c<bpt i="1">d</bpt>e</seg>', {}),
+  "invalid_inline_child_ignore": ("<seg><sub>b</sub></seg>", {"invalid_child_element": "ignore"}),
+  "empty_seg": ("<seg/>", {}),
+  "empty_code": ('<seg>a<ph x="1"/></seg>', {}),
+  "missing_seg": ("", {}),
+  "multiple_seg": ("<seg>a</seg><seg>b</seg>", {}),
+  "multiple_seg_keep_first": ("<seg>a</seg><seg/>", {"multiple_seg": "keep_first"}),
+  "extra_text": ("text<seg>a</seg>", {}),
+  "whitespace_text": ("\n  <seg>a</seg>", {}),
+  "invalid_child": ("<seg>a</seg><foo/>", {}),
+  "missing_required_attribute": ('<seg><bpt>a</bpt><ept i="1">b</ept></seg>', {}),
+  "invalid_int": ('<seg><ph x="one">a</ph></seg>', {}),
+  "invalid_enum": ('<seg><it pos="middle">a</it></seg>', {}),
+  "valid_prop": ('<prop type="x" xml:lang="en">a</prop><seg>a</seg>', {}),
+  "empty_prop": ('<prop type="x"/><seg>a</seg>', {}),
+  "empty_note": ("<note><foo/>tail</note><seg>a</seg>", {"invalid_child_element": "ignore"}),
+}
+
+
+class TestValidatorPolicies:
+  @pytest.mark.parametrize("case", list(_CASES))
+  def test_same_verdict_as_load(self, tmp_path, case):
+    tuv_content, behaviors = _CASES[case]
+    path = _write(tmp_path, tuv_content)
+    policy = make_policy(**behaviors)
+    violations = validate(path, policy, check_pairing=False)
+    try:
+      load(path, policy=policy)
+    except Exception as e:
+      assert violations[0].message == str(e)
+    else:
+      assert violations == []
+
+  def test_invalid_datetime(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text(
+      f'<tmx version="1.4">{_HEADER}<body><tu changedate="yesterday"/></body></tmx>',
+      encoding="utf-8",
+    )
+    [violation] = validate(path)
+    assert violation.message == (
+      "Cannot convert 'yesterday' to a datetime object for attribute changedate"
+    )
+
+  @pytest.mark.parametrize("behavior", ["raise", "keep_first", "keep_last"])
+  def test_multiple_headers(self, tmp_path, behavior):
+    path = tmp_path / "test.tmx"
+    path.write_text(f'<tmx version="1.4">{_HEADER}{_HEADER}<body/></tmx>', encoding="utf-8")
+    violations = validate(path, make_policy(multiple_headers=behavior))
+    assert [v.check for v in violations] == (["multiple_headers"] if behavior == "raise" else [])
+
+  def test_missing_header(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text('<tmx version="1.4"><body/></tmx>', encoding="utf-8")
+    assert validate(path) == [
+      Violation("missing_header", "Element <tmx> is missing a <header> child element", 1, 0)
+    ]
+    assert validate(path, make_policy(missing_header="ignore")) == []
+
+
+class TestValidatorError:
+  def test_root_is_not_tmx(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text("<root><tmx/></root>", encoding="utf-8")
+    assert validate(path) == [Violation("invalid_tag", "Root element is not a tmx", 1, 0)]
+
+  def test_not_well_formed(self, tmp_path):
+    path = tmp_path / "test.tmx"
+    path.write_text(f'<tmx version="1.4">{_HEADER}\n<body><tu></body></tmx>', encoding="utf-8")
+    assert validate(path) == [Violation("not_well_formed", "mismatched tag", 2, 12)]
+
+  def test_missing_file(self, tmp_path):
+    with pytest.raises(FileNotFoundError):
+      validate(tmp_path / "missing.tmx")
+    with pytest.raises(FileNotFoundError):
+      TmxValidator().iter_violations(tmp_path / "missing.tmx")
+
+  def test_directory(self, tmp_path):
+    with pytest.raises(IsADirectoryError):
+      validate(tmp_path)
+
+  def test_invalid_buffer_size(self):
+    with pytest.raises(ValueError, match="buffer_size must be at least 1"):
+      TmxValidator(buffer_size=0)